@@ -0,0 +1,7 @@
+"""Load benchmarks for the /api/v1 surface.
+
+``python -m benchmarks seed --size 100k`` builds a synthetic dataset in a
+separate database, ``python -m benchmarks run`` drives every router viewset
+over HTTP and writes latency percentiles, queries per request and throughput
+as JSON, and ``python -m benchmarks compare`` diffs two such runs.
+"""
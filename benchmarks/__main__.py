@@ -0,0 +1,160 @@
+"""Command line entry point: ``python -m benchmarks {seed,run,compare,serialize,payload,concurrency}``."""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed = commands.add_parser('seed', help='Build a synthetic dataset in the benchmark database.')
+    seed.add_argument('--size', default='10k', help='Deadline count: 10k, 100k, 1m or a number (default 10k).')
+    seed.add_argument('--seed', type=int, default=0, help='Random seed; the same seed gives the same data.')
+    seed.add_argument('--flush', action='store_true', help='Delete existing data first.')
+
+    run = commands.add_parser('run', help='Drive the API and write a JSON result.')
+    run.add_argument('--users', type=int, default=4, help='Concurrent virtual users (default 4).')
+    run.add_argument('--duration', type=float, default=30.0, help='Measured seconds (default 30).')
+    run.add_argument('--warmup', type=float, default=3.0, help='Unmeasured seconds before measuring (default 3).')
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--only', help='Comma-separated task names to run, e.g. deadlines:list (default all).')
+    run.add_argument('--url', help='Benchmark a running server instead of serving in-process.')
+    run.add_argument('--output', '-o', help='Write the JSON result here instead of stdout.')
+
+    diff = commands.add_parser('compare', help='Compare two JSON results.')
+    diff.add_argument('baseline')
+    diff.add_argument('candidate')
+    diff.add_argument('--threshold', type=float, default=0.10, help='p95 increase counted as a regression (default 0.10).')
+    diff.add_argument('--fail-on-regression', action='store_true', help='Exit with status 1 on any regression.')
+
+    serialize = commands.add_parser('serialize', help='CPU per row of the fast list path vs the serializers.')
+    serialize.add_argument('--rows', type=int, default=1000, help='Rows per list (default 1000).')
+    serialize.add_argument('--repeat', type=int, default=5, help='Best of this many runs (default 5).')
+
+    payload = commands.add_parser('payload', help='Response bytes and render/compress CPU for one page.')
+    payload.add_argument('--rows', type=int, default=500, help='Rows in the page (default 500).')
+    payload.add_argument('--repeat', type=int, default=5, help='Best of this many runs (default 5).')
+
+    concurrency = commands.add_parser('concurrency', help='Throughput and memory per connection, WSGI vs ASGI.')
+    concurrency.add_argument('--clients', type=int, default=500, help='Concurrent connections (default 500).')
+    concurrency.add_argument('--workers', type=int, default=2, help='Gunicorn workers per deployment (default 2).')
+    concurrency.add_argument('--duration', type=float, default=30.0, help='Measured seconds (default 30).')
+    concurrency.add_argument('--warmup', type=float, default=5.0, help='Unmeasured seconds before measuring (default 5).')
+    concurrency.add_argument('--only', help='Comma-separated deployments: wsgi, asgi, asgi-sync (default all).')
+    concurrency.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare':
+        from benchmarks.stats import compare
+
+        baseline, candidate = (json.loads(Path(path).read_text()) for path in (args.baseline, args.candidate))
+        lines, regressions = compare(baseline, candidate, args.threshold)
+        print('\n'.join(lines))
+        return 1 if regressions and args.fail_on_regression else 0
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from django.core.management import call_command
+
+    database = settings.DATABASES['default']
+    if database['ENGINE'].endswith('sqlite3'):
+        Path(database['NAME']).parent.mkdir(parents=True, exist_ok=True)
+
+    if args.command == 'seed':
+        from benchmarks.datasets import generate, parse_size
+        from court_rules.models import Deadline
+
+        call_command('migrate', verbosity=0)
+        if args.flush:
+            call_command('flush', interactive=False, verbosity=0)
+        elif Deadline.objects.exists():
+            print('The benchmark database already has data; pass --flush to replace it.', file=sys.stderr)
+            return 1
+        started = time.perf_counter()
+        counts = generate(parse_size(args.size), seed=args.seed)
+        for table, count in counts.items():
+            print(f'{table:<24} {count:>12}')
+        print(f'Seeded in {time.perf_counter() - started:.1f}s.')
+        return 0
+
+    if args.command == 'serialize':
+        from benchmarks.serialization import measure
+
+        print(f'{"list":<12} {"rows":>6} {"serializer µs/row":>18} {"fast µs/row":>12} {"speedup":>8}')
+        for name, result in measure(rows=args.rows, repeat=args.repeat).items():
+            print(
+                f'{name:<12} {result["rows"]:>6} {result["serializer_us"]:>18.1f} '
+                f'{result["fast_us"]:>12.1f} {result["speedup"]:>7.1f}x'
+            )
+        return 0
+
+    if args.command == 'payload':
+        from benchmarks.serialization import measure_payloads
+
+        for name, result in measure_payloads(rows=args.rows, repeat=args.repeat).items():
+            print(f'{name} ({result["rows"]} rows)')
+            print(f'  bytes   json {result["json_bytes"]:>9}  gzip {result["gzip_bytes"]:>8}  br {result["br_bytes"]:>8}')
+            print(
+                f'  cpu ms  JSONRenderer {result["json_renderer_ms"]:.2f}  ORJSONRenderer {result["orjson_renderer_ms"]:.2f}'
+                f'  gzip {result["gzip_ms"]:.2f}  br {result["br_ms"]:.2f}'
+            )
+        return 0
+
+    if args.command == 'concurrency':
+        from benchmarks.concurrency import measure
+        from benchmarks.runner import BenchmarkError
+
+        try:
+            results = measure(
+                deployments=args.only.split(',') if args.only else None,
+                clients=args.clients,
+                workers=args.workers,
+                duration=args.duration,
+                warmup=args.warmup,
+                seed=args.seed,
+            )
+        except BenchmarkError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        print(f'{"deployment":<10} {"req/s":>8} {"p50 ms":>8} {"p95 ms":>8} {"errors":>7} {"idle MiB":>9} {"peak MiB":>9} {"KiB/conn":>9}')
+        for name, result in results.items():
+            print(
+                f'{name:<10} {result["throughput_rps"]:>8.1f} {result["p50_ms"]:>8.1f} {result["p95_ms"]:>8.1f} '
+                f'{result["errors"]:>7} {result["idle_rss_kb"] / 1024:>9.1f} {result["peak_rss_kb"] / 1024:>9.1f} '
+                f'{result["kb_per_connection"]:>9.1f}'
+            )
+        return 0
+
+    from benchmarks.runner import BenchmarkError, run_benchmark
+
+    try:
+        result = run_benchmark(
+            base_url=args.url,
+            users=args.users,
+            duration=args.duration,
+            warmup=args.warmup,
+            seed=args.seed,
+            only=args.only.split(',') if args.only else None,
+        )
+    except BenchmarkError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Throughput and memory per connection at high concurrency, WSGI vs ASGI.
+
+``measure`` serves the project under gunicorn once per entry of
+``DEPLOYMENTS``: sync workers on ``config.wsgi`` as deployed today (``wsgi``),
+uvicorn workers on ``config.asgi`` with ``ASYNC_READS_ENABLED`` (``asgi``),
+and the same workers running every view on a thread (``asgi-sync``).
+``clients`` keep-alive connections then issue the deadline and case list
+and detail GETs, weighted as in ``benchmarks.scenarios``. The result holds
+requests per second, latency, and the servers' resident memory twice: once
+after a few warm-up clients stop, once at its peak under load. The
+difference divided by ``clients`` is the memory one concurrent connection
+costs. Memory is read from ``/proc``, so this runs on Linux only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from django.conf import settings
+from rest_framework.authtoken.models import Token
+
+from benchmarks.datasets import BENCHMARK_EMAIL
+from benchmarks.runner import BenchmarkError
+from benchmarks.scenarios import API_PREFIX, Context, build_tasks, sample_ids
+from benchmarks.stats import summarize
+
+
+READ_TASKS = ('deadlines:list', 'deadlines:retrieve', 'cases:list', 'cases:retrieve')
+# name: (application, gunicorn worker class, ASYNC_READS_ENABLED)
+DEPLOYMENTS = {
+    'wsgi': ('config.wsgi:application', 'sync', False),
+    'asgi': ('config.asgi:application', 'uvicorn_worker.UvicornWorker', True),
+    'asgi-sync': ('config.asgi:application', 'uvicorn_worker.UvicornWorker', False),
+}
+WARMUP_CLIENTS = 4
+STARTUP_SECONDS = 30.0
+MEMORY_SAMPLE_SECONDS = 0.25
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def _process_tree(root: int) -> list[int]:
+    parents = {}
+    for entry in Path('/proc').iterdir():
+        if entry.name.isdigit():
+            try:
+                # The command name in field 2 may contain spaces; the parent pid follows its closing parenthesis.
+                parents[int(entry.name)] = int((entry / 'stat').read_text().rpartition(')')[2].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    tree, frontier = [root], [root]
+    while frontier:
+        frontier = [pid for pid, parent in parents.items() if parent in frontier]
+        tree.extend(frontier)
+    return tree
+
+
+def resident_kb(root: int) -> int:
+    """Resident memory of ``root`` and all its descendants, in KiB."""
+
+    total = 0
+    for pid in _process_tree(root):
+        try:
+            status = Path(f'/proc/{pid}/status').read_text()
+        except OSError:
+            continue
+        for line in status.splitlines():
+            if line.startswith('VmRSS:'):
+                total += int(line.split()[1])
+    return total
+
+
+@contextmanager
+def serve(deployment: str, workers: int) -> Iterator[tuple[subprocess.Popen, int]]:
+    """Run gunicorn for ``deployment`` on a free port until the block exits."""
+
+    application, worker_class, async_reads = DEPLOYMENTS[deployment]
+    port = _free_port()
+    env = {
+        **os.environ,
+        'DJANGO_SETTINGS_MODULE': 'benchmarks.settings',
+        'ASYNC_READS_ENABLED': str(async_reads),
+        'PROMETHEUS_MULTIPROC_DIR': tempfile.mkdtemp(prefix='benchmark-prometheus-'),
+    }
+    command = [
+        sys.executable, '-m', 'gunicorn', '-c', 'config/gunicorn.py', application,
+        '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--worker-class', worker_class,
+        '--timeout', '300', '--backlog', '2048',
+    ]
+    with tempfile.TemporaryFile() as log:
+        server = subprocess.Popen(command, cwd=settings.BASE_DIR, env=env, stdout=log, stderr=log)
+        try:
+            yield server, port
+        except (OSError, asyncio.IncompleteReadError) as exc:
+            log.seek(0)
+            raise BenchmarkError(f'{deployment} server failed: {exc}\n{log.read().decode(errors="replace")[-2000:]}')
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection, reopened whenever the server closes it."""
+
+    def __init__(self, port: int, token: str):
+        self.port = port
+        self.headers = (
+            f'Host: 127.0.0.1:{port}\r\nAuthorization: Token {token}\r\n'
+            'Accept: application/json\r\nAccept-Encoding: br, gzip\r\n\r\n'
+        ).encode()
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def get(self, path: str) -> int:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection('127.0.0.1', self.port)
+        self.writer.write(f'GET {path} HTTP/1.1\r\n'.encode() + self.headers)
+        await self.writer.drain()
+        lines = (await self.reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+        status = int(lines[0].split()[1])
+        fields = {name.strip().lower(): value.strip().lower() for name, _, value in (line.partition(':') for line in lines[1:] if line)}
+        if 'content-length' in fields:
+            await self.reader.readexactly(int(fields['content-length']))
+        elif fields.get('transfer-encoding') == 'chunked':
+            while size := int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16):
+                await self.reader.readexactly(size + 2)
+            await self.reader.readuntil(b'\r\n')
+        else:
+            await self.reader.read()
+            fields['connection'] = 'close'
+        if fields.get('connection') == 'close':
+            self.close()
+        return status
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def _wait_until_ready(server: subprocess.Popen, port: int, token: str) -> None:
+    deadline = time.monotonic() + STARTUP_SECONDS
+    while server.poll() is None and time.monotonic() < deadline:
+        connection = _Connection(port, token)
+        try:
+            if await connection.get(f'{API_PREFIX}/cases/') == 200:
+                return
+        except (OSError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            connection.close()
+        await asyncio.sleep(0.2)
+    raise OSError('it did not answer within the startup timeout')
+
+
+async def _drive(port: int, token: str, tasks, ids: dict, clients: int, duration: float, seed: int, server_pid: int) -> dict:
+    """Run ``clients`` connections for ``duration`` seconds; return the summary and the peak memory."""
+
+    latencies, statuses = [], []
+    cum_weights = list(itertools.accumulate(task.weight for task in tasks))
+    stop_at = time.perf_counter() + duration
+
+    async def client(index: int) -> None:
+        context = Context(ids=ids, rng=random.Random(seed + index))
+        connection = _Connection(port, token)
+        while time.perf_counter() < stop_at:
+            task = context.rng.choices(tasks, cum_weights=cum_weights)[0]
+            started = time.perf_counter()
+            try:
+                status = await connection.get(task.build(context).path)
+            except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+                connection.close()
+                status = 0
+            latencies.append(time.perf_counter() - started)
+            statuses.append(status)
+        connection.close()
+
+    peak = 0
+
+    async def sample_memory() -> None:
+        nonlocal peak
+        while time.perf_counter() < stop_at:
+            peak = max(peak, resident_kb(server_pid))
+            await asyncio.sleep(MEMORY_SAMPLE_SECONDS)
+
+    started = time.perf_counter()
+    await asyncio.gather(sample_memory(), *(client(index) for index in range(clients)))
+    summary = summarize(latencies, [], statuses, time.perf_counter() - started)
+    summary['peak_rss_kb'] = peak
+    return summary
+
+
+def measure(
+    deployments: Optional[list[str]] = None,
+    clients: int = 500,
+    workers: int = 2,
+    duration: float = 30.0,
+    warmup: float = 5.0,
+    seed: int = 0,
+) -> dict[str, dict]:
+    """Per deployment: throughput, latency and memory with ``clients`` concurrent connections."""
+
+    token = Token.objects.filter(user__email=BENCHMARK_EMAIL).values_list('key', flat=True).first()
+    if token is None:
+        raise BenchmarkError('No benchmark dataset found; run `python -m benchmarks seed` first.')
+    ids = sample_ids()
+    tasks = [task for task in build_tasks(ids) if task.name in READ_TASKS]
+    results = {}
+    for deployment in deployments or list(DEPLOYMENTS):
+        with serve(deployment, workers) as (server, port):
+            asyncio.run(_wait_until_ready(server, port, token))
+            asyncio.run(_drive(port, token, tasks, ids, WARMUP_CLIENTS, warmup, seed, server.pid))
+            time.sleep(1)
+            idle = resident_kb(server.pid)
+            result = asyncio.run(_drive(port, token, tasks, ids, clients, duration, seed, server.pid))
+        result['idle_rss_kb'] = idle
+        result['kb_per_connection'] = round(max(result['peak_rss_kb'] - idle, 0) / clients, 1)
+        results[deployment] = result
+    return results
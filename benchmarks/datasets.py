@@ -0,0 +1,40 @@
+"""Benchmark dataset tiers sized by deadline count.
+
+The rows come from ``court_rules.services.synthetic`` (also behind the
+``seed_synthetic`` management command) at about twenty deadlines per case,
+anchored on a fixed date so a dataset generated today matches one generated
+next month.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from court_rules.services import synthetic
+
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+DEADLINES_PER_CASE = 20
+BENCHMARK_EMAIL = synthetic.LOGIN_EMAIL
+EPOCH = date(2025, 6, 2)
+
+
+def parse_size(value: str) -> int:
+    """``'100k'`` or ``'250000'`` -> deadline count."""
+
+    value = value.strip().lower()
+    if value in SIZES:
+        return SIZES[value]
+    return int(value.replace('_', ''))
+
+
+def generate(deadlines: int, *, seed: int = 0, batch_size: int = synthetic.BATCH_SIZE) -> dict[str, int]:
+    """Insert a dataset with ``deadlines`` deadlines; returns row counts per table."""
+
+    return synthetic.generate(
+        cases=max(1, deadlines // DEADLINES_PER_CASE),
+        deadlines_per_case=DEADLINES_PER_CASE,
+        seed=seed,
+        anchor=EPOCH,
+        batch_size=batch_size,
+    )
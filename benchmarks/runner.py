@@ -0,0 +1,191 @@
+"""Closed-loop HTTP load generator.
+
+Each virtual user is a thread with its own keep-alive connection that picks
+weighted tasks back to back for the run's duration, in the style of Locust.
+Samples from a warm-up period are discarded.
+"""
+
+from __future__ import annotations
+
+import http.client
+import itertools
+import json
+import platform
+import random
+import re
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import Optional
+from urllib.parse import urlsplit
+
+import django
+from django.conf import settings
+from django.db import connection
+from rest_framework.authtoken.models import Token
+
+from benchmarks.datasets import BENCHMARK_EMAIL
+from benchmarks.scenarios import Context, Task, build_tasks, sample_ids
+from benchmarks.server import BenchmarkServer
+from benchmarks.stats import summarize
+from court_rules.models import Case, Deadline, DeadlineReminder, User
+
+
+# Written by court_rules.middleware.QueryInstrumentationMiddleware.
+SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries')
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+@dataclass
+class Sample:
+    task: str
+    latency: float
+    status: int
+    queries: Optional[int]
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, base_url: str, token: str, tasks: list[Task], ids: dict, seed: int, stop: threading.Event):
+        super().__init__(daemon=True)
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.headers = {'Authorization': f'Token {token}', 'Accept': 'application/json'}
+        self.tasks = tasks
+        self.cum_weights = list(itertools.accumulate(task.weight for task in tasks))
+        self.context = Context(ids=ids, rng=random.Random(seed))
+        self.stop = stop
+        self.samples: list[Sample] = []
+        self.recording = False
+
+    def run(self):
+        client = http.client.HTTPConnection(self.host, self.port, timeout=120)
+        rng = self.context.rng
+        while not self.stop.is_set():
+            task = rng.choices(self.tasks, cum_weights=self.cum_weights)[0]
+            request = task.build(self.context)
+            if request is None:
+                continue
+            headers = dict(self.headers)
+            if request.body is not None:
+                headers['Content-Type'] = request.content_type
+            started = time.perf_counter()
+            try:
+                client.request(request.method, request.path, body=request.body, headers=headers)
+                response = client.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                client.close()
+                status, queries, body = 0, None, b''
+            else:
+                status = response.status
+                timing = SERVER_TIMING_QUERIES.search(response.getheader('Server-Timing', ''))
+                queries = int(timing.group(1)) if timing else None
+            latency = time.perf_counter() - started
+            if self.recording:
+                self.samples.append(Sample(task.name, latency, status, queries))
+            if task.on_success and 200 <= status < 300:
+                task.on_success(self.context, json.loads(body))
+        client.close()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True, cwd=settings.BASE_DIR)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _summaries(samples: list[Sample], elapsed: float) -> tuple[dict, dict]:
+    by_task = defaultdict(list)
+    for sample in samples:
+        by_task[sample.task].append(sample)
+
+    def summary(group: list[Sample]) -> dict:
+        return summarize(
+            [sample.latency for sample in group],
+            [sample.queries for sample in group if sample.queries is not None],
+            [sample.status for sample in group],
+            elapsed,
+        )
+
+    endpoints = {name: summary(group) for name, group in sorted(by_task.items())}
+    return summary(samples), endpoints
+
+
+def run_benchmark(
+    *,
+    base_url: Optional[str] = None,
+    users: int = 4,
+    duration: float = 30.0,
+    warmup: float = 3.0,
+    seed: int = 0,
+    only: Optional[list[str]] = None,
+) -> dict:
+    """Drive the API with ``users`` concurrent virtual users and return the JSON-ready result.
+
+    Without ``base_url`` the project is served in-process. Queries per request
+    come from the ``Server-Timing`` header either way. ``only`` restricts the
+    run to the named tasks.
+    """
+
+    token = Token.objects.filter(user__email=BENCHMARK_EMAIL).values_list('key', flat=True).first()
+    if token is None:
+        raise BenchmarkError('No benchmark dataset found; run `python -m benchmarks seed` first.')
+    ids = sample_ids()
+    tasks = build_tasks(ids)
+    if only:
+        unknown = set(only) - {task.name for task in tasks}
+        if unknown:
+            raise BenchmarkError(f'Unknown tasks: {", ".join(sorted(unknown))}.')
+        tasks = [task for task in tasks if task.name in only]
+    dataset = {
+        'deadlines': Deadline.objects.count(),
+        'cases': Case.objects.count(),
+        'users': User.objects.count(),
+        'deadline_reminders': DeadlineReminder.objects.count(),
+    }
+
+    def drive(url: str) -> tuple[list[Sample], float]:
+        stop = threading.Event()
+        workers = [VirtualUser(url, token, tasks, ids, seed + index, stop) for index in range(users)]
+        for worker in workers:
+            worker.start()
+        time.sleep(warmup)
+        for worker in workers:
+            worker.recording = True
+        started = time.perf_counter()
+        time.sleep(duration)
+        stop.set()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+        return [sample for worker in workers for sample in worker.samples], elapsed
+
+    if base_url is None:
+        with BenchmarkServer() as server:
+            samples, elapsed = drive(server.url)
+    else:
+        samples, elapsed = drive(base_url.rstrip('/'))
+
+    total, endpoints = _summaries(samples, elapsed)
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'created_at': datetime.now(dt_timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'server': base_url or 'in-process',
+        },
+        'config': {'users': users, 'duration': duration, 'warmup': warmup, 'seed': seed, 'only': only},
+        'dataset': dataset,
+        'total': total,
+        'endpoints': endpoints,
+    }
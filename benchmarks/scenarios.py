@@ -0,0 +1,246 @@
+"""Requests the load generator sends, derived from the /api/v1 router.
+
+Every registered viewset gets a ``<prefix>:list`` and ``<prefix>:retrieve``
+task when it supports them; mutations and the heavier detail actions are
+listed explicitly in ``MUTATIONS`` and ``ACTIONS``. ``uncovered_routes``
+reports router methods with no task, so a new endpoint cannot silently
+drop out of the benchmark.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.utils import timezone
+
+from court_rules.api.v1.urls import router
+
+
+API_PREFIX = '/api/v1'
+SAMPLE_SIZE = 500
+LIST_PAGES = 10
+# Relative frequencies, roughly what the frontend issues.
+DEFAULT_WEIGHT = 2
+WEIGHTS = {
+    'deadlines:list': 12,
+    'deadlines:retrieve': 8,
+    'deadlines:create': 3,
+    'deadlines:partial_update': 3,
+    'cases:list': 6,
+    'cases:retrieve': 4,
+    'deadline-reminders:list': 4,
+    'deadline-reminders:create': 2,
+    'deadline-reminders:destroy': 2,
+}
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    body: Optional[bytes] = None
+    content_type: str = 'application/json'
+
+
+@dataclass
+class Context:
+    """Sample primary keys per router prefix plus per-user state for chained mutations."""
+
+    ids: dict[str, list[Any]]
+    rng: random.Random
+    created_reminders: list[str] = field(default_factory=list)
+
+    def pick(self, prefix: str) -> Any:
+        return self.rng.choice(self.ids[prefix])
+
+
+@dataclass
+class Task:
+    name: str
+    build: Callable[[Context], Optional[Request]]
+    weight: int = DEFAULT_WEIGHT
+    # Called with the decoded JSON body of a successful response.
+    on_success: Optional[Callable[[Context, Any], None]] = None
+
+
+def _json(method: str, path: str, payload: dict) -> Request:
+    return Request(method, path, json.dumps(payload, default=str).encode())
+
+
+def _future(ctx: Context, days: int = 90) -> str:
+    return (timezone.now() + timedelta(days=ctx.rng.randint(1, days))).isoformat()
+
+
+def _multipart(fields: dict[str, str], filename: str, content: bytes) -> Request:
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        'Content-Type: application/pdf\r\n\r\n'.encode()
+        + content
+        + b'\r\n'
+    )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return Request('POST', f'{API_PREFIX}/documents/', b''.join(parts), f'multipart/form-data; boundary={boundary}')
+
+
+def _create_deadline(ctx: Context) -> Request:
+    return _json(
+        'POST',
+        f'{API_PREFIX}/deadlines/',
+        {
+            'case': ctx.pick('cases'),
+            'trigger_type': 'user',
+            'basis': 'calendar_days',
+            'due_at': _future(ctx),
+            'timezone': 'America/Chicago',
+            'priority': ctx.rng.randint(1, 5),
+            'computation_rationale': 'Benchmark deadline.',
+        },
+    )
+
+
+def _update_deadline(ctx: Context) -> Request:
+    return _json('PATCH', f'{API_PREFIX}/deadlines/{ctx.pick("deadlines")}/', {'priority': ctx.rng.randint(1, 5)})
+
+
+def _create_reminder(ctx: Context) -> Request:
+    return _json(
+        'POST',
+        f'{API_PREFIX}/deadline-reminders/',
+        {'deadline': ctx.pick('deadlines'), 'notify_at': _future(ctx, 30), 'channel': 'email'},
+    )
+
+
+def _remember_reminder(ctx: Context, body: Any) -> None:
+    ctx.created_reminders.append(body['id'])
+
+
+def _destroy_reminder(ctx: Context) -> Optional[Request]:
+    if not ctx.created_reminders:
+        return None
+    return Request('DELETE', f'{API_PREFIX}/deadline-reminders/{ctx.created_reminders.pop()}/')
+
+
+def _conflict_check(ctx: Context) -> Request:
+    names = [f'{ctx.rng.choice(["Avery", "Jordan", "Quinn"])} {ctx.rng.choice(["Smith", "Patel", "Kim"])}' for _ in range(5)]
+    return _json('POST', f'{API_PREFIX}/contacts/conflict-check/', {'names': names})
+
+
+def _upload_document(ctx: Context) -> Request:
+    # A small pool of distinct files, so most uploads exercise deduplication.
+    content = b'%PDF-1.4 benchmark exhibit ' + str(ctx.rng.randrange(20)).encode() * 4096
+    return _multipart({'case': str(ctx.pick('cases')), 'title': 'Benchmark exhibit'}, 'exhibit.pdf', content)
+
+
+def _hearing_conflicts(ctx: Context) -> Request:
+    starts_at = timezone.now() + timedelta(days=ctx.rng.randint(1, 60), hours=ctx.rng.randint(0, 8))
+    query = urlencode({'starts_at': starts_at.isoformat(), 'ends_at': (starts_at + timedelta(hours=1)).isoformat(), 'case': ctx.pick('cases')})
+    return Request('GET', f'{API_PREFIX}/hearings/conflicts/?{query}')
+
+
+def _free_slots(ctx: Context) -> Request:
+    start = timezone.now() + timedelta(days=ctx.rng.randint(1, 30))
+    query = urlencode({'judge': ctx.pick('judges'), 'start': start.isoformat(), 'end': (start + timedelta(days=14)).isoformat()})
+    return Request('GET', f'{API_PREFIX}/hearings/free-slots/?{query}')
+
+
+def _detail(prefix: str, suffix: str) -> Callable[[Context], Request]:
+    return lambda ctx: Request('GET', f'{API_PREFIX}/{prefix}/{ctx.pick(prefix)}/{suffix}')
+
+
+# name: (build, on_success, prefixes whose sample ids the request needs)
+MUTATIONS = {
+    'deadlines:create': (_create_deadline, None, ('cases',)),
+    'deadlines:partial_update': (_update_deadline, None, ('deadlines',)),
+    'deadline-reminders:create': (_create_reminder, _remember_reminder, ('deadlines',)),
+    'deadline-reminders:destroy': (_destroy_reminder, None, ('deadlines',)),
+    'contacts:conflict_check': (_conflict_check, None, ()),
+    'documents:create': (_upload_document, None, ('cases',)),
+}
+
+ACTIONS = {
+    'judges:profile': (_detail('judges', 'profile/'), ('judges',)),
+    'rules:related': (_detail('rules', 'related/?depth=2'), ('rules',)),
+    'deadlines:history': (_detail('deadlines', 'history/'), ('deadlines',)),
+    'hearings:conflicts': (_hearing_conflicts, ('cases',)),
+    'hearings:free_slots': (_free_slots, ('judges',)),
+    'filings:service_list': (_detail('filings', 'service-list/'), ('filings',)),
+    'filings:package': (_detail('filings', 'package/'), ('filings',)),
+}
+
+# Not benchmarked: writes that need fixtures the synthetic data lacks, and
+# ``history`` on the other entities, which shares ``deadlines:history``'s code path.
+SKIPPED = {
+    'cases:apply_template',
+    'hearings:follow_ups',
+    'documents:content',
+    'judges:history',
+    'cases:history',
+    'rules:history',
+}
+
+
+def sample_ids(limit: int = SAMPLE_SIZE) -> dict[str, list[Any]]:
+    ids = {}
+    for prefix, viewset, _ in router.registry:
+        model = viewset.queryset.model
+        ids[prefix] = [str(pk) for pk in model.objects.order_by().values_list('pk', flat=True)[:limit]]
+    return ids
+
+
+def _list(prefix: str, rows: int) -> Callable[[Context], Request]:
+    pages = min(LIST_PAGES, max(1, math.ceil(rows / settings.REST_FRAMEWORK['PAGE_SIZE'])))
+    return lambda ctx: Request('GET', f'{API_PREFIX}/{prefix}/?page={ctx.rng.randint(1, pages)}')
+
+
+def _retrieve(prefix: str) -> Callable[[Context], Request]:
+    return lambda ctx: Request('GET', f'{API_PREFIX}/{prefix}/{ctx.pick(prefix)}/')
+
+
+def build_tasks(ids: dict[str, list[Any]]) -> list[Task]:
+    """Tasks for every router route whose requests can be addressed with the sampled rows."""
+
+    tasks = []
+    for prefix, viewset, _ in router.registry:
+        if hasattr(viewset, 'list'):
+            tasks.append(Task(f'{prefix}:list', _list(prefix, len(ids.get(prefix, ())))))
+        if hasattr(viewset, 'retrieve') and ids.get(prefix):
+            tasks.append(Task(f'{prefix}:retrieve', _retrieve(prefix)))
+    for name, (build, on_success, needs) in MUTATIONS.items():
+        if all(ids.get(prefix) for prefix in needs):
+            tasks.append(Task(name, build, on_success=on_success))
+    for name, (build, needs) in ACTIONS.items():
+        if all(ids.get(prefix) for prefix in needs):
+            tasks.append(Task(name, build))
+    for task in tasks:
+        task.weight = WEIGHTS.get(task.name, DEFAULT_WEIGHT)
+    return tasks
+
+
+def uncovered_routes() -> list[str]:
+    """Router methods that neither have a task nor are deliberately skipped."""
+
+    covered = set(MUTATIONS) | set(ACTIONS) | SKIPPED
+    missing = []
+    for prefix, viewset, _ in router.registry:
+        # PUT is not routed anywhere, so ``update`` is covered by ``partial_update``.
+        for method in ('create', 'partial_update', 'destroy'):
+            name = f'{prefix}:{method}'
+            if hasattr(viewset, method) and name not in covered:
+                missing.append(name)
+        for extra in viewset.get_extra_actions():
+            name = f'{prefix}:{extra.__name__}'
+            if name not in covered:
+                missing.append(name)
+    return missing
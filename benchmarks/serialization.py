@@ -0,0 +1,100 @@
+"""CPU spent turning list rows into response bytes.
+
+``measure`` compares the fast list path with the DRF serializers it
+replaces: model instances through the serializer and ``JSONRenderer``,
+against ``values_list`` tuples through ``RowPlan.render`` and
+``ORJSONRenderer``. ``measure_payloads`` takes one page of serialized data
+and compares the two renderers and the two content encodings by size and CPU.
+Rows are fetched once up front, so no database time is counted.
+"""
+
+from __future__ import annotations
+
+import time
+
+import brotli
+from django.conf import settings
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from court_rules.api.v1.renderers import ORJSONRenderer
+from court_rules.api.v1.viewsets import AuditLogViewSet, CaseViewSet, DeadlineViewSet, FastListMixin, RuleViewSet
+from court_rules.middleware import GZIP_MAX_RANDOM_BYTES
+
+
+VIEWSETS = {'deadlines': DeadlineViewSet, 'cases': CaseViewSet, 'rules': RuleViewSet}
+PAYLOAD_VIEWSETS = {'deadlines': DeadlineViewSet, 'audit-log': AuditLogViewSet}
+
+
+def _list_queryset(viewset):
+    """The queryset ``viewset`` lists, annotations included."""
+
+    view = viewset(action_map={'get': 'list'}, args=(), kwargs={}, format_kwarg=None)
+    view.request = view.initialize_request(APIRequestFactory().get('/'))
+    return view.get_queryset()
+
+
+def _cpu(work, repeat: int) -> float:
+    """Best-of-``repeat`` CPU seconds for one call of ``work``."""
+
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.process_time()
+        work()
+        best = min(best, time.process_time() - started)
+    return best
+
+
+def _cpu_per_row(render, rows: int, repeat: int) -> float:
+    return _cpu(render, repeat) / rows * 1e6
+
+
+def measure(rows: int = 1000, repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Best-of-``repeat`` CPU microseconds per row for each list, serializer vs fast path."""
+
+    results = {}
+    for name, viewset in VIEWSETS.items():
+        serializer_class = viewset.serializer_class
+        plan = serializer_class.row_plan()
+        queryset = _list_queryset(viewset)
+        instances = list(queryset[:rows])
+        tuples = list(queryset.values_list(*plan.paths)[:rows])
+        count = len(instances)
+        if not count:
+            continue
+        serializer = _cpu_per_row(
+            lambda: JSONRenderer().render(serializer_class(instances, many=True).data), count, repeat
+        )
+        fast = _cpu_per_row(lambda: ORJSONRenderer().render(plan.render(tuples)), count, repeat)
+        results[name] = {'rows': count, 'serializer_us': serializer, 'fast_us': fast, 'speedup': serializer / fast}
+    return results
+
+
+def measure_payloads(rows: int = 500, repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Bytes and CPU milliseconds to render and compress one ``rows``-row page of each list."""
+
+    results = {}
+    for name, viewset in PAYLOAD_VIEWSETS.items():
+        queryset = _list_queryset(viewset)
+        serializer_class = viewset.serializer_class
+        if issubclass(viewset, FastListMixin):
+            plan = serializer_class.row_plan()
+            data = plan.render(queryset.values_list(*plan.paths)[:rows])
+        else:
+            data = serializer_class(queryset[:rows], many=True).data
+        if not data:
+            continue
+        body = ORJSONRenderer().render(data)
+        quality = settings.COMPRESSION_BROTLI_QUALITY
+        results[name] = {
+            'rows': len(data),
+            'json_bytes': len(body),
+            'gzip_bytes': len(compress_string(body, max_random_bytes=GZIP_MAX_RANDOM_BYTES)),
+            'br_bytes': len(brotli.compress(body, quality=quality)),
+            'json_renderer_ms': _cpu(lambda: JSONRenderer().render(data), repeat) * 1000,
+            'orjson_renderer_ms': _cpu(lambda: ORJSONRenderer().render(data), repeat) * 1000,
+            'gzip_ms': _cpu(lambda: compress_string(body, max_random_bytes=GZIP_MAX_RANDOM_BYTES), repeat) * 1000,
+            'br_ms': _cpu(lambda: brotli.compress(body, quality=quality), repeat) * 1000,
+        }
+    return results
@@ -0,0 +1,50 @@
+"""Settings for benchmark runs: production-like, against a separate database.
+
+SQLite by default (``BENCHMARK_DB_PATH``); set ``POSTGRES_DB`` (and the usual
+``POSTGRES_*`` variables) to benchmark against Postgres instead.
+"""
+
+import os
+
+from config.settings.base import *  # noqa: F403,F401
+
+DEBUG = False
+
+SECRET_KEY = 'benchmark-only'
+
+ALLOWED_HOSTS = ['*']
+
+if os.getenv('POSTGRES_DB'):
+    DATABASES = {  # noqa: F405
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ['POSTGRES_DB'],
+            'USER': os.getenv('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.getenv('POSTGRES_PASSWORD', ''),
+            'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+            'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        }
+    }
+else:
+    DATABASES = {  # noqa: F405
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv('BENCHMARK_DB_PATH', str(BASE_DIR / 'benchmarks' / 'data' / 'benchmark.sqlite3')),  # noqa: F405
+            # Concurrent virtual users write through one SQLite file.
+            'OPTIONS': {'timeout': 30},
+        }
+    }
+
+BLOB_STORE_OPTIONS = {'root': BASE_DIR / 'benchmarks' / 'data' / 'blobs'}  # noqa: F405
+
+# Toggle instrumentation, caching and async reads to measure their effect (see benchmarks/README.md).
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+REFERENCE_CACHE_ENABLED = os.getenv('REFERENCE_CACHE_ENABLED', 'True') == 'True'
+ASYNC_READS_ENABLED = os.getenv('ASYNC_READS_ENABLED', 'False') == 'True'
+
+# Production caches in Redis; set REDIS_URL to do the same. The local-memory stand-in gets room for
+# the reference cache's working set, which its default of 300 entries would keep evicting.
+if os.getenv('REDIS_URL'):
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': os.environ['REDIS_URL']}}
+else:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'OPTIONS': {'MAX_ENTRIES': 100_000}}}
@@ -0,0 +1,67 @@
+"""Latency summaries for benchmark results, and comparison of two runs."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Optional, Sequence
+
+
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+# Latency changes smaller than this are noise on a shared machine.
+MIN_REGRESSION_MS = 1.0
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values (``fraction`` in 0..1)."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: Sequence[float], queries: Sequence[int], statuses: Sequence[int], elapsed: float) -> dict:
+    """Summarize one endpoint's samples; latencies are in seconds, output in milliseconds.
+
+    Status 0 stands for a request that failed without a response.
+    """
+
+    ordered = sorted(latencies)
+    count = len(ordered)
+    query_mean: Optional[float] = round(sum(queries) / len(queries), 2) if queries else None
+    return {
+        'requests': count,
+        'errors': sum(1 for status in statuses if not 200 <= status < 400),
+        'statuses': {str(status): count for status, count in sorted(Counter(statuses).items())},
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 2),
+        'mean_ms': round(sum(ordered) / count * 1000, 2) if count else 0.0,
+        'max_ms': round(ordered[-1] * 1000, 2) if count else 0.0,
+        'queries_per_request': query_mean,
+        'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def compare(baseline: dict, candidate: dict, threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> tuple[list[str], list[str]]:
+    """Return report lines and the endpoints whose p95 latency or query count regressed."""
+
+    lines = [f'{"endpoint":<32} {"p95 ms":>18} {"change":>8} {"queries":>14}']
+    regressions = []
+    for name in sorted(set(baseline['endpoints']) & set(candidate['endpoints'])):
+        before, after = baseline['endpoints'][name], candidate['endpoints'][name]
+        change = (after['p95_ms'] - before['p95_ms']) / before['p95_ms'] if before['p95_ms'] else 0.0
+        queries_before, queries_after = before.get('queries_per_request'), after.get('queries_per_request')
+        slower = change > threshold and after['p95_ms'] - before['p95_ms'] > MIN_REGRESSION_MS
+        more_queries = queries_before is not None and queries_after is not None and queries_after > queries_before + 0.5
+        flag = ' !' if slower or more_queries else ''
+        if flag:
+            regressions.append(name)
+        lines.append(
+            f'{name:<32} {before["p95_ms"]:>8.1f} -> {after["p95_ms"]:>6.1f} {change:>+8.0%} '
+            f'{queries_before if queries_before is not None else "-":>5} -> {queries_after if queries_after is not None else "-":<5}{flag}'
+        )
+    for name in sorted(set(baseline['endpoints']) ^ set(candidate['endpoints'])):
+        lines.append(f'{name:<32} only in {"baseline" if name in baseline["endpoints"] else "candidate"}')
+    return lines, regressions
@@ -0,0 +1,27 @@
+"""Gunicorn hooks: ``gunicorn -c config/gunicorn.py config.wsgi:application``.
+
+The same file serves the ASGI deployment:
+``gunicorn -c config/gunicorn.py config.asgi:application -k uvicorn_worker.UvicornWorker``.
+
+Prometheus multiprocess mode keeps one sample file per worker in
+``PROMETHEUS_MULTIPROC_DIR``. The directory is emptied when the master
+starts, and a dead worker's files are marked so its live gauges stop
+counting; counters and histograms keep the worker's totals.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+_multiproc_dir = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus-multiproc')
+
+
+def on_starting(server):
+    shutil.rmtree(_multiproc_dir, ignore_errors=True)
+    Path(_multiproc_dir).mkdir(parents=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -31,6 +31,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'court_rules.middleware.PrometheusMetricsMiddleware',
+    'court_rules.middleware.QueryInstrumentationMiddleware',
+    'court_rules.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -122,6 +125,10 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'court_rules.api.v1.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 25,
 }
@@ -132,3 +139,68 @@ CORS_ALLOWED_ORIGINS = [
     'http://127.0.0.1:5173',
 ]
 
+# Number of audit entries per entity between full snapshots; the rest store only changed keys.
+AUDIT_CHECKPOINT_INTERVAL = 20
+
+# Months of audit history kept in Postgres before partitions are archived to AUDIT_ARCHIVE_DIR.
+AUDIT_RETENTION_MONTHS = 84
+AUDIT_ARCHIVE_DIR = BASE_DIR / 'archives' / 'audit_log'
+
+# Stored document files (Document.metadata['storage_path'] is relative to this directory).
+DOCUMENT_STORAGE_DIR = BASE_DIR / 'storage' / 'documents'
+
+# Content-addressed blob store for uploaded documents (see court_rules.services.blobs).
+BLOB_STORE_BACKEND = 'court_rules.services.blobs.FileSystemBlobBackend'
+BLOB_STORE_OPTIONS = {'root': BASE_DIR / 'storage' / 'blobs'}
+# Unreferenced blobs are kept this long before garbage collection deletes them.
+BLOB_GC_GRACE_HOURS = 24
+
+# Per-request SQL counts and time in the Server-Timing header and the court_rules.sql log
+# (see court_rules.middleware). False removes the middleware from the stack.
+QUERY_INSTRUMENTATION = True
+# Requests at least this slow log their full query list, for this fraction of them.
+QUERY_SLOW_REQUEST_MS = 500
+QUERY_SLOW_SAMPLE_RATE = 1.0
+# One statement repeated this many times within a request is logged as a likely N+1.
+QUERY_DUPLICATE_THRESHOLD = 10
+
+# Prometheus request metrics served at /metrics (see court_rules.metrics). When METRICS_BEARER_TOKEN
+# is set, scrapes must send it as "Authorization: Bearer <token>"; without one, /metrics is a 404
+# unless METRICS_PUBLIC is True.
+METRICS_ENABLED = True
+METRICS_BEARER_TOKEN = None
+METRICS_PUBLIC = True
+
+# Brotli or gzip response bodies, by the client's Accept-Encoding (see court_rules.middleware).
+# Smaller bodies are sent as is; quality 0-11 trades brotli CPU for size.
+COMPRESSION_ENABLED = True
+COMPRESSION_MIN_BYTES = 1024
+COMPRESSION_BROTLI_QUALITY = 4
+
+# Rules and judges responses shared across users in the cache, per version of the models they read
+# (see court_rules.services.reference_cache). Admins bypass it with "Cache-Control: no-cache".
+REFERENCE_CACHE_ENABLED = True
+REFERENCE_CACHE_TIMEOUT = 60 * 60 * 24
+# A worker filling a missing entry holds its lock this long at most; others wait this long for it.
+REFERENCE_CACHE_LOCK_SECONDS = 10
+REFERENCE_CACHE_WAIT_SECONDS = 2.0
+
+# Serve deadline and case list/detail GETs from async views (court_rules.api.v1.async_views). Enable
+# only when serving config.asgi; under WSGI every request to an async view starts its own event loop.
+ASYNC_READS_ENABLED = False
+# Async reads per worker that may hold a database connection at once; the rest wait on the event loop.
+ASYNC_READS_CONCURRENCY = 8
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'require_debug_true': {'()': 'django.utils.log.RequireDebugTrue'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'filters': ['require_debug_true']},
+    },
+    'loggers': {
+        'court_rules.sql': {'handlers': ['console'], 'level': 'INFO'},
+    },
+}
@@ -23,6 +23,17 @@ DATABASES = {  # noqa: F405
     }
 }
 
+# Under ASGI each request runs its queries on a thread of its own, so persistent connections would
+# be opened per request and never reused; share a psycopg pool across the worker instead.
+if os.getenv('POSTGRES_POOL', 'False') == 'True':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv('POSTGRES_POOL_MIN_SIZE', '2')),
+            'max_size': int(os.getenv('POSTGRES_POOL_MAX_SIZE', '10')),
+        }
+    }
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
@@ -32,6 +43,24 @@ CACHES = {
 
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 
+QUERY_INSTRUMENTATION = os.getenv('QUERY_INSTRUMENTATION', 'True') == 'True'
+QUERY_SLOW_REQUEST_MS = int(os.getenv('QUERY_SLOW_REQUEST_MS', '500'))
+QUERY_SLOW_SAMPLE_RATE = float(os.getenv('QUERY_SLOW_SAMPLE_RATE', '0.1'))
+
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+METRICS_BEARER_TOKEN = os.getenv('METRICS_BEARER_TOKEN') or None
+METRICS_PUBLIC = os.getenv('METRICS_PUBLIC', 'False') == 'True'
+
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True') == 'True'
+COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', '1024'))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))
+
+REFERENCE_CACHE_ENABLED = os.getenv('REFERENCE_CACHE_ENABLED', 'True') == 'True'
+REFERENCE_CACHE_TIMEOUT = int(os.getenv('REFERENCE_CACHE_TIMEOUT', str(60 * 60 * 24)))
+
+ASYNC_READS_ENABLED = os.getenv('ASYNC_READS_ENABLED', 'False') == 'True'
+ASYNC_READS_CONCURRENCY = int(os.getenv('ASYNC_READS_CONCURRENCY', '8'))
+
 CSRF_TRUSTED_ORIGINS = [origin.strip() for origin in os.getenv('CSRF_TRUSTED_ORIGINS', '').split(',') if origin.strip()]
 
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
@@ -4,9 +4,12 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
+from court_rules.views import metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/', include('court_rules.api.v1.urls')),
+    path('metrics', metrics, name='metrics'),
 ]
 
 if settings.DEBUG:
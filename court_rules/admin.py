@@ -116,7 +116,15 @@ class DeadlineAdmin(admin.ModelAdmin):
 class DocumentAdmin(admin.ModelAdmin):
     list_display = ("title", "case", "source", "uploaded_at", "ocr_status")
     list_filter = ("source", "ocr_status")
-    search_fields = ("title", "case__caption")
+    search_fields = ("title", "case__caption", "file_hash")
+    raw_id_fields = ("blob",)
+
+
+@admin.register(models.Blob)
+class BlobAdmin(admin.ModelAdmin):
+    list_display = ("sha256", "size", "ref_count", "created_at", "released_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("sha256", "size", "ref_count", "created_at", "released_at")
 
 
 @admin.register(models.Rule)
@@ -145,6 +153,7 @@ admin.site.register(models.ContactAddress)
 admin.site.register(models.RuleCrossRef)
 admin.site.register(models.DeadlineReminder)
 admin.site.register(models.DeadlineDependency)
+admin.site.register(models.DeadlineTemplate)
 admin.site.register(models.DocketEntry)
 admin.site.register(models.Filing)
 admin.site.register(models.FilingExhibit)
@@ -0,0 +1,192 @@
+"""Async ``list`` and ``retrieve`` for the read-heavy endpoints, for ASGI deployments.
+
+``async_read_patterns`` wraps the router's own list and detail routes for
+the given basenames in ``async_read_view``. A GET is then served on the
+event loop. The viewset still negotiates the renderer, authenticates,
+checks permissions, filters and paginates. Its queries go through Django's
+async ORM, and its rows are rendered through the serializer's ``RowPlan``,
+as ``FastListMixin`` does. Django runs each query on the request's worker
+thread, so a request holds a thread only while a query is in flight,
+instead of for the whole request as a WSGI worker does.
+
+Writes, the browsable API, and viewsets with ``fast_list = False`` or
+another pagination class go to the router's sync view on a thread, as under
+WSGI. DRF's authenticators also run unchanged on the request's thread, so
+token, session and JWT authentication behave as on the sync path.
+
+Django gives every in-flight request a thread and a database connection of
+its own. At most ``ASYNC_READS_CONCURRENCY`` requests per worker run their
+queries at once, and the rest wait on the event loop before opening a
+connection. Hundreds of slow clients then cost neither hundreds of database
+connections nor the memory that goes with them.
+
+The routes are installed only with ``ASYNC_READS_ENABLED``. Under WSGI,
+Django would have to start an event loop for every request to an async view.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable, Optional
+from weakref import WeakKeyDictionary
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponse
+from django.urls import URLPattern
+from django.views.decorators.csrf import csrf_exempt
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from court_rules.api.v1.viewsets import FastListMixin
+
+
+ASYNC_ACTIONS = ('list', 'retrieve')
+
+_query_slots: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
+
+def query_slots() -> asyncio.Semaphore:
+    """The running event loop's limit on requests querying at once."""
+
+    loop = asyncio.get_running_loop()
+    if loop not in _query_slots:
+        _query_slots[loop] = asyncio.Semaphore(settings.ASYNC_READS_CONCURRENCY)
+    return _query_slots[loop]
+
+
+def _filters_query(view, queryset) -> bool:
+    """Whether ``view.filter_queryset`` may read the database, e.g. to look up the case named by ``?case=``."""
+
+    params = view.request.query_params.keys()
+    for backend in view.filter_backends:
+        if not issubclass(backend, DjangoFilterBackend):
+            return True
+        filterset_class = backend().get_filterset_class(view, queryset)
+        if filterset_class is not None and filterset_class.base_filters.keys() & params:
+            return True
+    return False
+
+
+async def _filter_queryset(view, queryset):
+    if _filters_query(view, queryset):
+        return await sync_to_async(view.filter_queryset)(queryset)
+    return view.filter_queryset(queryset)
+
+
+async def _paginate_queryset(pagination: PageNumberPagination, queryset, request) -> Optional[list]:
+    """``PageNumberPagination.paginate_queryset`` with the count and the page read through the async ORM."""
+
+    pagination.request = request
+    page_size = pagination.get_page_size(request)
+    if not page_size:
+        return None
+    paginator = pagination.django_paginator_class(queryset, page_size)
+    paginator.count = await queryset.acount()
+    page_number = pagination.get_page_number(request, paginator)
+    try:
+        page = paginator.page(page_number)
+    except InvalidPage as exc:
+        raise NotFound(pagination.invalid_page_message.format(page_number=page_number, message=str(exc)))
+    page.object_list = [row async for row in page.object_list]
+    pagination.page = page
+    return page.object_list
+
+
+async def _list(view, request) -> Response:
+    plan = view.get_serializer_class().row_plan(view.get_sparse_fields())
+    queryset = (await _filter_queryset(view, view.get_queryset())).values_list(*plan.paths)
+    page = None if view.paginator is None else await _paginate_queryset(view.paginator, queryset, request)
+    if page is None:
+        return Response(plan.render([row async for row in queryset]))
+    return view.get_paginated_response(plan.render(page))
+
+
+async def _retrieve(view, request) -> Response:
+    plan = view.get_serializer_class().row_plan(view.get_sparse_fields())
+    queryset = (await _filter_queryset(view, view.get_queryset())).values_list(*plan.paths)
+    lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+    try:
+        row = await queryset.aget(**{view.lookup_field: view.kwargs[lookup_url_kwarg]})
+    except (TypeError, ValueError, DjangoValidationError):
+        raise Http404
+    except ObjectDoesNotExist:
+        # The message DRF's get_object_or_404 gives.
+        raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+    return Response(plan.render([row])[0])
+
+
+def _serves_async(view) -> bool:
+    return view.fast_list and (view.paginator is None or isinstance(view.paginator, PageNumberPagination))
+
+
+async def _respond(view, request, action: str) -> Optional[HttpResponse]:
+    """The response for ``action``, or ``None`` when it should go to the sync view."""
+
+    request = view.initialize_request(request, *view.args, **view.kwargs)
+    view.request = request
+    view.headers = view.default_response_headers
+    view.format_kwarg = view.get_format_suffix(**view.kwargs)
+    try:
+        renderer, _ = view.perform_content_negotiation(request)
+        if not isinstance(renderer, JSONRenderer) or not _serves_async(view):
+            return None
+        async with query_slots():
+            # The authenticators read the database; resolve the user on the request's thread.
+            await sync_to_async(lambda: request.user)()
+            view.initial(request, *view.args, **view.kwargs)
+            response = await (_list(view, request) if action == 'list' else _retrieve(view, request))
+    except Exception as exc:
+        response = view.handle_exception(exc)
+    response = view.finalize_response(request, response, *view.args, **view.kwargs)
+    # Django renders a response that still has ``render`` on a thread, so hand it over rendered.
+    response.render()
+    rendered = HttpResponse(response.content, status=response.status_code)
+    for header, value in response.items():
+        rendered[header] = value
+    return rendered
+
+
+def async_read_view(sync_view):
+    """An async view serving GET list and retrieve itself and everything else through ``sync_view``."""
+
+    viewset, actions, initkwargs = sync_view.cls, sync_view.actions, sync_view.initkwargs
+    run_sync = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        action = actions.get(request.method.lower())
+        if action in ASYNC_ACTIONS:
+            instance = viewset(**initkwargs)
+            instance.action_map = actions
+            instance.args = args
+            instance.kwargs = kwargs
+            instance.request = request
+            response = await _respond(instance, request, action)
+            if response is not None:
+                return response
+        return await run_sync(request, *args, **kwargs)
+
+    # Read by court_rules.middleware.view_labels, as on DRF's own views.
+    view.cls = viewset
+    view.initkwargs = initkwargs
+    view.actions = actions
+    return csrf_exempt(view)
+
+
+def async_read_patterns(router, basenames: Iterable[str]) -> list[URLPattern]:
+    """``router``'s list and detail routes for ``basenames``, served by ``async_read_view``.
+
+    They match the same URLs as the router's, so they must come before ``router.urls``.
+    """
+
+    names = {f'{basename}-{kind}' for basename in basenames for kind in ('list', 'detail')}
+    patterns = []
+    for url in router.urls:
+        if url.name in names and issubclass(url.callback.cls, FastListMixin):
+            patterns.append(URLPattern(url.pattern, async_read_view(url.callback), url.default_args, url.name))
+    return patterns
@@ -1,18 +1,253 @@
+from datetime import timedelta
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.utils import timezone
-from rest_framework import serializers
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from court_rules.services.audit import REMOVED_KEYS, compute_changes
+from court_rules.services.deadlines import DeadlineRecipe
+from court_rules.services.judges import JUDGE_EXPANSIONS, latest_versions
+from court_rules.services.timezones import get_zone
 
 from court_rules.models import (
+    AuditAction,
     Case,
     Deadline,
+    DeadlineBasis,
     DeadlineReminder,
+    Document,
+    DocumentSource,
+    Filing,
+    Hearing,
+    HolidayCalendar,
     Judge,
+    JudgeAssociation,
+    JudgeProcedure,
     Rule,
     AuditLog,
     User,
 )
 
 
-class JudgeSerializer(serializers.ModelSerializer):
+MAX_FREE_SLOT_RANGE_DAYS = 92
+MAX_FOLLOWUP_HEARINGS = 500
+MAX_FOLLOWUP_TEMPLATES = 50
+MAX_CONFLICT_NAMES = 100
+# DRF fields whose to_representation returns a database value unchanged.
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+
+
+def local_due_at(due_at, zone_name):
+    # The instant as a wall time in the deadline's court zone, e.g. 2025-03-10T23:59:59-05:00.
+    return due_at.astimezone(get_zone(zone_name)).isoformat() if due_at else None
+
+
+# How RowPlan.render fills a column; see _row_converter.
+COPY, CONVERT, ISO_DATETIME, COMPUTED = range(4)
+
+
+class RowPlan:
+    """Builds a serializer's output dicts from ``values_list(*plan.paths)`` tuples.
+
+    Each column is ``(name, index, convert, kind)``. ``COPY`` columns take
+    the database value as is. ``CONVERT`` columns call ``convert``, usually
+    the field's bound ``to_representation``; like DRF it is skipped for
+    ``None``. ``ISO_DATETIME`` columns do what ``DateTimeField`` does, with
+    the active timezone looked up once per ``render`` rather than per value.
+    ``COMPUTED`` columns call ``convert`` with the values at a tuple of
+    indexes.
+
+    All single-column values of a row are fetched with one ``itemgetter``
+    call; only the columns that need work are then visited, so a row costs
+    a loop over its converted columns rather than over all of them.
+    """
+
+    def __init__(self, paths: list[str], columns: list[tuple]):
+        self.paths = paths
+        self.columns = columns
+        self._build_aware = self._compile(columns)
+        # Without USE_TZ there is no active timezone; DateTimeField makes values naive instead.
+        self._build_naive = self._compile(
+            [(name, index, convert, CONVERT if kind == ISO_DATETIME else kind) for name, index, convert, kind in columns]
+        )
+
+    @staticmethod
+    def _compile(columns: list[tuple]):
+        names = tuple(name for name, _, _, _ in columns)
+        # A computed column's slot is filled in below; fetch any value there to keep the positions.
+        fetch = _tuple_getter([0 if kind == COMPUTED else index for _, index, _, kind in columns])
+        converted = [(position, convert) for position, (_, _, convert, kind) in enumerate(columns) if kind == CONVERT]
+        datetimes = [position for position, (_, _, _, kind) in enumerate(columns) if kind == ISO_DATETIME]
+        computed = [
+            (position, convert, _tuple_getter(index))
+            for position, (_, index, convert, kind) in enumerate(columns)
+            if kind == COMPUTED
+        ]
+
+        def build(row, zone):
+            values = list(fetch(row))
+            for position, convert in converted:
+                value = values[position]
+                if value is not None:
+                    values[position] = convert(value)
+            for position in datetimes:
+                value = values[position]
+                if value is not None:
+                    values[position] = _iso_datetime(value, zone)
+            for position, convert, arguments in computed:
+                values[position] = convert(*arguments(row))
+            return dict(zip(names, values))
+
+        return build
+
+    def render(self, rows: Iterable[tuple]) -> list[dict]:
+        zone = timezone.get_current_timezone() if settings.USE_TZ else None
+        build = self._build_naive if zone is None else self._build_aware
+        return [build(row, zone) for row in rows]
+
+
+def _tuple_getter(indexes):
+    """``itemgetter(*indexes)``, returning a tuple for a single index too."""
+
+    if len(indexes) > 1:
+        return itemgetter(*indexes)
+    return lambda row: tuple(row[index] for index in indexes)
+
+
+def _iso_datetime(value, zone):
+    value = value.astimezone(zone).isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+
+def _row_converter(field: serializers.Field) -> tuple:
+    if isinstance(field, serializers.MultipleChoiceField):
+        return field.to_representation, CONVERT
+    if isinstance(field, (*PASSTHROUGH_FIELDS, serializers.ChoiceField)):
+        return None, COPY
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+        return None, COPY
+    if isinstance(field, serializers.JSONField) and not field.binary:
+        return None, COPY
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == 'hex_verbose':
+        return str, CONVERT
+    if (
+        isinstance(field, serializers.DateTimeField)
+        and not hasattr(field, 'timezone')
+        and (getattr(field, 'format', api_settings.DATETIME_FORMAT) or '').lower() == ISO_8601
+    ):
+        return field.to_representation, ISO_DATETIME
+    return field.to_representation, CONVERT
+
+
+@lru_cache(maxsize=None)
+def _build_row_plan(serializer_class, selected: Optional[frozenset[str]]) -> RowPlan:
+    meta = serializer_class.Meta
+    field_sources = getattr(meta, 'field_sources', {})
+    row_fields = getattr(meta, 'row_fields', {})
+    paths: dict[str, int] = {}
+
+    def column(path):
+        return paths.setdefault(path, len(paths))
+
+    columns = []
+    for name, field in serializer_class().fields.items():
+        if selected is not None and name not in selected:
+            continue
+        if name in row_fields:
+            sources, convert = row_fields[name]
+        elif isinstance(field, serializers.SerializerMethodField):
+            sources, convert = field_sources.get(name), None
+            if sources is None or len(sources) != 1:
+                raise ImproperlyConfigured(f'{serializer_class.__name__}.Meta.row_fields has no entry for {name!r}.')
+        elif field.source == '*':
+            raise ImproperlyConfigured(f'{serializer_class.__name__}.Meta.row_fields has no entry for {name!r}.')
+        else:
+            columns.append((name, column(field.source.replace('.', '__')), *_row_converter(field)))
+            continue
+        if convert is None and len(sources) == 1:
+            columns.append((name, column(sources[0]), None, COPY))
+        else:
+            columns.append((name, tuple(column(source) for source in sources), convert, COMPUTED))
+    return RowPlan(list(paths), columns)
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """Renders only the fields named in the ``sparse_fields`` context entry (see ``SparseFieldsetMixin``).
+
+    ``Meta.field_sources`` lists the model paths a computed field reads, e.g.
+    ``{'case_caption': ['case__caption']}``, or ``[]`` for an annotation.
+    Fields with a plain ``source`` need no entry.
+
+    ``row_plan`` renders the same output from ``values_list`` tuples. A
+    computed field that reads one path is copied as is; anything else needs
+    ``Meta.row_fields = {name: (paths, function)}``, where the function gets
+    the values of ``paths`` and returns what the method field would.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.context.get('sparse_fields')
+        if selected is not None:
+            for name in set(self.fields) - selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def projection(cls, selected: Iterable[str]) -> tuple[set[str], set[str]]:
+        """Model paths for ``.only()`` and relations for ``.select_related()`` that the ``selected`` fields read."""
+
+        field_sources = getattr(cls.Meta, 'field_sources', {})
+        fields = cls().fields
+        paths = set()
+        for name in selected:
+            if name in field_sources:
+                paths.update(field_sources[name])
+            elif fields[name].source == '*':
+                raise ImproperlyConfigured(f'{cls.__name__}.Meta.field_sources has no entry for {name!r}.')
+            else:
+                paths.add(fields[name].source.replace('.', '__'))
+        related = {path.rsplit('__', 1)[0] for path in paths if '__' in path}
+        return paths, related
+
+    @classmethod
+    def row_plan(cls, selected: Optional[frozenset[str]] = None) -> RowPlan:
+        """The ``RowPlan`` for the ``selected`` fields, or all of them; built once per selection."""
+
+        return _build_row_plan(cls, selected)
+
+
+class SparseFieldsQuerySerializer(serializers.Serializer):
+    """``?fields=`` / ``?omit=`` as comma-separated names, checked against the ``available`` context entry."""
+
+    fields = serializers.CharField(required=False)
+    omit = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        available = self.context['available']
+        requested = {
+            key: [name.strip() for name in attrs[key].split(',') if name.strip()] for key in ('fields', 'omit') if key in attrs
+        }
+        errors = {}
+        for key, names in requested.items():
+            unknown = [name for name in names if name not in available]
+            if unknown:
+                errors[key] = f'Unknown fields: {", ".join(unknown)}. Choose from: {", ".join(available)}.'
+        if errors:
+            raise serializers.ValidationError(errors)
+        selected = set(requested['fields']) if 'fields' in requested else set(available)
+        return {'selected': frozenset(selected - set(requested.get('omit', ())))}
+
+
+class JudgeSerializer(SparseFieldsetSerializer):
     court_name = serializers.SerializerMethodField()
     holiday_calendar_name = serializers.SerializerMethodField()
 
@@ -31,6 +266,7 @@ class JudgeSerializer(serializers.ModelSerializer):
             'holiday_calendar_name',
         ]
         read_only_fields = fields
+        field_sources = {'court_name': ['court__name'], 'holiday_calendar_name': ['holiday_calendar__name']}
 
     def get_court_name(self, obj):
         return obj.court.name if obj.court else None
@@ -39,7 +275,67 @@ class JudgeSerializer(serializers.ModelSerializer):
         return obj.holiday_calendar.name if obj.holiday_calendar else None
 
 
-class CaseSerializer(serializers.ModelSerializer):
+class JudgeProcedureSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JudgeProcedure
+        fields = [
+            'id',
+            'title',
+            'version',
+            'effective_date',
+            'expiry_date',
+            'filing_format',
+            'exhibit_labeling',
+            'motion_practice',
+            'filing_cutoff_time',
+            'hearing_windows',
+        ]
+        read_only_fields = fields
+
+
+class JudgeAssociationSerializer(serializers.ModelSerializer):
+    associated_judge_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = JudgeAssociation
+        fields = ['id', 'associated_judge', 'associated_judge_name', 'association_type']
+        read_only_fields = fields
+
+    def get_associated_judge_name(self, obj):
+        return obj.associated_judge.full_name
+
+
+class JudgeProfileSerializer(JudgeSerializer):
+    """Judge with the prefetched ``current_procedures`` and ``current_associations``.
+
+    Pass ``expand`` in the context to limit which of the two are rendered.
+    """
+
+    procedures = serializers.SerializerMethodField()
+    associations = serializers.SerializerMethodField()
+
+    class Meta(JudgeSerializer.Meta):
+        fields = JudgeSerializer.Meta.fields + list(JUDGE_EXPANSIONS)
+        read_only_fields = fields
+        # Prefetched by with_judge_expansions.
+        field_sources = {**JudgeSerializer.Meta.field_sources, 'procedures': [], 'associations': []}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        expand = self.context.get('expand')
+        if expand is not None:
+            for name in set(JUDGE_EXPANSIONS) - set(expand):
+                self.fields.pop(name)
+
+    def get_procedures(self, obj):
+        procedures = latest_versions(obj.current_procedures)
+        return JudgeProcedureSerializer(procedures, many=True, context=self.context).data
+
+    def get_associations(self, obj):
+        return JudgeAssociationSerializer(obj.current_associations, many=True, context=self.context).data
+
+
+class CaseSerializer(SparseFieldsetSerializer):
     court_name = serializers.SerializerMethodField()
     lead_attorney_name = serializers.SerializerMethodField()
 
@@ -65,6 +361,7 @@ class CaseSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = fields
+        field_sources = {'court_name': ['court__name'], 'lead_attorney_name': ['lead_attorney__full_name']}
 
     def get_court_name(self, obj):
         return obj.court.name if obj.court else None
@@ -73,13 +370,14 @@ class CaseSerializer(serializers.ModelSerializer):
         return obj.lead_attorney.full_name if obj.lead_attorney else None
 
 
-class DeadlineSerializer(serializers.ModelSerializer):
+class DeadlineSerializer(SparseFieldsetSerializer):
     case_caption = serializers.SerializerMethodField()
     owner_name = serializers.SerializerMethodField()
     created_by_name = serializers.SerializerMethodField()
     updated_by_name = serializers.SerializerMethodField()
     holiday_calendar_name = serializers.SerializerMethodField()
     pending_reminders = serializers.SerializerMethodField()
+    due_at_local = serializers.SerializerMethodField()
 
     class Meta:
         model = Deadline
@@ -94,6 +392,7 @@ class DeadlineSerializer(serializers.ModelSerializer):
             'holiday_calendar',
             'holiday_calendar_name',
             'due_at',
+            'due_at_local',
             'timezone',
             'owner',
             'owner_name',
@@ -128,6 +427,20 @@ class DeadlineSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
+        field_sources = {
+            'case_caption': ['case__caption'],
+            'owner_name': ['owner__full_name'],
+            'created_by_name': ['created_by__full_name'],
+            'updated_by_name': ['updated_by__full_name'],
+            'holiday_calendar_name': ['holiday_calendar__name'],
+            'due_at_local': ['due_at', 'timezone'],
+            # Annotated by DeadlineViewSet.
+            'pending_reminders': [],
+        }
+        row_fields = {
+            'due_at_local': (['due_at', 'timezone'], local_due_at),
+            'pending_reminders': (['pending_reminder_count'], None),
+        }
 
     def get_case_caption(self, obj):
         return obj.case.caption if obj.case else None
@@ -144,13 +457,20 @@ class DeadlineSerializer(serializers.ModelSerializer):
     def get_holiday_calendar_name(self, obj):
         return obj.holiday_calendar.name if obj.holiday_calendar else None
 
+    def get_due_at_local(self, obj):
+        return local_due_at(obj.due_at, obj.timezone)
+
     def validate_snooze_until(self, value):
         if value and value <= timezone.now():
             raise serializers.ValidationError('Snooze until must be in the future.')
         return value
 
     def get_pending_reminders(self, obj):
-        return obj.reminders.filter(sent=False).count()
+        # DeadlineViewSet annotates the count; other callers fall back to one query per deadline.
+        count = getattr(obj, 'pending_reminder_count', None)
+        if count is None:
+            count = obj.reminders.filter(sent=False).count()
+        return count
 
 
 class DeadlineReminderSerializer(serializers.ModelSerializer):
@@ -207,7 +527,7 @@ class DeadlineCreateSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class RuleSerializer(serializers.ModelSerializer):
+class RuleSerializer(SparseFieldsetSerializer):
     superseded_by_citation = serializers.SerializerMethodField()
 
     class Meta:
@@ -221,17 +541,32 @@ class RuleSerializer(serializers.ModelSerializer):
             'effective_date',
             'superseded_by',
             'superseded_by_citation',
+            'valid_from',
+            'valid_to',
             'text',
             'url',
             'created_at',
         ]
         read_only_fields = fields
+        field_sources = {'superseded_by_citation': ['superseded_by__citation']}
 
     def get_superseded_by_citation(self, obj):
         return obj.superseded_by.citation if obj.superseded_by else None
 
 
-class AuditLogSerializer(serializers.ModelSerializer):
+class RelatedRuleSerializer(serializers.ModelSerializer):
+    distance = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Rule
+        fields = ['id', 'source_type', 'citation', 'jurisdiction', 'version', 'distance']
+        read_only_fields = fields
+
+    def get_distance(self, obj):
+        return self.context['distances'][obj.pk]
+
+
+class AuditLogSerializer(SparseFieldsetSerializer):
     actor_name = serializers.SerializerMethodField()
 
     class Meta:
@@ -248,6 +583,7 @@ class AuditLogSerializer(serializers.ModelSerializer):
             'created_at',
         ]
         read_only_fields = fields
+        field_sources = {'actor_name': ['actor_user__full_name', 'actor_user__email']}
 
     def get_actor_name(self, obj):
         if obj.actor_user:
@@ -255,6 +591,168 @@ class AuditLogSerializer(serializers.ModelSerializer):
         return None
 
 
+class AuditHistorySerializer(AuditLogSerializer):
+    changes = serializers.SerializerMethodField()
+
+    class Meta(AuditLogSerializer.Meta):
+        fields = AuditLogSerializer.Meta.fields + ['sequence', 'is_checkpoint', 'changes']
+        read_only_fields = fields
+        field_sources = {**AuditLogSerializer.Meta.field_sources, 'changes': ['action', 'before', 'after', 'is_checkpoint']}
+
+    def get_changes(self, obj):
+        # Keys listed as removed show as changed to null.
+        after = {key: value for key, value in (obj.after or {}).items() if key != REMOVED_KEYS}
+        before, after = compute_changes(obj.before, after)
+        if obj.action == AuditAction.UPDATE and obj.is_checkpoint:
+            # Checkpoints carry the full snapshot in ``after``; only ``before`` lists what changed.
+            return {key: {'from': before[key], 'to': after[key]} for key in (obj.before or {}) if key in before}
+        return {key: {'from': before[key], 'to': after[key]} for key in sorted(after)}
+
+
+class HearingSerializer(SparseFieldsetSerializer):
+    case_caption = serializers.CharField(source='case.caption', read_only=True)
+    judge_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Hearing
+        fields = [
+            'id',
+            'case',
+            'case_caption',
+            'judge',
+            'judge_name',
+            'hearing_type',
+            'starts_at',
+            'ends_at',
+            'location',
+            'virtual_link',
+            'requirements',
+            'outcome',
+        ]
+        read_only_fields = fields
+        field_sources = {'judge_name': ['judge__full_name']}
+
+    def get_judge_name(self, obj):
+        return obj.judge.full_name if obj.judge else None
+
+
+class HearingSlotQuerySerializer(serializers.Serializer):
+    starts_at = serializers.DateTimeField()
+    ends_at = serializers.DateTimeField()
+    case = serializers.UUIDField(required=False)
+    judge = serializers.UUIDField(required=False)
+    exclude = serializers.UUIDField(required=False)
+
+    def validate(self, attrs):
+        if attrs['ends_at'] <= attrs['starts_at']:
+            raise serializers.ValidationError({'ends_at': 'Must be after starts_at.'})
+        return attrs
+
+
+class FreeSlotQuerySerializer(serializers.Serializer):
+    judge = serializers.UUIDField()
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    duration = serializers.IntegerField(min_value=5, max_value=8 * 60, default=60)
+    case = serializers.UUIDField(required=False)
+
+    def validate(self, attrs):
+        if attrs['end'] <= attrs['start']:
+            raise serializers.ValidationError({'end': 'Must be after start.'})
+        if attrs['end'] - attrs['start'] > timedelta(days=MAX_FREE_SLOT_RANGE_DAYS):
+            raise serializers.ValidationError({'end': f'Search at most {MAX_FREE_SLOT_RANGE_DAYS} days at a time.'})
+        return attrs
+
+
+class DeadlineRecipeSerializer(serializers.Serializer):
+    label = serializers.CharField(max_length=255)
+    offset_days = serializers.IntegerField(min_value=-3650, max_value=3650)
+    basis = serializers.ChoiceField(choices=DeadlineBasis.choices, default=DeadlineBasis.CALENDAR_DAYS)
+    roll_forward = serializers.BooleanField(default=True)
+    priority = serializers.IntegerField(min_value=1, max_value=5, default=3)
+    rule = serializers.UUIDField(required=False, allow_null=True)
+
+    def to_recipe(self, data):
+        return DeadlineRecipe(
+            label=data['label'],
+            offset_days=data['offset_days'],
+            basis=data['basis'],
+            roll_forward=data['roll_forward'],
+            priority=data['priority'],
+            rule_id=data.get('rule'),
+        )
+
+
+class HearingOutcomeSerializer(serializers.Serializer):
+    hearing = serializers.UUIDField()
+    outcome = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+
+
+class HearingFollowUpRequestSerializer(serializers.Serializer):
+    hearings = HearingOutcomeSerializer(many=True, allow_empty=False, max_length=MAX_FOLLOWUP_HEARINGS)
+    templates = DeadlineRecipeSerializer(many=True, allow_empty=False, max_length=MAX_FOLLOWUP_TEMPLATES)
+
+    def validate_hearings(self, value):
+        if len({item['hearing'] for item in value}) != len(value):
+            raise serializers.ValidationError('Each hearing may only be listed once.')
+        return value
+
+    def outcomes(self):
+        return {item['hearing']: item.get('outcome') for item in self.validated_data['hearings']}
+
+    def recipes(self):
+        return [DeadlineRecipeSerializer().to_recipe(item) for item in self.validated_data['templates']]
+
+
+class GeneratedDeadlineSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Deadline
+        fields = [
+            'id',
+            'case',
+            'trigger_type',
+            'trigger_source_type',
+            'trigger_source_id',
+            'basis',
+            'due_at',
+            'timezone',
+            'priority',
+            'computation_rationale',
+        ]
+        read_only_fields = fields
+
+
+class FollowUpDeadlineSerializer(GeneratedDeadlineSerializer):
+    hearing = serializers.UUIDField(source='trigger_source_id', read_only=True)
+
+    class Meta(GeneratedDeadlineSerializer.Meta):
+        fields = ['id', 'hearing', 'case', 'trigger_type', 'basis', 'due_at', 'timezone', 'priority', 'computation_rationale']
+        read_only_fields = fields
+
+
+class ApplyTemplateSerializer(serializers.Serializer):
+    trigger_event = serializers.CharField(max_length=64)
+    trigger_date = serializers.DateField()
+    # Both default to the case's: its court's district, and the judge's or the district's holiday calendar.
+    jurisdiction = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    holiday_calendar = serializers.PrimaryKeyRelatedField(
+        queryset=HolidayCalendar.objects.all(), required=False, allow_null=True
+    )
+    # Whose filing cutoff applies; defaults to the judge of the case's latest hearing.
+    judge = serializers.PrimaryKeyRelatedField(queryset=Judge.objects.all(), required=False, allow_null=True, default=None)
+    dry_run = serializers.BooleanField(default=False)
+
+
+class ConflictSerializer(serializers.Serializer):
+    subject = serializers.CharField()
+    subject_id = serializers.UUIDField()
+    source = serializers.CharField(source='interval.source')
+    object_id = serializers.UUIDField(source='interval.object_id')
+    case = serializers.UUIDField(source='interval.case_id')
+    starts_at = serializers.DateTimeField(source='interval.starts_at')
+    ends_at = serializers.DateTimeField(source='interval.ends_at')
+
+
 class UserSerializer(serializers.ModelSerializer):
     full_name = serializers.CharField()
 
@@ -262,3 +760,123 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'full_name', 'email', 'role']
         read_only_fields = fields
+
+
+class ConflictCheckRequestSerializer(serializers.Serializer):
+    names = serializers.ListField(
+        child=serializers.CharField(max_length=255), allow_empty=False, max_length=MAX_CONFLICT_NAMES
+    )
+    threshold = serializers.FloatField(required=False, min_value=0.1, max_value=1.0)
+
+
+class CaseAppearanceSerializer(serializers.Serializer):
+    case_id = serializers.UUIDField()
+    internal_case_id = serializers.CharField()
+    caption = serializers.CharField()
+    status = serializers.CharField()
+    role = serializers.CharField()
+
+
+class ConflictHitSerializer(serializers.Serializer):
+    contact_id = serializers.UUIDField()
+    contact_name = serializers.CharField()
+    organization = serializers.CharField()
+    matched_on = serializers.CharField()
+    similarity = serializers.FloatField()
+    cases = CaseAppearanceSerializer(many=True)
+
+
+class ConflictResultSerializer(serializers.Serializer):
+    query = serializers.CharField()
+    normalized = serializers.CharField()
+    hits = ConflictHitSerializer(many=True)
+
+
+class FilingSerializer(SparseFieldsetSerializer):
+    case_caption = serializers.CharField(source='case.caption', read_only=True)
+    exhibit_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Filing
+        fields = [
+            'id',
+            'case',
+            'case_caption',
+            'filing_type',
+            'ecf_category',
+            'packaged_as',
+            'served_at',
+            'service_method',
+            'notes',
+            'primary_document',
+            'exhibit_count',
+        ]
+        read_only_fields = fields
+        # Annotated by FilingViewSet.
+        field_sources = {'exhibit_count': []}
+
+
+class ServiceListQuerySerializer(serializers.Serializer):
+    output = serializers.ChoiceField(choices=['json', 'text', 'pdf'], default='json')
+
+
+class ServiceEntrySerializer(serializers.Serializer):
+    contact_id = serializers.UUIDField()
+    name = serializers.CharField()
+    organization = serializers.CharField()
+    email = serializers.CharField()
+    method = serializers.CharField()
+    address_label = serializers.CharField()
+    address = serializers.ListField(child=serializers.CharField())
+
+
+class FilingPackageQuerySerializer(serializers.Serializer):
+    output = serializers.ChoiceField(choices=['json', 'zip', 'pdf'], default='json')
+    judge = serializers.PrimaryKeyRelatedField(queryset=Judge.objects.all(), required=False, allow_null=True, default=None)
+
+
+class PackageItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    role = serializers.CharField()
+    label = serializers.CharField()
+    document = serializers.UUIDField(source='document.id', default=None)
+    page_count = serializers.IntegerField(allow_null=True)
+
+
+class FilingPackageSerializer(serializers.Serializer):
+    items = PackageItemSerializer(many=True)
+    total_pages = serializers.IntegerField()
+    filing_format = serializers.DictField()
+    issues = serializers.ListField(child=serializers.CharField())
+    blocking = serializers.BooleanField()
+
+
+class DocumentSerializer(serializers.ModelSerializer):
+    size = serializers.IntegerField(source='blob.size', read_only=True, default=None)
+
+    class Meta:
+        model = Document
+        fields = [
+            'id',
+            'case',
+            'title',
+            'source',
+            'url',
+            'file_hash',
+            'size',
+            'mime_type',
+            'page_count',
+            'ocr_status',
+            'uploaded_at',
+            'uploaded_by',
+        ]
+        read_only_fields = fields
+
+
+class DocumentUploadSerializer(serializers.ModelSerializer):
+    file = serializers.FileField(write_only=True)
+
+    class Meta:
+        model = Document
+        fields = ['file', 'case', 'title', 'source', 'mime_type', 'page_count']
+        extra_kwargs = {'source': {'default': DocumentSource.UPLOAD}}
@@ -1,12 +1,18 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 from rest_framework.authtoken.views import obtain_auth_token
 
+from court_rules.api.v1.async_views import async_read_patterns
 from court_rules.api.v1.viewsets import (
     AuditLogViewSet,
     CaseViewSet,
+    ContactViewSet,
     DeadlineReminderViewSet,
     DeadlineViewSet,
+    DocumentViewSet,
+    FilingViewSet,
+    HearingViewSet,
     JudgeViewSet,
     RuleViewSet,
     UserViewSet,
@@ -17,6 +23,10 @@ router.register(r'judges', JudgeViewSet, basename='judge')
 router.register(r'cases', CaseViewSet, basename='case')
 router.register(r'deadlines', DeadlineViewSet, basename='deadline')
 router.register(r'rules', RuleViewSet, basename='rule')
+router.register(r'hearings', HearingViewSet, basename='hearing')
+router.register(r'filings', FilingViewSet, basename='filing')
+router.register(r'documents', DocumentViewSet, basename='document')
+router.register(r'contacts', ContactViewSet, basename='contact')
 router.register(r'deadline-reminders', DeadlineReminderViewSet, basename='deadline-reminder')
 router.register(r'audit-log', AuditLogViewSet, basename='audit-log')
 router.register(r'users', UserViewSet, basename='user')
@@ -24,4 +34,7 @@ router.register(r'users', UserViewSet, basename='user')
 urlpatterns = [
     path('auth/token/', obtain_auth_token, name='api-token-auth'),
 ]
+if settings.ASYNC_READS_ENABLED:
+    # Same URLs as the router's deadline and case routes, so they must come first.
+    urlpatterns += async_read_patterns(router, ('deadline', 'case'))
 urlpatterns += router.urls
@@ -1,37 +1,320 @@
-from rest_framework import mixins, viewsets
+import itertools
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-from court_rules.models import AuditAction, AuditLog, Case, Deadline, DeadlineReminder, Judge, Rule, User
+from court_rules.metrics import record_cache
+from court_rules.models import (
+    AuditAction,
+    AuditLog,
+    Case,
+    Contact,
+    Court,
+    Deadline,
+    DeadlineReminder,
+    Document,
+    Filing,
+    FilingExhibit,
+    Hearing,
+    HolidayCalendar,
+    Judge,
+    JudgeAssociation,
+    JudgeProcedure,
+    Rule,
+    User,
+    UserRole,
+)
 from court_rules.services.audit import format_deadline_snapshot, record_audit_event
+from court_rules.services.blobs import ingest_document
+from court_rules.services.conflicts import check_conflicts
+from court_rules.services.deadline_templates import apply_template, build_template_deadlines, get_template_registry
+from court_rules.services.deadlines import case_judges, filing_cutoffs, holiday_calendar_for, load_court_calendars
+from court_rules.services.hearing_followups import generate_hearing_followups
+from court_rules.services.documents import DocumentUnavailable, iter_document
+from court_rules.services.filing_packages import plan_filing_package, single_pdf_document, stream_package_zip
+from court_rules.services.judges import (
+    JUDGE_EXPANSIONS,
+    get_cached_profile,
+    parse_expand,
+    set_cached_profile,
+    with_judge_expansions,
+)
+from court_rules.services.reference_cache import get_or_build, response_key
+from court_rules.services.rule_graph import DIRECTION_OUT, DIRECTIONS, get_rule_graph
+from court_rules.services.rules import filter_as_of
+from court_rules.services.scheduling import ConflictDetector
+from court_rules.services.service_lists import build_service_lists, stream_service_list_pdf, stream_service_list_text
 from court_rules.api.v1.serializers import (
+    ApplyTemplateSerializer,
+    AuditHistorySerializer,
     AuditLogSerializer,
     CaseSerializer,
+    ConflictCheckRequestSerializer,
+    ConflictResultSerializer,
+    ConflictSerializer,
     DeadlineCreateSerializer,
     DeadlineReminderSerializer,
     DeadlineSerializer,
+    DocumentSerializer,
+    DocumentUploadSerializer,
+    FilingPackageQuerySerializer,
+    FilingPackageSerializer,
+    FilingSerializer,
+    FollowUpDeadlineSerializer,
+    FreeSlotQuerySerializer,
+    GeneratedDeadlineSerializer,
+    HearingFollowUpRequestSerializer,
+    HearingSerializer,
+    HearingSlotQuerySerializer,
+    JudgeProfileSerializer,
     JudgeSerializer,
+    RelatedRuleSerializer,
     RuleSerializer,
+    ServiceEntrySerializer,
+    ServiceListQuerySerializer,
+    SparseFieldsQuerySerializer,
     UserSerializer,
 )
 
 
-class JudgeViewSet(viewsets.ReadOnlyModelViewSet):
+MAX_RELATED_DEPTH = 5
+
+
+class AuditHistoryMixin:
+    """Adds ``<entity>/<id>/history/`` backed by the (entity_table, entity_id, created_at) index."""
+
+    @action(detail=True, methods=['get'], url_path='history')
+    def history(self, request, pk=None):
+        model = self.queryset.model
+        try:
+            entity_id = model._meta.pk.to_python(pk)
+        except DjangoValidationError:
+            raise Http404
+        queryset = (
+            AuditLog.objects.filter(entity_table=model._meta.db_table, entity_id=entity_id)
+            .select_related('actor_user')
+            .order_by('-created_at', '-sequence')
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = AuditHistorySerializer(page, many=True, context=self.get_serializer_context())
+            return self.get_paginated_response(serializer.data)
+        serializer = AuditHistorySerializer(queryset, many=True, context=self.get_serializer_context())
+        return Response(serializer.data)
+
+
+class SparseFieldsetMixin:
+    """``?fields=a,b`` and ``?omit=c`` on list and retrieve.
+
+    The serializer renders only the selected fields, and the queryset loads
+    only the columns and joins they read (``SparseFieldsetSerializer.projection``).
+    """
+
+    sparse_actions = ('list', 'retrieve')
+
+    def get_sparse_fields(self) -> Optional[frozenset[str]]:
+        """The selected field names, or ``None`` when the request selects all of them."""
+
+        if not hasattr(self, '_sparse_fields'):
+            self._sparse_fields = None
+            params = self.request.query_params
+            if self.action in self.sparse_actions and ('fields' in params or 'omit' in params):
+                available = list(self.get_serializer_class()().fields)
+                query = SparseFieldsQuerySerializer(data=params, context={'available': available})
+                query.is_valid(raise_exception=True)
+                self._sparse_fields = query.validated_data['selected']
+        return self._sparse_fields
+
+    def wants_field(self, name: str) -> bool:
+        selected = self.get_sparse_fields()
+        return selected is None or name in selected
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        selected = self.get_sparse_fields()
+        if selected is None:
+            return queryset
+        paths, related = self.get_serializer_class().projection(selected)
+        return queryset.select_related(None).select_related(*related).only(*paths)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['sparse_fields'] = self.get_sparse_fields()
+        return context
+
+
+class FastListMixin:
+    """Serves ``list`` from ``values_list`` tuples through the serializer's ``RowPlan``.
+
+    The response is byte-identical to the serializer's (``test_fast_lists``),
+    without building a model instance or running DRF's field machinery per
+    row. Set ``fast_list = False`` to go back to the serializer.
+    """
+
+    fast_list = True
+
+    def list(self, request, *args, **kwargs):
+        if not self.fast_list:
+            return super().list(request, *args, **kwargs)
+        plan = self.get_serializer_class().row_plan(self.get_sparse_fields())
+        queryset = self.filter_queryset(self.get_queryset()).values_list(*plan.paths)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(plan.render(page))
+        return Response(plan.render(queryset))
+
+
+class ReferenceCacheMixin:
+    """Serves list and retrieve from the shared reference cache (``court_rules.services.reference_cache``).
+
+    Responses are cached per URL and per version of each of
+    ``reference_models``, which must cover every model the response reads.
+    They must not depend on who is asking. An admin sending
+    ``Cache-Control: no-cache`` gets a freshly built response, which also
+    replaces the cached one. ``X-Reference-Cache`` says which happened.
+    """
+
+    reference_models: tuple = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def skips_reference_cache(self, request) -> bool:
+        user = request.user
+        is_admin = user.is_staff or getattr(user, 'role', None) == UserRole.ADMIN
+        return is_admin and 'no-cache' in request.headers.get('Cache-Control', '')
+
+    def cached_response(self, view, request, *args, **kwargs):
+        if not settings.REFERENCE_CACHE_ENABLED:
+            return view(request, *args, **kwargs)
+        built = []
+
+        def build():
+            response = view(request, *args, **kwargs)
+            built.append(response)
+            return response.data if response.status_code == status.HTTP_200_OK else None
+
+        # Pagination links are absolute, so the host is part of the key. So is the day, for content
+        # that depends on the date (judge procedures in force).
+        url = f'{request.build_absolute_uri(request.path)}?{sorted(request.query_params.lists())}'
+        key = response_key(f'{self.basename}:{self.action}:{timezone.localdate()}', url, self.reference_models)
+        data, result = get_or_build(key, build, refresh=self.skips_reference_cache(request))
+        record_cache('reference', result)
+        response = built[0] if built else Response(data)
+        response['X-Reference-Cache'] = result
+        return response
+
+
+class JudgeViewSet(AuditHistoryMixin, ReferenceCacheMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Judge.objects.select_related('court', 'holiday_calendar').order_by('full_name')
     serializer_class = JudgeSerializer
+    reference_models = (Judge, Court, HolidayCalendar, JudgeProcedure, JudgeAssociation)
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'head', 'options']
     filterset_fields = ['court']
 
+    def get_expand(self):
+        if self.action == 'profile':
+            return set(JUDGE_EXPANSIONS)
+        return parse_expand(self.request.query_params.get('expand'))
 
-class CaseViewSet(viewsets.ReadOnlyModelViewSet):
+    def get_queryset(self):
+        return with_judge_expansions(super().get_queryset(), self.get_expand())
+
+    def get_serializer_class(self):
+        if self.get_expand():
+            return JudgeProfileSerializer
+        return super().get_serializer_class()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = self.get_expand()
+        return context
+
+    @action(detail=True, methods=['get'], url_path='profile')
+    def profile(self, request, pk=None):
+        try:
+            judge_id = Judge._meta.pk.to_python(pk)
+        except DjangoValidationError:
+            raise Http404
+        data = get_cached_profile(judge_id)
+        if data is None:
+            judge = self.get_object()
+            data = self.get_serializer(judge).data
+            set_cached_profile(judge.pk, data)
+        return Response(data)
+
+
+class CaseViewSet(AuditHistoryMixin, FastListMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Case.objects.select_related('court', 'lead_attorney').order_by('-filing_date', 'caption')
     serializer_class = CaseSerializer
     permission_classes = [IsAuthenticated]
-    http_method_names = ['get', 'head', 'options']
+    http_method_names = ['get', 'head', 'options', 'post']
     filterset_fields = ['status', 'court', 'lead_attorney']
 
+    @action(detail=True, methods=['post'], url_path='apply-template')
+    def apply_template(self, request, pk=None):
+        """Expand a trigger event into its templated deadlines; ``dry_run`` previews without saving."""
+
+        case = self.get_object()
+        payload = ApplyTemplateSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        params = payload.validated_data
+        jurisdiction = params.get('jurisdiction', case.court.district if case.court_id else '')
+        template_set = get_template_registry().lookup(params['trigger_event'], jurisdiction)
+        if template_set is None or not len(template_set):
+            raise ValidationError({'trigger_event': f'No active templates for "{params["trigger_event"]}".'})
+
+        judge_id = params['judge'].pk if params['judge'] else case_judges([case.pk]).get(case.pk)
+        if 'holiday_calendar' in params:
+            holiday_calendar_id = params['holiday_calendar'].pk if params['holiday_calendar'] else None
+        else:
+            holiday_calendar_id = holiday_calendar_for(case, judge_id)
+        calendar = load_court_calendars([holiday_calendar_id])[holiday_calendar_id]
+        options = {
+            'holiday_calendar_id': holiday_calendar_id,
+            'cutoff': filing_cutoffs([judge_id]).get(judge_id),
+            'actor': request.user,
+        }
+        if params['dry_run']:
+            deadlines, _ = build_template_deadlines(case, template_set, params['trigger_date'], calendar, **options)
+        else:
+            deadlines = apply_template(case, template_set, params['trigger_date'], calendar, **options)
+        return Response(
+            {
+                'trigger_event': template_set.trigger_event,
+                'created': 0 if params['dry_run'] else len(deadlines),
+                'deadlines': GeneratedDeadlineSerializer(deadlines, many=True).data,
+            },
+            status=status.HTTP_200_OK if params['dry_run'] else status.HTTP_201_CREATED,
+        )
+
 
-class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets.ReadOnlyModelViewSet):
+class DeadlineViewSet(
+    AuditHistoryMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    mixins.CreateModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     queryset = (
         Deadline.objects.select_related(
             'case',
@@ -47,6 +330,20 @@ class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets
     http_method_names = ['get', 'head', 'options', 'patch', 'post']
     filterset_fields = ['case', 'status', 'owner']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.wants_field('pending_reminders'):
+            # A correlated subquery rather than Count() over a join, which would group every deadline before LIMIT.
+            pending = (
+                DeadlineReminder.objects.filter(deadline=OuterRef('pk'), sent=False)
+                .order_by()
+                .values('deadline')
+                .annotate(count=Count('*'))
+                .values('count')
+            )
+            queryset = queryset.annotate(pending_reminder_count=Coalesce(Subquery(pending), 0))
+        return queryset
+
     def perform_update(self, serializer):
         deadline = self.get_object()
         before_snapshot = format_deadline_snapshot(deadline)
@@ -77,12 +374,238 @@ class DeadlineViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets
         return super().get_serializer_class()
 
 
-class RuleViewSet(viewsets.ReadOnlyModelViewSet):
+class RuleViewSet(AuditHistoryMixin, ReferenceCacheMixin, FastListMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Rule.objects.select_related('superseded_by').order_by('citation')
     serializer_class = RuleSerializer
+    reference_models = (Rule,)
+    permission_classes = [IsAuthenticated]
+    http_method_names = ['get', 'head', 'options']
+    filterset_fields = ['source_type', 'jurisdiction', 'citation']
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        as_of = self.request.query_params.get('as_of')
+        if as_of:
+            try:
+                as_of_date = parse_date(as_of)
+            except ValueError:
+                as_of_date = None
+            if as_of_date is None:
+                raise ValidationError({'as_of': 'Use the YYYY-MM-DD date format.'})
+            queryset = filter_as_of(queryset, as_of_date)
+        return queryset
+
+    @action(detail=True, methods=['get'], url_path='related')
+    def related(self, request, pk=None):
+        rule = self.get_object()
+        try:
+            depth = int(request.query_params.get('depth', 1))
+        except ValueError:
+            raise ValidationError({'depth': 'Depth must be an integer.'})
+        if not 1 <= depth <= MAX_RELATED_DEPTH:
+            raise ValidationError({'depth': f'Depth must be between 1 and {MAX_RELATED_DEPTH}.'})
+        direction = request.query_params.get('direction', DIRECTION_OUT)
+        if direction not in DIRECTIONS:
+            raise ValidationError({'direction': f'Choose one of: {", ".join(DIRECTIONS)}.'})
+
+        distances = get_rule_graph().neighborhood(rule.pk, depth, direction)
+        related = sorted(
+            Rule.objects.filter(pk__in=distances).only('id', 'source_type', 'citation', 'jurisdiction', 'version'),
+            key=lambda item: (distances[item.pk], item.citation),
+        )
+        serializer = RelatedRuleSerializer(related, many=True, context={**self.get_serializer_context(), 'distances': distances})
+        return Response(serializer.data)
+
+
+class HearingViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Hearing.objects.select_related('case', 'judge').order_by('starts_at')
+    serializer_class = HearingSerializer
+    permission_classes = [IsAuthenticated]
+    http_method_names = ['get', 'head', 'options', 'post']
+    filterset_fields = {
+        'case': ['exact'],
+        'judge': ['exact'],
+        'starts_at': ['gte', 'lt'],
+    }
+
+    @action(detail=False, methods=['get'], url_path='conflicts')
+    def conflicts(self, request):
+        """Check a proposed slot against the case team's and the judge's calendars."""
+
+        query = HearingSlotQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        detector = ConflictDetector(params['starts_at'], params['ends_at'])
+        conflicts = detector.conflicts_for_slot(
+            params['starts_at'],
+            params['ends_at'],
+            case_id=params.get('case'),
+            judge_id=params.get('judge'),
+            exclude_ids=[params['exclude']] if params.get('exclude') else (),
+        )
+        return Response({'has_conflicts': bool(conflicts), 'conflicts': ConflictSerializer(conflicts, many=True).data})
+
+    @action(detail=False, methods=['get'], url_path='free-slots')
+    def free_slots(self, request):
+        """List open stretches inside the judge's hearing windows where the case team is also free."""
+
+        query = FreeSlotQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        judge = get_object_or_404(Judge.objects.select_related('court'), pk=params['judge'])
+        detector = ConflictDetector(params['start'], params['end'])
+        slots = detector.free_slots(judge, timedelta(minutes=params['duration']), case_id=params.get('case'))
+        return Response([{'starts_at': starts_at, 'ends_at': ends_at} for starts_at, ends_at in slots])
+
+    @action(detail=False, methods=['post'], url_path='follow-ups')
+    def follow_ups(self, request):
+        """Record outcomes for a batch of hearings and generate their follow-up deadlines."""
+
+        payload = HearingFollowUpRequestSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        try:
+            result = generate_hearing_followups(payload.outcomes(), payload.recipes(), actor=request.user)
+        except Hearing.DoesNotExist as exc:
+            raise ValidationError({'hearings': str(exc)})
+        return Response(
+            {
+                'created': len(result.deadlines),
+                'skipped': result.skipped,
+                'deadlines': FollowUpDeadlineSerializer(result.deadlines, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class FilingViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    # A correlated subquery rather than Count() over a join, which would group every filing before LIMIT.
+    queryset = (
+        Filing.objects.select_related('case__court')
+        .annotate(
+            exhibit_count=Coalesce(
+                Subquery(
+                    FilingExhibit.objects.filter(filing=OuterRef('pk'))
+                    .order_by()
+                    .values('filing')
+                    .annotate(count=Count('*'))
+                    .values('count')
+                ),
+                0,
+            )
+        )
+        .order_by(F('served_at').desc(nulls_last=True))
+    )
+    serializer_class = FilingSerializer
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'head', 'options']
-    filterset_fields = ['source_type', 'jurisdiction']
+    filterset_fields = ['case', 'packaged_as']
+
+    @action(detail=True, methods=['get'], url_path='service-list')
+    def service_list(self, request, pk=None):
+        """Return the filing's service list, or stream it as a certificate of service (``output=text|pdf``)."""
+
+        filing = self.get_object()
+        query = ServiceListQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        entries = build_service_lists([filing.pk])[filing.pk]
+        output = query.validated_data['output']
+        if output == 'json':
+            return Response(ServiceEntrySerializer(entries, many=True).data)
+        filename = f'certificate-of-service-{filing.pk}.{"pdf" if output == "pdf" else "txt"}'
+        if output == 'pdf':
+            response = StreamingHttpResponse(stream_service_list_pdf(filing, entries), content_type='application/pdf')
+        else:
+            response = StreamingHttpResponse(stream_service_list_text(filing, entries), content_type='text/plain; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=True, methods=['get'], url_path='package')
+    def package(self, request, pk=None):
+        """Check the filing package, or stream it (``output=zip``, or ``output=pdf`` for one-document packages)."""
+
+        filing = self.get_object()
+        query = FilingPackageQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        plan = plan_filing_package(filing, judge_id=params['judge'].pk if params['judge'] else None)
+        if params['output'] == 'json':
+            return Response(FilingPackageSerializer(plan).data)
+        if plan.blocking:
+            raise ValidationError({'package': plan.issues})
+
+        try:
+            if params['output'] == 'pdf':
+                document = single_pdf_document(plan)
+                if document is None:
+                    raise ValidationError({'output': 'Only packages made of a single PDF can be downloaded as PDF.'})
+                chunks = iter_document(document)
+                # As in DocumentViewSet.content: opening happens on first iteration, so pull it forward.
+                first = next(chunks, b'')
+                response = StreamingHttpResponse(itertools.chain([first], chunks), content_type='application/pdf')
+                filename = plan.items[0].name.replace('"', '') if plan.items[0].document else f'filing-{filing.pk}.pdf'
+            else:
+                response = StreamingHttpResponse(stream_package_zip(plan), content_type='application/zip')
+                filename = f'filing-{filing.pk}.zip'
+        except DocumentUnavailable as exc:
+            raise ValidationError({'package': str(exc)})
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class DocumentViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Document.objects.select_related('blob')
+    serializer_class = DocumentSerializer
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    filterset_fields = ['case', 'source', 'ocr_status', 'file_hash']
+
+    def create(self, request, *args, **kwargs):
+        """Upload a file; bytes already stored for another document are shared rather than written again."""
+
+        payload = DocumentUploadSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        fields = dict(payload.validated_data)
+        upload = fields.pop('file')
+        fields.setdefault('title', upload.name)
+        fields.setdefault('mime_type', upload.content_type or '')
+        document, duplicate = ingest_document(upload.chunks(), uploaded_by=request.user, **fields)
+        data = dict(DocumentSerializer(document).data, deduplicated=duplicate)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'])
+    def content(self, request, pk=None):
+        document = self.get_object()
+        try:
+            chunks = iter_document(document)
+            # Opening happens on first iteration; pull it forward so a missing file is a 404, not a broken stream.
+            first = next(chunks, b'')
+        except DocumentUnavailable:
+            raise Http404('Document content is not available.')
+        response = StreamingHttpResponse(
+            itertools.chain([first], chunks), content_type=document.mime_type or 'application/octet-stream'
+        )
+        filename = (document.title or str(document.pk)).replace('"', '')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ContactViewSet(viewsets.GenericViewSet):
+    queryset = Contact.objects.all()
+    permission_classes = [IsAuthenticated]
+
+    @action(detail=False, methods=['post'], url_path='conflict-check')
+    def conflict_check(self, request):
+        """Search a batch of intake names against every contact and the cases they appear in."""
+
+        payload = ConflictCheckRequestSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        results = check_conflicts(payload.validated_data['names'], threshold=payload.validated_data.get('threshold'))
+        return Response(
+            {
+                'has_conflicts': any(result.hits for result in results),
+                'results': ConflictResultSerializer(results, many=True).data,
+            }
+        )
 
 
 class DeadlineReminderViewSet(
@@ -98,12 +621,18 @@ class DeadlineReminderViewSet(
     http_method_names = ['get', 'post', 'delete', 'head', 'options']
 
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = AuditLog.objects.order_by('-created_at')
+class AuditLogViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = AuditLog.objects.select_related('actor_user').order_by('-created_at')
     serializer_class = AuditLogSerializer
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'head', 'options']
-    filterset_fields = ['entity_table', 'entity_id', 'action']
+    # created_at bounds let Postgres prune the monthly audit_log partitions.
+    filterset_fields = {
+        'entity_table': ['exact'],
+        'entity_id': ['exact'],
+        'action': ['exact'],
+        'created_at': ['gte', 'lt'],
+    }
 
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CourtRulesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'court_rules'
+
+    def ready(self):
+        from court_rules import signals  # noqa: F401
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from court_rules.services import audit_partitions
+
+
+class Command(BaseCommand):
+    help = "Partition, maintain, archive and re-import the audit_log table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "action",
+            choices=["convert", "maintain", "import"],
+            help=(
+                "convert: rebuild audit_log as monthly partitions (PostgreSQL, run once); "
+                "maintain: create future partitions, empty the default partition and archive partitions past retention; "
+                "import: re-insert rows from an archive manifest."
+            ),
+        )
+        parser.add_argument("--months-ahead", type=int, default=3, help="Future monthly partitions to keep created.")
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=None,
+            help="Months of audit history kept in the database (defaults to AUDIT_RETENTION_MONTHS).",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=None,
+            help="Directory for compressed archives and manifest.json (defaults to AUDIT_ARCHIVE_DIR).",
+        )
+        parser.add_argument("--manifest", default=None, help="Manifest to import (defaults to <archive-dir>/manifest.json).")
+        parser.add_argument(
+            "--partition",
+            action="append",
+            dest="partitions",
+            default=None,
+            help="Restrict import to the named partition; may be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        archive_dir = Path(options["archive_dir"]) if options["archive_dir"] else audit_partitions.get_archive_dir()
+        action = options["action"]
+
+        if action == "import":
+            manifest = Path(options["manifest"]) if options["manifest"] else archive_dir / audit_partitions.MANIFEST_NAME
+            if not manifest.exists():
+                raise CommandError(f"Manifest {manifest} does not exist.")
+            try:
+                rows = audit_partitions.import_archive(manifest, options["partitions"])
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(self.style.SUCCESS(f"Imported {rows} audit rows from {manifest}."))
+            return
+
+        if not audit_partitions.supports_partitioning():
+            raise CommandError("Audit log partitioning requires PostgreSQL.")
+
+        if action == "convert":
+            moved = audit_partitions.convert_to_partitioned(months_ahead=options["months_ahead"])
+            self.stdout.write(self.style.SUCCESS(f"audit_log is partitioned; moved {moved} rows."))
+            return
+
+        if not audit_partitions.is_partitioned():
+            raise CommandError("audit_log is not partitioned yet; run the convert action first.")
+
+        created = audit_partitions.ensure_future_partitions(options["months_ahead"])
+        self.stdout.write(f"Ensured partitions: {', '.join(created)}")
+        split = audit_partitions.split_default_partition()
+        if split:
+            self.stdout.write(f"Moved rows out of {audit_partitions.DEFAULT_PARTITION} into: {', '.join(split)}")
+
+        retention = options["retention_months"]
+        if retention is None:
+            retention = audit_partitions.get_retention_months()
+        archived = audit_partitions.detach_expired_partitions(retention, archive_dir)
+        for entry in archived:
+            self.stdout.write(f"Archived {entry.partition} ({entry.rows} rows) to {archive_dir / entry.file}")
+        self.stdout.write(self.style.SUCCESS(f"Archived {len(archived)} partitions past {retention} months of retention."))
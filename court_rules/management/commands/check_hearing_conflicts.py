@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from court_rules.services.scheduling import ConflictDetector
+
+
+class Command(BaseCommand):
+    help = "Report double-booked attorneys and judges across upcoming hearings and calendar events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="How many days ahead to check (default 90).")
+
+    def handle(self, *args, **options):
+        start = timezone.now()
+        detector = ConflictDetector(start, start + timedelta(days=options["days"]))
+        conflicts = detector.calendar_conflicts()
+        for subject, subject_id, first, second in conflicts:
+            self.stdout.write(
+                f"{subject} {subject_id}: {first.source} {first.object_id} ({first.starts_at:%Y-%m-%d %H:%M}) "
+                f"overlaps {second.source} {second.object_id} ({second.starts_at:%Y-%m-%d %H:%M})"
+            )
+        style = self.style.WARNING if conflicts else self.style.SUCCESS
+        self.stdout.write(style(f"{len(conflicts)} conflicts in the next {options['days']} days."))
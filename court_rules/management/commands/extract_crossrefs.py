@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from court_rules.services.crossref_extraction import extract_crossrefs
+
+
+class Command(BaseCommand):
+    help = "Extract rule cross-references from rule and judge procedure text."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rescan every rule, not only those whose text changed since the last run.",
+        )
+        parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to the CPU count).")
+
+    def handle(self, *args, **options):
+        result = extract_crossrefs(full=options["full"], workers=options["workers"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {result.scanned} rules, {result.changed} changed: "
+                f"{result.created} cross-references written, {result.removed} stale removed."
+            )
+        )
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from court_rules.services.blobs import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete stored blobs that no document has referenced for longer than the grace period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=None,
+            help="Hours a blob must stay unreferenced before it is deleted (default BLOB_GC_GRACE_HOURS).",
+        )
+
+    def handle(self, *args, **options):
+        grace = timedelta(hours=options["grace_hours"]) if options["grace_hours"] is not None else None
+        removed, freed = collect_garbage(grace=grace)
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} blobs ({freed} bytes)."))
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from court_rules.services.deadlines import recompute_due_instants
+
+
+class Command(BaseCommand):
+    help = "Re-derive due instants of open deadlines from the court's time zone and the judge's filing cutoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000, help="Deadlines loaded per batch (default 2000).")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        changed = recompute_due_instants(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Updated {changed} deadlines in {elapsed:.1f}s."))
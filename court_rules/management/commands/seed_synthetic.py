@@ -0,0 +1,48 @@
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from court_rules.models import Case
+from court_rules.services.synthetic import BATCH_SIZE, LOGIN_EMAIL, LOGIN_PASSWORD, generate
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic synthetic dataset at production scale for performance work."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cases", type=int, default=1000, help="Number of cases (default 1000).")
+        parser.add_argument("--deadlines-per-case", type=int, default=20, help="Average deadlines per case (default 20).")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed; the same seed and anchor give the same rows.")
+        parser.add_argument("--anchor", help="Date the generated activity is centred on, YYYY-MM-DD (default today).")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=f"Rows buffered per write (default {BATCH_SIZE}).")
+        parser.add_argument("--flush", action="store_true", help="Delete all existing data first.")
+
+    def handle(self, *args, **options):
+        if options["cases"] < 1 or options["deadlines_per_case"] < 0:
+            raise CommandError("--cases must be positive and --deadlines-per-case not negative.")
+        anchor = None
+        if options["anchor"]:
+            anchor = parse_date(options["anchor"])
+            if anchor is None:
+                raise CommandError("Use the YYYY-MM-DD format for --anchor.")
+        if options["flush"]:
+            call_command("flush", interactive=False, verbosity=0)
+        elif Case.objects.exists():
+            raise CommandError("The database already has cases; pass --flush to replace them.")
+
+        started = time.perf_counter()
+        counts = generate(
+            cases=options["cases"],
+            deadlines_per_case=options["deadlines_per_case"],
+            seed=options["seed"],
+            anchor=anchor,
+            batch_size=options["batch_size"],
+            progress=lambda message: self.stdout.write(message),
+        )
+        elapsed = time.perf_counter() - started
+        for table, count in counts.items():
+            self.stdout.write(f"{table:<24} {count:>12}")
+        self.stdout.write(self.style.SUCCESS(f"Generated {sum(counts.values())} rows in {elapsed:.1f}s."))
+        self.stdout.write(self.style.WARNING(f"Login with {LOGIN_EMAIL} / {LOGIN_PASSWORD}"))
@@ -0,0 +1,93 @@
+"""Prometheus metrics for the ``/metrics`` endpoint.
+
+Request metrics are recorded by ``PrometheusMetricsMiddleware`` and labelled
+with the DRF viewset and action that served the request. The per-worker
+caches report hits and misses through ``record_cache``. Reminder dispatch lag
+and the audit archive backlog are read from the database at scrape time by
+``DatabaseCollector``.
+
+Under gunicorn, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory before
+the workers start (``config/gunicorn.py`` does the cleanup). prometheus_client
+then writes samples to per-process files there, and ``render_metrics``
+merges them, so every scrape sees all workers whichever one serves it.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+from django.utils import timezone
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from court_rules.models import DeadlineReminder
+from court_rules.services.audit_partitions import expired_partitions, get_retention_months, supports_partitioning
+
+
+REQUEST_LATENCY = Histogram(
+    'court_rules_http_request_duration_seconds',
+    'Time spent serving a request, by the viewset and action that handled it.',
+    ['viewset', 'action', 'method', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0),
+)
+REQUEST_QUERIES = Histogram(
+    'court_rules_http_request_db_queries',
+    'SQL statements executed per request.',
+    ['viewset', 'action'],
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+)
+REQUEST_SQL_DURATION = Histogram(
+    'court_rules_http_request_db_duration_seconds',
+    'Time spent in SQL per request.',
+    ['viewset', 'action'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+CACHE_REQUESTS = Counter(
+    'court_rules_cache_requests_total',
+    'Lookups in each cache layer; result is hit, or how a miss was filled (delta, snapshot, rebuild, miss).',
+    ['layer', 'result'],
+)
+
+
+def record_cache(layer: str, result: str) -> None:
+    CACHE_REQUESTS.labels(layer, result).inc()
+
+
+class DatabaseCollector:
+    """Gauges computed with a query or two on each scrape rather than kept in process memory."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        now = timezone.now()
+        due = DeadlineReminder.objects.filter(sent=False, notify_at__lte=now)
+        oldest = due.order_by('notify_at').values_list('notify_at', flat=True).first()
+        lag = GaugeMetricFamily(
+            'court_rules_reminder_dispatch_lag_seconds',
+            'How long the oldest due, unsent reminder has been waiting.',
+        )
+        lag.add_metric([], (now - oldest).total_seconds() if oldest else 0.0)
+        yield lag
+        pending = GaugeMetricFamily('court_rules_reminders_due_unsent', 'Reminders past notify_at that are not sent yet.')
+        pending.add_metric([], due.count())
+        yield pending
+
+        backlog = GaugeMetricFamily(
+            'court_rules_audit_expired_partitions',
+            'Audit log partitions past AUDIT_RETENTION_MONTHS still waiting to be archived.',
+        )
+        backlog.add_metric([], len(expired_partitions(get_retention_months())) if supports_partitioning() else 0)
+        yield backlog
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The exposition for one scrape, merged across gunicorn workers in multiprocess mode."""
+
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    database = CollectorRegistry()
+    database.register(DatabaseCollector())
+    return generate_latest(registry) + generate_latest(database), CONTENT_TYPE_LATEST
@@ -0,0 +1,346 @@
+"""Per-request SQL instrumentation, Prometheus request metrics and response compression.
+
+``QueryInstrumentationMiddleware`` wraps every database connection with an
+``execute_wrapper`` for the duration of a request and records each statement
+and its time. The totals go out in a ``Server-Timing`` header (visible in the
+browser's network panel) and as structured fields on the ``court_rules.sql``
+logger. Statements are grouped by fingerprint (the SQL with literals and
+``IN`` lists collapsed), so a serializer issuing one query per row shows up
+as a single fingerprint repeated 25 times and is logged as a likely N+1.
+
+``PrometheusMetricsMiddleware`` records request latency and, from the
+statistics above, queries and SQL time per request in the histograms of
+``court_rules.metrics``, labelled by the viewset and action that served it.
+
+``CompressionMiddleware`` encodes response bodies of at least
+``COMPRESSION_MIN_BYTES`` with brotli or gzip, whichever the client's
+``Accept-Encoding`` ranks higher. Streaming responses are compressed chunk by
+chunk as they are sent. Payloads that are already compressed (PDFs, ZIP
+packages, images) are left alone. So are HTML pages and responses that vary
+on ``Cookie``: those can carry a CSRF token or session-bound secret next to
+text an attacker controls, which BREACH recovers from the compressed size.
+
+With ``QUERY_INSTRUMENTATION = False``, ``METRICS_ENABLED = False`` or
+``COMPRESSION_ENABLED = False`` the middleware raises ``MiddlewareNotUsed``
+and Django drops it from the stack entirely.
+
+All three run natively under ASGI as well, so an async view behind them is
+not pushed onto a thread for the whole request.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Optional
+
+import brotli
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.cache import has_vary_header, patch_vary_headers
+from django.utils.text import compress_sequence, compress_string
+
+from court_rules.metrics import REQUEST_LATENCY, REQUEST_QUERIES, REQUEST_SQL_DURATION
+
+
+logger = logging.getLogger('court_rules.sql')
+
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*%s\s*,?)+\)', re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+
+# Request methods labelled as themselves; anything else a client sends is counted as ``other``.
+METRIC_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH', 'DELETE'})
+# Content encodings CompressionMiddleware offers, preferred first when the client ranks them equally.
+ENCODINGS = ('br', 'gzip')
+# Bodies of these types are compressed already; encoding them again costs CPU and saves nothing.
+INCOMPRESSIBLE_TYPES = ('application/pdf', 'application/zip', 'image/', 'audio/', 'video/')
+# Random bytes in the gzip header, as Django's GZipMiddleware adds against BREACH.
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def fingerprint(sql: str) -> str:
+    """``sql`` with literals and parameter lists collapsed, so repeats of one statement compare equal."""
+
+    sql = _IN_LIST.sub('IN (...)', sql)
+    sql = _STRING.sub('?', sql)
+    return _NUMBER.sub('?', sql)
+
+
+@dataclass
+class QueryStats:
+    """Statements a request executed, in order, with their durations in seconds."""
+
+    statements: list[tuple[str, float]] = field(default_factory=list)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.statements.append((sql, time.perf_counter() - started))
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def fingerprints(self) -> Counter:
+        return Counter(fingerprint(sql) for sql, _ in self.statements)
+
+
+def _wrap_connections(stack: ExitStack, stats: QueryStats) -> None:
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(stats))
+
+
+class QueryInstrumentationMiddleware:
+    """Counts and times the SQL behind each request; see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = QueryStats()
+        request.query_stats = stats
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            _wrap_connections(stack, stats)
+            response = self.get_response(request)
+        return self.report(request, response, stats, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        request.query_stats = stats
+        started = time.perf_counter()
+        # Under ASGI the request's queries run on its sync thread, which has connections of its own.
+        stack = ExitStack()
+        await sync_to_async(_wrap_connections)(stack, stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.report(request, response, stats, time.perf_counter() - started)
+
+    def report(self, request, response, stats: QueryStats, elapsed: float):
+        fingerprints = stats.fingerprints()
+        duplicates = stats.count - len(fingerprints)
+        sql_ms = stats.duration * 1000
+        total_ms = elapsed * 1000
+        # Streaming responses run their remaining queries after this point; those are not counted.
+        response['Server-Timing'] = (
+            f'db;dur={sql_ms:.2f};desc="{stats.count} queries, {duplicates} duplicate", app;dur={total_ms:.2f}'
+        )
+
+        fields = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round(total_ms, 2),
+            'sql_queries': stats.count,
+            'sql_ms': round(sql_ms, 2),
+            'sql_duplicates': duplicates,
+        }
+        logger.info(
+            '%s %s %s: %d queries (%d duplicate) in %.1f of %.1f ms',
+            request.method, request.path, response.status_code, stats.count, duplicates, sql_ms, total_ms,
+            extra=fields,
+        )
+        for statement, repeats in fingerprints.items():
+            if repeats >= settings.QUERY_DUPLICATE_THRESHOLD:
+                logger.warning(
+                    'Likely N+1 on %s %s: %d executions of %s',
+                    request.method, request.path, repeats, statement,
+                    extra={**fields, 'sql_fingerprint': statement, 'sql_repeats': repeats},
+                )
+        if total_ms >= settings.QUERY_SLOW_REQUEST_MS and random.random() < settings.QUERY_SLOW_SAMPLE_RATE:
+            logger.warning(
+                'Slow request %s %s: %.1f ms, %d queries',
+                request.method, request.path, total_ms, stats.count,
+                extra={**fields, 'sql': [{'sql': sql, 'ms': round(duration * 1000, 3)} for sql, duration in stats.statements]},
+            )
+        return response
+
+
+def method_label(method: str) -> str:
+    """``method`` if it is one of ``METRIC_METHODS``, else ``other``, so clients cannot add label values."""
+
+    return method if method in METRIC_METHODS else 'other'
+
+
+def view_labels(view_func, method: str) -> tuple[str, str]:
+    """``(viewset, action)`` for a resolved view; plain Django views use their name and the method."""
+
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    name = view_class.__name__ if view_class else getattr(view_func, '__name__', 'unknown')
+    actions = getattr(view_func, 'actions', None) or {}
+    return name, actions.get(method.lower(), method_label(method).lower())
+
+
+class PrometheusMetricsMiddleware:
+    """Observes each request in the ``court_rules.metrics`` histograms.
+
+    Sits outside ``QueryInstrumentationMiddleware`` so the request's
+    ``query_stats`` are complete by the time the response comes back.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        return self.observe(request, response, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        return self.observe(request, response, time.perf_counter() - started)
+
+    def observe(self, request, response, elapsed: float):
+        # Read from the resolved view rather than in process_view, which Django would run on a thread under ASGI.
+        match = request.resolver_match
+        if match is None:
+            viewset, action = 'unmatched', method_label(request.method).lower()
+        else:
+            viewset, action = view_labels(match.func, request.method)
+        REQUEST_LATENCY.labels(viewset, action, method_label(request.method), str(response.status_code)).observe(elapsed)
+        stats = getattr(request, 'query_stats', None)
+        if stats is not None:
+            REQUEST_QUERIES.labels(viewset, action).observe(stats.count)
+            REQUEST_SQL_DURATION.labels(viewset, action).observe(stats.duration)
+        return response
+
+
+def preferred_encoding(accept_encoding: str) -> Optional[str]:
+    """The entry of ``ENCODINGS`` that an ``Accept-Encoding`` header ranks highest, or ``None``."""
+
+    weights = {}
+    for entry in accept_encoding.split(','):
+        coding, _, params = entry.partition(';')
+        weight = 1.0
+        params = params.strip().lower()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    default = weights.get('*', 0.0)
+    best = max(ENCODINGS, key=lambda coding: weights.get(coding, default))
+    return best if weights.get(best, default) > 0 else None
+
+
+def _brotli_sequence(chunks, quality: int):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _abrotli_sequence(chunks, quality: int):
+    compressor = brotli.Compressor(quality=quality)
+    async for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _agzip_sequence(chunks):
+    # Each chunk becomes its own gzip member, as in Django's GZipMiddleware; clients decode them as one stream.
+    async for chunk in chunks:
+        yield compress_string(chunk, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+
+class CompressionMiddleware:
+    """Brotli or gzip response bodies; see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.COMPRESSION_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_BYTES:
+            return response
+        if response.has_header('Content-Encoding') or response.get('Content-Type', '').startswith(INCOMPRESSIBLE_TYPES):
+            return response
+        if response.get('Content-Type', '').startswith('text/html') or has_vary_header(response, 'Cookie'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = preferred_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        quality = settings.COMPRESSION_BROTLI_QUALITY
+        if response.streaming:
+            chunks = response.streaming_content
+            if encoding == 'br':
+                sequence = _abrotli_sequence(chunks, quality) if response.is_async else _brotli_sequence(chunks, quality)
+            elif response.is_async:
+                sequence = _agzip_sequence(chunks)
+            else:
+                sequence = compress_sequence(chunks, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+            response.streaming_content = sequence
+            del response.headers['Content-Length']
+        else:
+            if encoding == 'br':
+                compressed = brotli.compress(response.content, quality=quality)
+            else:
+                compressed = compress_string(response.content, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # A strong ETag names the unencoded bytes; weaken it so conditional requests still match.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
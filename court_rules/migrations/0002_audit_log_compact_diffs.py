@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditlog',
+            name='is_checkpoint',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='sequence',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
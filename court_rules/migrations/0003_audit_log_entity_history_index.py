@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0002_audit_log_compact_diffs'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='idx_audit_entity',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['entity_table', 'entity_id', 'created_at'], name='idx_audit_entity_created'),
+        ),
+    ]
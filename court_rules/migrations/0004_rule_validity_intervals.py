@@ -0,0 +1,63 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:28
+
+from collections import defaultdict
+from datetime import date
+
+from django.db import migrations, models
+
+
+def compute_validity_intervals(rules):
+    """Frozen copy of ``court_rules.services.rules.compute_validity_intervals`` as of this migration."""
+
+    groups = defaultdict(list)
+    by_id = {}
+    for rule in rules:
+        groups[(rule.jurisdiction, rule.citation)].append(rule)
+        by_id[rule.pk] = rule
+
+    intervals = {}
+    for versions in groups.values():
+        versions.sort(key=lambda rule: (rule.effective_date or date.min, rule.created_at))
+        for index, rule in enumerate(versions):
+            valid_to = None
+            successor = by_id.get(rule.superseded_by_id)
+            if successor is not None and successor.effective_date:
+                valid_to = successor.effective_date
+            elif index + 1 < len(versions):
+                valid_to = versions[index + 1].effective_date
+            intervals[rule.pk] = (rule.effective_date, valid_to)
+    return intervals
+
+
+def backfill_validity_intervals(apps, schema_editor):
+    Rule = apps.get_model('court_rules', 'Rule')
+    rules = list(Rule.objects.all())
+    intervals = compute_validity_intervals(rules)
+    for rule in rules:
+        rule.valid_from, rule.valid_to = intervals[rule.pk]
+    Rule.objects.bulk_update(rules, ['valid_from', 'valid_to'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0003_audit_log_entity_history_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rule',
+            name='valid_from',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='rule',
+            name='valid_to',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='rule',
+            index=models.Index(fields=['citation', 'valid_from', 'valid_to'], name='idx_rule_citation_validity'),
+        ),
+        migrations.RunPython(backfill_validity_intervals, migrations.RunPython.noop),
+    ]
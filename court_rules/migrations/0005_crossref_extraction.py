@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0004_rule_validity_intervals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rule',
+            name='crossref_text_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='rulecrossref',
+            name='origin',
+            field=models.CharField(choices=[('manual', 'Manual'), ('extracted', 'Extracted')], default='manual', max_length=16),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0005_crossref_extraction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hearing',
+            name='judge',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='hearings', to='court_rules.judge'),
+        ),
+        migrations.AddIndex(
+            model_name='hearing',
+            index=models.Index(fields=['judge', 'starts_at'], name='idx_hearing_judge_start'),
+        ),
+    ]
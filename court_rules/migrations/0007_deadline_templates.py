@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:40
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0006_hearing_judge'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeadlineTemplate',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('trigger_event', models.CharField(max_length=64)),
+                ('jurisdiction', models.CharField(blank=True, max_length=255)),
+                ('label', models.CharField(max_length=255)),
+                ('offset_days', models.IntegerField()),
+                ('basis', models.CharField(choices=[('calendar_days', 'Calendar Days'), ('business_days', 'Business Days')], default='calendar_days', max_length=32)),
+                ('roll_forward', models.BooleanField(default=True)),
+                ('priority', models.PositiveSmallIntegerField(default=3, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('anchor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dependents', to='court_rules.deadlinetemplate')),
+                ('rule', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='deadline_templates', to='court_rules.rule')),
+            ],
+            options={
+                'db_table': 'deadline_templates',
+                'ordering': ['trigger_event', 'label'],
+                'indexes': [models.Index(fields=['trigger_event', 'jurisdiction'], name='idx_template_event_juris')],
+            },
+        ),
+    ]
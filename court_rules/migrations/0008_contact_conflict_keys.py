@@ -0,0 +1,87 @@
+# Generated by Django 5.2.6 on 2026-10-19 00:51
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+TRIGRAM_INDEXES = {
+    'idx_contact_name_trgm': 'normalized_name',
+    'idx_contact_org_trgm': 'normalized_org',
+}
+
+# Frozen copies of court_rules.services.conflicts as of this migration.
+STOP_TOKENS = frozenset({
+    'the', 'and', 'of',
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'plc', 'ltd', 'limited', 'corp', 'corporation',
+    'co', 'company', 'pc', 'pllc', 'pa', 'gmbh', 'ag', 'sa', 'bv', 'nv',
+    'mr', 'mrs', 'ms', 'dr', 'esq', 'jr', 'sr',
+})
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def normalize_name(value):
+    if not value:
+        return ''
+    folded = unicodedata.normalize('NFKD', value)
+    folded = ''.join(char for char in folded if not unicodedata.combining(char)).casefold()
+    tokens = _TOKEN_RE.findall(folded.replace('&', ' and '))
+    kept = [token for token in tokens if token not in STOP_TOKENS]
+    return ' '.join(sorted(kept or tokens))
+
+
+def contact_keys(contact):
+    if contact.type == 'organization':
+        return normalize_name(contact.org_name), ''
+    name_key = normalize_name(f'{contact.first_name} {contact.last_name}')
+    return name_key, normalize_name(contact.org_name)
+
+
+def backfill_conflict_keys(apps, schema_editor):
+    Contact = apps.get_model('court_rules', 'Contact')
+    batch = []
+    for contact in Contact.objects.order_by().iterator(chunk_size=2000):
+        contact.normalized_name, contact.normalized_org = contact_keys(contact)
+        batch.append(contact)
+        if len(batch) >= 2000:
+            Contact.objects.bulk_update(batch, ['normalized_name', 'normalized_org'])
+            batch = []
+    Contact.objects.bulk_update(batch, ['normalized_name', 'normalized_org'])
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON contacts USING gin ({column} gin_trgm_ops)')
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('court_rules', '0007_deadline_templates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='normalized_name',
+            field=models.CharField(blank=True, editable=False, max_length=512),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='normalized_org',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_conflict_keys, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -1,6 +1,7 @@
 import uuid
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 from django.db.models import Q
@@ -268,6 +269,9 @@ class Contact(UUIDModel):
     address = models.JSONField(null=True, blank=True)
     preferred_contact_method = models.CharField(max_length=50, blank=True)
     availability = models.JSONField(null=True, blank=True)
+    # Conflict-check keys, kept in sync by a pre_save signal (see services.conflicts.normalize_name).
+    normalized_name = models.CharField(max_length=512, blank=True, editable=False)
+    normalized_org = models.CharField(max_length=255, blank=True, editable=False)
 
     class Meta:
         db_table = "contacts"
@@ -394,12 +398,33 @@ class OcrStatus(models.TextChoices):
     FAILED = "failed", "Failed"
 
 
+class Blob(UUIDModel):
+    """Content-addressed file shared by every document with the same bytes."""
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # When ref_count last dropped to zero; garbage collection waits out a grace period from here.
+    released_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "blobs"
+        indexes = [
+            models.Index(fields=["ref_count", "released_at"], name="idx_blob_gc"),
+        ]
+
+    def __str__(self):
+        return self.sha256
+
+
 class Document(UUIDModel):
     case = models.ForeignKey(Case, on_delete=models.SET_NULL, null=True, blank=True, related_name="documents")
     title = models.CharField(max_length=255, blank=True)
     source = models.CharField(max_length=32, choices=DocumentSource.choices)
     url = models.URLField(blank=True)
     file_hash = models.CharField(max_length=128, blank=True)
+    blob = models.ForeignKey(Blob, on_delete=models.PROTECT, null=True, blank=True, related_name="documents")
     mime_type = models.CharField(max_length=128, blank=True)
     page_count = models.PositiveIntegerField(null=True, blank=True)
     ocr_status = models.CharField(max_length=16, choices=OcrStatus.choices, default=OcrStatus.PENDING)
@@ -410,6 +435,9 @@ class Document(UUIDModel):
     class Meta:
         db_table = "documents"
         ordering = ["-uploaded_at"]
+        indexes = [
+            models.Index(fields=["file_hash"], name="idx_document_file_hash"),
+        ]
 
     def __str__(self):
         return self.title or f"Document {self.pk}"
@@ -451,21 +479,35 @@ class Rule(UUIDModel):
     version = models.CharField(max_length=64, blank=True)
     effective_date = models.DateField(null=True, blank=True)
     superseded_by = models.ForeignKey("self", on_delete=models.SET_NULL, null=True, blank=True, related_name="supersedes")
+    # Half-open [valid_from, valid_to) interval maintained by court_rules.services.rules.
+    valid_from = models.DateField(null=True, blank=True)
+    valid_to = models.DateField(null=True, blank=True)
     text = models.TextField(blank=True)
+    # SHA-256 of ``text`` when cross-references were last extracted from it.
+    crossref_text_hash = models.CharField(max_length=64, blank=True)
     url = models.URLField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "rules"
         ordering = ["jurisdiction", "citation"]
+        indexes = [
+            models.Index(fields=["citation", "valid_from", "valid_to"], name="idx_rule_citation_validity"),
+        ]
 
     def __str__(self):
         return self.citation or f"Rule {self.pk}"
 
 
+class CrossRefOrigin(models.TextChoices):
+    MANUAL = "manual", "Manual"
+    EXTRACTED = "extracted", "Extracted"
+
+
 class RuleCrossRef(UUIDModel):
     from_rule = models.ForeignKey(Rule, on_delete=models.CASCADE, related_name="crossref_from")
     to_rule = models.ForeignKey(Rule, on_delete=models.CASCADE, related_name="crossref_to")
+    origin = models.CharField(max_length=16, choices=CrossRefOrigin.choices, default=CrossRefOrigin.MANUAL)
 
     class Meta:
         db_table = "rule_crossrefs"
@@ -567,6 +609,45 @@ class DeadlineDependency(UUIDModel):
         return f"{self.predecessor} → {self.successor}"
 
 
+class DeadlineTemplate(UUIDModel):
+    trigger_event = models.CharField(max_length=64)
+    jurisdiction = models.CharField(max_length=255, blank=True)
+    label = models.CharField(max_length=255)
+    rule = models.ForeignKey(Rule, on_delete=models.SET_NULL, null=True, blank=True, related_name="deadline_templates")
+    # Counted from this template's due date instead of the trigger event when set.
+    anchor = models.ForeignKey("self", on_delete=models.CASCADE, null=True, blank=True, related_name="dependents")
+    offset_days = models.IntegerField()
+    basis = models.CharField(max_length=32, choices=DeadlineBasis.choices, default=DeadlineBasis.CALENDAR_DAYS)
+    roll_forward = models.BooleanField(default=True)
+    priority = models.PositiveSmallIntegerField(default=3, validators=[MinValueValidator(1), MaxValueValidator(5)])
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "deadline_templates"
+        indexes = [
+            models.Index(fields=["trigger_event", "jurisdiction"], name="idx_template_event_juris"),
+        ]
+        ordering = ["trigger_event", "label"]
+
+    def __str__(self):
+        return f"{self.trigger_event}: {self.label}"
+
+    def clean(self):
+        anchor, seen = self.anchor, {self.pk}
+        if anchor is not None and anchor.trigger_event != self.trigger_event:
+            raise ValidationError({"anchor": "Anchor must belong to the same trigger event."})
+        # Sets are compiled per jurisdiction from its own and the shared templates, so no other anchor resolves.
+        if anchor is not None and anchor.jurisdiction not in ("", self.jurisdiction):
+            raise ValidationError({"anchor": "Anchor must belong to the same jurisdiction or be shared."})
+        while anchor is not None:
+            if anchor.pk in seen:
+                raise ValidationError({"anchor": "Anchors cannot form a cycle."})
+            seen.add(anchor.pk)
+            anchor = anchor.anchor
+
+
 class DocketEntry(UUIDModel):
     case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="docket_entries")
     entry_no = models.IntegerField(null=True, blank=True)
@@ -641,6 +722,7 @@ class FilingServiceContact(UUIDModel):
 
 class Hearing(UUIDModel):
     case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="hearings")
+    judge = models.ForeignKey(Judge, on_delete=models.SET_NULL, null=True, blank=True, related_name="hearings")
     hearing_type = models.CharField(max_length=255, blank=True)
     starts_at = models.DateTimeField()
     ends_at = models.DateTimeField(null=True, blank=True)
@@ -653,6 +735,7 @@ class Hearing(UUIDModel):
         db_table = "hearings"
         indexes = [
             models.Index(fields=["case", "starts_at"], name="idx_hearing_case_start"),
+            models.Index(fields=["judge", "starts_at"], name="idx_hearing_judge_start"),
         ]
         ordering = ["starts_at"]
 
@@ -793,12 +876,14 @@ class AuditLog(UUIDModel):
     action = models.CharField(max_length=32, choices=AuditAction.choices)
     before = models.JSONField(null=True, blank=True)
     after = models.JSONField(null=True, blank=True)
+    sequence = models.PositiveIntegerField(default=0)
+    is_checkpoint = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "audit_log"
         indexes = [
-            models.Index(fields=["entity_table", "entity_id"], name="idx_audit_entity"),
+            models.Index(fields=["entity_table", "entity_id", "created_at"], name="idx_audit_entity_created"),
         ]
         ordering = ["-created_at"]
 
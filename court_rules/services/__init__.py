@@ -1,8 +1,19 @@
 """Service layer helpers for the court_rules app."""
 
-from .audit import format_deadline_snapshot, record_audit_event
+from .audit import (
+    compute_changes,
+    format_deadline_snapshot,
+    reconstruct_entity_state,
+    record_audit_event,
+    record_created_events,
+    record_update_events,
+)
 
 __all__ = [
+    'compute_changes',
     'format_deadline_snapshot',
+    'reconstruct_entity_state',
     'record_audit_event',
+    'record_created_events',
+    'record_update_events',
 ]
@@ -1,12 +1,83 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Iterable, Optional
 
+from django.apps import apps
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Max
 
 from court_rules.models import AuditAction, AuditLog, User
 
 
+DEFAULT_CHECKPOINT_INTERVAL = 20
+# Compact UPDATE entries list here the keys dropped from the snapshot, which replay removes.
+# A key stored with a ``None`` value was set to null instead.
+REMOVED_KEYS = '__removed__'
+
+
+def get_checkpoint_interval() -> int:
+    """Return how many entries may separate two full snapshots of an entity."""
+
+    return max(int(getattr(settings, 'AUDIT_CHECKPOINT_INTERVAL', DEFAULT_CHECKPOINT_INTERVAL)), 1)
+
+
+def compute_changes(
+    before: Optional[dict[str, Any]],
+    after: Optional[dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the old and new values of every key that differs between two snapshots."""
+
+    before = before or {}
+    after = after or {}
+    changed_before: dict[str, Any] = {}
+    changed_after: dict[str, Any] = {}
+    for key in before.keys() | after.keys():
+        old_value = before.get(key)
+        new_value = after.get(key)
+        if old_value != new_value:
+            changed_before[key] = old_value
+            changed_after[key] = new_value
+    return changed_before, changed_after
+
+
+def _compact_entry(
+    action: AuditAction,
+    sequence: int,
+    before: Optional[dict[str, Any]],
+    after: Optional[dict[str, Any]],
+) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]], bool]:
+    """Return the ``before``/``after`` to store for an entry and whether it is a checkpoint."""
+
+    is_checkpoint = action == AuditAction.CREATE or sequence % get_checkpoint_interval() == 0
+    if action == AuditAction.UPDATE and before is not None and after is not None:
+        changed_before, changed_after = compute_changes(before, after)
+        removed = sorted(before.keys() - after.keys())
+        before = changed_before
+        if not is_checkpoint:
+            after = {key: value for key, value in changed_after.items() if key not in removed}
+            if removed:
+                after[REMOVED_KEYS] = removed
+    elif action == AuditAction.DELETE:
+        is_checkpoint = False
+    return before or None, after or None, is_checkpoint and bool(after)
+
+
+def lock_audited_rows(entity_table: str, entity_ids: Iterable[Any]) -> None:
+    """Lock the audited rows with ``SELECT ... FOR UPDATE`` until the transaction ends.
+
+    Taken before the next ``sequence`` is read, so two entries for one entity
+    cannot both be numbered last+1. Entities whose row is gone (deletes) or
+    whose table is not a model are not locked.
+    """
+
+    model = next((model for model in apps.get_models() if model._meta.db_table == entity_table), None)
+    if model is not None:
+        rows = model._default_manager.select_for_update().filter(pk__in=list(entity_ids)).order_by('pk')
+        list(rows.values_list('pk', flat=True))
+
+
 def record_audit_event(
     *,
     actor: Optional[User],
@@ -16,20 +87,153 @@ def record_audit_event(
     before: Optional[dict[str, Any]] = None,
     after: Optional[dict[str, Any]] = None,
 ) -> AuditLog:
-    """Persist a single audit log entry."""
+    """Persist a single audit log entry.
+
+    Updates only store the keys that changed or were removed. Creates, and every
+    ``AUDIT_CHECKPOINT_INTERVAL``-th entry of an entity, keep the full
+    ``after`` snapshot as a checkpoint so history can be replayed without
+    walking back to the first entry.
+    """
 
     with transaction.atomic():
+        lock_audited_rows(entity_table, [entity_id])
+        last_sequence = (
+            AuditLog.objects.filter(entity_table=entity_table, entity_id=entity_id)
+            .order_by('-sequence')
+            .values_list('sequence', flat=True)
+            .first()
+        )
+        sequence = (last_sequence or 0) + 1
+        before, after, is_checkpoint = _compact_entry(action, sequence, before, after)
         log = AuditLog.objects.create(
             actor_user=actor,
             entity_table=entity_table,
             entity_id=entity_id,
             action=action,
-            before=before or None,
-            after=after or None,
+            before=before,
+            after=after,
+            sequence=sequence,
+            is_checkpoint=is_checkpoint,
         )
     return log
 
 
+def record_update_events(
+    *,
+    actor: Optional[User],
+    entity_table: str,
+    changes: dict[Any, tuple[dict[str, Any], dict[str, Any]]],
+    batch_size: int = 500,
+) -> list[AuditLog]:
+    """Persist UPDATE entries for many entities of one table with ``bulk_create``.
+
+    ``changes`` maps entity ids to their (before, after) snapshots. Sequence
+    numbers for the whole batch come from one aggregate query, under the same
+    row locks as ``record_audit_event``; entries are compacted and
+    checkpointed exactly as it does.
+    """
+
+    if not changes:
+        return []
+    with transaction.atomic():
+        lock_audited_rows(entity_table, changes)
+        last_sequences = dict(
+            AuditLog.objects.filter(entity_table=entity_table, entity_id__in=list(changes))
+            .order_by()
+            .values('entity_id')
+            .annotate(last=Max('sequence'))
+            .values_list('entity_id', 'last')
+        )
+        logs = []
+        for entity_id, (before, after) in changes.items():
+            sequence = (last_sequences.get(entity_id) or 0) + 1
+            before, after, is_checkpoint = _compact_entry(AuditAction.UPDATE, sequence, before, after)
+            logs.append(
+                AuditLog(
+                    actor_user=actor,
+                    entity_table=entity_table,
+                    entity_id=entity_id,
+                    action=AuditAction.UPDATE,
+                    before=before,
+                    after=after,
+                    sequence=sequence,
+                    is_checkpoint=is_checkpoint,
+                )
+            )
+        return AuditLog.objects.bulk_create(logs, batch_size=batch_size)
+
+
+def record_created_events(
+    *,
+    actor: Optional[User],
+    entity_table: str,
+    snapshots: dict[Any, dict[str, Any]],
+    batch_size: int = 500,
+) -> list[AuditLog]:
+    """Persist CREATE entries for many new entities of one table with ``bulk_create``.
+
+    ``snapshots`` maps entity ids to their ``after`` snapshot. New entities have
+    no prior history, so every entry starts the sequence as a checkpoint.
+    """
+
+    logs = [
+        AuditLog(
+            actor_user=actor,
+            entity_table=entity_table,
+            entity_id=entity_id,
+            action=AuditAction.CREATE,
+            after=after or None,
+            sequence=1,
+            is_checkpoint=bool(after),
+        )
+        for entity_id, after in snapshots.items()
+    ]
+    return AuditLog.objects.bulk_create(logs, batch_size=batch_size)
+
+
+def apply_audit_entry(state: Optional[dict[str, Any]], entry: AuditLog) -> Optional[dict[str, Any]]:
+    """Return ``state`` with a single audit entry replayed on top of it."""
+
+    if entry.action == AuditAction.DELETE:
+        return None
+    if entry.is_checkpoint:
+        return dict(entry.after or {})
+    # Entries written before compaction hold full snapshots, which merge the same way.
+    merged = dict(state or {})
+    after = dict(entry.after or {})
+    removed = after.pop(REMOVED_KEYS, ())
+    merged.update(after)
+    for key in removed:
+        merged.pop(key, None)
+    return merged
+
+
+def reconstruct_entity_state(
+    entity_table: str,
+    entity_id: Any,
+    as_of: Optional[datetime] = None,
+) -> Optional[dict[str, Any]]:
+    """Rebuild the snapshot of an entity as recorded at ``as_of`` (default: latest).
+
+    Replay starts from the most recent checkpoint at or before ``as_of`` and
+    applies the compact diffs that follow it. Returns ``None`` when nothing
+    was recorded yet or the entity was deleted.
+    """
+
+    entries = AuditLog.objects.filter(entity_table=entity_table, entity_id=entity_id)
+    if as_of is not None:
+        entries = entries.filter(created_at__lte=as_of)
+
+    checkpoint = entries.filter(is_checkpoint=True).order_by('-sequence', '-created_at').first()
+    if checkpoint is not None:
+        entries = entries.filter(sequence__gt=checkpoint.sequence)
+
+    state = apply_audit_entry(None, checkpoint) if checkpoint is not None else None
+    for entry in entries.order_by('sequence', 'created_at'):
+        state = apply_audit_entry(state, entry)
+    return state
+
+
 def format_deadline_snapshot(deadline) -> dict[str, Any]:
     """Return a minimal dict describing the important deadline fields."""
 
@@ -0,0 +1,425 @@
+"""Monthly range partitioning, retention and archival for ``audit_log``.
+
+Partitioning is Postgres-only. Archives are gzip-compressed NDJSON files
+(one audit row per line) listed in a ``manifest.json`` next to them, and can
+be re-imported on any database backend.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection as default_connection
+from django.db import transaction
+from django.utils import timezone
+
+from court_rules.models import AuditLog
+
+
+AUDIT_TABLE = AuditLog._meta.db_table
+PARTITION_PREFIX = f'{AUDIT_TABLE}_p'
+DEFAULT_PARTITION = f'{AUDIT_TABLE}_default'
+MANIFEST_NAME = 'manifest.json'
+ARCHIVE_FIELDS = [
+    'id',
+    'actor_user',
+    'entity_table',
+    'entity_id',
+    'action',
+    'before',
+    'after',
+    'sequence',
+    'is_checkpoint',
+    'created_at',
+]
+EXPORT_BATCH_SIZE = 2000
+
+
+@dataclass
+class ArchivedPartition:
+    partition: str
+    range_start: str
+    range_end: str
+    file: str
+    rows: int
+    sha256: str
+    archived_at: str
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f'{PARTITION_PREFIX}{month:%Y%m}'
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Return the first day of the month a partition covers, or ``None`` for foreign tables."""
+
+    suffix = name[len(PARTITION_PREFIX):] if name.startswith(PARTITION_PREFIX) else ''
+    if len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+def _month_bound(month: date) -> datetime:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.get_current_timezone())
+
+
+def get_retention_months() -> int:
+    return int(getattr(settings, 'AUDIT_RETENTION_MONTHS', 84))
+
+
+def get_archive_dir() -> Path:
+    return Path(getattr(settings, 'AUDIT_ARCHIVE_DIR', Path(settings.BASE_DIR) / 'archives' / 'audit_log'))
+
+
+def supports_partitioning(connection=default_connection) -> bool:
+    return connection.vendor == 'postgresql'
+
+
+def is_partitioned(connection=default_connection) -> bool:
+    if not supports_partitioning(connection):
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid '
+            'WHERE c.relname = %s AND pg_table_is_visible(c.oid)',
+            [AUDIT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(connection=default_connection) -> list[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits i '
+            'JOIN pg_class parent ON parent.oid = i.inhparent '
+            'JOIN pg_class child ON child.oid = i.inhrelid '
+            'WHERE parent.relname = %s AND pg_table_is_visible(parent.oid) '
+            'ORDER BY child.relname',
+            [AUDIT_TABLE],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def partition_exists(name: str, connection=default_connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s)', [connection.ops.quote_name(name)])
+        return cursor.fetchone()[0] is not None
+
+
+def create_partition(month: date, connection=default_connection) -> str:
+    """Create the partition for ``month``, moving any of its rows out of the default partition."""
+
+    name = partition_name(month)
+    if partition_exists(name, connection):
+        return name
+    qn = connection.ops.quote_name
+    bounds = [_month_bound(month), _month_bound(add_months(month, 1))]
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            if not partition_exists(DEFAULT_PARTITION, connection):
+                cursor.execute(
+                    f'CREATE TABLE {qn(name)} PARTITION OF {qn(AUDIT_TABLE)} FOR VALUES FROM (%s) TO (%s)', bounds
+                )
+                return name
+            # Postgres refuses a new partition while the default one holds rows in its range,
+            # so build it detached, move those rows into it, then attach it.
+            cursor.execute(f'LOCK TABLE {qn(DEFAULT_PARTITION)} IN SHARE ROW EXCLUSIVE MODE')
+            cursor.execute(f'CREATE TABLE {qn(name)} (LIKE {qn(AUDIT_TABLE)} INCLUDING DEFAULTS)')
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} '
+                f'WHERE {qn("created_at")} >= %s AND {qn("created_at")} < %s RETURNING *) '
+                f'INSERT INTO {qn(name)} SELECT * FROM moved',
+                bounds,
+            )
+            cursor.execute(
+                f'ALTER TABLE {qn(AUDIT_TABLE)} ATTACH PARTITION {qn(name)} FOR VALUES FROM (%s) TO (%s)', bounds
+            )
+    return name
+
+
+def create_default_partition(connection=default_connection) -> str:
+    """Create the partition that takes rows outside every monthly range."""
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {qn(DEFAULT_PARTITION)} PARTITION OF {qn(AUDIT_TABLE)} DEFAULT')
+    return DEFAULT_PARTITION
+
+
+def split_default_partition(connection=default_connection) -> list[str]:
+    """Move rows that landed in the default partition into monthly partitions of their own."""
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN({qn("created_at")}), MAX({qn("created_at")}) FROM {qn(DEFAULT_PARTITION)}')
+        oldest, newest = cursor.fetchone()
+    if oldest is None:
+        return []
+    return ensure_partitions(timezone.localtime(oldest).date(), timezone.localtime(newest).date(), connection)
+
+
+def ensure_partitions(start: date, end: date, connection=default_connection) -> list[str]:
+    """Create every monthly partition from ``start`` through ``end`` (inclusive)."""
+
+    created = []
+    month = month_start(start)
+    while month <= month_start(end):
+        created.append(create_partition(month, connection))
+        month = add_months(month, 1)
+    return created
+
+
+def ensure_future_partitions(months_ahead: int, today: Optional[date] = None, connection=default_connection) -> list[str]:
+    today = today or timezone.localdate()
+    return ensure_partitions(today, add_months(month_start(today), months_ahead), connection)
+
+
+def convert_to_partitioned(months_ahead: int = 3, connection=default_connection) -> int:
+    """Rebuild ``audit_log`` as a table range-partitioned by month on ``created_at``.
+
+    Existing rows are copied into their monthly partitions and the old heap is
+    dropped. The primary key becomes (``id``, ``created_at``) because Postgres
+    requires the partition key in every unique constraint; every other index of
+    the old table is recreated as it was. Rows outside the monthly partitions go
+    to a default partition until ``split_default_partition`` moves them out.
+    Returns the number of rows moved.
+    """
+
+    if not supports_partitioning(connection):
+        raise RuntimeError('Audit log partitioning requires PostgreSQL.')
+    if is_partitioned(connection):
+        return 0
+
+    qn = connection.ops.quote_name
+    legacy_table = f'{AUDIT_TABLE}_unpartitioned'
+    columns = ', '.join(qn(AuditLog._meta.get_field(name).column) for name in ARCHIVE_FIELDS)
+
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE {qn(AUDIT_TABLE)} IN ACCESS EXCLUSIVE MODE')
+            # Django's own indexes (Meta.indexes, the actor_user foreign key) and any added by hand.
+            cursor.execute(
+                'SELECT i.relname, pg_get_indexdef(i.oid) FROM pg_index x '
+                'JOIN pg_class i ON i.oid = x.indexrelid '
+                'WHERE x.indrelid = %s::regclass AND NOT x.indisprimary ORDER BY i.relname',
+                [qn(AUDIT_TABLE)],
+            )
+            indexes = cursor.fetchall()
+            for index_name, _ in indexes:
+                cursor.execute(f'ALTER INDEX {qn(index_name)} RENAME TO {qn(index_name + "_old")}')
+            cursor.execute(f'ALTER TABLE {qn(AUDIT_TABLE)} RENAME TO {qn(legacy_table)}')
+            cursor.execute(
+                f'CREATE TABLE {qn(AUDIT_TABLE)} (LIKE {qn(legacy_table)} INCLUDING DEFAULTS) '
+                f'PARTITION BY RANGE ({qn("created_at")})'
+            )
+            cursor.execute(f'ALTER TABLE {qn(AUDIT_TABLE)} ADD PRIMARY KEY ({qn("id")}, {qn("created_at")})')
+            actor_column = AuditLog._meta.get_field('actor_user').column
+            cursor.execute(
+                f'ALTER TABLE {qn(AUDIT_TABLE)} ADD FOREIGN KEY ({qn(actor_column)}) '
+                f'REFERENCES {qn(AuditLog._meta.get_field("actor_user").related_model._meta.db_table)} ({qn("id")}) '
+                f'ON DELETE SET NULL DEFERRABLE INITIALLY DEFERRED'
+            )
+            # The definitions were read before the rename, so they name the new table.
+            for _, definition in indexes:
+                cursor.execute(definition)
+
+            cursor.execute(f'SELECT MIN({qn("created_at")}) FROM {qn(legacy_table)}')
+            oldest = cursor.fetchone()[0]
+            today = timezone.localdate()
+            first_month = timezone.localtime(oldest).date() if oldest else today
+            ensure_partitions(first_month, add_months(month_start(today), months_ahead), connection)
+            create_default_partition(connection)
+
+            cursor.execute(
+                f'INSERT INTO {qn(AUDIT_TABLE)} ({columns}) SELECT {columns} FROM {qn(legacy_table)}'
+            )
+            moved = cursor.rowcount
+            cursor.execute(f'DROP TABLE {qn(legacy_table)}')
+    return moved
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ArchiveJSONEncoder(DjangoJSONEncoder):
+    """Keep full microsecond precision; DjangoJSONEncoder truncates to milliseconds."""
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _encode_row(row: dict[str, Any]) -> bytes:
+    return (json.dumps(row, cls=ArchiveJSONEncoder, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def export_audit_rows(queryset, path: Path) -> tuple[int, str]:
+    """Stream ``queryset`` rows into a gzip NDJSON file and return (row count, sha256 of the file)."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    values = [name if name != 'actor_user' else 'actor_user_id' for name in ARCHIVE_FIELDS]
+    rows = 0
+    with gzip.open(path, 'wb') as handle:
+        for row in queryset.order_by().values(*values).iterator(chunk_size=EXPORT_BATCH_SIZE):
+            handle.write(_encode_row(row))
+            rows += 1
+    return rows, _file_sha256(path)
+
+
+def read_manifest(archive_dir: Path) -> dict[str, Any]:
+    manifest_path = archive_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {'table': AUDIT_TABLE, 'partitions': []}
+    return json.loads(manifest_path.read_text())
+
+
+def write_manifest_entry(archive_dir: Path, entry: ArchivedPartition) -> None:
+    manifest = read_manifest(archive_dir)
+    manifest['partitions'] = [
+        existing for existing in manifest['partitions'] if existing['partition'] != entry.partition
+    ]
+    manifest['partitions'].append(asdict(entry))
+    manifest['partitions'].sort(key=lambda existing: existing['range_start'])
+    (archive_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+
+
+def archive_month(month: date, archive_dir: Path, queryset=None) -> ArchivedPartition:
+    """Export one month of audit rows to ``archive_dir`` and record it in the manifest."""
+
+    lower, upper = _month_bound(month), _month_bound(add_months(month, 1))
+    queryset = queryset if queryset is not None else AuditLog.objects.all()
+    name = partition_name(month)
+    file_name = f'{name}.ndjson.gz'
+    rows, sha256 = export_audit_rows(
+        queryset.filter(created_at__gte=lower, created_at__lt=upper),
+        archive_dir / file_name,
+    )
+    entry = ArchivedPartition(
+        partition=name,
+        range_start=lower.isoformat(),
+        range_end=upper.isoformat(),
+        file=file_name,
+        rows=rows,
+        sha256=sha256,
+        archived_at=timezone.now().isoformat(),
+    )
+    write_manifest_entry(archive_dir, entry)
+    return entry
+
+
+def expired_partitions(
+    retention_months: int,
+    today: Optional[date] = None,
+    connection=default_connection,
+) -> list[tuple[str, date]]:
+    """``(name, month)`` of every partition that ends before the retention window."""
+
+    today = today or timezone.localdate()
+    cutoff = add_months(month_start(today), -retention_months)
+    expired = []
+    for name in list_partitions(connection):
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= cutoff:
+            expired.append((name, month))
+    return expired
+
+
+def detach_expired_partitions(
+    retention_months: int,
+    archive_dir: Path,
+    today: Optional[date] = None,
+    connection=default_connection,
+) -> list[ArchivedPartition]:
+    """Archive and drop every partition that ends before the retention window.
+
+    Each partition is locked against writes, exported, detached and dropped in
+    one transaction, so a failed export leaves the partition attached.
+    """
+
+    qn = connection.ops.quote_name
+    archived = []
+    for name, month in expired_partitions(retention_months, today, connection):
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(f'LOCK TABLE {qn(name)} IN SHARE MODE')
+                archived.append(archive_month(month, archive_dir))
+                cursor.execute(f'ALTER TABLE {qn(AUDIT_TABLE)} DETACH PARTITION {qn(name)}')
+                cursor.execute(f'DROP TABLE {qn(name)}')
+    return archived
+
+
+def _decode_rows(path: Path) -> Iterable[dict[str, Any]]:
+    with gzip.open(path, 'rt', encoding='utf-8') as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def import_archive(
+    manifest_path: Path,
+    partitions: Optional[Iterable[str]] = None,
+    connection=default_connection,
+) -> int:
+    """Re-insert archived rows listed in a manifest; rows already present are skipped.
+
+    Returns the number of rows read from the archive files.
+    """
+
+    archive_dir = manifest_path.parent
+    manifest = json.loads(manifest_path.read_text())
+    wanted = set(partitions) if partitions else None
+    fields = [AuditLog._meta.get_field(name) for name in ARCHIVE_FIELDS]
+    qn = connection.ops.quote_name
+    columns = ', '.join(qn(field.column) for field in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+    sql = f'INSERT INTO {qn(AUDIT_TABLE)} ({columns}) VALUES ({placeholders}) ON CONFLICT DO NOTHING'
+
+    imported = 0
+    for entry in manifest['partitions']:
+        if wanted is not None and entry['partition'] not in wanted:
+            continue
+        path = archive_dir / entry['file']
+        if _file_sha256(path) != entry['sha256']:
+            raise ValueError(f'Checksum mismatch for archive {path}.')
+
+        with transaction.atomic(using=connection.alias):
+            if is_partitioned(connection):
+                create_partition(partition_month(entry['partition']), connection)
+            batch = []
+            with connection.cursor() as cursor:
+                for row in _decode_rows(path):
+                    batch.append([
+                        field.get_db_prep_value(field.to_python(row[field.attname]), connection)
+                        for field in fields
+                    ])
+                    if len(batch) >= EXPORT_BATCH_SIZE:
+                        cursor.executemany(sql, batch)
+                        imported += len(batch)
+                        batch = []
+                if batch:
+                    cursor.executemany(sql, batch)
+                    imported += len(batch)
+    return imported
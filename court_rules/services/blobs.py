@@ -0,0 +1,247 @@
+"""Content-addressed blob store for document files.
+
+Files are keyed by their SHA-256. Uploads are streamed to a temporary file
+and hashed while they are written; when the hash is already stored the
+temporary file is dropped, so the same exhibit uploaded to many cases takes
+the space of one. ``Blob.ref_count`` tracks how many documents point at a
+blob, and ``collect_garbage`` removes blobs that have been unreferenced for
+longer than ``BLOB_GC_GRACE_HOURS``.
+
+A document whose bytes are already stored also inherits the OCR result,
+page count and chunks of an earlier copy, so duplicates cost no processing.
+
+The storage backend is pluggable through ``BLOB_STORE_BACKEND``; the default
+keeps files on the local filesystem under ``BLOB_STORE_OPTIONS['root']``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from court_rules.models import Blob, DocChunk, Document, OcrStatus
+
+
+DEFAULT_GC_GRACE_HOURS = 24
+
+
+class BlobBackend:
+    """Where blob bytes live. Keys are lowercase hex SHA-256 digests."""
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def open(self, key: str) -> BinaryIO:
+        raise NotImplementedError
+
+    def size(self, key: str) -> int:
+        raise NotImplementedError
+
+    def create_temporary(self) -> tuple[BinaryIO, Any]:
+        """Return a writable handle and a reference to pass to ``commit`` or ``discard``."""
+
+        raise NotImplementedError
+
+    def commit(self, temporary: Any, key: str) -> None:
+        raise NotImplementedError
+
+    def discard(self, temporary: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class FileSystemBlobBackend(BlobBackend):
+    """Stores ``<root>/ab/cd/abcd...``; temporary files live under ``<root>/tmp`` on the same device."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def exists(self, key: str) -> bool:
+        return self.path(key).is_file()
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self.path(key), 'rb')
+
+    def size(self, key: str) -> int:
+        return self.path(key).stat().st_size
+
+    def create_temporary(self) -> tuple[BinaryIO, Any]:
+        directory = self.root / 'tmp'
+        directory.mkdir(parents=True, exist_ok=True)
+        handle = tempfile.NamedTemporaryFile(dir=directory, delete=False)
+        return handle, handle.name
+
+    def commit(self, temporary: Any, key: str) -> None:
+        target = self.path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic on one filesystem; a concurrent writer of the same key writes identical bytes.
+        os.replace(temporary, target)
+
+    def discard(self, temporary: Any) -> None:
+        try:
+            os.unlink(temporary)
+        except FileNotFoundError:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            self.path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def get_blob_backend() -> BlobBackend:
+    backend_class = import_string(settings.BLOB_STORE_BACKEND)
+    return backend_class(**getattr(settings, 'BLOB_STORE_OPTIONS', {}))
+
+
+def get_gc_grace() -> timedelta:
+    return timedelta(hours=float(getattr(settings, 'BLOB_GC_GRACE_HOURS', DEFAULT_GC_GRACE_HOURS)))
+
+
+@dataclass
+class StagedUpload:
+    sha256: str
+    size: int
+    temporary: Any
+
+
+def stage_upload(chunks: Iterable[bytes], backend: Optional[BlobBackend] = None) -> StagedUpload:
+    """Write ``chunks`` to a temporary file, hashing them on the way through."""
+
+    backend = backend or get_blob_backend()
+    digest = hashlib.sha256()
+    size = 0
+    handle, temporary = backend.create_temporary()
+    try:
+        with handle:
+            for chunk in chunks:
+                digest.update(chunk)
+                handle.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        backend.discard(temporary)
+        raise
+    return StagedUpload(sha256=digest.hexdigest(), size=size, temporary=temporary)
+
+
+def acquire_blob(staged: StagedUpload, backend: Optional[BlobBackend] = None) -> tuple[Blob, bool]:
+    """Take a reference on the blob for ``staged``, storing its bytes only if they are new.
+
+    Must run inside a transaction. Returns the blob and whether it was
+    already stored (i.e. the upload was a duplicate).
+    """
+
+    backend = backend or get_blob_backend()
+    blob, created = Blob.objects.select_for_update().get_or_create(
+        sha256=staged.sha256, defaults={'size': staged.size}
+    )
+    # The row is locked, so garbage collection cannot remove the file between this check and commit.
+    if created or not backend.exists(staged.sha256):
+        backend.commit(staged.temporary, staged.sha256)
+    else:
+        backend.discard(staged.temporary)
+    Blob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1, released_at=None)
+    blob.ref_count += 1
+    return blob, not created
+
+
+def release_blob(blob_id: Any) -> None:
+    """Drop one reference; a blob reaching zero starts its garbage collection grace period."""
+
+    Blob.objects.filter(pk=blob_id, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+    Blob.objects.filter(pk=blob_id, ref_count=0, released_at__isnull=True).update(released_at=timezone.now())
+
+
+def inherit_processing(document: Document) -> bool:
+    """Copy OCR results and chunks from an already processed document with the same blob."""
+
+    source = (
+        Document.objects.filter(blob_id=document.blob_id, ocr_status=OcrStatus.COMPLETE)
+        .exclude(pk=document.pk)
+        .order_by('uploaded_at')
+        .first()
+    )
+    if source is None:
+        return False
+    chunks = [
+        DocChunk(
+            document=document,
+            chunk_index=chunk.chunk_index,
+            start_offset=chunk.start_offset,
+            end_offset=chunk.end_offset,
+            heading=chunk.heading,
+            content=chunk.content,
+            embedding_id=chunk.embedding_id,
+            model_version=chunk.model_version,
+        )
+        for chunk in source.chunks.all()
+    ]
+    DocChunk.objects.bulk_create(chunks, batch_size=500)
+    document.ocr_status = OcrStatus.COMPLETE
+    document.page_count = document.page_count or source.page_count
+    Document.objects.filter(pk=document.pk).update(ocr_status=document.ocr_status, page_count=document.page_count)
+    return True
+
+
+def ingest_document(
+    chunks: Iterable[bytes],
+    *,
+    backend: Optional[BlobBackend] = None,
+    **fields: Any,
+) -> tuple[Document, bool]:
+    """Store an uploaded file and create its ``Document``; returns it and whether it was a duplicate.
+
+    ``fields`` are passed to ``Document`` (case, title, source, mime_type, ...).
+    """
+
+    backend = backend or get_blob_backend()
+    staged = stage_upload(chunks, backend)
+    try:
+        with transaction.atomic():
+            blob, duplicate = acquire_blob(staged, backend)
+            document = Document.objects.create(blob=blob, file_hash=blob.sha256, **fields)
+            if duplicate:
+                inherit_processing(document)
+    except BaseException:
+        backend.discard(staged.temporary)
+        raise
+    return document, duplicate
+
+
+def collect_garbage(*, grace: Optional[timedelta] = None, now: Optional[datetime] = None) -> tuple[int, int]:
+    """Delete blobs unreferenced for longer than ``grace``; returns (blobs, bytes) removed."""
+
+    cutoff = (now or timezone.now()) - (grace if grace is not None else get_gc_grace())
+    backend = get_blob_backend()
+    removed = freed = 0
+    with transaction.atomic():
+        expired = list(
+            Blob.objects.select_for_update()
+            .filter(ref_count=0, released_at__lt=cutoff)
+            # Guards against a drifted count; PROTECT would refuse the delete anyway.
+            .filter(~Exists(Document.objects.filter(blob=OuterRef('pk'))))
+        )
+        for blob in expired:
+            # Files go while the rows are locked, so a concurrent upload of the same bytes waits and re-stores them.
+            backend.delete(blob.sha256)
+            removed += 1
+            freed += blob.size
+        Blob.objects.filter(pk__in=[blob.pk for blob in expired]).delete()
+    return removed, freed
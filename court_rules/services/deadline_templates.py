@@ -0,0 +1,224 @@
+"""Compiled registry of ``DeadlineTemplate`` recipes.
+
+Active templates are compiled once per worker into template sets keyed by
+(trigger event, jurisdiction). A set holds its steps in dependency order, so
+expanding a trigger date is one pass: each step is counted from the trigger
+or from the due date of the earlier step it is anchored to. Jurisdiction
+sets include the templates that apply everywhere (blank jurisdiction).
+
+Workers notice template changes through a version counter in the Django cache
+that template signals bump, and recompile on the next lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Any, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from court_rules.metrics import record_cache
+from court_rules.models import (
+    Case,
+    Deadline,
+    DeadlineDependency,
+    DeadlineTemplate,
+    DeadlineTriggerType,
+    User,
+)
+from court_rules.services.deadlines import (
+    TRIGGER_SOURCE_TEMPLATE,
+    ComputedDate,
+    CourtCalendar,
+    DeadlineRecipe,
+    bulk_create_deadlines,
+    court_timezone,
+    due_instant,
+)
+
+
+CACHE_VERSION_KEY = 'deadline-templates:version'
+ANY_JURISDICTION = ''
+
+
+@dataclass(frozen=True)
+class TemplateStep:
+    template_id: Any
+    recipe: DeadlineRecipe
+    # Index of the earlier step this one is counted from, or None for the trigger date.
+    anchor: Optional[int]
+
+
+class CompiledTemplateSet:
+    def __init__(self, trigger_event: str, jurisdiction: str, steps: list[TemplateStep]):
+        self.trigger_event = trigger_event
+        self.jurisdiction = jurisdiction
+        self.steps = steps
+
+    def __len__(self):
+        return len(self.steps)
+
+    def expand(self, trigger: date, calendar: CourtCalendar) -> list[ComputedDate]:
+        """Return the computed date of every step, in step order."""
+
+        computed: list[ComputedDate] = []
+        for step in self.steps:
+            start = trigger if step.anchor is None else computed[step.anchor].due_date
+            computed.append(calendar.compute(start, step.recipe))
+        return computed
+
+
+def _order_steps(templates: list[DeadlineTemplate]) -> list[TemplateStep]:
+    """Topologically order templates so anchors come first; unresolvable ones are dropped."""
+
+    by_id = {template.pk: template for template in templates}
+    dependents: dict[Any, list[DeadlineTemplate]] = defaultdict(list)
+    ready: deque[DeadlineTemplate] = deque()
+    for template in templates:
+        if template.anchor_id is None:
+            ready.append(template)
+        elif template.anchor_id in by_id:
+            dependents[template.anchor_id].append(template)
+
+    steps: list[TemplateStep] = []
+    positions: dict[Any, int] = {}
+    while ready:
+        template = ready.popleft()
+        positions[template.pk] = len(steps)
+        steps.append(
+            TemplateStep(
+                template_id=template.pk,
+                recipe=DeadlineRecipe(
+                    label=template.label,
+                    offset_days=template.offset_days,
+                    basis=template.basis,
+                    roll_forward=template.roll_forward,
+                    priority=template.priority,
+                    rule_id=template.rule_id,
+                ),
+                anchor=positions.get(template.anchor_id),
+            )
+        )
+        ready.extend(dependents.pop(template.pk, ()))
+    return steps
+
+
+def compile_templates(templates: Iterable[DeadlineTemplate]) -> dict[tuple[str, str], CompiledTemplateSet]:
+    groups: dict[str, dict[str, list[DeadlineTemplate]]] = defaultdict(lambda: defaultdict(list))
+    for template in templates:
+        groups[template.trigger_event][template.jurisdiction].append(template)
+
+    compiled = {}
+    for trigger_event, by_jurisdiction in groups.items():
+        shared = by_jurisdiction.get(ANY_JURISDICTION, [])
+        for jurisdiction, templates_for_jurisdiction in by_jurisdiction.items():
+            members = templates_for_jurisdiction if jurisdiction == ANY_JURISDICTION else shared + templates_for_jurisdiction
+            compiled[(trigger_event, jurisdiction)] = CompiledTemplateSet(
+                trigger_event, jurisdiction, _order_steps(members)
+            )
+    return compiled
+
+
+class TemplateRegistry:
+    def __init__(self, templates: Iterable[DeadlineTemplate]):
+        self.sets = compile_templates(templates)
+
+    @classmethod
+    def from_database(cls) -> 'TemplateRegistry':
+        return cls(DeadlineTemplate.objects.filter(is_active=True).order_by('trigger_event', 'label'))
+
+    def trigger_events(self) -> list[str]:
+        return sorted({trigger_event for trigger_event, _ in self.sets})
+
+    def lookup(self, trigger_event: str, jurisdiction: str = ANY_JURISDICTION) -> Optional[CompiledTemplateSet]:
+        return self.sets.get((trigger_event, jurisdiction)) or self.sets.get((trigger_event, ANY_JURISDICTION))
+
+
+_lock = threading.Lock()
+_state: dict[str, Optional[object]] = {'registry': None, 'version': None}
+
+
+def _current_version() -> int:
+    cache.add(CACHE_VERSION_KEY, 0, None)
+    return cache.get(CACHE_VERSION_KEY, 0)
+
+
+def get_template_registry() -> TemplateRegistry:
+    version = _current_version()
+    with _lock:
+        if _state['registry'] is None or _state['version'] != version:
+            record_cache('template_registry', 'rebuild')
+            _state['registry'], _state['version'] = TemplateRegistry.from_database(), version
+        else:
+            record_cache('template_registry', 'hit')
+        return _state['registry']
+
+
+def invalidate_template_registry() -> None:
+    _current_version()
+    cache.incr(CACHE_VERSION_KEY)
+
+
+def build_template_deadlines(
+    case: Case,
+    template_set: CompiledTemplateSet,
+    trigger: date,
+    calendar: CourtCalendar,
+    *,
+    holiday_calendar_id: Any = None,
+    cutoff: Optional[time] = None,
+    actor: Optional[User] = None,
+) -> tuple[list[Deadline], list[DeadlineDependency]]:
+    """Build (unsaved) deadlines for a template set plus dependencies between anchored ones."""
+
+    zone_name = court_timezone(case)
+    deadlines: list[Deadline] = []
+    for step, computed in zip(template_set.steps, template_set.expand(trigger, calendar)):
+        deadlines.append(
+            Deadline(
+                case=case,
+                trigger_type=DeadlineTriggerType.RULE if step.recipe.rule_id else DeadlineTriggerType.COURT_ORDER,
+                trigger_source_type=TRIGGER_SOURCE_TEMPLATE,
+                trigger_source_id=step.template_id,
+                basis=step.recipe.basis,
+                holiday_calendar_id=holiday_calendar_id,
+                due_at=due_instant(computed.due_date, zone_name, cutoff),
+                timezone=zone_name,
+                owner_id=case.lead_attorney_id,
+                priority=step.recipe.priority,
+                computation_rationale=computed.rationale,
+                created_by=actor,
+                updated_by=actor,
+            )
+        )
+    dependencies = [
+        DeadlineDependency(predecessor=deadlines[step.anchor], successor=deadline, dependency_type='anchor')
+        for step, deadline in zip(template_set.steps, deadlines)
+        if step.anchor is not None
+    ]
+    return deadlines, dependencies
+
+
+def apply_template(
+    case: Case,
+    template_set: CompiledTemplateSet,
+    trigger: date,
+    calendar: CourtCalendar,
+    *,
+    holiday_calendar_id: Any = None,
+    cutoff: Optional[time] = None,
+    actor: Optional[User] = None,
+) -> list[Deadline]:
+    """Create every deadline of ``template_set`` for ``case`` in one transaction."""
+
+    deadlines, dependencies = build_template_deadlines(
+        case, template_set, trigger, calendar, holiday_calendar_id=holiday_calendar_id, cutoff=cutoff, actor=actor
+    )
+    with transaction.atomic():
+        bulk_create_deadlines(deadlines, actor=actor)
+        DeadlineDependency.objects.bulk_create(dependencies)
+    return deadlines
@@ -0,0 +1,317 @@
+"""Business-day deadline arithmetic.
+
+Counting follows FRCP 6(a)(1): the trigger day is excluded and, when the last
+day falls on a weekend or court holiday, the period runs to the next court day.
+Backward-counted periods roll to the previous court day instead (FRCP 6(a)(5)).
+Business-day periods count court days only.
+
+Court days for a holiday calendar are precomputed as a sorted list of date
+ordinals, so adding N court days is a binary search and an index rather than
+a day-by-day loop.
+
+A deadline falling on a day expires at the judge's filing cutoff (or
+23:59:59 when none is set) in the court's time zone; ``due_instant`` turns
+that into the UTC instant stored in ``Deadline.due_at``.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
+
+from court_rules.models import (
+    Case,
+    Deadline,
+    DeadlineBasis,
+    DeadlineStatus,
+    DeadlineTriggerType,
+    Hearing,
+    Holiday,
+    HolidayCalendar,
+    Judge,
+    User,
+)
+from court_rules.services.audit import format_deadline_snapshot, record_created_events, record_update_events
+from court_rules.services.judges import current_procedures_queryset, latest_versions
+from court_rules.services.timezones import get_zone, local_to_utc
+
+
+WEEKEND = frozenset({5, 6})
+# Court days are precomputed this many years either side of the dates requested.
+CALENDAR_MARGIN_YEARS = 2
+END_OF_DAY = time(23, 59, 59)
+BULK_BATCH_SIZE = 500
+# ``Deadline.trigger_source_type`` of deadlines generated from a hearing or a deadline template.
+TRIGGER_SOURCE_HEARING = 'hearing'
+TRIGGER_SOURCE_TEMPLATE = 'deadline_template'
+
+
+@dataclass(frozen=True)
+class DeadlineRecipe:
+    """How one deadline is derived from a trigger date."""
+
+    label: str
+    offset_days: int
+    basis: str = DeadlineBasis.CALENDAR_DAYS
+    roll_forward: bool = True
+    priority: int = 3
+    rule_id: Any = None
+
+
+@dataclass(frozen=True)
+class ComputedDate:
+    due_date: date
+    rationale: str
+
+
+class CourtCalendar:
+    """Court days for one holiday calendar."""
+
+    def __init__(self, holidays: Iterable[date] = ()):
+        self.holidays = frozenset(holidays)
+        self._first_year: Optional[int] = None
+        self._last_year: Optional[int] = None
+        self._ordinals: list[int] = []
+
+    def is_court_day(self, day: date) -> bool:
+        return day.weekday() not in WEEKEND and day not in self.holidays
+
+    def _ensure_range(self, *days: date) -> None:
+        first_year = min(day.year for day in days) - CALENDAR_MARGIN_YEARS
+        last_year = max(day.year for day in days) + CALENDAR_MARGIN_YEARS
+        if self._first_year is not None and self._first_year <= first_year and last_year <= self._last_year:
+            return
+        if self._first_year is not None:
+            first_year, last_year = min(first_year, self._first_year), max(last_year, self._last_year)
+        start, end = date(first_year, 1, 1).toordinal(), date(last_year, 12, 31).toordinal()
+        self._ordinals = [
+            ordinal for ordinal in range(start, end + 1) if self.is_court_day(date.fromordinal(ordinal))
+        ]
+        self._first_year, self._last_year = first_year, last_year
+
+    def next_court_day(self, day: date) -> date:
+        """Return ``day`` if the court is open, otherwise the next court day."""
+
+        self._ensure_range(day)
+        return date.fromordinal(self._ordinals[bisect_left(self._ordinals, day.toordinal())])
+
+    def previous_court_day(self, day: date) -> date:
+        self._ensure_range(day)
+        return date.fromordinal(self._ordinals[bisect_right(self._ordinals, day.toordinal()) - 1])
+
+    def add_court_days(self, start: date, days: int) -> date:
+        """Count ``days`` court days after (or, when negative, before) ``start``."""
+
+        if days == 0:
+            return self.next_court_day(start)
+        # Court days never run more than two-to-one against calendar days, plus a holiday cluster.
+        span = timedelta(days=abs(days) * 2 + 30)
+        self._ensure_range(start, start - span if days < 0 else start + span)
+        if days > 0:
+            position = bisect_right(self._ordinals, start.toordinal()) + days - 1
+        else:
+            position = bisect_left(self._ordinals, start.toordinal()) + days
+        return date.fromordinal(self._ordinals[position])
+
+    def compute(self, trigger: date, recipe: DeadlineRecipe) -> ComputedDate:
+        """Apply ``recipe`` to a trigger date and explain how the due date was reached."""
+
+        days = recipe.offset_days
+        direction = 'after' if days >= 0 else 'before'
+        if recipe.basis == DeadlineBasis.BUSINESS_DAYS:
+            due_date = self.add_court_days(trigger, days)
+            rationale = f'{recipe.label}: {abs(days)} court days {direction} {trigger.isoformat()}'
+            return ComputedDate(due_date, rationale)
+
+        counted = trigger + timedelta(days=days)
+        rationale = f'{recipe.label}: {abs(days)} days {direction} {trigger.isoformat()}'
+        due_date = counted
+        if recipe.roll_forward and not self.is_court_day(counted):
+            due_date = self.next_court_day(counted) if days >= 0 else self.previous_court_day(counted)
+            rationale += f' ({counted.isoformat()} is not a court day; moved to {due_date.isoformat()})'
+        return ComputedDate(due_date, rationale)
+
+
+def load_court_calendars(calendar_ids: Iterable[Any]) -> dict[Any, CourtCalendar]:
+    """Build a ``CourtCalendar`` per holiday calendar id with one query.
+
+    ``None`` maps to a weekends-only calendar for deadlines without a holiday calendar.
+    """
+
+    calendar_ids = {calendar_id for calendar_id in calendar_ids if calendar_id is not None}
+    holidays: dict[Any, list[date]] = defaultdict(list)
+    if calendar_ids:
+        for calendar_id, day in Holiday.objects.filter(calendar_id__in=calendar_ids).order_by().values_list('calendar_id', 'date'):
+            holidays[calendar_id].append(day)
+    calendars: dict[Any, CourtCalendar] = {None: CourtCalendar()}
+    for calendar_id in calendar_ids:
+        calendars[calendar_id] = CourtCalendar(holidays.get(calendar_id, ()))
+    return calendars
+
+
+def due_instant(day: date, timezone_name: Optional[str], cutoff: Optional[time] = None) -> datetime:
+    """Return the UTC instant a deadline falling on ``day`` expires in the given court zone."""
+
+    return local_to_utc(day, cutoff or END_OF_DAY, timezone_name)
+
+
+def court_timezone(case: Case) -> str:
+    """The zone deadlines of ``case`` are computed in: its court's, else the case's own."""
+
+    if case.court_id and case.court.timezone:
+        return case.court.timezone
+    return case.timezone
+
+
+def holiday_calendar_for(case: Case, judge_id: Any = None) -> Any:
+    """The holiday calendar id court days of ``case`` are counted on.
+
+    That is the judge's calendar, else a calendar for the court's district,
+    else ``None`` (weekends only).
+    """
+
+    if judge_id is not None:
+        calendar_id = Judge.objects.filter(pk=judge_id).values_list('holiday_calendar_id', flat=True).first()
+        if calendar_id is not None:
+            return calendar_id
+    if case.court_id and case.court.district:
+        return district_calendars([case.court.district]).get(case.court.district)
+    return None
+
+
+def district_calendars(districts: Iterable[str]) -> dict[str, Any]:
+    """Map each district to the id of its first holiday calendar by name, with one query."""
+
+    calendars: dict[str, Any] = {}
+    districts = {district for district in districts if district}
+    if not districts:
+        return calendars
+    rows = HolidayCalendar.objects.filter(jurisdiction__in=districts).order_by('name').values_list('jurisdiction', 'id')
+    for district, calendar_id in rows:
+        calendars.setdefault(district, calendar_id)
+    return calendars
+
+
+def filing_cutoffs(judge_ids: Iterable[Any], today: Optional[date] = None) -> dict[Any, time]:
+    """Return each judge's filing cutoff from their current procedures with one query.
+
+    When several current procedures set a cutoff, the earliest one wins.
+    """
+
+    judge_ids = {judge_id for judge_id in judge_ids if judge_id is not None}
+    if not judge_ids:
+        return {}
+    procedures = current_procedures_queryset(today).filter(judge_id__in=judge_ids).only(
+        'judge_id', 'title', 'effective_date', 'created_at', 'filing_cutoff_time'
+    )
+    by_judge: dict[Any, list] = defaultdict(list)
+    for procedure in procedures:
+        by_judge[procedure.judge_id].append(procedure)
+    cutoffs = {}
+    for judge_id, judge_procedures in by_judge.items():
+        times = [procedure.filing_cutoff_time for procedure in latest_versions(judge_procedures) if procedure.filing_cutoff_time]
+        if times:
+            cutoffs[judge_id] = min(times)
+    return cutoffs
+
+
+def case_judges(case_ids: Iterable[Any]) -> dict[Any, Any]:
+    """Return the judge of each case's most recent hearing with one query."""
+
+    judges: dict[Any, Any] = {}
+    hearings = (
+        Hearing.objects.filter(case_id__in=set(case_ids), judge__isnull=False)
+        .order_by('case_id', '-starts_at')
+        .values_list('case_id', 'judge_id')
+    )
+    for case_id, judge_id in hearings:
+        judges.setdefault(case_id, judge_id)
+    return judges
+
+
+def bulk_create_deadlines(deadlines: list[Deadline], *, actor: Optional[User] = None) -> list[Deadline]:
+    """Insert generated deadlines and their CREATE audit entries in one transaction."""
+
+    with transaction.atomic():
+        Deadline.objects.bulk_create(deadlines, batch_size=BULK_BATCH_SIZE)
+        record_created_events(
+            actor=actor,
+            entity_table=Deadline._meta.db_table,
+            snapshots={deadline.pk: format_deadline_snapshot(deadline) for deadline in deadlines},
+            batch_size=BULK_BATCH_SIZE,
+        )
+    return deadlines
+
+
+RECOMPUTE_STATUSES = (DeadlineStatus.OPEN, DeadlineStatus.SNOOZED)
+
+
+def recompute_due_instants(
+    queryset: Optional[QuerySet] = None,
+    *,
+    actor: Optional[User] = None,
+    batch_size: int = 2000,
+) -> int:
+    """Re-derive ``due_at`` for open deadlines from their local due date, court zone and judge cutoff.
+
+    By default only deadlines the engine generated are considered: those from
+    a hearing, a deadline template or a rule. The local due date and time are
+    read in the zone the deadline was stored with. A deadline whose time is
+    neither 23:59:59 nor the judge's cutoff was set by hand and is left alone;
+    the rest are re-expired at the court's cutoff. Changed rows are written with
+    one ``UPDATE`` per distinct shift and audited in bulk. Returns the number of rows changed.
+    """
+
+    if queryset is None:
+        queryset = Deadline.objects.filter(
+            Q(trigger_source_type__in=(TRIGGER_SOURCE_HEARING, TRIGGER_SOURCE_TEMPLATE))
+            | Q(trigger_type=DeadlineTriggerType.RULE),
+            status__in=RECOMPUTE_STATUSES,
+        )
+    queryset = queryset.select_related('case__court').order_by('pk')
+    changed_total = 0
+    batch: list[Deadline] = []
+
+    def flush(deadlines: list[Deadline]) -> int:
+        judges = case_judges(deadline.case_id for deadline in deadlines)
+        cutoffs = filing_cutoffs(judges.values())
+        changes = {}
+        # Rows moving by the same shift into the same zone share one UPDATE; there are only a
+        # handful of distinct shifts, whereas bulk_update builds a CASE per row.
+        shifts: dict[tuple[timedelta, str], list[Any]] = defaultdict(list)
+        for deadline in deadlines:
+            zone_name = court_timezone(deadline.case)
+            cutoff = cutoffs.get(judges.get(deadline.case_id))
+            stored = deadline.due_at.astimezone(get_zone(deadline.timezone))
+            if stored.time() not in (END_OF_DAY, cutoff):
+                continue
+            due_at = due_instant(stored.date(), zone_name, cutoff)
+            if due_at == deadline.due_at and zone_name == deadline.timezone:
+                continue
+            before = format_deadline_snapshot(deadline)
+            shifts[(due_at - deadline.due_at, zone_name)].append(deadline.pk)
+            deadline.due_at, deadline.timezone = due_at, zone_name
+            changes[deadline.pk] = (before, format_deadline_snapshot(deadline))
+        with transaction.atomic():
+            for (shift, zone_name), ids in shifts.items():
+                for start in range(0, len(ids), BULK_BATCH_SIZE):
+                    Deadline.objects.filter(pk__in=ids[start:start + BULK_BATCH_SIZE]).update(
+                        due_at=F('due_at') + shift, timezone=zone_name
+                    )
+            record_update_events(actor=actor, entity_table=Deadline._meta.db_table, changes=changes)
+        return len(changes)
+
+    for deadline in queryset.iterator(chunk_size=batch_size):
+        batch.append(deadline)
+        if len(batch) >= batch_size:
+            changed_total += flush(batch)
+            batch = []
+    if batch:
+        changed_total += flush(batch)
+    return changed_total
@@ -0,0 +1,62 @@
+"""Access to stored document content.
+
+Uploaded documents reference a content-addressed blob (``services.blobs``),
+whose key is also kept in ``Document.file_hash``. Older documents live in a
+Django storage rooted at ``DOCUMENT_STORAGE_DIR``, where
+``Document.metadata['storage_path']`` names the file.
+"""
+
+from __future__ import annotations
+
+from typing import BinaryIO, Iterator, Optional
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, Storage
+
+from court_rules.models import Document
+from court_rules.services.blobs import get_blob_backend
+
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class DocumentUnavailable(Exception):
+    """Raised when a document has no stored content."""
+
+
+def get_document_storage() -> Storage:
+    return FileSystemStorage(location=settings.DOCUMENT_STORAGE_DIR)
+
+
+def document_path(document: Document) -> Optional[str]:
+    return (document.metadata or {}).get('storage_path') or None
+
+
+def document_size(document: Document) -> Optional[int]:
+    if document.blob_id:
+        backend = get_blob_backend()
+        return backend.size(document.file_hash) if backend.exists(document.file_hash) else None
+    path = document_path(document)
+    storage = get_document_storage()
+    if path is None or not storage.exists(path):
+        return None
+    return storage.size(path)
+
+
+def open_document(document: Document) -> BinaryIO:
+    if document.blob_id:
+        backend = get_blob_backend()
+        if not backend.exists(document.file_hash):
+            raise DocumentUnavailable(f'Blob {document.file_hash} for document {document.pk} is missing.')
+        return backend.open(document.file_hash)
+    path = document_path(document)
+    storage = get_document_storage()
+    if path is None or not storage.exists(path):
+        raise DocumentUnavailable(f'No stored content for document {document.pk}.')
+    return storage.open(path, 'rb')
+
+
+def iter_document(document: Document, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    with open_document(document) as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
@@ -0,0 +1,228 @@
+"""Filing packages: ordered documents checked against the judge's filing format.
+
+The primary document comes first, then exhibits in natural label order
+(``Ex. 2`` before ``Ex. 10``, ``Z`` before ``AA``). The plan is checked
+against the ``filing_format`` of the judge's current procedures, e.g.
+``{"preferred_format": "single_pdf", "page_limit": 25}``.
+
+Packages are streamed as a zip written to an unseekable buffer that is
+drained after every chunk, so memory use does not grow with package size.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from court_rules.models import Document, Filing, FilingPackageType
+from court_rules.services.deadlines import case_judges
+from court_rules.services.documents import DocumentUnavailable, document_size, iter_document
+from court_rules.services.judges import current_procedures_queryset, latest_versions
+
+
+PDF_MIME_TYPE = 'application/pdf'
+INDEX_NAME = '00 - Index.txt'
+MAX_NAME_LENGTH = 120
+# Entries at or above this size need zip64 headers up front, since sizes can't be patched on a stream.
+ZIP64_THRESHOLD = 0x7FFFFFFF
+_TOKEN_RE = re.compile(r'(\d+)|([^\W\d_]+)')
+_UNSAFE_NAME_RE = re.compile(r'[^\w .,()&+-]+')
+
+
+def natural_key(label: str) -> tuple:
+    """Sort key for exhibit labels: numbers by value and short letter runs by length, then text."""
+
+    key = []
+    for number, text in _TOKEN_RE.findall(label.casefold()):
+        if number:
+            key.append((0, int(number), ''))
+        else:
+            # Letter sequences (A ... Z, AA) count like numbers; longer words sort as text.
+            key.append((1, len(text) if len(text) <= 3 else 0, text))
+    return tuple(key)
+
+
+@dataclass
+class PackageItem:
+    name: str
+    role: str
+    label: str
+    document: Optional[Document]
+
+    @property
+    def page_count(self) -> Optional[int]:
+        return self.document.page_count if self.document else None
+
+
+@dataclass
+class PackagePlan:
+    filing: Filing
+    items: list[PackageItem]
+    filing_format: dict[str, Any] = field(default_factory=dict)
+    issues: list[str] = field(default_factory=list)
+    # Issues that make the package impossible to assemble, as opposed to format warnings.
+    blocking: bool = False
+
+    @property
+    def total_pages(self) -> int:
+        return sum(item.page_count or 0 for item in self.items)
+
+
+def _entry_name(position: int, parts: list[str], document: Optional[Document]) -> str:
+    stem = ' - '.join(part for part in parts if part)
+    stem = _UNSAFE_NAME_RE.sub('_', stem).strip()[:MAX_NAME_LENGTH] or 'Document'
+    extension = '.pdf' if document is None or document.mime_type in ('', PDF_MIME_TYPE) else ''
+    return f'{position:02d} - {stem}{extension}'
+
+
+def judge_filing_format(judge_id: Any) -> dict[str, Any]:
+    """Merge the ``filing_format`` of a judge's current procedures (newest title versions)."""
+
+    if judge_id is None:
+        return {}
+    procedures = current_procedures_queryset().filter(judge_id=judge_id, filing_format__isnull=False)
+    merged: dict[str, Any] = {}
+    for procedure in reversed(latest_versions(procedures)):
+        if isinstance(procedure.filing_format, dict):
+            merged.update(procedure.filing_format)
+    return merged
+
+
+def _check(plan: PackagePlan) -> None:
+    rules = plan.filing_format
+    documents = [item for item in plan.items if item.document is not None]
+    for item in plan.items:
+        if item.document is None:
+            plan.issues.append(f'{item.label or item.role} has no document attached.')
+            plan.blocking = True
+        elif item.document.mime_type not in ('', PDF_MIME_TYPE):
+            plan.issues.append(f'{item.label or item.role} is {item.document.mime_type}, not PDF.')
+
+    preferred = rules.get('preferred_format')
+    if preferred in FilingPackageType.values:
+        if plan.filing.packaged_as and plan.filing.packaged_as != preferred:
+            plan.issues.append(
+                f'Judge requires {FilingPackageType(preferred).label}; filing is packaged as '
+                f'{FilingPackageType(plan.filing.packaged_as).label}.'
+            )
+        if preferred == FilingPackageType.SINGLE_PDF and len(documents) > 1:
+            plan.issues.append(f'Judge requires a single PDF; this package has {len(documents)} documents.')
+
+    page_limit = rules.get('page_limit')
+    primary = plan.items[0] if plan.items and plan.items[0].role == 'primary' else None
+    if page_limit and primary and primary.page_count and primary.page_count > page_limit:
+        plan.issues.append(f'Primary document has {primary.page_count} pages; the limit is {page_limit}.')
+    exhibit_limit = rules.get('exhibit_page_limit')
+    if exhibit_limit:
+        for item in plan.items:
+            if item.role == 'exhibit' and item.page_count and item.page_count > exhibit_limit:
+                plan.issues.append(f'{item.label} has {item.page_count} pages; the exhibit limit is {exhibit_limit}.')
+
+
+def plan_filing_package(filing: Filing, *, judge_id: Any = None) -> PackagePlan:
+    """Order a filing's documents and check them against the judge's filing format.
+
+    ``judge_id`` defaults to the judge of the case's most recent hearing.
+    """
+
+    items: list[PackageItem] = []
+    if filing.primary_document_id:
+        document = filing.primary_document
+        items.append(PackageItem(_entry_name(1, [filing.filing_type, document.title], document), 'primary', '', document))
+    exhibits = sorted(filing.exhibits.select_related('document'), key=lambda exhibit: natural_key(exhibit.label))
+    for exhibit in exhibits:
+        position = len(items) + 1
+        title = exhibit.document.title if exhibit.document else ''
+        items.append(
+            PackageItem(_entry_name(position, [exhibit.label, title], exhibit.document), 'exhibit', exhibit.label, exhibit.document)
+        )
+
+    if judge_id is None:
+        judge_id = case_judges([filing.case_id]).get(filing.case_id)
+    plan = PackagePlan(filing=filing, items=items, filing_format=judge_filing_format(judge_id))
+    if not items:
+        plan.issues.append('Filing has no primary document or exhibits.')
+        plan.blocking = True
+    _check(plan)
+    return plan
+
+
+def index_text(plan: PackagePlan) -> str:
+    lines = [f'Filing package: {plan.filing.case.caption}', '']
+    for item in plan.items:
+        pages = f' ({item.page_count} pp.)' if item.page_count else ''
+        lines.append(f'{item.name}{pages}')
+    if plan.issues:
+        lines += ['', 'Format issues:'] + [f'- {issue}' for issue in plan.issues]
+    return '\n'.join(lines) + '\n'
+
+
+class _StreamBuffer(io.RawIOBase):
+    """Write-only, unseekable sink that hands written bytes back to a generator."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_package_zip(plan: PackagePlan) -> Iterator[bytes]:
+    """Return an iterator over a zip of the package: an index, then each document.
+
+    PDFs are already compressed, so entries are stored rather than deflated.
+    Content is checked here, before the first byte is produced, so a missing
+    file raises ``DocumentUnavailable`` instead of truncating the download.
+    """
+
+    sizes = {}
+    for item in plan.items:
+        if item.document is not None:
+            sizes[item.name] = document_size(item.document)
+            if sizes[item.name] is None:
+                raise DocumentUnavailable(f'No stored content for {item.name}.')
+    return _zip_chunks(plan, sizes)
+
+
+def _zip_chunks(plan: PackagePlan, sizes: dict[str, int]) -> Iterator[bytes]:
+    sink = _StreamBuffer()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        archive.writestr(INDEX_NAME, index_text(plan), compress_type=zipfile.ZIP_DEFLATED)
+        yield sink.drain()
+        for item in plan.items:
+            if item.document is None:
+                continue
+            info = zipfile.ZipInfo(item.name, date_time=item.document.uploaded_at.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            with archive.open(info, 'w', force_zip64=sizes[item.name] >= ZIP64_THRESHOLD) as entry:
+                for chunk in iter_document(item.document):
+                    entry.write(chunk)
+                    yield sink.drain()
+            yield sink.drain()
+    yield sink.drain()
+
+
+def single_pdf_document(plan: PackagePlan) -> Optional[Document]:
+    """The document to serve as the package PDF, when the package is exactly one PDF."""
+
+    documents = [item.document for item in plan.items if item.document is not None]
+    if len(documents) == 1 and documents[0].mime_type in ('', PDF_MIME_TYPE):
+        return documents[0]
+    return None
@@ -0,0 +1,127 @@
+"""Generate follow-up deadlines for many hearings in one batch.
+
+Hearings, their holiday calendars and any follow-ups already generated are
+loaded with a fixed number of queries. Due dates are computed in memory with
+the business-day engine, and the ``Deadline``, ``HearingFollowUp`` and audit
+rows are written with ``bulk_create`` in a single transaction.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence
+
+from django.db import transaction
+
+from court_rules.models import Deadline, DeadlineTriggerType, Hearing, HearingFollowUp, User
+from court_rules.services.deadlines import (
+    BULK_BATCH_SIZE,
+    TRIGGER_SOURCE_HEARING,
+    DeadlineRecipe,
+    bulk_create_deadlines,
+    court_timezone,
+    district_calendars,
+    due_instant,
+    filing_cutoffs,
+    load_court_calendars,
+)
+from court_rules.services.timezones import get_zone
+
+
+@dataclass
+class FollowUpResult:
+    deadlines: list[Deadline]
+    skipped: int
+
+
+def _calendar_ids(hearings: list[Hearing]) -> dict[Any, Any]:
+    """Each hearing's holiday calendar id, falling back like ``holiday_calendar_for``."""
+
+    calendar_ids = {hearing.pk: hearing.judge.holiday_calendar_id if hearing.judge_id else None for hearing in hearings}
+    unresolved = [hearing for hearing in hearings if calendar_ids[hearing.pk] is None and hearing.case.court_id]
+    by_district = district_calendars(hearing.case.court.district for hearing in unresolved)
+    for hearing in unresolved:
+        calendar_ids[hearing.pk] = by_district.get(hearing.case.court.district)
+    return calendar_ids
+
+
+def _trigger_date(hearing: Hearing):
+    return hearing.starts_at.astimezone(get_zone(court_timezone(hearing.case))).date()
+
+
+def generate_hearing_followups(
+    outcomes: Mapping[Any, Optional[str]],
+    recipes: Sequence[DeadlineRecipe],
+    *,
+    actor: Optional[User] = None,
+) -> FollowUpResult:
+    """Create the follow-up deadlines ``recipes`` produce for every hearing in ``outcomes``.
+
+    ``outcomes`` maps hearing ids to the outcome to record, or ``None`` to keep
+    the stored one. Deadlines already generated for a hearing with the same due
+    instant and rationale are skipped, so re-running a court day is harmless.
+    Raises ``Hearing.DoesNotExist`` before writing anything if an id is unknown.
+    """
+
+    hearings = list(Hearing.objects.filter(pk__in=list(outcomes)).select_related('case__court', 'judge'))
+    missing = set(outcomes) - {hearing.pk for hearing in hearings}
+    if missing:
+        raise Hearing.DoesNotExist(f'Unknown hearings: {", ".join(sorted(str(pk) for pk in missing))}')
+    calendar_ids = _calendar_ids(hearings)
+    calendars = load_court_calendars(calendar_ids.values())
+    cutoffs = filing_cutoffs(hearing.judge_id for hearing in hearings)
+    existing: dict[Any, set] = defaultdict(set)
+    existing_rows = Deadline.objects.filter(
+        trigger_source_type=TRIGGER_SOURCE_HEARING,
+        trigger_source_id__in=[hearing.pk for hearing in hearings],
+    ).order_by().values_list('trigger_source_id', 'due_at', 'computation_rationale')
+    for hearing_id, due_at, rationale in existing_rows:
+        existing[hearing_id].add((due_at, rationale))
+
+    deadlines: list[Deadline] = []
+    followups: list[HearingFollowUp] = []
+    updated_hearings: list[Hearing] = []
+    skipped = 0
+    for hearing in hearings:
+        outcome = outcomes[hearing.pk]
+        if outcome is not None and outcome != hearing.outcome:
+            hearing.outcome = outcome
+            updated_hearings.append(hearing)
+
+        calendar_id = calendar_ids[hearing.pk]
+        calendar = calendars[calendar_id]
+        zone_name = court_timezone(hearing.case)
+        cutoff = cutoffs.get(hearing.judge_id)
+        trigger = _trigger_date(hearing)
+        for recipe in recipes:
+            computed = calendar.compute(trigger, recipe)
+            due_at = due_instant(computed.due_date, zone_name, cutoff)
+            if (due_at, computed.rationale) in existing[hearing.pk]:
+                skipped += 1
+                continue
+            existing[hearing.pk].add((due_at, computed.rationale))
+            deadline = Deadline(
+                case=hearing.case,
+                trigger_type=DeadlineTriggerType.RULE if recipe.rule_id else DeadlineTriggerType.COURT_ORDER,
+                trigger_source_type=TRIGGER_SOURCE_HEARING,
+                trigger_source_id=hearing.pk,
+                basis=recipe.basis,
+                holiday_calendar_id=calendar_id,
+                due_at=due_at,
+                timezone=zone_name,
+                owner_id=hearing.case.lead_attorney_id,
+                priority=recipe.priority,
+                computation_rationale=computed.rationale,
+                created_by=actor,
+                updated_by=actor,
+            )
+            deadlines.append(deadline)
+            followups.append(HearingFollowUp(hearing=hearing, deadline=deadline))
+
+    with transaction.atomic():
+        if updated_hearings:
+            Hearing.objects.bulk_update(updated_hearings, ['outcome'], batch_size=BULK_BATCH_SIZE)
+        bulk_create_deadlines(deadlines, actor=actor)
+        HearingFollowUp.objects.bulk_create(followups, batch_size=BULK_BATCH_SIZE)
+    return FollowUpResult(deadlines=deadlines, skipped=skipped)
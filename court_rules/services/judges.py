@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Iterable, Optional
+
+from django.core.cache import cache
+from django.db.models import Prefetch, Q, QuerySet
+from django.utils import timezone
+
+from court_rules.metrics import record_cache
+from court_rules.models import Court, HolidayCalendar, Judge, JudgeAssociation, JudgeProcedure
+from court_rules.services.reference_cache import model_versions
+
+
+JUDGE_EXPANSIONS = ('procedures', 'associations')
+PROFILE_CACHE_TIMEOUT = 60 * 60 * 24
+# Every model a profile reads, including the court, calendar and associated judges it names.
+PROFILE_MODELS = (Judge, Court, HolidayCalendar, JudgeProcedure, JudgeAssociation)
+
+
+def parse_expand(value: Optional[str]) -> set[str]:
+    """Return the recognised judge expansions from a comma-separated ``?expand=`` value."""
+
+    if not value:
+        return set()
+    return {item.strip() for item in value.split(',')} & set(JUDGE_EXPANSIONS)
+
+
+def current_procedures_queryset(today: Optional[date] = None) -> QuerySet:
+    """Procedures in force on ``today``, newest version first within each title."""
+
+    today = today or timezone.localdate()
+    return (
+        JudgeProcedure.objects.filter(
+            Q(effective_date__isnull=True) | Q(effective_date__lte=today),
+            Q(expiry_date__isnull=True) | Q(expiry_date__gt=today),
+        )
+        .order_by('title', '-effective_date', '-created_at')
+    )
+
+
+def with_judge_expansions(queryset: QuerySet, expand: Iterable[str], today: Optional[date] = None) -> QuerySet:
+    """Attach ``current_procedures`` / ``current_associations`` with one query per relation."""
+
+    expand = set(expand)
+    prefetches = []
+    if 'procedures' in expand:
+        prefetches.append(
+            Prefetch('procedures', queryset=current_procedures_queryset(today), to_attr='current_procedures')
+        )
+    if 'associations' in expand:
+        prefetches.append(
+            Prefetch(
+                'associated_judges',
+                queryset=JudgeAssociation.objects.select_related('associated_judge').order_by('associated_judge__full_name'),
+                to_attr='current_associations',
+            )
+        )
+    return queryset.prefetch_related(*prefetches) if prefetches else queryset
+
+
+def latest_versions(procedures: Iterable[JudgeProcedure]) -> list[JudgeProcedure]:
+    """Keep the first (newest) procedure per title from a title-ordered iterable."""
+
+    seen: set[str] = set()
+    latest = []
+    for procedure in procedures:
+        if procedure.title not in seen:
+            seen.add(procedure.title)
+            latest.append(procedure)
+    return latest
+
+
+def profile_cache_key(judge_id: Any, today: Optional[date] = None) -> str:
+    # Keyed by day so procedures that take effect or expire overnight are picked up, and by the
+    # reference cache versions so saving anything the profile shows stops it being looked up.
+    today = today or timezone.localdate()
+    versions = '.'.join(str(version) for version in model_versions(PROFILE_MODELS))
+    return f'judge-profile:{judge_id}:{today.isoformat()}:{versions}'
+
+
+def get_cached_profile(judge_id: Any) -> Optional[dict[str, Any]]:
+    data = cache.get(profile_cache_key(judge_id))
+    record_cache('judge_profile', 'miss' if data is None else 'hit')
+    return data
+
+
+def set_cached_profile(judge_id: Any, data: dict[str, Any]) -> None:
+    cache.set(profile_cache_key(judge_id), data, PROFILE_CACHE_TIMEOUT)
@@ -0,0 +1,121 @@
+"""Minimal streaming PDF writer for plain-text reports.
+
+Pages are emitted as soon as they are full, so a report of any length is
+rendered with constant memory: only the byte offsets of written objects are
+kept for the cross-reference table at the end. Text is set in Helvetica with
+WinAnsi encoding; characters outside Latin-1 are replaced.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 54
+FONT_SIZE = 10
+LEADING = 13
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LEADING
+# Helvetica averages a little over half an em per glyph; wrap conservatively.
+CHARS_PER_LINE = int((PAGE_WIDTH - 2 * MARGIN) / (FONT_SIZE * 0.55))
+
+CATALOG_ID = 1
+PAGES_ID = 2
+FONT_ID = 3
+FIRST_PAGE_ID = 4
+
+
+def _escape(line: str) -> bytes:
+    encoded = line.encode('cp1252', errors='replace')
+    return encoded.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def wrap_line(line: str, width: int = CHARS_PER_LINE) -> list[str]:
+    """Split ``line`` on spaces into pieces no longer than ``width`` (long words are cut)."""
+
+    if len(line) <= width:
+        return [line]
+    pieces: list[str] = []
+    current = ''
+    for word in line.split(' '):
+        while len(word) > width:
+            if current:
+                pieces.append(current)
+                current = ''
+            pieces.append(word[:width])
+            word = word[width:]
+        candidate = f'{current} {word}' if current else word
+        if len(candidate) > width:
+            pieces.append(current)
+            current = word
+        else:
+            current = candidate
+    pieces.append(current)
+    return pieces
+
+
+def _page_stream(lines: list[str]) -> bytes:
+    parts = [b'BT', f'/F1 {FONT_SIZE} Tf {LEADING} TL {MARGIN} {PAGE_HEIGHT - MARGIN} Td'.encode()]
+    for line in lines:
+        parts.append(b'(' + _escape(line) + b') Tj T*')
+    parts.append(b'ET')
+    return b'\n'.join(parts)
+
+
+def stream_text_pdf(lines: Iterable[str], *, title: str = '') -> Iterator[bytes]:
+    """Yield a PDF laying out ``lines`` top to bottom, one chunk per object."""
+
+    offset = 0
+    offsets: dict[int, int] = {}
+
+    def emit(object_id: int, body: bytes) -> bytes:
+        nonlocal offset
+        offsets[object_id] = offset
+        chunk = f'{object_id} 0 obj\n'.encode() + body + b'\nendobj\n'
+        offset += len(chunk)
+        return chunk
+
+    header = b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n'
+    offset += len(header)
+    yield header
+    yield emit(FONT_ID, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+
+    page_ids: list[int] = []
+    next_id = FIRST_PAGE_ID
+
+    def page(page_lines: list[str]) -> Iterator[bytes]:
+        nonlocal next_id
+        content_id, page_id = next_id, next_id + 1
+        next_id += 2
+        stream = _page_stream(page_lines)
+        yield emit(content_id, f'<< /Length {len(stream)} >>\nstream\n'.encode() + stream + b'\nendstream')
+        yield emit(
+            page_id,
+            f'<< /Type /Page /Parent {PAGES_ID} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+            f'/Resources << /Font << /F1 {FONT_ID} 0 R >> >> /Contents {content_id} 0 R >>'.encode(),
+        )
+        page_ids.append(page_id)
+
+    buffered: list[str] = []
+    for line in lines:
+        for piece in wrap_line(line):
+            buffered.append(piece)
+            if len(buffered) == LINES_PER_PAGE:
+                yield from page(buffered)
+                buffered = []
+    if buffered or not page_ids:
+        yield from page(buffered)
+
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    yield emit(PAGES_ID, f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode())
+    info_id = next_id
+    yield emit(info_id, b'<< /Title (' + _escape(title) + b') /Producer (Precedentum) >>')
+    yield emit(CATALOG_ID, f'<< /Type /Catalog /Pages {PAGES_ID} 0 R >>'.encode())
+
+    size = info_id + 1
+    xref = [f'xref\n0 {size}\n0000000000 65535 f \n']
+    for object_id in range(1, size):
+        xref.append(f'{offsets[object_id]:010d} 00000 n \n')
+    xref.append(f'trailer\n<< /Size {size} /Root {CATALOG_ID} 0 R /Info {info_id} 0 R >>\nstartxref\n{offset}\n%%EOF\n')
+    yield ''.join(xref).encode()
@@ -0,0 +1,105 @@
+"""Shared response cache for reference data that every user sees the same way.
+
+Rules, judges and the courts, holiday calendars and procedures embedded in
+them change maybe weekly but are read on almost every page. Their list and
+detail responses are stored in the Django cache (Redis in production) under
+a key made of the request URL and the version counter of each model the
+response reads. Saving or deleting one of those models bumps its counter
+(``court_rules.signals``), so every stored response that read it stops being
+looked up at once. Code that writes them in bulk, bypassing the signals,
+calls ``bump_versions`` itself. Entries that are no longer looked up expire
+after ``REFERENCE_CACHE_TIMEOUT``.
+
+When an entry is missing, one worker builds it while holding a
+``cache.add`` lock. The others poll for its result for up to
+``REFERENCE_CACHE_WAIT_SECONDS`` rather than all querying the database
+together, e.g. right after a version bump.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+
+from court_rules.models import Court, Holiday, HolidayCalendar, Judge, JudgeAssociation, JudgeProcedure, Rule
+
+
+REFERENCE_MODELS = (Court, HolidayCalendar, Holiday, Judge, JudgeAssociation, JudgeProcedure, Rule)
+POLL_SECONDS = 0.025
+
+
+def _version_key(model: type[Model]) -> str:
+    return f'reference-cache:version:{model._meta.label_lower}'
+
+
+def model_versions(models: Iterable[type[Model]]) -> list[int]:
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, 0, None)
+            versions[key] = cache.get(key, 0)
+    return [versions[key] for key in keys]
+
+
+def _increment(keys: list[str]) -> None:
+    for key in keys:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def bump_versions(*models: type[Model]) -> None:
+    """Stop serving cached responses that read any of ``models``."""
+
+    keys = [_version_key(model) for model in models]
+    _increment(keys)
+    # The first bump covers reads later in this transaction. Until it commits, other workers still
+    # read the old rows and could store them under the new version, so bump once more afterwards.
+    transaction.on_commit(lambda: _increment(keys))
+
+
+def response_key(scope: str, url: str, models: Iterable[type[Model]]) -> str:
+    versions = '.'.join(str(version) for version in model_versions(models))
+    return f'reference-cache:{scope}:{versions}:{hashlib.sha256(url.encode()).hexdigest()}'
+
+
+def get_or_build(key: str, build: Callable[[], Optional[Any]], refresh: bool = False) -> tuple[Optional[Any], str]:
+    """The value cached under ``key``, or ``build()`` stored there unless it is ``None``.
+
+    Also returns how it was found: ``hit``, ``wait`` (another worker built
+    it meanwhile), ``miss`` (built here) or ``bypass`` (``refresh``, which
+    builds and stores without reading).
+    """
+
+    if refresh:
+        value = build()
+        if value is not None:
+            cache.set(key, value, settings.REFERENCE_CACHE_TIMEOUT)
+        return value, 'bypass'
+
+    value = cache.get(key)
+    if value is not None:
+        return value, 'hit'
+    lock_key = f'{key}:lock'
+    locked = cache.add(lock_key, 1, settings.REFERENCE_CACHE_LOCK_SECONDS)
+    if not locked:
+        deadline = time.monotonic() + settings.REFERENCE_CACHE_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(POLL_SECONDS)
+            value = cache.get(key)
+            if value is not None:
+                return value, 'wait'
+    try:
+        value = build()
+        if value is not None:
+            cache.set(key, value, settings.REFERENCE_CACHE_TIMEOUT)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return value, 'miss'
@@ -0,0 +1,262 @@
+"""In-memory cross-reference graph over ``rule_crossrefs``.
+
+Edges are held in compressed sparse row (CSR) arrays for both directions,
+with a small add/remove overlay for incremental changes. Every node's
+outgoing neighborhood up to ``MAX_PRECOMPUTED_DEPTH`` hops is precomputed so
+``related`` lookups are a dictionary read.
+
+Workers share the graph through the Django cache: a version counter is bumped
+on every cross-ref change together with a delta entry, so a worker applies the
+deltas it missed instead of reloading ``rule_crossrefs``. A full snapshot is
+stored per version for workers that start cold.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from array import array
+from collections import deque
+from typing import Iterable, Optional
+
+from django.core.cache import cache
+
+from court_rules.metrics import record_cache
+from court_rules.models import RuleCrossRef
+
+
+MAX_PRECOMPUTED_DEPTH = 3
+CACHE_VERSION_KEY = 'rule-graph:version'
+CACHE_SNAPSHOT_KEY = 'rule-graph:snapshot'
+CACHE_DELTA_KEY = 'rule-graph:delta:{version}'
+CACHE_TIMEOUT = 60 * 60 * 24
+COMPACT_RATIO = 0.1
+
+DIRECTION_OUT = 'out'
+DIRECTION_IN = 'in'
+DIRECTION_BOTH = 'both'
+DIRECTIONS = (DIRECTION_OUT, DIRECTION_IN, DIRECTION_BOTH)
+
+
+def _csr(node_count: int, pairs: list[tuple[int, int]]) -> tuple[array, array]:
+    counts = [0] * (node_count + 1)
+    for source, _ in pairs:
+        counts[source + 1] += 1
+    for index in range(node_count):
+        counts[index + 1] += counts[index]
+    indptr = array('l', counts)
+    indices = array('l', [0]) * len(pairs)
+    cursor = list(counts[:-1])
+    for source, target in pairs:
+        indices[cursor[source]] = target
+        cursor[source] += 1
+    return indptr, indices
+
+
+class RuleGraph:
+    def __init__(self, edges: Iterable[tuple[uuid.UUID, uuid.UUID]], max_depth: int = MAX_PRECOMPUTED_DEPTH):
+        self.max_depth = max_depth
+        self.ids: list[uuid.UUID] = []
+        self.index: dict[uuid.UUID, int] = {}
+        pairs = [(self._node(source), self._node(target)) for source, target in edges]
+        self._build(pairs)
+
+    def _node(self, rule_id: uuid.UUID) -> int:
+        position = self.index.get(rule_id)
+        if position is None:
+            position = len(self.ids)
+            self.ids.append(rule_id)
+            self.index[rule_id] = position
+        return position
+
+    def _build(self, pairs: list[tuple[int, int]]) -> None:
+        pairs = sorted(set(pairs))
+        node_count = len(self.ids)
+        self.edge_count = len(pairs)
+        self.out_indptr, self.out_indices = _csr(node_count, pairs)
+        self.in_indptr, self.in_indices = _csr(node_count, [(target, source) for source, target in pairs])
+        self._added: dict[int, set[int]] = {}
+        self._added_in: dict[int, set[int]] = {}
+        self._removed: set[tuple[int, int]] = set()
+        self.closure: dict[int, dict[int, int]] = {}
+        for node in range(node_count):
+            if self.out_indptr[node + 1] > self.out_indptr[node]:
+                self.closure[node] = self._bfs(node, self.max_depth, DIRECTION_OUT)
+
+    def _csr_neighbors(self, node: int, indptr: array, indices: array) -> Iterable[int]:
+        if node + 1 >= len(indptr):
+            return ()
+        return indices[indptr[node]:indptr[node + 1]]
+
+    def successors(self, node: int) -> list[int]:
+        base = [target for target in self._csr_neighbors(node, self.out_indptr, self.out_indices) if (node, target) not in self._removed]
+        return base + sorted(self._added.get(node, ()))
+
+    def predecessors(self, node: int) -> list[int]:
+        base = [source for source in self._csr_neighbors(node, self.in_indptr, self.in_indices) if (source, node) not in self._removed]
+        return base + sorted(self._added_in.get(node, ()))
+
+    def _has_csr_edge(self, source: int, target: int) -> bool:
+        return target in self._csr_neighbors(source, self.out_indptr, self.out_indices)
+
+    def _bfs(self, start: int, depth: int, direction: str) -> dict[int, int]:
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]
+            if distance == depth:
+                continue
+            neighbors = []
+            if direction in (DIRECTION_OUT, DIRECTION_BOTH):
+                neighbors.extend(self.successors(node))
+            if direction in (DIRECTION_IN, DIRECTION_BOTH):
+                neighbors.extend(self.predecessors(node))
+            for neighbor in neighbors:
+                if neighbor not in distances:
+                    distances[neighbor] = distance + 1
+                    queue.append(neighbor)
+        del distances[start]
+        return distances
+
+    def neighborhood(self, rule_id: uuid.UUID, depth: int, direction: str = DIRECTION_OUT) -> dict[uuid.UUID, int]:
+        """Return ``{rule_id: hops}`` for every rule reachable within ``depth`` hops."""
+
+        node = self.index.get(rule_id)
+        if node is None or depth < 1:
+            return {}
+        if direction == DIRECTION_OUT and depth <= self.max_depth:
+            reachable = self.closure.get(node, {})
+            return {self.ids[other]: hops for other, hops in reachable.items() if hops <= depth}
+        return {self.ids[other]: hops for other, hops in self._bfs(node, depth, direction).items()}
+
+    def _refresh_closure_around(self, source: int) -> None:
+        # Only nodes that reach ``source`` within max_depth - 1 hops can see the changed edge.
+        affected = {source, *self._bfs(source, self.max_depth - 1, DIRECTION_IN)}
+        for node in affected:
+            reachable = self._bfs(node, self.max_depth, DIRECTION_OUT)
+            if reachable:
+                self.closure[node] = reachable
+            else:
+                self.closure.pop(node, None)
+
+    def add_edge(self, from_id: uuid.UUID, to_id: uuid.UUID) -> None:
+        source, target = self._node(from_id), self._node(to_id)
+        if (source, target) in self._removed:
+            self._removed.discard((source, target))
+        elif not self._has_csr_edge(source, target):
+            self._added.setdefault(source, set()).add(target)
+            self._added_in.setdefault(target, set()).add(source)
+        else:
+            return
+        self._after_change(source)
+
+    def remove_edge(self, from_id: uuid.UUID, to_id: uuid.UUID) -> None:
+        source, target = self.index.get(from_id), self.index.get(to_id)
+        if source is None or target is None:
+            return
+        if target in self._added.get(source, ()):
+            self._added[source].discard(target)
+            self._added_in[target].discard(source)
+        elif self._has_csr_edge(source, target) and (source, target) not in self._removed:
+            self._removed.add((source, target))
+        else:
+            return
+        self._after_change(source)
+
+    def _after_change(self, source: int) -> None:
+        overlay = len(self._removed) + sum(len(targets) for targets in self._added.values())
+        if overlay > max(COMPACT_RATIO * self.edge_count, 64):
+            self._build(list(self.edges()))
+        else:
+            self._refresh_closure_around(source)
+
+    def edges(self) -> Iterable[tuple[int, int]]:
+        for source in range(len(self.ids)):
+            for target in self.successors(source):
+                yield source, target
+
+    def snapshot(self) -> tuple[list[uuid.UUID], list[tuple[int, int]]]:
+        return list(self.ids), list(self.edges())
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tuple[list[uuid.UUID], list[tuple[int, int]]]) -> 'RuleGraph':
+        ids, pairs = snapshot
+        return cls((ids[source], ids[target]) for source, target in pairs)
+
+
+_lock = threading.Lock()
+_state: dict[str, Optional[object]] = {'graph': None, 'version': None}
+
+
+def _current_version() -> int:
+    cache.add(CACHE_VERSION_KEY, 0, None)
+    return cache.get(CACHE_VERSION_KEY, 0)
+
+
+def load_rule_graph_from_db() -> RuleGraph:
+    return RuleGraph(RuleCrossRef.objects.values_list('from_rule_id', 'to_rule_id').iterator(chunk_size=5000))
+
+
+def _apply_deltas(graph: RuleGraph, since: int, until: int) -> bool:
+    if until <= since:
+        return True
+    keys = [CACHE_DELTA_KEY.format(version=version) for version in range(since + 1, until + 1)]
+    deltas = cache.get_many(keys)
+    if len(deltas) != len(keys):
+        return False
+    for key in keys:
+        operation, from_id, to_id = deltas[key]
+        if operation == 'add':
+            graph.add_edge(from_id, to_id)
+        else:
+            graph.remove_edge(from_id, to_id)
+    return True
+
+
+def get_rule_graph() -> RuleGraph:
+    """Return this worker's graph, catching up with changes other workers recorded."""
+
+    version = _current_version()
+    with _lock:
+        graph, local_version = _state['graph'], _state['version']
+        if graph is not None and local_version == version:
+            record_cache('rule_graph', 'hit')
+            return graph
+        if graph is not None and local_version < version and _apply_deltas(graph, local_version, version):
+            record_cache('rule_graph', 'delta')
+            _state['version'] = version
+            return graph
+
+        snapshot = cache.get(CACHE_SNAPSHOT_KEY)
+        if snapshot is not None and snapshot[0] <= version:
+            graph = RuleGraph.from_snapshot(snapshot[1])
+            if not _apply_deltas(graph, snapshot[0], version):
+                graph = None
+        else:
+            graph = None
+        if graph is None:
+            record_cache('rule_graph', 'rebuild')
+            graph = load_rule_graph_from_db()
+            cache.set(CACHE_SNAPSHOT_KEY, (version, graph.snapshot()), CACHE_TIMEOUT)
+        else:
+            record_cache('rule_graph', 'snapshot')
+
+        _state['graph'], _state['version'] = graph, version
+        return graph
+
+
+def record_crossref_change(operation: str, from_id: uuid.UUID, to_id: uuid.UUID) -> None:
+    """Publish a single edge change so every worker can apply it incrementally."""
+
+    _current_version()
+    version = cache.incr(CACHE_VERSION_KEY)
+    cache.set(CACHE_DELTA_KEY.format(version=version), (operation, from_id, to_id), CACHE_TIMEOUT)
+
+
+def invalidate_rule_graph() -> None:
+    """Force a full rebuild on every worker, e.g. after bulk_create of cross-refs."""
+
+    _current_version()
+    cache.incr(CACHE_VERSION_KEY)
+    cache.delete(CACHE_SNAPSHOT_KEY)
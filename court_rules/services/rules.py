@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from court_rules.models import Rule
+from court_rules.services.reference_cache import bump_versions
+
+
+RESOLVE_BATCH_SIZE = 500
+
+
+def compute_validity_intervals(rules: Iterable[Rule]) -> dict:
+    """Return ``{rule_id: (valid_from, valid_to)}`` for every version of the given rules.
+
+    Versions sharing a (jurisdiction, citation) are ordered by ``effective_date``;
+    each is valid until the next version takes effect, or until its explicit
+    ``superseded_by`` rule does. Rules without an effective date are treated as
+    valid from the beginning of time.
+    """
+
+    groups: dict[tuple[str, str], list[Rule]] = defaultdict(list)
+    by_id = {}
+    for rule in rules:
+        groups[(rule.jurisdiction, rule.citation)].append(rule)
+        by_id[rule.pk] = rule
+
+    intervals = {}
+    for versions in groups.values():
+        versions.sort(key=lambda rule: (rule.effective_date or date.min, rule.created_at))
+        for index, rule in enumerate(versions):
+            valid_to = None
+            successor = by_id.get(rule.superseded_by_id)
+            if successor is not None and successor.effective_date:
+                valid_to = successor.effective_date
+            elif index + 1 < len(versions):
+                valid_to = versions[index + 1].effective_date
+            intervals[rule.pk] = (rule.effective_date, valid_to)
+    return intervals
+
+
+@transaction.atomic
+def refresh_rule_intervals(citations: Optional[Iterable[str]] = None) -> int:
+    """Recompute ``valid_from``/``valid_to`` for the given citations (all rules when omitted).
+
+    Rules that supersede or are superseded by an affected rule are included so
+    renumbered successors keep the chain consistent. Returns the number of rows changed.
+    """
+
+    queryset = Rule.objects.all()
+    affected = None
+    if citations is not None:
+        affected = set(citations)
+        # Predecessors filed under another citation end when these rules take effect.
+        affected |= set(Rule.objects.filter(superseded_by__citation__in=affected).values_list('citation', flat=True))
+        queryset = queryset.filter(Q(citation__in=affected) | Q(supersedes__citation__in=affected)).distinct()
+
+    fields = ['id', 'citation', 'jurisdiction', 'effective_date', 'superseded_by', 'created_at', 'valid_from', 'valid_to']
+    rules = list(queryset.only(*fields))
+    intervals = compute_validity_intervals(rules)
+    changed = []
+    for rule in rules:
+        if affected is not None and rule.citation not in affected:
+            continue
+        valid_from, valid_to = intervals[rule.pk]
+        if (rule.valid_from, rule.valid_to) != (valid_from, valid_to):
+            rule.valid_from, rule.valid_to = valid_from, valid_to
+            changed.append(rule)
+    # bulk_update bypasses post_save, so refreshing from a signal handler cannot recurse.
+    Rule.objects.bulk_update(changed, ['valid_from', 'valid_to'], batch_size=RESOLVE_BATCH_SIZE)
+    if changed:
+        bump_versions(Rule)
+    return len(changed)
+
+
+def supersede_rule(rule: Rule, successor: Rule) -> None:
+    """Mark ``rule`` as superseded by ``successor`` and update both validity intervals."""
+
+    rule.superseded_by = successor
+    rule.save(update_fields=['superseded_by'])
+
+
+def filter_as_of(queryset: QuerySet, as_of: date) -> QuerySet:
+    """Restrict a rule queryset to the versions in force on ``as_of``."""
+
+    return queryset.filter(
+        Q(valid_from__isnull=True) | Q(valid_from__lte=as_of),
+        Q(valid_to__isnull=True) | Q(valid_to__gt=as_of),
+    )
+
+
+def resolve_rule(citation: str, as_of: date, jurisdiction: Optional[str] = None) -> Optional[Rule]:
+    """Return the version of ``citation`` in force on ``as_of`` with a single indexed query."""
+
+    queryset = filter_as_of(Rule.objects.filter(citation=citation), as_of)
+    if jurisdiction is not None:
+        queryset = queryset.filter(jurisdiction=jurisdiction)
+    return queryset.order_by('-valid_from').first()
+
+
+def resolve_rules(pairs: Iterable[tuple[str, date]], jurisdiction: Optional[str] = None) -> dict[tuple[str, date], Optional[Rule]]:
+    """Resolve many (citation, date) pairs with one query per ``RESOLVE_BATCH_SIZE`` citations.
+
+    All versions of the requested citations are loaded once and each date is
+    located by binary search over the sorted ``valid_from`` boundaries.
+    """
+
+    pairs = list(dict.fromkeys(pairs))
+    citations = sorted({citation for citation, _ in pairs})
+    versions: dict[str, list[Rule]] = defaultdict(list)
+    for start in range(0, len(citations), RESOLVE_BATCH_SIZE):
+        queryset = Rule.objects.filter(citation__in=citations[start:start + RESOLVE_BATCH_SIZE])
+        if jurisdiction is not None:
+            queryset = queryset.filter(jurisdiction=jurisdiction)
+        for rule in queryset:
+            versions[rule.citation].append(rule)
+
+    for rules in versions.values():
+        rules.sort(key=lambda rule: rule.valid_from or date.min)
+    boundaries = {
+        citation: [rule.valid_from or date.min for rule in rules]
+        for citation, rules in versions.items()
+    }
+    resolved: dict[tuple[str, date], Optional[Rule]] = {}
+    for citation, as_of in pairs:
+        rules = versions.get(citation, [])
+        index = bisect_right(boundaries.get(citation, []), as_of) - 1
+        match = None
+        while index >= 0:
+            candidate = rules[index]
+            if candidate.valid_to is None or candidate.valid_to > as_of:
+                match = candidate
+                break
+            index -= 1
+        resolved[(citation, as_of)] = match
+    return resolved
@@ -0,0 +1,284 @@
+"""Hearing conflict detection over attorney and judge calendars.
+
+Busy time is loaded once for a window and indexed in per-user and per-judge
+interval trees. A tree is a balanced BST over intervals sorted by start, with
+each node storing the largest end in its subtree, so overlap queries run in
+O(log n + k).
+
+``JudgeProcedure.hearing_windows`` is read as a list of
+``{"weekday": "tue", "start": "09:30", "end": "11:00"}`` objects in the
+court's local time; weekdays may also be given as 0 (Monday) to 6.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from court_rules.models import CalendarEvent, Case, CaseTeam, Hearing, Judge
+from court_rules.services.judges import current_procedures_queryset, latest_versions
+
+
+DEFAULT_HEARING_DURATION = timedelta(hours=1)
+# Hearings starting this long before a window can still run into it.
+MAX_HEARING_SPAN = timedelta(days=1)
+WEEKDAYS = {name: index for index, name in enumerate(['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'])}
+
+SUBJECT_USER = 'user'
+SUBJECT_JUDGE = 'judge'
+
+
+@dataclass(frozen=True)
+class BusyInterval:
+    starts_at: datetime
+    ends_at: datetime
+    source: str
+    object_id: Any
+    case_id: Any
+
+
+@dataclass(frozen=True)
+class Conflict:
+    subject: str
+    subject_id: Any
+    interval: BusyInterval
+
+
+class IntervalTree:
+    """Static augmented interval tree over half-open ``[starts_at, ends_at)`` intervals."""
+
+    def __init__(self, intervals: Iterable[BusyInterval]):
+        self.items = sorted(intervals, key=lambda item: (item.starts_at, item.ends_at))
+        self.max_end: list[Optional[datetime]] = [None] * len(self.items)
+        self._augment(0, len(self.items))
+
+    def __len__(self):
+        return len(self.items)
+
+    def _augment(self, low: int, high: int) -> Optional[datetime]:
+        if low >= high:
+            return None
+        mid = (low + high) // 2
+        candidates = [self.items[mid].ends_at, self._augment(low, mid), self._augment(mid + 1, high)]
+        self.max_end[mid] = max(value for value in candidates if value is not None)
+        return self.max_end[mid]
+
+    def overlapping(self, starts_at: datetime, ends_at: datetime) -> list[BusyInterval]:
+        found: list[BusyInterval] = []
+        stack = [(0, len(self.items))]
+        while stack:
+            low, high = stack.pop()
+            if low >= high:
+                continue
+            mid = (low + high) // 2
+            if self.max_end[mid] <= starts_at:
+                continue
+            stack.append((low, mid))
+            item = self.items[mid]
+            if item.starts_at < ends_at:
+                if item.ends_at > starts_at:
+                    found.append(item)
+                stack.append((mid + 1, high))
+        found.sort(key=lambda item: item.starts_at)
+        return found
+
+
+def _hearing_end(starts_at: datetime, ends_at: Optional[datetime]) -> datetime:
+    return ends_at if ends_at and ends_at > starts_at else starts_at + DEFAULT_HEARING_DURATION
+
+
+def load_case_members(case_ids: Iterable[Any]) -> dict[Any, set]:
+    """Return the team members and lead attorney of each case with two queries."""
+
+    case_ids = set(case_ids)
+    case_members: dict[Any, set] = {case_id: set() for case_id in case_ids}
+    if not case_ids:
+        return case_members
+    for case_id, user_id in CaseTeam.objects.filter(case_id__in=case_ids).values_list('case_id', 'user_id'):
+        case_members[case_id].add(user_id)
+    leads = Case.objects.filter(id__in=case_ids, lead_attorney__isnull=False).values_list('id', 'lead_attorney_id')
+    for case_id, user_id in leads:
+        case_members[case_id].add(user_id)
+    return case_members
+
+
+class ConflictDetector:
+    """Loads busy time between ``window_start`` and ``window_end`` with a fixed number of queries.
+
+    Only the teams of cases with a hearing or event in the window are loaded;
+    the team of any other case is read when a slot for it is checked.
+    """
+
+    def __init__(self, window_start: datetime, window_end: datetime):
+        self.window_start = window_start
+        self.window_end = window_end
+        lookback = window_start - MAX_HEARING_SPAN
+        hearings = Hearing.objects.filter(starts_at__lt=window_end, starts_at__gte=lookback).values_list(
+            'id', 'case_id', 'judge_id', 'starts_at', 'ends_at'
+        )
+        events = CalendarEvent.objects.filter(
+            case__isnull=False, starts_at__lt=window_end, starts_at__gte=lookback
+        ).values_list('id', 'case_id', 'starts_at', 'ends_at')
+
+        busy: list[tuple[BusyInterval, Any]] = []
+        for hearing_id, case_id, judge_id, starts_at, ends_at in hearings.iterator(chunk_size=2000):
+            interval = BusyInterval(starts_at, _hearing_end(starts_at, ends_at), 'hearing', hearing_id, case_id)
+            if interval.ends_at > window_start:
+                busy.append((interval, judge_id))
+        for event_id, case_id, starts_at, ends_at in events.iterator(chunk_size=2000):
+            interval = BusyInterval(starts_at, _hearing_end(starts_at, ends_at), 'calendar_event', event_id, case_id)
+            if interval.ends_at > window_start:
+                busy.append((interval, None))
+        self.case_members = load_case_members(interval.case_id for interval, _ in busy)
+
+        by_user: dict[Any, list[BusyInterval]] = defaultdict(list)
+        by_judge: dict[Any, list[BusyInterval]] = defaultdict(list)
+        for interval, judge_id in busy:
+            for user_id in self.case_members[interval.case_id]:
+                by_user[user_id].append(interval)
+            if judge_id is not None:
+                by_judge[judge_id].append(interval)
+
+        self.user_intervals = by_user
+        self.judge_intervals = by_judge
+        self.user_trees = {user_id: IntervalTree(items) for user_id, items in by_user.items()}
+        self.judge_trees = {judge_id: IntervalTree(items) for judge_id, items in by_judge.items()}
+
+    def attorneys_for_case(self, case_id: Any) -> set:
+        if case_id not in self.case_members:
+            self.case_members.update(load_case_members([case_id]))
+        return set(self.case_members[case_id])
+
+    def conflicts_for_slot(
+        self,
+        starts_at: datetime,
+        ends_at: datetime,
+        *,
+        case_id: Any = None,
+        user_ids: Iterable[Any] = (),
+        judge_id: Any = None,
+        exclude_ids: Iterable[Any] = (),
+    ) -> list[Conflict]:
+        """Return everything that overlaps a proposed slot for the case team, extra users and the judge."""
+
+        excluded = set(exclude_ids)
+        users = set(user_ids)
+        if case_id is not None:
+            users |= self.attorneys_for_case(case_id)
+        conflicts = []
+        for user_id in sorted(users, key=str):
+            tree = self.user_trees.get(user_id)
+            if tree is None:
+                continue
+            for interval in tree.overlapping(starts_at, ends_at):
+                if interval.object_id not in excluded:
+                    conflicts.append(Conflict(SUBJECT_USER, user_id, interval))
+        if judge_id is not None and judge_id in self.judge_trees:
+            for interval in self.judge_trees[judge_id].overlapping(starts_at, ends_at):
+                if interval.object_id not in excluded:
+                    conflicts.append(Conflict(SUBJECT_JUDGE, judge_id, interval))
+        return conflicts
+
+    def free_slots(
+        self,
+        judge: Judge,
+        duration: timedelta,
+        *,
+        case_id: Any = None,
+        user_ids: Iterable[Any] = (),
+        windows: Optional[list[dict]] = None,
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the free stretches of at least ``duration`` inside the judge's hearing windows."""
+
+        if windows is None:
+            windows = judge_hearing_windows(judge)
+        zone = ZoneInfo(judge.court.timezone if judge.court_id and judge.court.timezone else 'UTC')
+        users = set(user_ids)
+        if case_id is not None:
+            users |= self.attorneys_for_case(case_id)
+
+        free = []
+        for window_start, window_end in expand_hearing_windows(windows, self.window_start, self.window_end, zone):
+            busy = []
+            trees = [self.judge_trees.get(judge.pk)] + [self.user_trees.get(user_id) for user_id in users]
+            for tree in trees:
+                if tree is not None:
+                    busy.extend(tree.overlapping(window_start, window_end))
+            cursor = window_start
+            for interval in sorted(busy, key=lambda item: item.starts_at):
+                if interval.starts_at - cursor >= duration:
+                    free.append((cursor, interval.starts_at))
+                cursor = max(cursor, interval.ends_at)
+            if window_end - cursor >= duration:
+                free.append((cursor, window_end))
+        return free
+
+    def calendar_conflicts(self) -> list[tuple[str, Any, BusyInterval, BusyInterval]]:
+        """Return every overlapping pair on each attorney's and judge's calendar (sweep line)."""
+
+        found = []
+        for subject, calendars in ((SUBJECT_USER, self.user_intervals), (SUBJECT_JUDGE, self.judge_intervals)):
+            for subject_id, intervals in calendars.items():
+                active: list[BusyInterval] = []
+                for interval in sorted(set(intervals), key=lambda item: (item.starts_at, item.ends_at)):
+                    active = [other for other in active if other.ends_at > interval.starts_at]
+                    for other in active:
+                        found.append((subject, subject_id, other, interval))
+                    active.append(interval)
+        return found
+
+
+def judge_hearing_windows(judge: Judge, today: Optional[date] = None) -> list[dict]:
+    windows = []
+    for procedure in latest_versions(current_procedures_queryset(today).filter(judge=judge)):
+        if isinstance(procedure.hearing_windows, list):
+            windows.extend(procedure.hearing_windows)
+    return windows
+
+
+def _parse_weekday(value) -> Optional[int]:
+    if isinstance(value, int) and 0 <= value <= 6:
+        return value
+    if isinstance(value, str):
+        return WEEKDAYS.get(value.strip().lower()[:3])
+    return None
+
+
+def expand_hearing_windows(
+    windows: list[dict],
+    window_start: datetime,
+    window_end: datetime,
+    zone: ZoneInfo,
+) -> list[tuple[datetime, datetime]]:
+    """Turn weekly local-time hearing windows into concrete aware intervals clipped to the range."""
+
+    parsed = []
+    for window in windows:
+        if not isinstance(window, dict):
+            continue
+        weekday = _parse_weekday(window.get('weekday'))
+        try:
+            start, end = time.fromisoformat(window['start']), time.fromisoformat(window['end'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if weekday is not None and start < end:
+            parsed.append((weekday, start, end))
+
+    slots = []
+    day = window_start.astimezone(zone).date()
+    last_day = window_end.astimezone(zone).date()
+    while day <= last_day:
+        for weekday, start, end in parsed:
+            if day.weekday() != weekday:
+                continue
+            starts_at = datetime.combine(day, start, tzinfo=zone)
+            ends_at = datetime.combine(day, end, tzinfo=zone)
+            starts_at, ends_at = max(starts_at, window_start), min(ends_at, window_end)
+            if starts_at < ends_at:
+                slots.append((starts_at, ends_at))
+        day += timedelta(days=1)
+    slots.sort()
+    return slots
@@ -0,0 +1,709 @@
+"""Deterministic synthetic data at production scale.
+
+``generate`` fills every core table (courts, calendars and holidays, judges
+and their procedures, rules and cross references, deadline templates,
+users, cases with their teams, tags, notes, contacts, documents and chunks,
+docket entries, filings, hearings, deadlines with reminders, dependencies
+and audit history). The same arguments always produce the same rows.
+
+Rows are written as raw tuples rather than model instances, so generating a
+million deadlines takes minutes: Postgres receives them through ``COPY``,
+other databases through ``executemany``. Buffered rows are flushed table by
+table in dependency order, so foreign keys can be checked as rows arrive.
+Signals do not fire; denormalized columns (contact keys, rule validity
+intervals) are filled in here and the per-worker caches are invalidated at
+the end.
+"""
+
+from __future__ import annotations
+
+import calendar
+import random
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Optional
+
+from django.contrib.auth.hashers import make_password
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Model
+from rest_framework.authtoken.models import Token
+
+from court_rules.models import (
+    AuditAction,
+    AuditLog,
+    Case,
+    CaseContact,
+    CaseContactRole,
+    CaseNote,
+    CasePermission,
+    CaseStatus,
+    CaseTag,
+    CaseTagAssignment,
+    CaseTeam,
+    CaseTeamRole,
+    Contact,
+    ContactAddress,
+    ContactType,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    DeadlineDependency,
+    DeadlineReminder,
+    DeadlineStatus,
+    DeadlineTemplate,
+    DeadlineTriggerType,
+    DocChunk,
+    DocketEntry,
+    Document,
+    DocumentSource,
+    Filing,
+    FilingExhibit,
+    FilingPackageType,
+    FilingServiceContact,
+    Hearing,
+    HearingFollowUp,
+    Holiday,
+    HolidayCalendar,
+    Judge,
+    JudgeAssociation,
+    JudgeProcedure,
+    OcrStatus,
+    ReminderChannel,
+    Rule,
+    RuleCrossRef,
+    RuleSourceType,
+    User,
+    UserRole,
+)
+from court_rules.services.audit import get_checkpoint_interval
+from court_rules.services.conflicts import invalidate_trigram_index, normalize_name
+from court_rules.services.deadline_templates import invalidate_template_registry
+from court_rules.services.reference_cache import REFERENCE_MODELS, bump_versions
+from court_rules.services.rule_graph import invalidate_rule_graph
+from court_rules.services.rules import refresh_rule_intervals
+
+
+BATCH_SIZE = 20_000
+LOGIN_EMAIL = 'synthetic.lawyer@example.com'
+LOGIN_PASSWORD = 'changeme123'
+
+COURTS = [
+    ('United States District Court for the Northern District of Illinois', 'N.D. Ill.', 'Chicago, IL', 'America/Chicago'),
+    ('United States District Court for the Southern District of New York', 'S.D.N.Y.', 'New York, NY', 'America/New_York'),
+    ('United States District Court for the District of Delaware', 'D. Del.', 'Wilmington, DE', 'America/New_York'),
+    ('United States District Court for the Eastern District of Texas', 'E.D. Tex.', 'Marshall, TX', 'America/Chicago'),
+    ('United States District Court for the Northern District of California', 'N.D. Cal.', 'San Francisco, CA', 'America/Los_Angeles'),
+    ('United States District Court for the District of Colorado', 'D. Colo.', 'Denver, CO', 'America/Denver'),
+    ('United States District Court for the District of Arizona', 'D. Ariz.', 'Phoenix, AZ', 'America/Phoenix'),
+    ('United States District Court for the District of Hawaii', 'D. Haw.', 'Honolulu, HI', 'Pacific/Honolulu'),
+]
+JUDGES_PER_COURT = 6
+RULE_COUNT = 300
+TAGS = ['MDL', 'Class Action', 'Patent', 'Trade Secret', 'Expedited', 'Pro Bono', 'Appeal Risk', 'Sealed Filings']
+PRACTICE_AREAS = ['Intellectual Property', 'Commercial', 'Antitrust', 'Employment', 'Securities', 'Product Liability']
+STAGES = ['Pleadings', 'Discovery', 'Summary Judgment', 'Pretrial', 'Trial', 'Post-Trial']
+FILING_TYPES = ['Motion to Compel', 'Motion to Dismiss', 'Opposition', 'Reply', 'Status Report', 'Notice of Appearance']
+HEARING_TYPES = ['Status Conference', 'Motion Hearing', 'Scheduling Conference', 'Pretrial Conference']
+DOCKET_TYPES = ['Complaint', 'Answer', 'Minute Entry', 'Order', 'Motion', 'Notice', 'Transcript']
+SURNAMES = [
+    'Smith', 'Johnson', 'Garcia', 'Nguyen', 'Patel', 'Okafor', 'Kowalski', 'Rossi', 'Haddad', 'Kim', 'Larsen', 'Moreau',
+    'Schmidt', 'Tanaka', 'Silva', 'Novak', 'Byrne', 'Cohen', 'Mensah', 'Ivanova', 'Walsh', 'Dubois', 'Chen', 'Alvarez',
+]
+GIVEN_NAMES = [
+    'Avery', 'Jordan', 'Morgan', 'Riley', 'Casey', 'Quinn', 'Taylor', 'Rowan', 'Emerson', 'Parker', 'Sage', 'Drew',
+    'Harper', 'Reese', 'Skyler', 'Dakota', 'Finley', 'Hayden', 'Jamie', 'Kendall', 'Logan', 'Marley', 'Noel', 'Peyton',
+]
+ORGANIZATION_SUFFIXES = ['LLP', 'LLC', 'Inc.', 'Corp.', 'P.C.', 'Holdings']
+TEMPLATE_STEPS = [
+    # (trigger event, label, anchor index, offset days, basis)
+    ('complaint_served', 'Answer due', None, 21, DeadlineBasis.CALENDAR_DAYS),
+    ('complaint_served', 'Rule 26(f) conference', 0, 21, DeadlineBasis.CALENDAR_DAYS),
+    ('complaint_served', 'Initial disclosures', 1, 14, DeadlineBasis.CALENDAR_DAYS),
+    ('motion_filed', 'Response due', None, 14, DeadlineBasis.BUSINESS_DAYS),
+    ('motion_filed', 'Reply due', 3, 7, DeadlineBasis.BUSINESS_DAYS),
+]
+
+# Choice values computed once; ``.values`` rebuilds its list on every access.
+PACKAGE_TYPES = FilingPackageType.values
+TRIGGER_TYPES = DeadlineTriggerType.values
+REMINDER_CHANNELS = ReminderChannel.values
+DEADLINE_STATUSES = [DeadlineStatus.OPEN, DeadlineStatus.DONE, DeadlineStatus.SNOOZED, DeadlineStatus.MISSED]
+DEADLINE_STATUS_WEIGHTS = [55, 38, 5, 2]
+REMINDER_COUNTS = [0, 1, 2, 3]
+REMINDER_COUNT_WEIGHTS = [30, 45, 20, 5]
+UPDATE_COUNTS = [0, 1, 2, 4]
+UPDATE_COUNT_WEIGHTS = [50, 30, 15, 5]
+_PLAIN_TYPES = {
+    'BigIntegerField',
+    'BooleanField',
+    'CharField',
+    'IntegerField',
+    'PositiveBigIntegerField',
+    'PositiveIntegerField',
+    'PositiveSmallIntegerField',
+    'SmallIntegerField',
+    'TextField',
+}
+
+
+def _preparer(field, connection) -> Optional[Callable[[Any], Any]]:
+    """How to turn a Python value into a database parameter; ``None`` when it passes through as is."""
+
+    target = field.target_field if field.is_relation else field
+    if target.get_internal_type() in _PLAIN_TYPES:
+        return None
+    if target.get_internal_type() == 'UUIDField':
+        # The hot path: every row has several keys.
+        return None if connection.features.has_native_uuid_field else lambda value: value.hex if value is not None else None
+    return lambda value: field.get_db_prep_save(value, connection)
+
+
+class _Table:
+    """Buffered rows for one table, prepared for the database on flush."""
+
+    def __init__(self, model: type[Model], columns: list[str], connection, now: datetime):
+        meta = model._meta
+        fields = [meta.get_field(name) for name in columns]
+        given = {field.attname for field in fields}
+        rest = [field for field in meta.concrete_fields if field.attname not in given]
+        self.table = meta.db_table
+        self.columns = [field.column for field in fields + rest]
+        self.rows: list[tuple] = []
+        self.written = 0
+        self._prepare = [_preparer(field, connection) for field in fields]
+        self._tail = tuple(field.get_db_prep_save(self._default(field, now), connection) for field in rest)
+
+    @staticmethod
+    def _default(field, now: datetime) -> Any:
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            return now
+        if field.has_default():
+            return field.get_default()
+        if field.null:
+            return None
+        if field.blank and field.get_internal_type() in _PLAIN_TYPES:
+            return ''
+        raise ValueError(f'{field.model.__name__}.{field.name} needs a value.')
+
+    def add(self, *values: Any) -> None:
+        self.rows.append(values)
+
+    def prepared_rows(self) -> list[tuple]:
+        prepare, tail = self._prepare, self._tail
+        rows = []
+        for row in self.rows:
+            rows.append(tuple(value if step is None else step(value) for step, value in zip(prepare, row)) + tail)
+        return rows
+
+
+class BulkWriter:
+    """Writes buffered rows table by table, in the order the tables were registered."""
+
+    def __init__(self, connection=None, *, batch_size: int = BATCH_SIZE, now: Optional[datetime] = None):
+        # The wrapper itself rather than the ``django.db.connection`` proxy, which is slow to call per value.
+        self.connection = connection or connections[DEFAULT_DB_ALIAS]
+        self.batch_size = batch_size
+        self.now = now or datetime.now(dt_timezone.utc)
+        self.tables: dict[type[Model], _Table] = {}
+        self._use_copy = self.connection.vendor == 'postgresql' and _is_psycopg3()
+
+    def table(self, model: type[Model], columns: list[str]) -> _Table:
+        self.tables[model] = _Table(model, columns, self.connection, self.now)
+        return self.tables[model]
+
+    def pending(self) -> int:
+        return sum(len(table.rows) for table in self.tables.values())
+
+    def maybe_flush(self) -> None:
+        if self.pending() >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        quote = self.connection.ops.quote_name
+        with self.connection.cursor() as cursor:
+            for table in self.tables.values():
+                if not table.rows:
+                    continue
+                rows = table.prepared_rows()
+                columns = ', '.join(quote(column) for column in table.columns)
+                if self._use_copy:
+                    with cursor.cursor.copy(f'COPY {quote(table.table)} ({columns}) FROM STDIN') as copy:
+                        for row in rows:
+                            copy.write_row(row)
+                else:
+                    placeholders = ', '.join(['%s'] * len(table.columns))
+                    cursor.executemany(f'INSERT INTO {quote(table.table)} ({columns}) VALUES ({placeholders})', rows)
+                table.written += len(rows)
+                table.rows.clear()
+
+    def counts(self) -> dict[str, int]:
+        return {table.table: table.written for table in self.tables.values()}
+
+
+def _is_psycopg3() -> bool:
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The ``n``-th ``weekday`` (0 = Monday) of a month; ``n = -1`` is the last one."""
+
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year, month, calendar.monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def federal_holidays(year: int) -> list[tuple[date, str]]:
+    fixed = [(1, 1, "New Year's Day"), (6, 19, 'Juneteenth'), (7, 4, 'Independence Day'), (11, 11, 'Veterans Day'), (12, 25, 'Christmas Day')]
+    holidays = [(date(year, month, day), name) for month, day, name in fixed]
+    holidays += [
+        (_nth_weekday(year, 1, 0, 3), 'Martin Luther King Jr. Day'),
+        (_nth_weekday(year, 2, 0, 3), "Washington's Birthday"),
+        (_nth_weekday(year, 5, 0, -1), 'Memorial Day'),
+        (_nth_weekday(year, 9, 0, 1), 'Labor Day'),
+        (_nth_weekday(year, 10, 0, 2), 'Columbus Day'),
+        (_nth_weekday(year, 11, 3, 4), 'Thanksgiving Day'),
+    ]
+    return sorted(holidays)
+
+
+def spread(total: int, weights: list[float]) -> list[int]:
+    """Split ``total`` into integer parts proportional to ``weights`` (largest remainder)."""
+
+    scale = total / sum(weights)
+    exact = [weight * scale for weight in weights]
+    parts = [int(value) for value in exact]
+    by_remainder = sorted(range(len(weights)), key=lambda index: parts[index] - exact[index])
+    for index in by_remainder[: total - sum(parts)]:
+        parts[index] += 1
+    return parts
+
+
+class _Generator:
+    def __init__(
+        self,
+        writer: BulkWriter,
+        *,
+        cases: int,
+        deadlines_per_case: int,
+        seed: int,
+        anchor: date,
+        progress: Optional[Callable[[str], None]] = None,
+    ):
+        self.writer = writer
+        self.progress = progress
+        self.rng = random.Random(seed)
+        self.case_count = cases
+        self.deadlines_per_case = deadlines_per_case
+        self.anchor = datetime.combine(anchor, time(14), tzinfo=dt_timezone.utc)
+        self.now = writer.now
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def person(self) -> tuple[str, str]:
+        return self.rng.choice(GIVEN_NAMES), self.rng.choice(SURNAMES)
+
+    def organization(self) -> str:
+        return f'{self.rng.choice(SURNAMES)} & {self.rng.choice(SURNAMES)} {self.rng.choice(ORGANIZATION_SUFFIXES)}'
+
+    def around_anchor(self, days_before: int, days_after: int) -> datetime:
+        return self.anchor + timedelta(minutes=self.rng.randint(-days_before * 1440, days_after * 1440))
+
+    def reference_data(self) -> None:
+        w, rng = self.writer, self.rng
+        calendars = w.table(HolidayCalendar, ['id', 'name', 'jurisdiction', 'timezone', 'source_url'])
+        holidays = w.table(Holiday, ['id', 'calendar', 'date', 'name'])
+        courts = w.table(Court, ['id', 'name', 'district', 'location', 'timezone', 'website_url'])
+        judges = w.table(Judge, ['id', 'full_name', 'court', 'courtroom', 'contact_email', 'contact_phone', 'holiday_calendar'])
+        procedures = w.table(
+            JudgeProcedure,
+            ['id', 'judge', 'title', 'version', 'effective_date', 'content_text', 'filing_format', 'filing_cutoff_time', 'hearing_windows', 'created_at'],
+        )
+        associations = w.table(JudgeAssociation, ['id', 'primary_judge', 'associated_judge', 'association_type'])
+        rules = w.table(Rule, ['id', 'source_type', 'citation', 'jurisdiction', 'version', 'effective_date', 'valid_from', 'text', 'url', 'created_at'])
+        crossrefs = w.table(RuleCrossRef, ['id', 'from_rule', 'to_rule'])
+        templates = w.table(DeadlineTemplate, ['id', 'trigger_event', 'jurisdiction', 'label', 'rule', 'anchor', 'offset_days', 'basis', 'priority'])
+        users = w.table(User, ['id', 'password', 'email', 'full_name', 'role', 'firm', 'timezone', 'created_at', 'updated_at'])
+        tags = w.table(CaseTag, ['id', 'name'])
+
+        self.courts = []
+        for name, short_name, location, zone in COURTS:
+            calendar_id, court_id = self.uuid(), self.uuid()
+            calendars.add(calendar_id, f'{short_name} Holidays', 'Federal', zone, 'https://www.opm.gov/policy-data-oversight/pay-leave/federal-holidays/')
+            for year in range(self.anchor.year - 2, self.anchor.year + 3):
+                for day, holiday in federal_holidays(year):
+                    holidays.add(self.uuid(), calendar_id, day, holiday)
+            courts.add(court_id, name, short_name, location, zone, '')
+            court_judges = []
+            for index in range(JUDGES_PER_COURT):
+                judge_id = self.uuid()
+                given, surname = self.person()
+                judges.add(
+                    judge_id,
+                    f'Hon. {given} {surname}',
+                    court_id,
+                    f'Courtroom {rng.randint(1, 30)}{rng.randint(10, 99)}',
+                    f'{surname.lower()}_{index}_chambers@{short_name.lower().replace(".", "").replace(" ", "")}.uscourts.gov',
+                    f'{rng.randint(200, 989)}-{rng.randint(200, 989)}-{rng.randint(1000, 9999)}',
+                    calendar_id,
+                )
+                for version, effective in (('2024.1', date(2024, 1, 1)), ('2025.1', date(2025, 1, 1))):
+                    procedures.add(
+                        self.uuid(),
+                        judge_id,
+                        'Standing Order on Motion Practice',
+                        version,
+                        effective,
+                        'Motions must include a notice of presentment in compliance with the local rules.',
+                        {'preferred_format': rng.choice(['single_pdf', 'multi_pdf']), 'page_limit': rng.choice([15, 25, 35])},
+                        time(rng.choice([17, 18, 23]), rng.choice([0, 59])),
+                        {'weekdays': [rng.randrange(5)], 'start': '09:30', 'end': '12:00'},
+                        self.now,
+                    )
+                court_judges.append(judge_id)
+            for primary, associated in zip(court_judges[::2], court_judges[1::2]):
+                associations.add(self.uuid(), primary, associated, 'magistrate')
+            self.courts.append((court_id, calendar_id, zone, short_name, court_judges))
+
+        self.rules = []
+        for index in range(RULE_COUNT):
+            federal = index % 3 == 0
+            rule_id = self.uuid()
+            citation = f'Fed. R. Civ. P. {index // 3 + 1}' if federal else f'L.R. {index // 3 + 1}.{index % 3}'
+            effective = date(2020 + index % 6, 12, 1)
+            rules.add(
+                rule_id,
+                RuleSourceType.FRCP if federal else RuleSourceType.LOCAL_RULE,
+                citation,
+                'Federal' if federal else self.courts[index % len(self.courts)][3],
+                str(effective.year),
+                effective,
+                effective,
+                f'{citation}. Synthetic rule text; see Fed. R. Civ. P. {rng.randint(1, RULE_COUNT // 3)}.',
+                '',
+                self.now,
+            )
+            self.rules.append(rule_id)
+        for from_rule, to_rule in {(rng.choice(self.rules), rng.choice(self.rules)) for _ in range(RULE_COUNT * 2)}:
+            if from_rule != to_rule:
+                crossrefs.add(self.uuid(), from_rule, to_rule)
+
+        for jurisdiction in ['Federal'] + [court[3] for court in self.courts]:
+            template_ids = []
+            for trigger_event, label, anchor_index, offset, basis in TEMPLATE_STEPS:
+                template_ids.append(self.uuid())
+                templates.add(
+                    template_ids[-1],
+                    trigger_event,
+                    jurisdiction,
+                    label,
+                    rng.choice(self.rules),
+                    template_ids[anchor_index] if anchor_index is not None else None,
+                    offset,
+                    basis,
+                    rng.randint(1, 5),
+                )
+
+        login_password = make_password(LOGIN_PASSWORD)
+        # Unusable, like accounts created without a password; one hash serves every user.
+        unusable_password = make_password(None)
+        self.users = []
+        for index in range(max(5, self.case_count // 25)):
+            given, surname = self.person()
+            user_id = self.uuid()
+            users.add(
+                user_id,
+                login_password if index == 0 else unusable_password,
+                LOGIN_EMAIL if index == 0 else f'{given}.{surname}.{index}@example.com'.lower(),
+                f'{given} {surname}',
+                UserRole.PARALEGAL if index % 4 == 3 else UserRole.LAWYER,
+                'Synthetic Firm LLP',
+                rng.choice(COURTS)[3],
+                self.now,
+                self.now,
+            )
+            self.users.append(user_id)
+
+        self.tags = [self.uuid() for _ in TAGS]
+        for tag_id, name in zip(self.tags, TAGS):
+            tags.add(tag_id, name)
+
+    def case_data(self) -> None:
+        w, rng = self.writer, self.rng
+        cases = w.table(
+            Case,
+            ['id', 'internal_case_id', 'case_number', 'caption', 'practice_area', 'court', 'filing_date', 'status', 'stage', 'lead_attorney', 'confidentiality_level', 'legal_hold', 'timezone', 'created_at', 'updated_at'],
+        )
+        team = w.table(CaseTeam, ['id', 'case', 'user', 'role', 'added_at'])
+        permissions = w.table(CasePermission, ['id', 'case', 'user', 'can_view', 'can_edit', 'can_manage_deadlines', 'can_manage_filings'])
+        tag_assignments = w.table(CaseTagAssignment, ['id', 'case', 'tag'])
+        notes = w.table(CaseNote, ['id', 'case', 'author', 'body', 'visibility', 'created_at', 'updated_at'])
+        contacts = w.table(
+            Contact,
+            ['id', 'type', 'first_name', 'last_name', 'org_name', 'bar_number', 'email', 'phone', 'address', 'normalized_name', 'normalized_org'],
+        )
+        addresses = w.table(ContactAddress, ['id', 'contact', 'label', 'address', 'is_primary'])
+        case_contacts = w.table(CaseContact, ['id', 'case', 'contact', 'role'])
+        documents = w.table(
+            Document,
+            ['id', 'case', 'title', 'source', 'url', 'file_hash', 'mime_type', 'page_count', 'ocr_status', 'uploaded_at', 'uploaded_by'],
+        )
+        chunks = w.table(DocChunk, ['id', 'document', 'chunk_index', 'start_offset', 'end_offset', 'heading', 'content'])
+        docket = w.table(DocketEntry, ['id', 'case', 'entry_no', 'entered_at', 'entry_type', 'description', 'pdf_document'])
+        filings = w.table(Filing, ['id', 'case', 'filing_type', 'ecf_category', 'packaged_as', 'served_at', 'service_method', 'primary_document'])
+        exhibits = w.table(FilingExhibit, ['id', 'filing', 'label', 'document'])
+        service = w.table(FilingServiceContact, ['id', 'filing', 'contact'])
+        hearings = w.table(Hearing, ['id', 'case', 'judge', 'hearing_type', 'starts_at', 'ends_at', 'location'])
+        deadlines = w.table(
+            Deadline,
+            ['id', 'case', 'trigger_type', 'trigger_source_type', 'trigger_source_id', 'basis', 'holiday_calendar', 'due_at', 'timezone', 'owner', 'priority', 'status', 'computation_rationale', 'created_by', 'updated_by', 'created_at', 'updated_at'],
+        )
+        reminders = w.table(DeadlineReminder, ['id', 'deadline', 'notify_at', 'channel', 'sent', 'sent_at'])
+        dependencies = w.table(DeadlineDependency, ['id', 'predecessor', 'successor', 'dependency_type'])
+        followups = w.table(HearingFollowUp, ['id', 'hearing', 'deadline'])
+        audit = w.table(AuditLog, ['id', 'actor_user', 'entity_table', 'entity_id', 'action', 'before', 'after', 'sequence', 'is_checkpoint', 'created_at'])
+        checkpoint_interval = get_checkpoint_interval()
+
+        # Matter size is heavy-tailed: most cases have a handful of deadlines, a few MDLs have thousands.
+        weights = [rng.paretovariate(1.2) for _ in range(self.case_count)]
+        per_case = spread(self.case_count * self.deadlines_per_case, weights)
+        user_count = len(self.users)
+        report_every = max(1, self.case_count // 10)
+
+        for index, deadline_count in enumerate(per_case):
+            if self.progress and index and index % report_every == 0:
+                self.progress(f'{index} of {self.case_count} cases written.')
+            court_id, calendar_id, zone, short_name, court_judges = rng.choice(self.courts)
+            case_id = self.uuid()
+            members = rng.sample(self.users, min(3, user_count))
+            lead = members[0]
+            filed = self.anchor - timedelta(days=rng.randint(30, 1500))
+            plaintiff, defendant = rng.choice(SURNAMES), rng.choice(SURNAMES)
+            cases.add(
+                case_id,
+                f'SYN-{index:08d}',
+                f'1:{filed.year % 100:02d}-cv-{index % 100000:05d}',
+                f'{plaintiff} {rng.choice(ORGANIZATION_SUFFIXES)} v. {defendant} {rng.choice(ORGANIZATION_SUFFIXES)}',
+                rng.choice(PRACTICE_AREAS),
+                court_id,
+                filed.date(),
+                rng.choices([CaseStatus.OPEN, CaseStatus.STAYED, CaseStatus.CLOSED, CaseStatus.APPEAL], [78, 5, 14, 3])[0],
+                rng.choice(STAGES),
+                lead,
+                rng.choice(['', 'Confidential', 'Attorneys Eyes Only']),
+                rng.random() < 0.2,
+                zone,
+                filed,
+                filed,
+            )
+            for user_id, role in zip(members, [CaseTeamRole.OWNER, CaseTeamRole.CONTRIBUTOR, CaseTeamRole.REVIEWER]):
+                team.add(self.uuid(), case_id, user_id, role, filed)
+                permissions.add(self.uuid(), case_id, user_id, True, role != CaseTeamRole.REVIEWER, role == CaseTeamRole.OWNER, role == CaseTeamRole.OWNER)
+            for tag_id in rng.sample(self.tags, rng.choice([0, 1, 1, 2])):
+                tag_assignments.add(self.uuid(), case_id, tag_id)
+            for _ in range(rng.randint(0, 3)):
+                written = filed + timedelta(days=rng.randint(0, 400))
+                notes.add(self.uuid(), case_id, rng.choice(members), 'Synthetic case note.', 'team', written, written)
+
+            contact_ids = []
+            for role in (CaseContactRole.CLIENT, CaseContactRole.OPPOSING_COUNSEL, CaseContactRole.OPPOSING_COUNSEL, CaseContactRole.EXPERT):
+                contact_id = self.uuid()
+                given, surname = self.person()
+                organization = self.organization()
+                city = rng.choice(COURTS)[2]
+                contacts.add(
+                    contact_id,
+                    ContactType.PERSON,
+                    given,
+                    surname,
+                    organization,
+                    f'{rng.randint(100000, 9999999)}' if role == CaseContactRole.OPPOSING_COUNSEL else '',
+                    f'{given}.{surname}.{rng.randrange(10**6)}@example.com'.lower(),
+                    f'{rng.randint(200, 989)}-555-{rng.randint(1000, 9999)}',
+                    {'line1': f'{rng.randint(1, 999)} Main St', 'city': city.split(', ')[0], 'state': city[-2:], 'zip': f'{rng.randint(10000, 99999)}'},
+                    normalize_name(f'{given} {surname}'),
+                    normalize_name(organization),
+                )
+                addresses.add(
+                    self.uuid(),
+                    contact_id,
+                    'Service',
+                    {'line1': f'{rng.randint(1, 99)} Court Plaza', 'suite': f'Suite {rng.randint(100, 4000)}', 'city': city.split(', ')[0], 'state': city[-2:]},
+                    True,
+                )
+                case_contacts.add(self.uuid(), case_id, contact_id, role)
+                contact_ids.append(contact_id)
+
+            document_ids = []
+            for number in range(rng.randint(2, 6)):
+                document_id = self.uuid()
+                uploaded = filed + timedelta(days=rng.randint(0, 600))
+                pages = rng.randint(1, 80)
+                documents.add(
+                    document_id,
+                    case_id,
+                    f'{rng.choice(FILING_TYPES)} {number + 1}',
+                    DocumentSource.PACER,
+                    '',
+                    f'{rng.getrandbits(256):064x}',
+                    'application/pdf',
+                    pages,
+                    OcrStatus.COMPLETE,
+                    uploaded,
+                    rng.choice(members),
+                )
+                offset = 0
+                for chunk_index in range(min(pages, 4)):
+                    length = rng.randint(800, 2000)
+                    chunks.add(self.uuid(), document_id, chunk_index, offset, offset + length, f'Section {chunk_index + 1}', 'Synthetic chunk text. ' * 20)
+                    offset += length
+                docket.add(self.uuid(), case_id, number + 1, uploaded, rng.choice(DOCKET_TYPES), 'Synthetic docket entry.', document_id)
+                document_ids.append((document_id, uploaded))
+
+            for primary_id, uploaded in document_ids[: max(1, len(document_ids) // 2)]:
+                filing_id = self.uuid()
+                filings.add(
+                    filing_id,
+                    case_id,
+                    rng.choice(FILING_TYPES),
+                    'Motions',
+                    rng.choice(PACKAGE_TYPES),
+                    uploaded + timedelta(hours=rng.randint(1, 48)),
+                    'CM/ECF',
+                    primary_id,
+                )
+                others = [document_id for document_id, _ in document_ids if document_id != primary_id]
+                for number, document_id in enumerate(rng.sample(others, min(2, len(others))), start=1):
+                    exhibits.add(self.uuid(), filing_id, f'Ex. {number}', document_id)
+                for contact_id in contact_ids[1:3]:
+                    service.add(self.uuid(), filing_id, contact_id)
+
+            hearing_ids = []
+            for _ in range(rng.randint(1, 3)):
+                hearing_id = self.uuid()
+                starts_at = self.around_anchor(180, 180).replace(minute=0, second=0)
+                hearings.add(hearing_id, case_id, rng.choice(court_judges), rng.choice(HEARING_TYPES), starts_at, starts_at + timedelta(hours=1), f'{short_name} Courtroom')
+                hearing_ids.append(hearing_id)
+
+            previous = None
+            for _ in range(deadline_count):
+                deadline_id = self.uuid()
+                due_at = self.around_anchor(365, 365)
+                created_at = min(due_at, self.anchor) - timedelta(days=rng.randint(1, 60))
+                owner = rng.choice(members)
+                trigger_type = rng.choice(TRIGGER_TYPES)
+                basis = rng.choice([DeadlineBasis.CALENDAR_DAYS, DeadlineBasis.BUSINESS_DAYS])
+                priority = rng.choices([1, 2, 3, 4, 5], [10, 25, 40, 15, 10])[0]
+                status = rng.choices(DEADLINE_STATUSES, DEADLINE_STATUS_WEIGHTS)[0]
+                if status == DeadlineStatus.OPEN and due_at < self.anchor and rng.random() < 0.5:
+                    status = DeadlineStatus.DONE
+                trigger_source = rng.choice(self.rules) if trigger_type == DeadlineTriggerType.RULE else None
+                deadlines.add(
+                    deadline_id,
+                    case_id,
+                    trigger_type,
+                    'rule' if trigger_source else 'docket_entry',
+                    trigger_source,
+                    basis,
+                    calendar_id,
+                    due_at,
+                    zone,
+                    owner,
+                    priority,
+                    status,
+                    'Synthetic deadline.',
+                    owner,
+                    owner,
+                    created_at,
+                    created_at,
+                )
+                for _ in range(rng.choices(REMINDER_COUNTS, REMINDER_COUNT_WEIGHTS)[0]):
+                    notify_at = due_at - timedelta(days=rng.choice([1, 2, 7, 14]))
+                    sent = notify_at < self.anchor
+                    reminders.add(self.uuid(), deadline_id, notify_at, rng.choice(REMINDER_CHANNELS), sent, notify_at if sent else None)
+                if previous is not None and rng.random() < 0.15:
+                    dependencies.add(self.uuid(), previous, deadline_id, 'finish_to_start')
+                if hearing_ids and trigger_type == DeadlineTriggerType.COURT_ORDER and rng.random() < 0.3:
+                    followups.add(self.uuid(), rng.choice(hearing_ids), deadline_id)
+                previous = deadline_id
+
+                # The history replays to the row as written: priority changes ending at its priority,
+                # then the move out of open when it has one.
+                priorities = [rng.randint(1, 5) for _ in range(rng.choices(UPDATE_COUNTS, UPDATE_COUNT_WEIGHTS)[0])]
+                priorities.append(priority)
+                snapshot = {
+                    'id': str(deadline_id),
+                    'case_id': str(case_id),
+                    'trigger_type': trigger_type,
+                    'basis': basis,
+                    'due_at': due_at.isoformat(),
+                    'timezone': zone,
+                    'owner_id': str(owner),
+                    'priority': priorities[0],
+                    'status': DeadlineStatus.OPEN,
+                }
+                # Rows are serialized on flush, so every entry gets its own dicts.
+                audit.add(self.uuid(), owner, 'deadlines', deadline_id, AuditAction.CREATE, None, dict(snapshot), 1, True, created_at)
+                changes = [{'priority': new} for old, new in zip(priorities, priorities[1:]) if new != old]
+                if status != DeadlineStatus.OPEN:
+                    changes.append({'status': status})
+                changed_at = created_at
+                for sequence, change in enumerate(changes, start=2):
+                    changed_at += timedelta(hours=rng.randint(1, 240))
+                    before = {key: snapshot[key] for key in change}
+                    snapshot.update(change)
+                    is_checkpoint = sequence % checkpoint_interval == 0
+                    audit.add(
+                        self.uuid(), owner, 'deadlines', deadline_id, AuditAction.UPDATE,
+                        before, dict(snapshot) if is_checkpoint else change, sequence, is_checkpoint, changed_at,
+                    )
+                self.writer.maybe_flush()
+            self.writer.maybe_flush()
+
+
+def generate(
+    *,
+    cases: int,
+    deadlines_per_case: int,
+    seed: int = 0,
+    anchor: Optional[date] = None,
+    batch_size: int = BATCH_SIZE,
+    progress: Optional[Callable[[str], None]] = None,
+) -> dict[str, int]:
+    """Insert a synthetic dataset and return the rows written per table.
+
+    Dates are spread around ``anchor`` (default today), so the same seed and
+    anchor reproduce the same rows. Deadlines total ``cases * deadlines_per_case``.
+    """
+
+    anchor = anchor or date.today()
+    writer = BulkWriter(batch_size=batch_size, now=datetime.combine(anchor, time(12), tzinfo=dt_timezone.utc))
+    generator = _Generator(
+        writer, cases=cases, deadlines_per_case=deadlines_per_case, seed=seed, anchor=anchor, progress=progress
+    )
+    with transaction.atomic():
+        if writer.connection.vendor == 'postgresql':
+            # Tables are flushed parents first, so foreign keys can be checked per statement instead of queued until commit.
+            with writer.connection.cursor() as cursor:
+                cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        generator.reference_data()
+        writer.flush()
+        if progress:
+            progress('Reference data written.')
+        generator.case_data()
+        writer.flush()
+        refresh_rule_intervals()
+        Token.objects.get_or_create(user=User.objects.get(email=LOGIN_EMAIL))
+        transaction.on_commit(_invalidate_caches)
+    return writer.counts()
+
+
+def _invalidate_caches() -> None:
+    invalidate_rule_graph()
+    invalidate_trigram_index()
+    invalidate_template_registry()
+    bump_versions(*REFERENCE_MODELS)
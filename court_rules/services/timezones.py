@@ -0,0 +1,92 @@
+"""Cached time zones and local-to-UTC conversion for deadline cutoffs.
+
+``ZoneInfo`` objects are kept in an LRU cache. For each zone and year the UTC
+offset transitions are found once and stored as a sorted table, so converting
+a court-local wall time to an instant is a binary search.
+
+Wall times that fall in a spring-forward gap resolve to the same wall-clock
+distance past the gap (as ``fold=0`` does in ``zoneinfo``). Ambiguous times
+in a fall-back hour resolve to the later instant, which gives the filer the
+extra hour.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+DEFAULT_TIMEZONE = 'UTC'
+ZONE_CACHE_SIZE = 128
+UTC = dt_timezone.utc
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def get_zone(name: Optional[str]) -> ZoneInfo:
+    """Return the ``ZoneInfo`` for ``name``, falling back to UTC for blank or unknown names."""
+
+    try:
+        return ZoneInfo(name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def _offset(zone: ZoneInfo, instant: datetime) -> timedelta:
+    return instant.astimezone(zone).utcoffset()
+
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE * 8)
+def transition_table(zone_name: str, year: int) -> tuple[tuple[datetime, ...], tuple[timedelta, ...]]:
+    """Return the UTC instants at which ``zone_name`` changes offset in ``year`` and the offsets.
+
+    ``offsets[i]`` applies from ``instants[i - 1]`` (or the start of the year)
+    up to ``instants[i]``, so there is always one more offset than instant.
+    A margin of a day either side covers local dates near New Year.
+    """
+
+    zone = get_zone(zone_name)
+    start = datetime(year, 1, 1, tzinfo=UTC) - timedelta(days=1)
+    end = datetime(year + 1, 1, 1, tzinfo=UTC) + timedelta(days=1)
+    instants: list[datetime] = []
+    offsets = [_offset(zone, start)]
+    day = start
+    while day < end:
+        following = min(day + timedelta(days=1), end)
+        if _offset(zone, following) != offsets[-1]:
+            # Narrow the change down to the second.
+            low, high = day, following
+            while high - low > timedelta(seconds=1):
+                middle = low + (high - low) / 2
+                if _offset(zone, middle) == offsets[-1]:
+                    low = middle
+                else:
+                    high = middle
+            instants.append(high.replace(microsecond=0))
+            offsets.append(_offset(zone, following))
+        day = following
+    return tuple(instants), tuple(offsets)
+
+
+def _offset_at(instants: tuple[datetime, ...], offsets: tuple[timedelta, ...], instant: datetime) -> timedelta:
+    return offsets[bisect_right(instants, instant)]
+
+
+def local_to_utc(day: date, wall_time: time, zone_name: Optional[str]) -> datetime:
+    """Return the UTC instant of ``wall_time`` on ``day`` in ``zone_name``."""
+
+    zone_name = get_zone(zone_name).key
+    instants, offsets = transition_table(zone_name, day.year)
+    wall = datetime.combine(day, wall_time.replace(tzinfo=None), tzinfo=UTC)
+    if len(offsets) == 1:
+        return wall - offsets[0]
+
+    valid = [offset for offset in set(offsets) if _offset_at(instants, offsets, wall - offset) == offset]
+    if valid:
+        # Ambiguous wall times have two valid offsets; the smaller one is the later instant.
+        return wall - min(valid)
+    # In a gap: use the offset in force just before it, which lands past the gap.
+    gap_end = next(instant for instant in instants if instant > wall - max(offsets))
+    return wall - _offset_at(instants, offsets, gap_end - timedelta(seconds=1))
@@ -0,0 +1,80 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from court_rules.models import (
+    Contact,
+    Court,
+    DeadlineTemplate,
+    Document,
+    Holiday,
+    HolidayCalendar,
+    Judge,
+    JudgeAssociation,
+    JudgeProcedure,
+    Rule,
+    RuleCrossRef,
+)
+from court_rules.services.blobs import release_blob
+from court_rules.services.conflicts import contact_keys, record_contact_change
+from court_rules.services.deadline_templates import invalidate_template_registry
+from court_rules.services.reference_cache import bump_versions
+from court_rules.services.rule_graph import record_crossref_change
+from court_rules.services.rules import refresh_rule_intervals
+
+
+@receiver([post_save, post_delete], sender=Court)
+@receiver([post_save, post_delete], sender=HolidayCalendar)
+@receiver([post_save, post_delete], sender=Holiday)
+@receiver([post_save, post_delete], sender=Judge)
+@receiver([post_save, post_delete], sender=JudgeAssociation)
+@receiver([post_save, post_delete], sender=JudgeProcedure)
+@receiver([post_save, post_delete], sender=Rule)
+def bump_reference_version(sender, **kwargs):
+    bump_versions(sender)
+
+
+@receiver([post_save, post_delete], sender=Rule)
+def refresh_intervals_on_rule_change(sender, instance, **kwargs):
+    refresh_rule_intervals([instance.citation])
+
+
+@receiver(post_save, sender=RuleCrossRef)
+def publish_crossref_added(sender, instance, created, **kwargs):
+    # Other workers must not apply an edge that a rollback later removes.
+    transaction.on_commit(partial(record_crossref_change, 'add', instance.from_rule_id, instance.to_rule_id))
+
+
+@receiver(post_delete, sender=RuleCrossRef)
+def publish_crossref_removed(sender, instance, **kwargs):
+    transaction.on_commit(partial(record_crossref_change, 'remove', instance.from_rule_id, instance.to_rule_id))
+
+
+@receiver([post_save, post_delete], sender=DeadlineTemplate)
+def invalidate_templates_on_change(sender, instance, **kwargs):
+    invalidate_template_registry()
+
+
+@receiver(pre_save, sender=Contact)
+def normalize_contact_keys(sender, instance, **kwargs):
+    instance.normalized_name, instance.normalized_org = contact_keys(instance)
+
+
+@receiver(post_save, sender=Contact)
+def publish_contact_saved(sender, instance, **kwargs):
+    transaction.on_commit(
+        partial(record_contact_change, 'upsert', instance.pk, instance.normalized_name, instance.normalized_org)
+    )
+
+
+@receiver(post_delete, sender=Contact)
+def publish_contact_removed(sender, instance, **kwargs):
+    transaction.on_commit(partial(record_contact_change, 'remove', instance.pk))
+
+
+@receiver(post_delete, sender=Document)
+def release_document_blob(sender, instance, **kwargs):
+    if instance.blob_id:
+        release_blob(instance.blob_id)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import override_settings
+from django.urls import include, path
+from django.utils import timezone
+from rest_framework import mixins, status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.api.v1.async_views import async_read_patterns
+from court_rules.api.v1.urls import router
+from court_rules.api.v1.viewsets import FastListMixin
+from court_rules.models import Case, Deadline
+from court_rules.services.synthetic import LOGIN_EMAIL, generate
+
+
+# The API as an ASGI deployment with ASYNC_READS_ENABLED serves it.
+urlpatterns = [path('api/v1/', include(async_read_patterns(router, ('deadline', 'case')) + router.urls))]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncReadTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        generate(cases=4, deadlines_per_case=8, seed=5, anchor=date(2026, 3, 2))
+        cls.token = Token.objects.get(user__email=LOGIN_EMAIL)
+        cls.case = Case.objects.order_by('pk').first()
+        cls.deadline = Deadline.objects.order_by('pk').first()
+
+    def auth_headers(self):
+        return {'authorization': f'Token {self.token.key}'}
+
+    def aget(self, url, **headers):
+        return async_to_sync(self.async_client.get)(url, headers={**self.auth_headers(), **headers})
+
+    def sync_get(self, url):
+        with self.settings(ROOT_URLCONF='config.urls'):
+            return self.client.get(url, headers=self.auth_headers())
+
+    def test_reads_are_byte_identical_to_the_sync_views(self):
+        urls = [
+            '/api/v1/deadlines/',
+            '/api/v1/deadlines/?page=2',
+            f'/api/v1/deadlines/?case={self.case.pk}&fields=id,due_at_local,pending_reminders',
+            f'/api/v1/deadlines/{self.deadline.pk}/',
+            f'/api/v1/deadlines/{self.deadline.pk}/?omit=computation_rationale',
+            '/api/v1/cases/?fields=caption,court_name',
+            f'/api/v1/cases/{self.case.pk}/',
+            '/api/v1/deadlines/?page=9',
+            '/api/v1/deadlines/?fields=nonsense',
+            '/api/v1/deadlines/not-an-id/',
+            f'/api/v1/cases/{self.deadline.pk}/',
+        ]
+        for url in urls:
+            with self.subTest(url):
+                with mock.patch.object(FastListMixin, 'list') as sync_list:
+                    with mock.patch.object(mixins.RetrieveModelMixin, 'retrieve') as sync_retrieve:
+                        served = self.aget(url)
+                sync_list.assert_not_called()
+                sync_retrieve.assert_not_called()
+                expected = self.sync_get(url)
+                self.assertEqual(served.status_code, expected.status_code)
+                self.assertEqual(served.content, expected.content)
+
+    def test_queries_are_counted_as_on_the_sync_path(self):
+        with self.assertNumQueries(3):
+            response = self.aget('/api/v1/deadlines/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('desc="3 queries, 0 duplicate"', response['Server-Timing'])
+
+    def test_everything_else_goes_to_the_sync_views(self):
+        anonymous = async_to_sync(self.async_client.get)('/api/v1/deadlines/')
+        self.assertEqual(anonymous.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(anonymous['WWW-Authenticate'], 'Token')
+
+        browsable = self.aget('/api/v1/cases/', accept='text/html')
+        self.assertEqual(browsable.status_code, status.HTTP_200_OK)
+        self.assertTrue(browsable['Content-Type'].startswith('text/html'))
+
+        created = async_to_sync(self.async_client.post)(
+            '/api/v1/deadlines/',
+            json.dumps(
+                {
+                    'case': str(self.case.pk),
+                    'trigger_type': 'user',
+                    'basis': 'calendar_days',
+                    'due_at': (timezone.now() + timedelta(days=10)).isoformat(),
+                    'timezone': 'America/Chicago',
+                    'computation_rationale': 'Filed through the async route.',
+                }
+            ),
+            content_type='application/json',
+            headers=self.auth_headers(),
+        )
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Deadline.objects.filter(computation_rationale='Filed through the async route.').exists())
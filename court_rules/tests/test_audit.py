@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest import mock
+
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from court_rules.models import (
+    AuditAction,
+    AuditLog,
+    Case,
+    CaseStatus,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    DeadlineTriggerType,
+    User,
+    UserRole,
+)
+from court_rules.services.audit import (
+    format_deadline_snapshot,
+    reconstruct_entity_state,
+    record_audit_event,
+    record_update_events,
+)
+
+
+class CompactAuditLogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='auditor@example.com',
+            password='password123',
+            full_name='Audit User',
+            role=UserRole.LAWYER,
+        )
+        court = Court.objects.create(name='Northern District of Illinois', timezone='America/Chicago')
+        cls.case = Case.objects.create(
+            internal_case_id='CASE-AUDIT',
+            caption='Audit v. Trail',
+            court=court,
+            status=CaseStatus.OPEN,
+            timezone='America/Chicago',
+        )
+
+    def setUp(self):
+        self.deadline = Deadline.objects.create(
+            case=self.case,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=7),
+            timezone='America/Chicago',
+            computation_rationale='A long rationale ' * 50,
+        )
+        record_audit_event(
+            actor=self.user,
+            entity_table='deadlines',
+            entity_id=self.deadline.id,
+            action=AuditAction.CREATE,
+            after=format_deadline_snapshot(self.deadline),
+        )
+
+    def update_deadline(self, **changes):
+        before = format_deadline_snapshot(self.deadline)
+        for field, value in changes.items():
+            setattr(self.deadline, field, value)
+        self.deadline.save()
+        return record_audit_event(
+            actor=self.user,
+            entity_table='deadlines',
+            entity_id=self.deadline.id,
+            action=AuditAction.UPDATE,
+            before=before,
+            after=format_deadline_snapshot(self.deadline),
+        )
+
+    def test_sequences_are_taken_under_a_lock_on_the_audited_row(self):
+        snapshot = format_deadline_snapshot(self.deadline)
+        with mock.patch.object(QuerySet, 'select_for_update', autospec=True, side_effect=lambda queryset: queryset) as lock:
+            record_audit_event(
+                actor=self.user,
+                entity_table='deadlines',
+                entity_id=self.deadline.id,
+                action=AuditAction.UPDATE,
+                before=snapshot,
+                after={**snapshot, 'priority': 1},
+            )
+            record_update_events(
+                actor=self.user,
+                entity_table='deadlines',
+                changes={self.deadline.id: ({**snapshot, 'priority': 1}, {**snapshot, 'priority': 2})},
+            )
+
+        self.assertEqual([call.args[0].model for call in lock.call_args_list], [Deadline, Deadline])
+        self.assertEqual(
+            list(AuditLog.objects.filter(entity_id=self.deadline.id).order_by('sequence').values_list('sequence', flat=True)),
+            [1, 2, 3],
+        )
+
+    def test_update_stores_only_changed_keys(self):
+        log = self.update_deadline(status='done')
+
+        self.assertEqual(log.before, {'status': 'open'})
+        self.assertEqual(log.after, {'status': 'done'})
+        self.assertFalse(log.is_checkpoint)
+        self.assertEqual(log.sequence, 2)
+
+    def test_replay_tells_a_removed_key_from_a_null_one(self):
+        snapshot = format_deadline_snapshot(self.deadline)
+        without_outcome = {key: value for key, value in snapshot.items() if key != 'outcome'}
+        record_audit_event(
+            actor=self.user,
+            entity_table='deadlines',
+            entity_id=self.deadline.id,
+            action=AuditAction.UPDATE,
+            before=snapshot,
+            after={**without_outcome, 'extension_notes': None},
+        )
+
+        state = reconstruct_entity_state('deadlines', self.deadline.id)
+
+        self.assertNotIn('outcome', state)
+        self.assertIsNone(state['extension_notes'])
+
+    @override_settings(AUDIT_CHECKPOINT_INTERVAL=3)
+    def test_periodic_checkpoint_stores_full_snapshot(self):
+        self.update_deadline(priority=2)
+        checkpoint = self.update_deadline(priority=1)
+
+        self.assertTrue(checkpoint.is_checkpoint)
+        self.assertEqual(checkpoint.after, format_deadline_snapshot(self.deadline))
+        self.assertEqual(checkpoint.before, {'priority': 2})
+
+    @override_settings(AUDIT_CHECKPOINT_INTERVAL=3)
+    def test_reconstruct_entity_state_replays_history(self):
+        created = AuditLog.objects.get(entity_id=self.deadline.id, action=AuditAction.CREATE)
+        self.update_deadline(status='snoozed')
+        intermediate = format_deadline_snapshot(self.deadline)
+        middle = AuditLog.objects.get(entity_id=self.deadline.id, sequence=2)
+        for priority in (2, 1, 5):
+            self.update_deadline(priority=priority)
+
+        self.assertEqual(
+            reconstruct_entity_state('deadlines', self.deadline.id),
+            format_deadline_snapshot(self.deadline),
+        )
+        self.assertEqual(
+            reconstruct_entity_state('deadlines', self.deadline.id, as_of=middle.created_at),
+            intermediate,
+        )
+        self.assertEqual(
+            reconstruct_entity_state('deadlines', self.deadline.id, as_of=created.created_at)['status'],
+            'open',
+        )
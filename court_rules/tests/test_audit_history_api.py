@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    AuditAction,
+    Case,
+    CaseStatus,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    DeadlineTriggerType,
+    User,
+    UserRole,
+)
+from court_rules.services.audit import format_deadline_snapshot, record_audit_event
+
+
+class AuditHistoryApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='history@example.com',
+            password='password123',
+            full_name='History User',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        court = Court.objects.create(name='Northern District of Illinois', timezone='America/Chicago')
+        cls.case = Case.objects.create(
+            internal_case_id='CASE-HISTORY',
+            caption='History v. Replay',
+            court=court,
+            status=CaseStatus.OPEN,
+            timezone='America/Chicago',
+        )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def make_deadline_with_history(self, updates):
+        deadline = Deadline.objects.create(
+            case=self.case,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=10),
+            timezone='America/Chicago',
+        )
+        record_audit_event(
+            actor=self.user,
+            entity_table='deadlines',
+            entity_id=deadline.id,
+            action=AuditAction.CREATE,
+            after=format_deadline_snapshot(deadline),
+        )
+        for index in range(updates):
+            actor = User.objects.create(
+                email=f'actor{deadline.id.hex[:6]}{index}@example.com',
+                full_name=f'Actor {index}',
+                role=UserRole.PARALEGAL,
+            )
+            before = format_deadline_snapshot(deadline)
+            deadline.priority = index % 5 + 1
+            deadline.extension_notes = f'Revision {index}'
+            deadline.save()
+            record_audit_event(
+                actor=actor,
+                entity_table='deadlines',
+                entity_id=deadline.id,
+                action=AuditAction.UPDATE,
+                before=before,
+                after=format_deadline_snapshot(deadline),
+            )
+        return deadline
+
+    def fetch_history(self, deadline):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/v1/deadlines/{deadline.id}/history/', **self.auth_headers())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_history_returns_compact_changes_newest_first(self):
+        deadline = self.make_deadline_with_history(updates=1)
+
+        response, _ = self.fetch_history(deadline)
+
+        results = response.data['results']
+        self.assertEqual([entry['action'] for entry in results], ['update', 'create'])
+        self.assertEqual(results[0]['actor_name'], 'Actor 0')
+        self.assertEqual(
+            results[0]['changes'],
+            {
+                'extension_notes': {'from': '', 'to': 'Revision 0'},
+                'priority': {'from': 3, 'to': 1},
+            },
+        )
+
+    def test_history_query_count_does_not_grow_with_entries(self):
+        small = self.make_deadline_with_history(updates=2)
+        large = self.make_deadline_with_history(updates=12)
+
+        _, small_queries = self.fetch_history(small)
+        response, large_queries = self.fetch_history(large)
+
+        self.assertEqual(len(response.data['results']), 13)
+        self.assertEqual(small_queries, large_queries)
+
+    def test_history_for_invalid_id_returns_404(self):
+        response = self.client.get('/api/v1/deadlines/not-a-uuid/history/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from django.test import TestCase
+
+from court_rules.models import AuditAction, AuditLog, User, UserRole
+from court_rules.services import audit_partitions
+from court_rules.services.audit import record_audit_event
+
+
+class AuditPartitionHelperTests(TestCase):
+    def test_partition_names_round_trip(self):
+        name = audit_partitions.partition_name(date(2025, 3, 1))
+
+        self.assertEqual(name, 'audit_log_p202503')
+        self.assertEqual(audit_partitions.partition_month(name), date(2025, 3, 1))
+        self.assertIsNone(audit_partitions.partition_month('audit_log_unpartitioned'))
+        self.assertIsNone(audit_partitions.partition_month(audit_partitions.DEFAULT_PARTITION))
+
+    def test_add_months_crosses_year_boundaries(self):
+        self.assertEqual(audit_partitions.add_months(date(2025, 11, 1), 3), date(2026, 2, 1))
+        self.assertEqual(audit_partitions.add_months(date(2025, 1, 1), -1), date(2024, 12, 1))
+
+
+class AuditArchiveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='archivist@example.com',
+            password='password123',
+            full_name='Archive User',
+            role=UserRole.ADMIN,
+        )
+
+    def test_archive_and_import_round_trip(self):
+        entity_id = '0b7c3a52-4d4c-4f0e-9a55-2f5c1f0f6d11'
+        record_audit_event(
+            actor=self.user,
+            entity_table='deadlines',
+            entity_id=entity_id,
+            action=AuditAction.CREATE,
+            after={'status': 'open', 'priority': 3},
+        )
+        record_audit_event(
+            actor=self.user,
+            entity_table='deadlines',
+            entity_id=entity_id,
+            action=AuditAction.UPDATE,
+            before={'status': 'open', 'priority': 3},
+            after={'status': 'done', 'priority': 3},
+        )
+        original = list(AuditLog.objects.order_by('sequence').values())
+        month = audit_partitions.month_start(original[0]['created_at'].date())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            archive_dir = Path(tmp)
+            entry = audit_partitions.archive_month(month, archive_dir)
+            self.assertEqual(entry.rows, 2)
+
+            manifest = json.loads((archive_dir / audit_partitions.MANIFEST_NAME).read_text())
+            self.assertEqual([item['partition'] for item in manifest['partitions']], [entry.partition])
+            with gzip.open(archive_dir / entry.file, 'rt') as handle:
+                self.assertEqual(len(handle.readlines()), 2)
+
+            AuditLog.objects.all().delete()
+            imported = audit_partitions.import_archive(archive_dir / audit_partitions.MANIFEST_NAME)
+            self.assertEqual(imported, 2)
+            # Re-importing the same manifest is a no-op.
+            audit_partitions.import_archive(archive_dir / audit_partitions.MANIFEST_NAME)
+
+        self.assertEqual(list(AuditLog.objects.order_by('sequence').values()), original)
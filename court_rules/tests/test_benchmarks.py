@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+
+from benchmarks.datasets import BENCHMARK_EMAIL, generate, parse_size
+from benchmarks.scenarios import Context, build_tasks, sample_ids, uncovered_routes
+from benchmarks.stats import compare, percentile, summarize
+from court_rules.api.v1.urls import router
+
+
+class BenchmarkStatsTests(SimpleTestCase):
+    def test_nearest_rank_percentiles_and_summary(self):
+        values = [index / 1000 for index in range(1, 101)]
+
+        self.assertEqual(percentile(values, 0.5), 0.05)
+        self.assertEqual(percentile(values, 0.99), 0.099)
+        summary = summarize(values, [2, 4], [200] * 98 + [500, 0], elapsed=2.0)
+        self.assertEqual((summary['p50_ms'], summary['p95_ms']), (50.0, 95.0))
+        self.assertEqual(summary['errors'], 2)
+        self.assertEqual(summary['queries_per_request'], 3.0)
+        self.assertEqual(summary['throughput_rps'], 50.0)
+        self.assertEqual(parse_size('100k'), 100_000)
+
+    def test_compare_flags_slower_p95_and_extra_queries(self):
+        def run(p95, queries):
+            return {'endpoints': {'deadlines:list': {'p95_ms': p95, 'queries_per_request': queries}}}
+
+        _, regressions = compare(run(100.0, 3.0), run(105.0, 3.0))
+        self.assertEqual(regressions, [])
+        _, regressions = compare(run(100.0, 3.0), run(130.0, 3.0))
+        self.assertEqual(regressions, ['deadlines:list'])
+        _, regressions = compare(run(100.0, 3.0), run(100.0, 28.0))
+        self.assertEqual(regressions, ['deadlines:list'])
+
+
+class BenchmarkScenarioTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.counts = generate(400, seed=7, batch_size=100)
+        cls.token = Token.objects.get(user__email=BENCHMARK_EMAIL)
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        override = override_settings(BLOB_STORE_OPTIONS={'root': self.root})
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_every_router_method_is_benchmarked_or_skipped(self):
+        self.assertEqual(uncovered_routes(), [])
+
+    def test_dataset_is_deterministic_in_shape(self):
+        self.assertEqual(self.counts['deadlines'], 400)
+        self.assertEqual(self.counts['cases'], 20)
+        self.assertGreater(self.counts['deadline_reminders'], 200)
+
+    def test_every_task_succeeds_against_the_synthetic_dataset(self):
+        tasks = build_tasks(sample_ids())
+        context = Context(ids=sample_ids(), rng=random.Random(3))
+        prefixes = {prefix for prefix, _, _ in router.registry}
+
+        self.assertEqual({task.name.split(':')[0] for task in tasks}, prefixes)
+        # Creates run before destroys so chained mutations have something to remove.
+        for task in sorted(tasks, key=lambda task: task.name.endswith(':destroy')):
+            request = task.build(context)
+            response = self.client.generic(
+                request.method,
+                request.path,
+                data=request.body or b'',
+                content_type=request.content_type,
+                HTTP_AUTHORIZATION=f'Token {self.token.key}',
+            )
+            self.assertLess(response.status_code, 400, f'{task.name}: {response.status_code}')
+            if task.on_success:
+                task.on_success(context, json.loads(response.content))
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Blob, Case, DocChunk, Document, OcrStatus, User, UserRole
+from court_rules.services.blobs import collect_garbage, get_blob_backend, ingest_document
+
+
+class BlobStoreTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='blobs@example.com',
+            password='password123',
+            full_name='Blob Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.first_case = Case.objects.create(internal_case_id='BLOB-1', caption='Alpha v. Beta')
+        cls.second_case = Case.objects.create(internal_case_id='BLOB-2', caption='Gamma v. Beta')
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        override = override_settings(BLOB_STORE_OPTIONS={'root': self.root})
+        override.enable()
+        self.addCleanup(override.disable)
+        self.content = b'%PDF-1.4 exhibit A ' * 5000
+        self.sha256 = hashlib.sha256(self.content).hexdigest()
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def ingest(self, case, chunk_size=4096):
+        chunks = (self.content[start:start + chunk_size] for start in range(0, len(self.content), chunk_size))
+        return ingest_document(chunks, case=case, title='Exhibit A', source='upload', mime_type='application/pdf')
+
+    def test_identical_uploads_share_one_blob(self):
+        first, first_duplicate = self.ingest(self.first_case)
+        second, second_duplicate = self.ingest(self.second_case, chunk_size=1000)
+
+        self.assertFalse(first_duplicate)
+        self.assertTrue(second_duplicate)
+        self.assertEqual(first.blob_id, second.blob_id)
+        self.assertEqual(second.file_hash, self.sha256)
+        blob = Blob.objects.get()
+        self.assertEqual((blob.size, blob.ref_count), (len(self.content), 2))
+        backend = get_blob_backend()
+        with backend.open(self.sha256) as handle:
+            self.assertEqual(handle.read(), self.content)
+        self.assertEqual(list((backend.root / 'tmp').iterdir()), [])
+
+    def test_duplicate_inherits_ocr_and_chunks(self):
+        first, _ = self.ingest(self.first_case)
+        DocChunk.objects.create(document=first, chunk_index=0, heading='Exhibit A', content='Exhibit A text')
+        Document.objects.filter(pk=first.pk).update(ocr_status=OcrStatus.COMPLETE, page_count=12)
+
+        second, _ = self.ingest(self.second_case)
+
+        second.refresh_from_db()
+        self.assertEqual(second.ocr_status, OcrStatus.COMPLETE)
+        self.assertEqual(second.page_count, 12)
+        self.assertEqual(list(second.chunks.values_list('content', flat=True)), ['Exhibit A text'])
+
+    def test_deleting_documents_releases_blob_for_collection_after_grace(self):
+        first, _ = self.ingest(self.first_case)
+        second, _ = self.ingest(self.second_case)
+
+        first.delete()
+        self.assertEqual(Blob.objects.get().ref_count, 1)
+        second.delete()
+        blob = Blob.objects.get()
+        self.assertEqual(blob.ref_count, 0)
+        self.assertIsNotNone(blob.released_at)
+
+        self.assertEqual(collect_garbage(grace=timedelta(hours=1)), (0, 0))
+        removed = collect_garbage(grace=timedelta(hours=1), now=timezone.now() + timedelta(hours=2))
+
+        self.assertEqual(removed, (1, len(self.content)))
+        self.assertFalse(Blob.objects.exists())
+        self.assertFalse(get_blob_backend().exists(self.sha256))
+
+    def test_reupload_during_grace_period_revives_blob(self):
+        document, _ = self.ingest(self.first_case)
+        document.delete()
+
+        _, duplicate = self.ingest(self.second_case)
+
+        self.assertTrue(duplicate)
+        blob = Blob.objects.get()
+        self.assertEqual(blob.ref_count, 1)
+        self.assertIsNone(blob.released_at)
+        self.assertEqual(collect_garbage(grace=timedelta(0), now=timezone.now() + timedelta(days=30)), (0, 0))
+
+    def test_upload_endpoint_reports_deduplication_and_streams_content(self):
+        def upload(case):
+            return self.client.post(
+                '/api/v1/documents/',
+                {'file': SimpleUploadedFile('exhibit-a.pdf', self.content, 'application/pdf'), 'case': str(case.pk)},
+                format='multipart',
+                **self.auth_headers(),
+            )
+
+        first = upload(self.first_case)
+        second = upload(self.second_case)
+        content = self.client.get(f"/api/v1/documents/{second.data['id']}/content/", **self.auth_headers())
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(first.data['deduplicated'])
+        self.assertTrue(second.data['deduplicated'])
+        self.assertEqual(second.data['file_hash'], self.sha256)
+        self.assertEqual(second.data['title'], 'exhibit-a.pdf')
+        self.assertEqual(second.data['source'], 'upload')
+        self.assertEqual(b''.join(content.streaming_content), self.content)
+        self.assertEqual(Blob.objects.count(), 1)
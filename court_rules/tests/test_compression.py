@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import gzip
+from datetime import timedelta
+
+import brotli
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.middleware import CompressionMiddleware, preferred_encoding
+from court_rules.models import Case, Deadline, DeadlineBasis, DeadlineTriggerType, User, UserRole
+
+
+class PreferredEncodingTests(SimpleTestCase):
+    def test_quality_values_rank_the_encodings(self):
+        self.assertEqual(preferred_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(preferred_encoding('br;q=0.5, gzip'), 'gzip')
+        self.assertEqual(preferred_encoding('gzip, br;q=0'), 'gzip')
+        self.assertEqual(preferred_encoding('*'), 'br')
+        self.assertIsNone(preferred_encoding('identity'))
+        self.assertIsNone(preferred_encoding('gzip;q=0, *;q=0'))
+        self.assertIsNone(preferred_encoding(''))
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    def respond(self, response, accept_encoding='br, gzip'):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_streams_are_compressed_as_they_go(self):
+        chunks = [f'{index:05d} line of a long service list\n'.encode() * 50 for index in range(20)]
+
+        for encoding, decompress in (('br', brotli.decompress), ('gzip', gzip.decompress)):
+            with self.subTest(encoding):
+                response = self.respond(StreamingHttpResponse(iter(chunks), content_type='text/plain'), encoding)
+                self.assertEqual(response['Content-Encoding'], encoding)
+                self.assertNotIn('Content-Length', response)
+                self.assertEqual(decompress(b''.join(response.streaming_content)), b''.join(chunks))
+
+    def test_small_and_precompressed_bodies_are_sent_as_is(self):
+        small = self.respond(HttpResponse(b'{"count":0}', content_type='application/json'))
+        self.assertFalse(small.has_header('Content-Encoding'))
+
+        pdf = self.respond(StreamingHttpResponse(iter([b'%PDF-1.4' * 1000]), content_type='application/pdf'))
+        self.assertFalse(pdf.has_header('Content-Encoding'))
+
+    def test_html_and_cookie_bound_bodies_are_sent_as_is(self):
+        page = self.respond(HttpResponse(b'<input name="csrfmiddlewaretoken">' * 100, content_type='text/html'))
+        self.assertFalse(page.has_header('Content-Encoding'))
+
+        session = HttpResponse(b'{"results":[]}' * 100, content_type='application/json')
+        session['Vary'] = 'Cookie'
+        self.assertFalse(self.respond(session).has_header('Content-Encoding'))
+
+    def test_etag_is_weakened(self):
+        response = HttpResponse(b'x' * 5000, content_type='text/plain')
+        response['ETag'] = '"abc"'
+        response = self.respond(response, 'gzip')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+
+
+class CompressedApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='compressed@example.com',
+            password='password123',
+            full_name='Compressed Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        case = Case.objects.create(internal_case_id='GZIP-1', caption='Gzip v. Brotli')
+        Deadline.objects.bulk_create(
+            Deadline(
+                case=case,
+                trigger_type=DeadlineTriggerType.USER,
+                basis=DeadlineBasis.CALENDAR_DAYS,
+                due_at=timezone.now() + timedelta(days=days),
+                timezone='America/Chicago',
+                computation_rationale='Counted from service under FRCP 6(a). ' * 5,
+            )
+            for days in range(1, 26)
+        )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_list_is_sent_with_the_preferred_encoding(self):
+        plain = self.client.get('/api/v1/deadlines/', **self.auth_headers())
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        for encoding, decompress in (('br', brotli.decompress), ('gzip', gzip.decompress)):
+            with self.subTest(encoding):
+                response = self.client.get('/api/v1/deadlines/', HTTP_ACCEPT_ENCODING=encoding, **self.auth_headers())
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response['Content-Encoding'], encoding)
+                self.assertLess(len(response.content), len(plain.content) / 4)
+                self.assertEqual(decompress(response.content), plain.content)
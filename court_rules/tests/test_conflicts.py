@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import random
+import uuid
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Case, CaseContact, CaseContactRole, Contact, ContactType, User, UserRole
+from court_rules.services import conflicts
+from court_rules.services.conflicts import TrigramIndex, check_conflicts, normalize_name, similarity, trigrams
+
+
+class NormalizationTests(SimpleTestCase):
+    def test_names_normalize_to_sorted_folded_tokens(self):
+        self.assertEqual(normalize_name('Doe, John'), normalize_name('JOHN  DOE'))
+        self.assertEqual(normalize_name('Acme Corp.'), normalize_name('ACME Corporation'))
+        self.assertEqual(normalize_name('Müller & Söhne GmbH'), 'muller sohne')
+        self.assertEqual(normalize_name('The Company'), 'company the')
+        self.assertEqual(normalize_name('  '), '')
+
+    def test_index_matches_brute_force_scan(self):
+        rng = random.Random(37)
+        words = ['acme', 'globex', 'initech', 'umbrella', 'stark', 'wayne', 'tyrell', 'cyberdyne', 'hooli', 'vandelay']
+        rows = []
+        for _ in range(600):
+            name = ' '.join(rng.sample(words, rng.randint(1, 3)))
+            rows.append((uuid.uuid4(), normalize_name(name), ''))
+        index = TrigramIndex(rows)
+        removed = rows[0][0]
+        index.remove(removed)
+
+        for query in ('acme globex', 'stark industries', 'wayne', 'umbrela corp'):
+            key = normalize_name(query)
+            expected = {
+                contact_id
+                for contact_id, name_key, _ in rows[1:]
+                if similarity(trigrams(key), trigrams(name_key)) >= 0.4
+            }
+            found = {contact_id for contact_id, _, _ in index.search(key, 0.4)}
+            self.assertEqual(found, expected, query)
+
+
+class ConflictCheckTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='intake@example.com',
+            password='password123',
+            full_name='Intake Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.case = Case.objects.create(internal_case_id='COI-1', caption='Acme v. Globex', timezone='UTC')
+        cls.closed = Case.objects.create(internal_case_id='COI-2', caption='In re Acme', status='closed', timezone='UTC')
+        cls.acme = Contact.objects.create(type=ContactType.ORGANIZATION, org_name='ACME Corporation')
+        cls.officer = Contact.objects.create(
+            type=ContactType.PERSON, first_name='Wile', last_name='Coyote', org_name='Acme Corp.'
+        )
+        cls.bystander = Contact.objects.create(type=ContactType.PERSON, first_name='Road', last_name='Runner')
+        CaseContact.objects.create(case=cls.case, contact=cls.acme, role=CaseContactRole.PLAINTIFF)
+        CaseContact.objects.create(case=cls.closed, contact=cls.acme, role=CaseContactRole.CLIENT)
+        CaseContact.objects.create(case=cls.case, contact=cls.officer, role=CaseContactRole.OTHER)
+
+    def setUp(self):
+        cache.clear()
+        conflicts._state.update(index=None, version=None)
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_matches_parties_and_affiliated_people_with_roles(self):
+        with self.assertNumQueries(3):
+            [result] = check_conflicts(['Acme Corp'])
+
+        hits = {hit.contact_id: hit for hit in result.hits}
+        self.assertEqual(set(hits), {self.acme.id, self.officer.id})
+        self.assertEqual(hits[self.acme.id].matched_on, 'name')
+        self.assertEqual(hits[self.officer.id].matched_on, 'organization')
+        self.assertEqual(
+            [(appearance.internal_case_id, appearance.role) for appearance in hits[self.acme.id].cases],
+            [('COI-1', 'plaintiff'), ('COI-2', 'client')],
+        )
+
+    def test_index_follows_contact_changes(self):
+        check_conflicts(['warm up'])
+        self.bystander.last_name = 'Runner-Acme'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bystander.save()
+            self.officer.delete()
+
+        with self.assertNumQueries(2):
+            [result] = check_conflicts(['Runner Acme'])
+
+        found = [hit.contact_id for hit in result.hits]
+        self.assertEqual(found[0], self.bystander.id)
+        self.assertNotIn(self.officer.id, found)
+
+    def test_conflict_check_endpoint(self):
+        response = self.client.post(
+            '/api/v1/contacts/conflict-check/',
+            {'names': ['Coyote, Wile', 'Nobody Atall']},
+            format='json',
+            **self.auth_headers(),
+        )
+        invalid = self.client.post(
+            '/api/v1/contacts/conflict-check/', {'names': []}, format='json', **self.auth_headers()
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['has_conflicts'])
+        first, second = response.data['results']
+        self.assertEqual(first['hits'][0]['contact_id'], str(self.officer.id))
+        self.assertEqual(first['hits'][0]['similarity'], 1.0)
+        self.assertEqual(first['hits'][0]['cases'][0]['role'], 'other')
+        self.assertEqual(second['hits'], [])
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
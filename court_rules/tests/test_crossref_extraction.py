@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from court_rules.models import CrossRefOrigin, JudgeProcedure, Judge, Rule, RuleCrossRef, RuleSourceType
+from court_rules.services.crossref_extraction import CITATION_PATTERN, citation_keys, extract_crossrefs
+
+
+class CitationGrammarTests(TestCase):
+    def test_citation_variants_normalize_to_the_same_keys(self):
+        text = 'See Fed. R. Civ. P. 6(b)(1), FRCP 6, L.R. 5.3, LR 5.3(a) and Local Rule 83.1.'
+
+        keys = [citation_keys(match) for match in CITATION_PATTERN.finditer(text)]
+
+        self.assertEqual(
+            keys,
+            [
+                [('FRCP', '6(b)(1)'), ('FRCP', '6')],
+                [('FRCP', '6')],
+                [('LR', '5.3')],
+                [('LR', '5.3(a)'), ('LR', '5.3')],
+                [('LR', '83.1')],
+            ],
+        )
+
+
+class CrossRefExtractionTests(TestCase):
+    def setUp(self):
+        self.frcp_6 = self.make_rule(RuleSourceType.FRCP, 'Fed. R. Civ. P. 6', 'Computing time.', jurisdiction='Federal')
+        self.local_5_3 = self.make_rule(
+            RuleSourceType.LOCAL_RULE,
+            'LR 5.3',
+            'Notice of motion; extensions governed by Fed. R. Civ. P. 6(b).',
+        )
+        self.local_7_1 = self.make_rule(
+            RuleSourceType.LOCAL_RULE,
+            'LR 7.1',
+            'Briefs must follow L.R. 5.3 and FRCP 6.',
+        )
+
+    def make_rule(self, source_type, citation, text, jurisdiction='N.D. Ill.'):
+        return Rule.objects.create(source_type=source_type, citation=citation, jurisdiction=jurisdiction, text=text)
+
+    def edges(self):
+        return set(RuleCrossRef.objects.values_list('from_rule__citation', 'to_rule__citation'))
+
+    def test_extraction_creates_resolved_crossrefs(self):
+        result = extract_crossrefs(workers=1)
+
+        self.assertEqual(result.changed, 3)
+        self.assertEqual(
+            self.edges(),
+            {('LR 5.3', 'Fed. R. Civ. P. 6'), ('LR 7.1', 'LR 5.3'), ('LR 7.1', 'Fed. R. Civ. P. 6')},
+        )
+        self.assertTrue(RuleCrossRef.objects.filter(origin=CrossRefOrigin.EXTRACTED).exists())
+
+    def test_parallel_scan_matches_in_process_scan(self):
+        with patch('court_rules.services.crossref_extraction.PARALLEL_THRESHOLD', 0):
+            extract_crossrefs(workers=2)
+
+        self.assertEqual(
+            self.edges(),
+            {('LR 5.3', 'Fed. R. Civ. P. 6'), ('LR 7.1', 'LR 5.3'), ('LR 7.1', 'Fed. R. Civ. P. 6')},
+        )
+
+    def test_rerun_only_rescans_changed_rules_and_keeps_manual_links(self):
+        extract_crossrefs(workers=1)
+        RuleCrossRef.objects.create(from_rule=self.local_5_3, to_rule=self.local_7_1)
+
+        self.assertEqual(extract_crossrefs(workers=1).changed, 0)
+
+        self.local_7_1.text = 'Briefs must follow L.R. 5.3.'
+        self.local_7_1.save()
+        result = extract_crossrefs(workers=1)
+
+        self.assertEqual(result.changed, 1)
+        self.assertEqual(
+            self.edges(),
+            {('LR 5.3', 'Fed. R. Civ. P. 6'), ('LR 7.1', 'LR 5.3'), ('LR 5.3', 'LR 7.1')},
+        )
+
+    def test_judge_procedure_text_links_through_its_rule(self):
+        judge = Judge.objects.create(full_name='Hon. Example')
+        JudgeProcedure.objects.create(
+            judge=judge,
+            title='Standing Order on Motions',
+            version='2025.1',
+            content_text='Motions must comply with Local Rule 7.1.',
+        )
+        self.make_rule(RuleSourceType.JUDGE_PROCEDURE, 'Standing Order on Motions', '')
+
+        extract_crossrefs(workers=1)
+
+        self.assertIn(('Standing Order on Motions', 'LR 7.1'), self.edges())
+
+    def test_judge_procedure_edges_are_replaced_when_its_text_changes(self):
+        judge = Judge.objects.create(full_name='Hon. Example')
+        procedure = JudgeProcedure.objects.create(
+            judge=judge,
+            title='Standing Order on Motions',
+            version='2025.1',
+            content_text='Motions must comply with Local Rule 7.1.',
+        )
+        self.make_rule(RuleSourceType.JUDGE_PROCEDURE, 'Standing Order on Motions', '')
+        extract_crossrefs(workers=1)
+
+        unchanged = extract_crossrefs(workers=1)
+        procedure.content_text = 'Motions must comply with LR 5.3.'
+        procedure.save()
+        result = extract_crossrefs(workers=1)
+
+        self.assertEqual((unchanged.created, unchanged.removed), (0, 0))
+        self.assertEqual((result.created, result.removed), (1, 1))
+        self.assertIn(('Standing Order on Motions', 'LR 5.3'), self.edges())
+        self.assertNotIn(('Standing Order on Motions', 'LR 7.1'), self.edges())
+
+    def test_full_rescan_invalidates_the_graph_once_without_per_edge_deltas(self):
+        extract_crossrefs(workers=1)
+        Rule.objects.filter(pk=self.local_7_1.pk).update(text='Briefs are limited to fifteen pages.')
+
+        with patch('court_rules.signals.record_crossref_change') as record, patch(
+            'court_rules.services.crossref_extraction.invalidate_rule_graph'
+        ) as invalidate, self.captureOnCommitCallbacks(execute=True):
+            result = extract_crossrefs(full=True, workers=1)
+
+        self.assertEqual(result.removed, 2)
+        record.assert_not_called()
+        invalidate.assert_called_once_with()
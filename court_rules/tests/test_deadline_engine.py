@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase
+
+from court_rules.models import DeadlineBasis
+from court_rules.services.deadlines import CourtCalendar, DeadlineRecipe
+
+
+class CourtCalendarTests(SimpleTestCase):
+    def setUp(self):
+        # Thanksgiving 2025 and the day after.
+        self.calendar = CourtCalendar([date(2025, 11, 27), date(2025, 11, 28)])
+
+    def test_calendar_days_roll_forward_past_weekend_and_holidays(self):
+        recipe = DeadlineRecipe(label='Response', offset_days=14)
+
+        # 2025-11-13 + 14 days is Thanksgiving; the next court day is Monday 2025-12-01.
+        computed = self.calendar.compute(date(2025, 11, 13), recipe)
+
+        self.assertEqual(computed.due_date, date(2025, 12, 1))
+        self.assertIn('2025-11-27 is not a court day', computed.rationale)
+
+    def test_backward_periods_roll_to_previous_court_day(self):
+        recipe = DeadlineRecipe(label='Pretrial memo', offset_days=-7)
+
+        # 2025-12-06 is a Saturday.
+        self.assertEqual(self.calendar.compute(date(2025, 12, 13), recipe).due_date, date(2025, 12, 5))
+
+    def test_business_days_skip_weekends_and_holidays(self):
+        recipe = DeadlineRecipe(label='Brief', offset_days=3, basis=DeadlineBasis.BUSINESS_DAYS)
+
+        # Wednesday 2025-11-26 -> Mon 12/1, Tue 12/2, Wed 12/3.
+        self.assertEqual(self.calendar.compute(date(2025, 11, 26), recipe).due_date, date(2025, 12, 3))
+        self.assertEqual(self.calendar.add_court_days(date(2025, 12, 3), -3), date(2025, 11, 26))
+
+    def test_court_day_arithmetic_matches_day_by_day_count(self):
+        start = date(2024, 12, 20)
+        for days in (1, 5, 20, 250, 600):
+            expected, remaining = start, days
+            while remaining:
+                expected += timedelta(days=1)
+                if self.calendar.is_court_day(expected):
+                    remaining -= 1
+            self.assertEqual(self.calendar.add_court_days(start, days), expected)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    AuditLog,
+    Case,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    DeadlineDependency,
+    DeadlineTemplate,
+    Hearing,
+    Holiday,
+    HolidayCalendar,
+    Judge,
+    User,
+    UserRole,
+)
+from court_rules.services import deadline_templates
+from court_rules.services.deadline_templates import get_template_registry
+from court_rules.services.deadlines import CourtCalendar
+
+
+class DeadlineTemplateTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='templates@example.com',
+            password='password123',
+            full_name='Template Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.case = Case.objects.create(
+            internal_case_id='TEMPLATE-1',
+            caption='Template v. Recipe',
+            lead_attorney=cls.user,
+            timezone='America/Chicago',
+        )
+        cls.calendar = HolidayCalendar.objects.create(name='Federal', timezone='America/Chicago')
+        Holiday.objects.create(calendar=cls.calendar, date=date(2025, 11, 27), name='Thanksgiving Day')
+
+    def setUp(self):
+        cache.clear()
+        deadline_templates._state.update(registry=None, version=None)
+        self.answer = DeadlineTemplate.objects.create(
+            trigger_event='service_of_complaint',
+            label='Answer',
+            offset_days=21,
+        )
+        self.reply = DeadlineTemplate.objects.create(
+            trigger_event='service_of_complaint',
+            label='Reply to counterclaim',
+            offset_days=21,
+            anchor=self.answer,
+        )
+        DeadlineTemplate.objects.create(
+            trigger_event='service_of_complaint',
+            jurisdiction='N.D. Ill.',
+            label='Initial status report',
+            offset_days=10,
+            basis=DeadlineBasis.BUSINESS_DAYS,
+        )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_compiled_sets_order_anchors_and_merge_shared_templates(self):
+        registry = get_template_registry()
+
+        shared = registry.lookup('service_of_complaint')
+        local = registry.lookup('service_of_complaint', 'N.D. Ill.')
+
+        self.assertEqual([step.recipe.label for step in shared.steps], ['Answer', 'Reply to counterclaim'])
+        self.assertEqual(shared.steps[1].anchor, 0)
+        self.assertEqual(len(local), 3)
+        self.assertIs(registry.lookup('service_of_complaint', 'D. Del.'), shared)
+
+        # 2025-11-06 + 21 days is Thanksgiving, so the answer rolls to 11/28 and the reply counts from there.
+        computed = shared.expand(date(2025, 11, 6), CourtCalendar([date(2025, 11, 27)]))
+        self.assertEqual([item.due_date for item in computed], [date(2025, 11, 28), date(2025, 12, 19)])
+
+    def test_template_changes_recompile_registry(self):
+        get_template_registry()
+        self.reply.delete()
+
+        self.assertEqual(len(get_template_registry().lookup('service_of_complaint')), 1)
+
+    def test_expanding_a_large_set_needs_no_queries(self):
+        for index in range(40):
+            DeadlineTemplate.objects.create(trigger_event='scheduling_order', label=f'Step {index:02d}', offset_days=index * 7)
+        template_set = get_template_registry().lookup('scheduling_order')
+
+        with self.assertNumQueries(0):
+            computed = template_set.expand(date(2025, 1, 6), CourtCalendar())
+
+        self.assertEqual(len(computed), 40)
+
+    def test_clean_rejects_anchor_cycles(self):
+        self.answer.anchor = self.reply
+
+        with self.assertRaises(ValidationError):
+            self.answer.clean()
+
+    def test_clean_rejects_anchors_from_another_jurisdiction(self):
+        sdny = DeadlineTemplate.objects.create(
+            trigger_event='service_of_complaint',
+            jurisdiction='S.D.N.Y.',
+            label='Rule 26(f) conference',
+            offset_days=30,
+        )
+        step = DeadlineTemplate(
+            trigger_event='service_of_complaint',
+            jurisdiction='N.D. Ill.',
+            label='Joint status report',
+            offset_days=7,
+            anchor=sdny,
+        )
+
+        with self.assertRaises(ValidationError):
+            step.clean()
+        step.anchor = self.answer
+        step.clean()
+
+    def test_apply_template_endpoint_creates_deadlines(self):
+        response = self.client.post(
+            f'/api/v1/cases/{self.case.id}/apply-template/',
+            {
+                'trigger_event': 'service_of_complaint',
+                'trigger_date': '2025-11-06',
+                'jurisdiction': 'N.D. Ill.',
+                'holiday_calendar': str(self.calendar.id),
+            },
+            format='json',
+            **self.auth_headers(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 3)
+        self.assertEqual(Deadline.objects.filter(case=self.case, trigger_source_type='deadline_template').count(), 3)
+        self.assertEqual(AuditLog.objects.filter(entity_table='deadlines').count(), 3)
+        dependency = DeadlineDependency.objects.get()
+        self.assertEqual(dependency.successor.trigger_source_id, self.reply.id)
+
+    def test_apply_template_dry_run_and_unknown_event(self):
+        url = f'/api/v1/cases/{self.case.id}/apply-template/'
+        preview = self.client.post(
+            url,
+            {'trigger_event': 'service_of_complaint', 'trigger_date': '2025-11-06', 'dry_run': True},
+            format='json',
+            **self.auth_headers(),
+        )
+        unknown = self.client.post(
+            url,
+            {'trigger_event': 'missing', 'trigger_date': '2025-11-06'},
+            format='json',
+            **self.auth_headers(),
+        )
+
+        self.assertEqual(preview.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(preview.data['deadlines']), 2)
+        self.assertEqual(Deadline.objects.count(), 0)
+        self.assertEqual(unknown.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_apply_template_defaults_to_the_case_court_and_judge(self):
+        court = Court.objects.create(name='Northern District of Illinois', district='N.D. Ill.', timezone='America/Chicago')
+        district_calendar = HolidayCalendar.objects.create(name='N.D. Ill.', jurisdiction='N.D. Ill.', timezone='America/Chicago')
+        Holiday.objects.create(calendar=district_calendar, date=date(2025, 11, 27), name='Thanksgiving Day')
+        Holiday.objects.create(calendar=district_calendar, date=date(2025, 11, 28), name='Court closed')
+        case = Case.objects.create(internal_case_id='TEMPLATE-2', caption='Court v. Default', court=court, timezone='America/Chicago')
+        url = f'/api/v1/cases/{case.id}/apply-template/'
+        payload = {'trigger_event': 'service_of_complaint', 'trigger_date': '2025-11-06', 'dry_run': True}
+
+        def answer_rationale():
+            response = self.client.post(url, payload, format='json', **self.auth_headers())
+            self.assertEqual(len(response.data['deadlines']), 3)
+            return next(item['computation_rationale'] for item in response.data['deadlines'] if item['computation_rationale'].startswith('Answer'))
+
+        # The district's calendar closes the court on Thanksgiving and the day after.
+        self.assertIn('(2025-11-27 is not a court day; moved to 2025-12-01)', answer_rationale())
+
+        judge = Judge.objects.create(full_name='Hon. Calendar', court=court, holiday_calendar=self.calendar)
+        Hearing.objects.create(case=case, judge=judge, starts_at=datetime(2025, 11, 3, 15, tzinfo=dt_timezone.utc))
+        # The judge's calendar closes it on Thanksgiving only.
+        self.assertIn('(2025-11-27 is not a court day; moved to 2025-11-28)', answer_rationale())
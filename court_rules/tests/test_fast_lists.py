@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone as dt_timezone
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from rest_framework import serializers, status
+from rest_framework.authtoken.models import Token
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework.views import APIView
+
+from court_rules.api.v1.renderers import ORJSONRenderer
+from court_rules.api.v1.serializers import SparseFieldsetSerializer
+from court_rules.api.v1.viewsets import CaseViewSet, DeadlineViewSet, FastListMixin, RuleViewSet
+from court_rules.models import Case, Deadline, Rule
+from court_rules.services.synthetic import LOGIN_EMAIL, generate
+
+
+FAST_LIST_URLS = [
+    '/api/v1/deadlines/',
+    '/api/v1/deadlines/?status=open',
+    '/api/v1/deadlines/?fields=id,due_at_local,pending_reminders,owner_name',
+    '/api/v1/deadlines/?omit=computation_rationale,due_at_local',
+    '/api/v1/cases/',
+    '/api/v1/cases/?fields=caption,court_name,filing_date',
+    '/api/v1/rules/',
+    '/api/v1/rules/?omit=text',
+]
+
+
+@override_settings(REFERENCE_CACHE_ENABLED=False)
+class FastListParityTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        generate(cases=6, deadlines_per_case=5, seed=3, anchor=date(2026, 3, 2))
+        cls.token = Token.objects.get(user__email=LOGIN_EMAIL)
+        # Characters the two encoders could disagree on.
+        Case.objects.filter(pk=Case.objects.first().pk).update(caption='Zoë \u2028“Quoted” v. \\ Backslash')
+        Deadline.objects.filter(pk=Deadline.objects.first().pk).update(owner=None, holiday_calendar=None, snooze_until=None)
+        first, second = Rule.objects.order_by('citation')[:2]
+        Rule.objects.filter(pk=first.pk).update(superseded_by=second)
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def get(self, url):
+        with mock.patch.object(PageNumberPagination, 'page_size', 100):
+            response = self.client.get(url, **self.auth_headers())
+        self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+        return response
+
+    def test_fast_lists_are_byte_identical_to_the_serializers(self):
+        for url in FAST_LIST_URLS:
+            with self.subTest(url):
+                fast = self.get(url)
+                with mock.patch.object(FastListMixin, 'fast_list', False):
+                    with mock.patch.object(APIView, 'renderer_classes', [JSONRenderer]):
+                        slow = self.get(url)
+                self.assertGreater(len(slow.data['results']), 1)
+                self.assertEqual(fast.content, slow.content)
+
+    def test_fast_lists_skip_model_instances(self):
+        with mock.patch.object(SparseFieldsetSerializer, 'to_representation') as to_representation:
+            self.get('/api/v1/deadlines/')
+        to_representation.assert_not_called()
+
+    def test_every_fast_list_serializer_has_a_row_plan(self):
+        for viewset in (CaseViewSet, DeadlineViewSet, RuleViewSet):
+            with self.subTest(viewset.__name__):
+                plan = viewset.serializer_class.row_plan()
+                self.assertEqual([column[0] for column in plan.columns], list(viewset.serializer_class().fields))
+
+
+class RowPlanTests(SimpleTestCase):
+    def test_multi_source_method_fields_need_a_row_field(self):
+        class UndeclaredSerializer(SparseFieldsetSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Case
+                fields = ['id', 'label']
+                field_sources = {'label': ['caption', 'case_number']}
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "no entry for 'label'"):
+            UndeclaredSerializer.row_plan()
+
+    def test_orjson_renderer_matches_json_renderer(self):
+        data = {
+            'when': datetime(2026, 3, 2, 9, 30, 0, 123456, tzinfo=dt_timezone.utc),
+            'day': date(2026, 3, 2),
+            1: [1.5, None, True],
+            'text': 'line\u2028break',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
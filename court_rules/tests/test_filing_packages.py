@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    Document,
+    Filing,
+    FilingExhibit,
+    FilingPackageType,
+    Hearing,
+    Judge,
+    JudgeProcedure,
+    User,
+    UserRole,
+)
+from court_rules.services.filing_packages import natural_key, plan_filing_package
+
+
+class NaturalSortTests(SimpleTestCase):
+    def test_labels_sort_numbers_by_value_and_letters_by_length(self):
+        labels = ['Ex. 10', 'Ex. 2', 'Ex. 1a', 'Ex. 1', 'AA', 'B', 'A', 'Z']
+
+        self.assertEqual(
+            sorted(labels, key=natural_key),
+            ['A', 'B', 'Z', 'AA', 'Ex. 1', 'Ex. 1a', 'Ex. 2', 'Ex. 10'],
+        )
+
+
+class FilingPackageTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='packages@example.com',
+            password='password123',
+            full_name='Package Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.case = Case.objects.create(internal_case_id='PKG-1', caption='Widget v. Gadget', timezone='UTC')
+        cls.judge = Judge.objects.create(full_name='Judge Format')
+        JudgeProcedure.objects.create(
+            judge=cls.judge,
+            title='Standing Order',
+            version='1',
+            effective_date=date(2024, 1, 1),
+            filing_format={'preferred_format': 'single_pdf', 'page_limit': 25},
+        )
+        Hearing.objects.create(case=cls.case, judge=cls.judge, starts_at=datetime(2025, 1, 6, 15, tzinfo=dt_timezone.utc))
+
+        def document(title, pages):
+            return Document.objects.create(
+                case=cls.case,
+                title=title,
+                source='upload',
+                mime_type='application/pdf',
+                page_count=pages,
+                metadata={'storage_path': f'{title}.pdf'},
+            )
+
+        cls.motion = document('Motion', 30)
+        cls.filing = Filing.objects.create(
+            case=cls.case,
+            filing_type='Motion to Compel',
+            packaged_as=FilingPackageType.MULTI_PDF,
+            primary_document=cls.motion,
+        )
+        for label in ('Ex. 10', 'Ex. 2', 'Ex. 1'):
+            FilingExhibit.objects.create(filing=cls.filing, label=label, document=document(label.replace('.', ''), 3))
+
+    def setUp(self):
+        self.storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.storage_dir)
+        override = override_settings(DOCUMENT_STORAGE_DIR=self.storage_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        for name in ('Motion', 'Ex 1', 'Ex 2', 'Ex 10'):
+            with open(f'{self.storage_dir}/{name}.pdf', 'wb') as handle:
+                handle.write(f'%PDF-1.4 {name} '.encode() * 20000)
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_list_counts_exhibits_including_none(self):
+        Filing.objects.create(case=self.case, filing_type='Notice of Appearance')
+
+        response = self.client.get('/api/v1/filings/', **self.auth_headers())
+
+        counts = {item['filing_type']: item['exhibit_count'] for item in response.data['results']}
+        self.assertEqual(counts, {'Motion to Compel': 3, 'Notice of Appearance': 0})
+
+    def test_plan_orders_exhibits_and_checks_filing_format(self):
+        plan = plan_filing_package(self.filing)
+
+        self.assertEqual([item.label for item in plan.items], ['', 'Ex. 1', 'Ex. 2', 'Ex. 10'])
+        self.assertEqual(plan.items[0].name, '01 - Motion to Compel - Motion.pdf')
+        self.assertEqual(plan.total_pages, 39)
+        self.assertFalse(plan.blocking)
+        self.assertEqual(len(plan.issues), 3)
+        self.assertIn('Primary document has 30 pages; the limit is 25.', plan.issues)
+
+    def test_package_streams_zip_in_chunks(self):
+        url = f'/api/v1/filings/{self.filing.id}/package/'
+
+        check = self.client.get(url, **self.auth_headers())
+        response = self.client.get(url, {'output': 'zip'}, **self.auth_headers())
+        pdf = self.client.get(url, {'output': 'pdf'}, **self.auth_headers())
+
+        self.assertEqual(check.status_code, status.HTTP_200_OK)
+        self.assertEqual(check.data['items'][3]['label'], 'Ex. 10')
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 4)
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+        self.assertEqual(
+            archive.namelist(),
+            ['00 - Index.txt', '01 - Motion to Compel - Motion.pdf', '02 - Ex. 1 - Ex 1.pdf', '03 - Ex. 2 - Ex 2.pdf', '04 - Ex. 10 - Ex 10.pdf'],
+        )
+        self.assertIsNone(archive.testzip())
+        self.assertIn(b'Format issues:', archive.read('00 - Index.txt'))
+        self.assertEqual(pdf.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_missing_content_is_reported_before_streaming(self):
+        os.remove(f'{self.storage_dir}/Ex 2.pdf')
+
+        response = self.client.get(
+            f'/api/v1/filings/{self.filing.id}/package/', {'output': 'zip'}, **self.auth_headers()
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_single_pdf_package_streams_pdf_or_reports_missing_content(self):
+        brief = Document.objects.create(
+            case=self.case,
+            title='Brief "final"',
+            source='upload',
+            mime_type='application/pdf',
+            page_count=10,
+            metadata={'storage_path': 'Brief.pdf'},
+        )
+        filing = Filing.objects.create(
+            case=self.case,
+            filing_type='Brief',
+            packaged_as=FilingPackageType.SINGLE_PDF,
+            primary_document=brief,
+        )
+        url = f'/api/v1/filings/{filing.id}/package/'
+
+        missing = self.client.get(url, {'output': 'pdf'}, **self.auth_headers())
+        with open(f'{self.storage_dir}/Brief.pdf', 'wb') as handle:
+            handle.write(b'%PDF-1.4 brief')
+        pdf = self.client.get(url, {'output': 'pdf'}, **self.auth_headers())
+
+        self.assertEqual(missing.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(pdf.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(pdf.streaming_content), b'%PDF-1.4 brief')
+        self.assertEqual(pdf['Content-Disposition'], 'attachment; filename="01 - Brief - Brief _final_.pdf"')
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    AuditAction,
+    AuditLog,
+    Case,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    Hearing,
+    HearingFollowUp,
+    Holiday,
+    HolidayCalendar,
+    Judge,
+    User,
+    UserRole,
+)
+from court_rules.services.deadlines import DeadlineRecipe
+from court_rules.services.hearing_followups import generate_hearing_followups
+
+
+CHICAGO = ZoneInfo('America/Chicago')
+
+
+class HearingFollowUpTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='followups@example.com',
+            password='password123',
+            full_name='Follow Up Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        calendar = HolidayCalendar.objects.create(name='Federal', timezone='America/Chicago')
+        Holiday.objects.create(calendar=calendar, date=date(2025, 11, 27), name='Thanksgiving Day')
+        court = Court.objects.create(name='Northern District of Illinois', timezone='America/Chicago')
+        cls.judge = Judge.objects.create(full_name='Hon. Follow Up', court=court, holiday_calendar=calendar)
+        cls.hearings = []
+        for index in range(3):
+            case = Case.objects.create(
+                internal_case_id=f'FOLLOW-{index}',
+                caption=f'Case {index}',
+                lead_attorney=cls.user,
+                timezone='America/Chicago',
+            )
+            # 21:30 Chicago on 11/13 is already 11/14 in UTC; the trigger day must stay 11/13.
+            cls.hearings.append(
+                Hearing.objects.create(case=case, judge=cls.judge, starts_at=datetime(2025, 11, 13, 21, 30, tzinfo=CHICAGO))
+            )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def recipes(self):
+        return [
+            DeadlineRecipe(label='Supplemental brief', offset_days=14),
+            DeadlineRecipe(label='Proposed order', offset_days=5, basis=DeadlineBasis.BUSINESS_DAYS, priority=2),
+        ]
+
+    def test_generates_all_followups_in_constant_queries(self):
+        outcomes = {hearing.pk: 'Granted in part' for hearing in self.hearings}
+
+        with self.assertNumQueries(12):
+            result = generate_hearing_followups(outcomes, self.recipes(), actor=self.user)
+
+        self.assertEqual(len(result.deadlines), 6)
+        self.assertEqual(HearingFollowUp.objects.count(), 6)
+        self.assertEqual(AuditLog.objects.filter(entity_table='deadlines', action=AuditAction.CREATE).count(), 6)
+        self.assertEqual(set(Hearing.objects.values_list('outcome', flat=True)), {'Granted in part'})
+        due_dates = {
+            deadline.computation_rationale.split(':')[0]: deadline.due_at.astimezone(CHICAGO).date()
+            for deadline in Deadline.objects.filter(trigger_source_id=self.hearings[0].pk)
+        }
+        self.assertEqual(due_dates, {'Supplemental brief': date(2025, 11, 28), 'Proposed order': date(2025, 11, 20)})
+
+    def test_judge_without_calendar_falls_back_to_the_district_calendar(self):
+        district_calendar = HolidayCalendar.objects.create(name='N.D. Ill.', jurisdiction='N.D. Ill.', timezone='America/Chicago')
+        Holiday.objects.create(calendar=district_calendar, date=date(2025, 11, 27), name='Thanksgiving Day')
+        court = Court.objects.create(name='N.D. Ill. Eastern Division', district='N.D. Ill.', timezone='America/Chicago')
+        judge = Judge.objects.create(full_name='Hon. No Calendar', court=court)
+        case = Case.objects.create(internal_case_id='FOLLOW-D', caption='District', lead_attorney=self.user, court=court)
+        hearing = Hearing.objects.create(case=case, judge=judge, starts_at=datetime(2025, 11, 13, 10, 0, tzinfo=CHICAGO))
+
+        result = generate_hearing_followups({hearing.pk: None}, self.recipes()[:1])
+
+        deadline = result.deadlines[0]
+        self.assertEqual(deadline.holiday_calendar_id, district_calendar.pk)
+        self.assertEqual(deadline.due_at.astimezone(CHICAGO).date(), date(2025, 11, 28))
+
+    def test_rerunning_skips_existing_followups(self):
+        outcomes = {hearing.pk: None for hearing in self.hearings}
+        generate_hearing_followups(outcomes, self.recipes())
+
+        result = generate_hearing_followups(outcomes, self.recipes())
+
+        self.assertEqual((len(result.deadlines), result.skipped), (0, 6))
+        self.assertEqual(Deadline.objects.count(), 6)
+
+    def test_follow_ups_endpoint(self):
+        payload = {
+            'hearings': [{'hearing': str(hearing.pk), 'outcome': 'Continued'} for hearing in self.hearings],
+            'templates': [{'label': 'Status report', 'offset_days': 7}],
+        }
+
+        response = self.client.post('/api/v1/hearings/follow-ups/', payload, format='json', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 3)
+        self.assertEqual({item['hearing'] for item in response.data['deadlines']}, {str(hearing.pk) for hearing in self.hearings})
+
+    def test_follow_ups_endpoint_rejects_unknown_hearings(self):
+        payload = {
+            'hearings': [{'hearing': '00000000-0000-0000-0000-000000000000'}],
+            'templates': [{'label': 'Status report', 'offset_days': 7}],
+        }
+
+        response = self.client.post('/api/v1/hearings/follow-ups/', payload, format='json', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Deadline.objects.count(), 0)
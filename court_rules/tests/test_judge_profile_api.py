@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Court, Judge, JudgeAssociation, JudgeProcedure, User, UserRole
+
+
+class JudgeProfileApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='judges@example.com',
+            password='password123',
+            full_name='Judge Reader',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.court = Court.objects.create(name='Northern District of Illinois', timezone='America/Chicago')
+        cls.judge = cls.make_judge('Hon. Primary Judge')
+        cls.magistrate = cls.make_judge('Hon. Magistrate Judge')
+        JudgeAssociation.objects.create(
+            primary_judge=cls.judge,
+            associated_judge=cls.magistrate,
+            association_type='magistrate',
+        )
+
+    @classmethod
+    def make_judge(cls, name):
+        judge = Judge.objects.create(full_name=name, court=cls.court)
+        today = timezone.localdate()
+        JudgeProcedure.objects.create(
+            judge=judge,
+            title='Standing Order',
+            version='2024.1',
+            effective_date=today - timedelta(days=400),
+        )
+        JudgeProcedure.objects.create(
+            judge=judge,
+            title='Standing Order',
+            version='2025.1',
+            effective_date=today - timedelta(days=30),
+            filing_cutoff_time=time(17, 0),
+            hearing_windows=[{'weekday': 'tue', 'start': '09:30', 'end': '11:00'}],
+        )
+        JudgeProcedure.objects.create(
+            judge=judge,
+            title='Expired Case Management Order',
+            version='2020.1',
+            effective_date=date(2020, 1, 1),
+            expiry_date=today - timedelta(days=1),
+        )
+        return judge
+
+    def setUp(self):
+        cache.clear()
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_profile_includes_only_current_procedure_versions(self):
+        response = self.client.get(f'/api/v1/judges/{self.judge.id}/profile/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        procedures = response.data['procedures']
+        self.assertEqual([(item['title'], item['version']) for item in procedures], [('Standing Order', '2025.1')])
+        self.assertEqual(procedures[0]['filing_cutoff_time'], '17:00:00')
+        self.assertEqual(response.data['associations'][0]['associated_judge_name'], 'Hon. Magistrate Judge')
+
+    def test_profile_is_cached_until_a_procedure_changes(self):
+        url = f'/api/v1/judges/{self.judge.id}/profile/'
+        self.client.get(url, **self.auth_headers())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url, **self.auth_headers())
+        # Only the token lookup remains once the profile is cached.
+        self.assertEqual(len(queries), 1)
+
+        JudgeProcedure.objects.create(judge=self.judge, title='Courtesy Copies', version='2025.2')
+        response = self.client.get(url, **self.auth_headers())
+        self.assertIn('Courtesy Copies', [item['title'] for item in response.data['procedures']])
+
+    def test_profile_follows_renamed_court_and_associated_judge(self):
+        url = f'/api/v1/judges/{self.judge.id}/profile/'
+        self.client.get(url, **self.auth_headers())
+
+        self.court.name = 'N.D. Ill.'
+        self.court.save()
+        self.magistrate.full_name = 'Hon. Renamed Magistrate'
+        self.magistrate.save()
+        response = self.client.get(url, **self.auth_headers())
+
+        self.assertEqual(response.data['court_name'], 'N.D. Ill.')
+        self.assertEqual(response.data['associations'][0]['associated_judge_name'], 'Hon. Renamed Magistrate')
+
+    def test_list_expand_prefetches_without_per_judge_queries(self):
+        url = '/api/v1/judges/?expand=procedures,associations'
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url, **self.auth_headers())
+        for index in range(5):
+            self.make_judge(f'Hon. Extra Judge {index}')
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url, **self.auth_headers())
+
+        self.assertEqual(len(response.data['results']), 7)
+        self.assertIn('procedures', response.data['results'][0])
+        self.assertEqual(len(few), len(many))
+
+    def test_expand_renders_only_requested_relations(self):
+        response = self.client.get('/api/v1/judges/?expand=associations', **self.auth_headers())
+
+        first = response.data['results'][0]
+        self.assertIn('associations', first)
+        self.assertNotIn('procedures', first)
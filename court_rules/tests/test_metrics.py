@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    Court,
+    Deadline,
+    DeadlineBasis,
+    DeadlineReminder,
+    DeadlineTriggerType,
+    Judge,
+    ReminderChannel,
+    User,
+    UserRole,
+)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class MetricsEndpointTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='metrics@example.com',
+            password='password123',
+            full_name='Metrics Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.court = Court.objects.create(name='District of Delaware', timezone='America/New_York')
+        cls.judge = Judge.objects.create(full_name='Hon. Metrics', court=cls.court)
+        cls.case = Case.objects.create(internal_case_id='METRICS-1', caption='Metrics v. Scrapes')
+        cls.deadline = Deadline.objects.create(
+            case=cls.case,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=3),
+            timezone='America/New_York',
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_requests_are_labelled_by_viewset_and_action(self):
+        labels = {'viewset': 'DeadlineViewSet', 'action': 'list', 'method': 'GET', 'status': '200'}
+        requests_before = sample('court_rules_http_request_duration_seconds_count', **labels)
+        queries_before = sample('court_rules_http_request_db_queries_sum', viewset='DeadlineViewSet', action='list')
+
+        response = self.client.get('/api/v1/deadlines/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sample('court_rules_http_request_duration_seconds_count', **labels), requests_before + 1)
+        self.assertGreater(sample('court_rules_http_request_db_queries_sum', viewset='DeadlineViewSet', action='list'), queries_before)
+        labels = {'viewset': 'JudgeViewSet', 'action': 'profile', 'method': 'GET', 'status': '200'}
+        profiles_before = sample('court_rules_http_request_duration_seconds_count', **labels)
+        self.client.get(f'/api/v1/judges/{self.judge.id}/profile/', **self.auth_headers())
+        self.assertEqual(sample('court_rules_http_request_duration_seconds_count', **labels), profiles_before + 1)
+
+    def test_cache_layers_count_hits_and_misses(self):
+        url = f'/api/v1/judges/{self.judge.id}/profile/'
+        misses = sample('court_rules_cache_requests_total', layer='judge_profile', result='miss')
+        hits = sample('court_rules_cache_requests_total', layer='judge_profile', result='hit')
+
+        self.client.get(url, **self.auth_headers())
+        self.client.get(url, **self.auth_headers())
+
+        self.assertEqual(sample('court_rules_cache_requests_total', layer='judge_profile', result='miss'), misses + 1)
+        self.assertEqual(sample('court_rules_cache_requests_total', layer='judge_profile', result='hit'), hits + 1)
+
+    def test_exposition_includes_reminder_dispatch_lag(self):
+        DeadlineReminder.objects.create(
+            deadline=self.deadline,
+            notify_at=timezone.now() - timedelta(minutes=10),
+            channel=ReminderChannel.EMAIL,
+        )
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        lines = dict(
+            line.rsplit(' ', 1) for line in response.content.decode().splitlines() if line and not line.startswith('#')
+        )
+        self.assertGreaterEqual(float(lines['court_rules_reminder_dispatch_lag_seconds']), 600)
+        self.assertEqual(float(lines['court_rules_reminders_due_unsent']), 1)
+        self.assertEqual(float(lines['court_rules_audit_expired_partitions']), 0)
+
+    @override_settings(METRICS_BEARER_TOKEN='scrape-secret')
+    def test_bearer_token_guards_the_endpoint(self):
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_PUBLIC=False)
+    def test_endpoint_is_hidden_without_a_token_unless_public(self):
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_404_NOT_FOUND)
+        with self.settings(METRICS_BEARER_TOKEN='scrape-secret'):
+            response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unknown_methods_share_one_label(self):
+        labels = {'viewset': 'DeadlineViewSet', 'action': 'other', 'method': 'other', 'status': '405'}
+        before = sample('court_rules_http_request_duration_seconds_count', **labels)
+
+        self.client.generic('PROPFIND', '/api/v1/deadlines/', **self.auth_headers())
+        self.client.generic('XYZZY', '/nowhere/', **self.auth_headers())
+
+        self.assertEqual(sample('court_rules_http_request_duration_seconds_count', **labels), before + 1)
+        self.assertIsNone(REGISTRY.get_sample_value('court_rules_http_request_duration_seconds_count', {**labels, 'method': 'PROPFIND'}))
+        self.assertGreater(
+            sample('court_rules_http_request_duration_seconds_count', viewset='unmatched', action='other', method='other', status='404'), 0
+        )
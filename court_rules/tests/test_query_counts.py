@@ -0,0 +1,79 @@
+"""Query-count regression harness over every list route in the /api/v1 router.
+
+Each list endpoint is fetched with a page of ``SMALL_PAGE`` rows and again
+with ``LARGE_PAGE`` (ten times as many) from the same synthetic dataset.
+The number of queries must not change; when it does, the failure names
+the SQL fingerprints that grew, which is where a serializer method field
+or a missing ``select_related``/``prefetch_related`` is issuing a query
+per row.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APITestCase
+
+from court_rules.api.v1.urls import router
+from court_rules.middleware import fingerprint
+from court_rules.models import User
+from court_rules.services.synthetic import LOGIN_EMAIL, generate
+
+
+SMALL_PAGE = 2
+LARGE_PAGE = 10 * SMALL_PAGE
+# Query strings that change the serializer's work, checked alongside the plain list.
+LIST_VARIANTS = {
+    'judges': ['?expand=procedures,associations'],
+    'deadlines': ['?fields=id,due_at,status,case_caption,owner_name,pending_reminders'],
+    'rules': ['?omit=text'],
+}
+
+
+# The reference cache would answer the second request for rules and judges without SQL.
+@override_settings(REFERENCE_CACHE_ENABLED=False)
+class ListQueryCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        generate(cases=LARGE_PAGE, deadlines_per_case=4, seed=11, anchor=date(2026, 3, 2))
+        # The generator creates a handful of users for this many cases; the users route needs a full page.
+        User.objects.bulk_create(
+            User(email=f'harness.{index}@example.com', full_name=f'Harness User {index}') for index in range(LARGE_PAGE)
+        )
+        cls.token = Token.objects.get(user__email=LOGIN_EMAIL)
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def list_queries(self, url: str, page_size: int) -> tuple[int, Counter]:
+        with mock.patch.object(PageNumberPagination, 'page_size', page_size):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, **self.auth_headers())
+        self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+        self.assertEqual(len(response.data['results']), page_size, f'{url} needs at least {page_size} rows')
+        return len(queries), Counter(fingerprint(query['sql']) for query in queries)
+
+    def test_list_queries_do_not_scale_with_page_size(self):
+        for prefix, viewset, _ in router.registry:
+            if not hasattr(viewset, 'list'):
+                continue
+            for query_string in ['', *LIST_VARIANTS.get(prefix, [])]:
+                url = f'/api/v1/{prefix}/{query_string}'
+                with self.subTest(url):
+                    small, small_fingerprints = self.list_queries(url, SMALL_PAGE)
+                    large, large_fingerprints = self.list_queries(url, LARGE_PAGE)
+                    grown = large_fingerprints - small_fingerprints
+                    self.assertEqual(
+                        small,
+                        large,
+                        f'{url} ran {small} queries for {SMALL_PAGE} rows but {large} for {LARGE_PAGE}. Per-row queries:\n'
+                        + '\n'.join(f'{count:>4}x {sql}' for sql, count in grown.most_common()),
+                    )
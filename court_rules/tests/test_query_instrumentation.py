@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.middleware import QueryInstrumentationMiddleware, fingerprint
+from court_rules.models import Case, Deadline, DeadlineBasis, DeadlineTriggerType, User, UserRole
+
+
+SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries, (\d+) duplicate", app;dur=[\d.]+')
+
+
+class FingerprintTests(SimpleTestCase):
+    def test_literals_and_in_lists_collapse(self):
+        self.assertEqual(
+            fingerprint('SELECT * FROM "deadlines" WHERE "id" IN (%s, %s, %s) AND "priority" > 3'),
+            fingerprint("SELECT * FROM \"deadlines\" WHERE \"id\" IN (%s) AND \"priority\" > 1"),
+        )
+        self.assertEqual(fingerprint("SELECT 'it''s' LIMIT 21"), 'SELECT ? LIMIT ?')
+
+
+class QueryInstrumentationMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='timing@example.com',
+            password='password123',
+            full_name='Timing Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.case = Case.objects.create(internal_case_id='TIMING-1', caption='Timing v. Queries')
+        for days in range(1, 6):
+            Deadline.objects.create(
+                case=cls.case,
+                trigger_type=DeadlineTriggerType.USER,
+                basis=DeadlineBasis.CALENDAR_DAYS,
+                due_at=timezone.now() + timedelta(days=days),
+                timezone='America/Chicago',
+                created_by=cls.user,
+            )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_server_timing_reports_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/v1/cases/{self.case.id}/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        match = SERVER_TIMING.fullmatch(response['Server-Timing'])
+        self.assertIsNotNone(match)
+        self.assertEqual(int(match.group(1)), len(queries))
+
+    @override_settings(QUERY_DUPLICATE_THRESHOLD=5)
+    def test_repeated_statement_is_logged_as_n_plus_one(self):
+        def per_row_view(request):
+            # One query per deadline, as a serializer method field without an annotation would run.
+            counts = [deadline.reminders.filter(sent=False).count() for deadline in Deadline.objects.all()]
+            return HttpResponse(str(counts))
+
+        middleware = QueryInstrumentationMiddleware(per_row_view)
+        with self.assertLogs('court_rules.sql', 'INFO') as logs:
+            response = middleware(RequestFactory().get('/api/v1/deadlines/'))
+
+        summary = logs.records[0]
+        self.assertEqual((summary.path, summary.status, summary.sql_queries), ('/api/v1/deadlines/', 200, 6))
+        self.assertEqual(SERVER_TIMING.fullmatch(response['Server-Timing']).groups(), ('6', '4'))
+        warnings = [record for record in logs.records if record.getMessage().startswith('Likely N+1')]
+        self.assertEqual(len(warnings), 1)
+        self.assertEqual(warnings[0].sql_repeats, 5)
+        self.assertIn('deadline_reminders', warnings[0].sql_fingerprint)
+
+    @override_settings(QUERY_SLOW_REQUEST_MS=0, QUERY_SLOW_SAMPLE_RATE=1.0)
+    def test_slow_requests_log_their_queries(self):
+        with self.assertLogs('court_rules.sql', 'WARNING') as logs:
+            self.client.get(f'/api/v1/cases/{self.case.id}/', **self.auth_headers())
+
+        slow = [record for record in logs.records if record.getMessage().startswith('Slow request')]
+        self.assertEqual(len(slow), 1)
+        self.assertEqual(len(slow[0].sql), slow[0].sql_queries)
+        self.assertIn('ms', slow[0].sql[0])
+
+    @override_settings(QUERY_INSTRUMENTATION=False)
+    def test_disabled_middleware_is_removed(self):
+        response = self.client.get(f'/api/v1/cases/{self.case.id}/', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Server-Timing', response)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Court, Judge, Rule, RuleSourceType, User, UserRole
+from court_rules.services.reference_cache import get_or_build
+
+
+class ReferenceCacheApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.lawyer = User.objects.create_user(
+            email='reference@example.com',
+            password='password123',
+            full_name='Reference Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.admin = User.objects.create_user(
+            email='reference.admin@example.com',
+            password='password123',
+            full_name='Reference Admin',
+            role=UserRole.ADMIN,
+        )
+        cls.tokens = {user: Token.objects.create(user=user) for user in (cls.lawyer, cls.admin)}
+        cls.court = Court.objects.create(name='District of Delaware', timezone='America/New_York')
+        cls.judge = Judge.objects.create(full_name='Hon. Cached', court=cls.court)
+        cls.rule = Rule.objects.create(source_type=RuleSourceType.FRCP, citation='Fed. R. Civ. P. 6', text='Computing time.')
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, url, user=None, **headers):
+        token = self.tokens[user or self.lawyer]
+        return self.client.get(url, HTTP_AUTHORIZATION=f'Token {token.key}', **headers)
+
+    def test_second_request_is_served_without_querying_rules(self):
+        self.assertEqual(self.get('/api/v1/rules/')['X-Reference-Cache'], 'miss')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get('/api/v1/rules/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Reference-Cache'], 'hit')
+        self.assertEqual(response.data['results'][0]['citation'], 'Fed. R. Civ. P. 6')
+        self.assertFalse([query for query in queries if '"rules"' in query['sql']])
+
+    def test_saving_a_model_the_response_read_invalidates_it(self):
+        self.get('/api/v1/judges/')
+        self.get(f'/api/v1/rules/{self.rule.id}/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.court.name = 'District of New Jersey'
+            self.court.save()
+
+        judges = self.get('/api/v1/judges/')
+        self.assertEqual(judges['X-Reference-Cache'], 'miss')
+        self.assertEqual(judges.data['results'][0]['court_name'], 'District of New Jersey')
+        self.assertEqual(self.get(f'/api/v1/rules/{self.rule.id}/')['X-Reference-Cache'], 'hit')
+
+    def test_admins_can_skip_the_cache(self):
+        self.get('/api/v1/rules/')
+        Rule.objects.filter(pk=self.rule.pk).update(text='Changed without signals.')
+
+        self.assertEqual(self.get('/api/v1/rules/', HTTP_CACHE_CONTROL='no-cache')['X-Reference-Cache'], 'hit')
+        fresh = self.get('/api/v1/rules/', user=self.admin, HTTP_CACHE_CONTROL='no-cache')
+        self.assertEqual(fresh['X-Reference-Cache'], 'bypass')
+        self.assertEqual(fresh.data['results'][0]['text'], 'Changed without signals.')
+        # The fresh response replaced the cached one.
+        self.assertEqual(self.get('/api/v1/rules/').data['results'][0]['text'], 'Changed without signals.')
+
+    def test_errors_are_not_cached(self):
+        self.assertEqual(self.get(f'/api/v1/rules/{self.judge.id}/').status_code, status.HTTP_404_NOT_FOUND)
+        Rule.objects.filter(pk=self.rule.pk).update(id=self.judge.id)
+
+        self.assertEqual(self.get(f'/api/v1/rules/{self.judge.id}/').status_code, status.HTTP_200_OK)
+
+
+class GetOrBuildTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_waits_for_the_worker_holding_the_lock(self):
+        cache.add('entry:lock', 1)
+        threading.Timer(0.05, cache.set, ('entry', ['built elsewhere'])).start()
+
+        value, result = get_or_build('entry', lambda: self.fail('built twice'))
+
+        self.assertEqual((value, result), (['built elsewhere'], 'wait'))
+
+    @override_settings(REFERENCE_CACHE_WAIT_SECONDS=0.05)
+    def test_builds_itself_when_the_lock_holder_is_too_slow(self):
+        cache.add('entry:lock', 1)
+
+        self.assertEqual(get_or_build('entry', lambda: ['built here']), (['built here'], 'miss'))
+        self.assertEqual(get_or_build('entry', lambda: self.fail('built twice')), (['built here'], 'hit'))
+
+    def test_a_failed_build_releases_the_lock(self):
+        def build():
+            raise ValueError('database went away')
+
+        with self.assertRaises(ValueError):
+            get_or_build('entry', build)
+        self.assertIsNone(cache.get('entry:lock'))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import uuid
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Rule, RuleCrossRef, RuleSourceType, User, UserRole
+from court_rules.services import rule_graph
+from court_rules.services.rule_graph import RuleGraph
+
+
+class RuleGraphTests(SimpleTestCase):
+    def setUp(self):
+        self.a, self.b, self.c, self.d, self.e = (uuid.uuid4() for _ in range(5))
+        self.graph = RuleGraph([(self.a, self.b), (self.b, self.c), (self.c, self.d), (self.d, self.e)])
+
+    def test_neighborhood_is_bounded_by_depth(self):
+        self.assertEqual(self.graph.neighborhood(self.a, 1), {self.b: 1})
+        self.assertEqual(self.graph.neighborhood(self.a, 3), {self.b: 1, self.c: 2, self.d: 3})
+        self.assertEqual(self.graph.neighborhood(self.a, 4)[self.e], 4)
+        self.assertEqual(self.graph.neighborhood(self.c, 1, 'in'), {self.b: 1})
+        self.assertEqual(self.graph.neighborhood(self.c, 1, 'both'), {self.b: 1, self.d: 1})
+
+    def test_incremental_changes_update_precomputed_closure(self):
+        shortcut = uuid.uuid4()
+        self.graph.add_edge(self.b, shortcut)
+        self.assertEqual(self.graph.neighborhood(self.a, 2)[shortcut], 2)
+
+        self.graph.remove_edge(self.b, self.c)
+        self.assertEqual(self.graph.neighborhood(self.a, 3), {self.b: 1, shortcut: 2})
+
+        self.graph.add_edge(self.b, self.c)
+        self.assertEqual(self.graph.neighborhood(self.a, 3)[self.d], 3)
+
+
+class RuleRelatedApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='graph@example.com',
+            password='password123',
+            full_name='Graph Reader',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        cache.clear()
+        rule_graph._state.update(graph=None, version=None)
+        self.local_rule = self.make_rule(RuleSourceType.LOCAL_RULE, 'LR 5.3')
+        self.frcp_6 = self.make_rule(RuleSourceType.FRCP, 'Fed. R. Civ. P. 6')
+        self.frcp_5 = self.make_rule(RuleSourceType.FRCP, 'Fed. R. Civ. P. 5')
+        RuleCrossRef.objects.create(from_rule=self.local_rule, to_rule=self.frcp_6)
+        RuleCrossRef.objects.create(from_rule=self.frcp_6, to_rule=self.frcp_5)
+
+    def make_rule(self, source_type, citation):
+        return Rule.objects.create(source_type=source_type, citation=citation, jurisdiction='N.D. Ill.')
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_related_returns_rules_with_distance(self):
+        response = self.client.get(f'/api/v1/rules/{self.local_rule.id}/related/?depth=2', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item['citation'], item['distance']) for item in response.data],
+            [('Fed. R. Civ. P. 6', 1), ('Fed. R. Civ. P. 5', 2)],
+        )
+
+    def test_related_rejects_out_of_range_depth(self):
+        response = self.client.get(f'/api/v1/rules/{self.local_rule.id}/related/?depth=9', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_workers_catch_up_from_cached_deltas(self):
+        rule_graph.get_rule_graph()
+        with self.captureOnCommitCallbacks(execute=True):
+            crossref = RuleCrossRef.objects.create(from_rule=self.frcp_5, to_rule=self.local_rule)
+
+        # Emulate a worker that built its graph before the change was published.
+        with self.assertNumQueries(0):
+            graph = rule_graph.get_rule_graph()
+        self.assertEqual(graph.neighborhood(self.frcp_5.id, 1), {self.local_rule.id: 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            crossref.delete()
+        rule_graph._state.update(graph=None, version=None)
+        with self.assertNumQueries(0):
+            graph = rule_graph.get_rule_graph()
+        self.assertEqual(graph.neighborhood(self.frcp_5.id, 1), {})
+
+    def test_rolled_back_changes_are_not_published(self):
+        rule_graph.get_rule_graph()
+        version = cache.get(rule_graph.CACHE_VERSION_KEY)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    RuleCrossRef.objects.create(from_rule=self.frcp_5, to_rule=self.local_rule)
+                    raise IntegrityError
+            except IntegrityError:
+                pass
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(cache.get(rule_graph.CACHE_VERSION_KEY), version)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import date
+
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import Rule, RuleSourceType, User, UserRole
+from court_rules.services.rules import resolve_rule, resolve_rules, supersede_rule
+
+
+class RuleVersionResolverTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='rules@example.com',
+            password='password123',
+            full_name='Rule Reader',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        self.v2019 = self.make_rule('L.R. 5.3', '2019', date(2019, 1, 1))
+        self.v2023 = self.make_rule('L.R. 5.3', '2023', date(2023, 6, 1))
+        self.v2025 = self.make_rule('L.R. 5.3', '2025', date(2025, 1, 1))
+
+    def make_rule(self, citation, version, effective_date):
+        return Rule.objects.create(
+            source_type=RuleSourceType.LOCAL_RULE,
+            citation=citation,
+            jurisdiction='N.D. Ill.',
+            version=version,
+            effective_date=effective_date,
+        )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_intervals_are_maintained_on_import(self):
+        self.v2019.refresh_from_db()
+        self.v2025.refresh_from_db()
+
+        self.assertEqual((self.v2019.valid_from, self.v2019.valid_to), (date(2019, 1, 1), date(2023, 6, 1)))
+        self.assertEqual((self.v2025.valid_from, self.v2025.valid_to), (date(2025, 1, 1), None))
+
+    def test_resolve_rule_as_of_date(self):
+        self.assertEqual(resolve_rule('L.R. 5.3', date(2025, 3, 14)), self.v2025)
+        self.assertEqual(resolve_rule('L.R. 5.3', date(2024, 12, 31)), self.v2023)
+        self.assertIsNone(resolve_rule('L.R. 5.3', date(2018, 5, 1)))
+
+    def test_supersession_by_renumbered_rule_ends_interval(self):
+        renumbered = self.make_rule('L.R. 5.4', '2024', date(2024, 3, 1))
+        supersede_rule(self.v2023, renumbered)
+
+        self.v2023.refresh_from_db()
+        self.assertEqual(self.v2023.valid_to, date(2024, 3, 1))
+        self.assertIsNone(resolve_rule('L.R. 5.3', date(2024, 6, 1)))
+        self.assertEqual(resolve_rule('L.R. 5.4', date(2024, 6, 1)), renumbered)
+
+    def test_resolve_rules_in_batch(self):
+        pairs = [
+            ('L.R. 5.3', date(2019, 7, 4)),
+            ('L.R. 5.3', date(2023, 6, 1)),
+            ('L.R. 5.3', date(2025, 3, 14)),
+            ('L.R. 9.9', date(2025, 3, 14)),
+        ]
+        with self.assertNumQueries(1):
+            resolved = resolve_rules(pairs)
+
+        self.assertEqual([resolved[pair] for pair in pairs], [self.v2019, self.v2023, self.v2025, None])
+
+    def test_rule_list_filters_as_of(self):
+        response = self.client.get('/api/v1/rules/?as_of=2025-03-14', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['version'] for item in response.data['results']], ['2025'])
+
+        response = self.client.get('/api/v1/rules/?as_of=2025-02-30', **self.auth_headers())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    CalendarEvent,
+    Case,
+    CaseTeam,
+    CaseTeamRole,
+    Court,
+    Hearing,
+    Judge,
+    JudgeProcedure,
+    User,
+    UserRole,
+)
+from court_rules.services.scheduling import BusyInterval, ConflictDetector, IntervalTree, expand_hearing_windows
+
+
+CHICAGO = ZoneInfo('America/Chicago')
+
+
+class IntervalTreeTests(SimpleTestCase):
+    def test_overlapping_matches_brute_force(self):
+        rng = random.Random(7)
+        base = datetime(2025, 1, 1, tzinfo=ZoneInfo('UTC'))
+        intervals = []
+        for index in range(500):
+            start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30, 15))
+            intervals.append(BusyInterval(start, start + timedelta(minutes=rng.choice([15, 30, 60, 240])), 'hearing', index, None))
+        tree = IntervalTree(intervals)
+
+        for _ in range(200):
+            start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30, 15))
+            end = start + timedelta(minutes=rng.choice([15, 60, 120]))
+            expected = {item.object_id for item in intervals if item.starts_at < end and item.ends_at > start}
+            self.assertEqual({item.object_id for item in tree.overlapping(start, end)}, expected)
+
+    def test_touching_intervals_do_not_overlap(self):
+        start = datetime(2025, 1, 1, 9, tzinfo=ZoneInfo('UTC'))
+        tree = IntervalTree([BusyInterval(start, start + timedelta(hours=1), 'hearing', 1, None)])
+
+        self.assertEqual(tree.overlapping(start + timedelta(hours=1), start + timedelta(hours=2)), [])
+        self.assertEqual(tree.overlapping(start - timedelta(hours=1), start), [])
+
+
+class HearingWindowTests(SimpleTestCase):
+    def test_malformed_entries_are_skipped(self):
+        start = datetime(2025, 1, 6, tzinfo=CHICAGO)
+        windows = ['tue 09:30-11:00', None, {'weekday': 'tue', 'start': '09:30', 'end': '11:00'}]
+
+        self.assertEqual(
+            expand_hearing_windows(windows, start, start + timedelta(days=7), CHICAGO),
+            [(datetime(2025, 1, 7, 9, 30, tzinfo=CHICAGO), datetime(2025, 1, 7, 11, tzinfo=CHICAGO))],
+        )
+
+
+class HearingConflictTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='scheduler@example.com',
+            password='password123',
+            full_name='Scheduling Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.associate = User.objects.create(email='associate@example.com', full_name='Associate', role=UserRole.LAWYER)
+        court = Court.objects.create(name='Northern District of Illinois', timezone='America/Chicago')
+        cls.judge = Judge.objects.create(full_name='Hon. Scheduling Judge', court=court)
+        JudgeProcedure.objects.create(
+            judge=cls.judge,
+            title='Standing Order',
+            version='2025.1',
+            hearing_windows=[{'weekday': 'tue', 'start': '09:30', 'end': '11:00'}],
+        )
+        cls.case = Case.objects.create(
+            internal_case_id='SCHED-1',
+            caption='Alpha v. Beta',
+            lead_attorney=cls.user,
+            timezone='America/Chicago',
+        )
+        cls.other_case = Case.objects.create(internal_case_id='SCHED-2', caption='Gamma v. Delta', timezone='America/Chicago')
+        CaseTeam.objects.create(case=cls.other_case, user=cls.user, role=CaseTeamRole.CONTRIBUTOR)
+        CaseTeam.objects.create(case=cls.case, user=cls.associate, role=CaseTeamRole.CONTRIBUTOR)
+
+        # Next Tuesday 10:00-10:30 Chicago time, well in the future.
+        today = timezone.localdate() + timedelta(days=14)
+        cls.tuesday = today + timedelta(days=(1 - today.weekday()) % 7)
+        cls.busy_start = datetime(cls.tuesday.year, cls.tuesday.month, cls.tuesday.day, 10, tzinfo=CHICAGO)
+        cls.hearing = Hearing.objects.create(
+            case=cls.other_case,
+            judge=cls.judge,
+            starts_at=cls.busy_start,
+            ends_at=cls.busy_start + timedelta(minutes=30),
+        )
+        cls.event = CalendarEvent.objects.create(
+            case=cls.case,
+            starts_at=cls.busy_start - timedelta(hours=3),
+            ends_at=cls.busy_start - timedelta(hours=2),
+        )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def window(self):
+        return self.busy_start - timedelta(days=1), self.busy_start + timedelta(days=1)
+
+    def test_conflicts_cover_case_team_and_judge(self):
+        detector = ConflictDetector(*self.window())
+        conflicts = detector.conflicts_for_slot(
+            self.busy_start + timedelta(minutes=15),
+            self.busy_start + timedelta(minutes=45),
+            case_id=self.case.id,
+            judge_id=self.judge.id,
+        )
+
+        self.assertEqual(
+            {(conflict.subject, conflict.subject_id) for conflict in conflicts},
+            {('user', self.user.id), ('judge', self.judge.id)},
+        )
+        self.assertTrue(all(conflict.interval.object_id == self.hearing.id for conflict in conflicts))
+
+    def test_only_teams_of_cases_in_the_window_are_loaded(self):
+        quiet_case = Case.objects.create(internal_case_id='SCHED-3', caption='Epsilon v. Zeta', lead_attorney=self.associate)
+
+        with self.assertNumQueries(4):
+            detector = ConflictDetector(*self.window())
+
+        self.assertEqual(set(detector.case_members), {self.case.id, self.other_case.id})
+        with self.assertNumQueries(2):
+            self.assertEqual(detector.attorneys_for_case(quiet_case.id), {self.associate.id})
+
+    def test_free_slots_skip_busy_time_inside_hearing_windows(self):
+        detector = ConflictDetector(*self.window())
+        slots = detector.free_slots(self.judge, timedelta(minutes=30), case_id=self.case.id)
+
+        window_start = self.busy_start - timedelta(minutes=30)
+        self.assertEqual(
+            slots,
+            [
+                (window_start, self.busy_start),
+                (self.busy_start + timedelta(minutes=30), self.busy_start + timedelta(minutes=60)),
+            ],
+        )
+
+    def test_calendar_conflicts_report_double_bookings(self):
+        Hearing.objects.create(case=self.case, starts_at=self.busy_start + timedelta(minutes=20))
+        detector = ConflictDetector(*self.window())
+
+        pairs = detector.calendar_conflicts()
+
+        self.assertIn(self.user.id, {subject_id for subject, subject_id, _, _ in pairs if subject == 'user'})
+        self.assertNotIn(self.associate.id, {subject_id for _, subject_id, _, _ in pairs})
+
+    def test_conflicts_endpoint(self):
+        response = self.client.get(
+            '/api/v1/hearings/conflicts/',
+            {
+                'starts_at': (self.busy_start - timedelta(hours=2, minutes=30)).isoformat(),
+                'ends_at': (self.busy_start - timedelta(hours=1)).isoformat(),
+                'case': str(self.case.id),
+            },
+            **self.auth_headers(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['has_conflicts'])
+        self.assertEqual(
+            {(item['subject_id'], item['source']) for item in response.data['conflicts']},
+            {(str(self.user.id), 'calendar_event'), (str(self.associate.id), 'calendar_event')},
+        )
+
+    def test_free_slots_endpoint_validates_range(self):
+        start, end = self.window()
+        response = self.client.get(
+            '/api/v1/hearings/free-slots/',
+            {'judge': str(self.judge.id), 'start': end.isoformat(), 'end': start.isoformat()},
+            **self.auth_headers(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.models import (
+    Case,
+    Contact,
+    ContactAddress,
+    ContactType,
+    Court,
+    Filing,
+    FilingServiceContact,
+    User,
+    UserRole,
+)
+from court_rules.services.pdf import stream_text_pdf, wrap_line
+from court_rules.services.service_lists import address_block, build_service_lists
+
+
+class AddressBlockTests(SimpleTestCase):
+    def test_address_json_is_normalized_to_lines(self):
+        block = address_block(
+            {'street': '  233 S.  Wacker Dr. ', 'suite': 'Suite 5800', 'city': 'Chicago', 'state': 'il', 'zip': '60606'}
+        )
+
+        self.assertEqual(block, ('233 S. Wacker Dr.', 'Suite 5800', 'Chicago, IL 60606'))
+        self.assertEqual(address_block({'line1': '1 Main St', 'city': 'Toronto', 'country': 'Canada'})[-1], 'CANADA')
+        self.assertEqual(address_block(['PO Box 1', '', 'Wilmington, DE 19899']), ('PO Box 1', 'Wilmington, DE 19899'))
+        self.assertEqual(address_block(None), ())
+
+    def test_pdf_offsets_match_xref_table(self):
+        document = b''.join(stream_text_pdf([f'Line {index}' for index in range(130)], title='Test'))
+
+        self.assertTrue(document.startswith(b'%PDF-1.4'))
+        self.assertTrue(document.endswith(b'%%EOF\n'))
+        start = int(re.search(rb'startxref\n(\d+)', document).group(1))
+        self.assertTrue(document[start:].startswith(b'xref'))
+        for object_id, offset in enumerate(re.findall(rb'(\d{10}) 00000 n', document), start=1):
+            self.assertTrue(document[int(offset):].startswith(f'{object_id} 0 obj'.encode()))
+        self.assertIn(b'/Count 3', document)
+        self.assertEqual(wrap_line('alpha beta gamma', 10), ['alpha beta', 'gamma'])
+
+
+class ServiceListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='service@example.com',
+            password='password123',
+            full_name='Service Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        court = Court.objects.create(name='N.D. Ill.', timezone='America/Chicago')
+        cls.case = Case.objects.create(
+            internal_case_id='MDL-1', case_number='1:25-md-01234', caption='In re Widgets', court=court, timezone='UTC'
+        )
+        cls.filing = Filing.objects.create(
+            case=cls.case,
+            filing_type='Motion to Compel',
+            served_at=datetime(2025, 3, 1, 3, tzinfo=dt_timezone.utc),
+            service_method='CM/ECF',
+        )
+        contacts = Contact.objects.bulk_create(
+            [
+                Contact(
+                    type=ContactType.PERSON,
+                    first_name=f'Counsel{index:03d}',
+                    last_name='Smith',
+                    org_name=f'Firm {index % 40}',
+                    email=f'counsel{index}@example.com',
+                    address={'line1': f'{index} Fallback Ave', 'city': 'Chicago', 'state': 'IL', 'zip': '60601'},
+                )
+                for index in range(400)
+            ]
+        )
+        FilingServiceContact.objects.bulk_create(
+            [FilingServiceContact(filing=cls.filing, contact=contact) for contact in contacts]
+        )
+        cls.first = contacts[0]
+        ContactAddress.objects.create(
+            contact=cls.first, label='Billing', address={'line1': '9 Other St', 'city': 'Chicago', 'state': 'IL'}
+        )
+        ContactAddress.objects.create(
+            contact=cls.first,
+            label='Service',
+            address={'line1': '1 Primary Plaza', 'city': 'Chicago', 'state': 'IL', 'zip': '60602'},
+            is_primary=True,
+        )
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_bulk_builder_prefers_primary_address_with_two_queries(self):
+        with self.assertNumQueries(2):
+            entries = build_service_lists([self.filing.pk])[self.filing.pk]
+
+        self.assertEqual(len(entries), 400)
+        self.assertEqual(entries[0].name, 'Counsel000 Smith')
+        self.assertEqual(entries[0].address_label, 'Service')
+        self.assertEqual(entries[0].address, ('1 Primary Plaza', 'Chicago, IL 60602'))
+        self.assertEqual(entries[1].address, ('1 Fallback Ave', 'Chicago, IL 60601'))
+
+    def test_service_list_endpoint_json_text_and_pdf(self):
+        url = f'/api/v1/filings/{self.filing.id}/service-list/'
+
+        with self.assertNumQueries(4):  # token auth, filing, service contacts, addresses
+            listing = self.client.get(url, **self.auth_headers())
+        text = self.client.get(url, {'output': 'text'}, **self.auth_headers())
+        pdf = self.client.get(url, {'output': 'pdf'}, **self.auth_headers())
+
+        self.assertEqual(listing.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(listing.data), 400)
+        body = b''.join(text.streaming_content).decode()
+        self.assertIn('served on February 28, 2025 by CM/ECF', body)
+        self.assertIn('Case No. 1:25-md-01234', body)
+        self.assertIn('counsel399@example.com', body)
+        self.assertEqual(pdf['Content-Type'], 'application/pdf')
+        self.assertTrue(b''.join(pdf.streaming_content).endswith(b'%%EOF\n'))
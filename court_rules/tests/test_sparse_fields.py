@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from court_rules.api.v1.serializers import SparseFieldsetSerializer
+from court_rules.api.v1.urls import router
+from court_rules.api.v1.viewsets import SparseFieldsetMixin
+from court_rules.models import (
+    Case,
+    Deadline,
+    DeadlineBasis,
+    DeadlineReminder,
+    DeadlineTriggerType,
+    ReminderChannel,
+    Rule,
+    RuleSourceType,
+    User,
+    UserRole,
+)
+
+
+class SparseFieldsetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='sparse@example.com',
+            password='password123',
+            full_name='Sparse Lawyer',
+            role=UserRole.LAWYER,
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.case = Case.objects.create(internal_case_id='SPARSE-1', caption='Sparse v. Dense')
+        cls.deadline = Deadline.objects.create(
+            case=cls.case,
+            trigger_type=DeadlineTriggerType.USER,
+            basis=DeadlineBasis.CALENDAR_DAYS,
+            due_at=timezone.now() + timedelta(days=5),
+            timezone='America/Chicago',
+            owner=cls.user,
+            computation_rationale='A long explanation. ' * 200,
+        )
+        for sent in (False, False, True):
+            DeadlineReminder.objects.create(
+                deadline=cls.deadline,
+                notify_at=timezone.now() + timedelta(days=1),
+                channel=ReminderChannel.EMAIL,
+                sent=sent,
+            )
+        Rule.objects.create(source_type=RuleSourceType.FRCP, citation='Fed. R. Civ. P. 6', text='Computing time. ' * 300)
+
+    def auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Token {self.token.key}'}
+
+    def test_fields_trims_the_payload_and_the_select(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/deadlines/?fields=id,due_at,status,case_caption', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        deadline = response.data['results'][0]
+        self.assertEqual(set(deadline), {'id', 'due_at', 'status', 'case_caption'})
+        self.assertEqual(deadline['case_caption'], 'Sparse v. Dense')
+        select = queries.captured_queries[-1]['sql']
+        self.assertIn('"cases"."caption"', select)
+        self.assertNotIn('computation_rationale', select)
+        self.assertNotIn('"users"', select)
+        self.assertNotIn('deadline_reminders', select)
+
+    def test_omit_drops_fields_from_the_full_set(self):
+        response = self.client.get('/api/v1/rules/?omit=text,url', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rule = response.data['results'][0]
+        self.assertNotIn('text', rule)
+        self.assertNotIn('url', rule)
+        self.assertEqual(rule['citation'], 'Fed. R. Civ. P. 6')
+        self.assertIn('superseded_by_citation', rule)
+
+    def test_computed_fields_still_read_their_sources(self):
+        url = f'/api/v1/deadlines/{self.deadline.id}/?fields=owner_name,due_at_local,pending_reminders'
+        response = self.client.get(url, **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['owner_name'], 'Sparse Lawyer')
+        self.assertEqual(response.data['pending_reminders'], 2)
+        self.assertTrue(response.data['due_at_local'].endswith(('-05:00', '-06:00')))
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get('/api/v1/cases/?fields=caption,secret', **self.auth_headers())
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('secret', response.data['fields'][0])
+
+    def test_every_sparse_serializer_declares_its_computed_fields(self):
+        for prefix, viewset, _ in router.registry:
+            if not issubclass(viewset, SparseFieldsetMixin):
+                continue
+            serializer_class = viewset.serializer_class
+            with self.subTest(prefix):
+                self.assertTrue(issubclass(serializer_class, SparseFieldsetSerializer))
+                serializer_class.projection(serializer_class().fields)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+
+from court_rules.models import AuditLog, Case, Contact, Deadline, Holiday, Rule, User
+from court_rules.services.audit import reconstruct_entity_state
+from court_rules.services.synthetic import LOGIN_EMAIL, LOGIN_PASSWORD, federal_holidays, generate, spread
+
+
+ANCHOR = date(2026, 3, 2)
+
+
+class SyntheticHelperTests(SimpleTestCase):
+    def test_spread_keeps_the_total(self):
+        self.assertEqual(spread(10, [1, 1, 1]), [4, 3, 3])
+        self.assertEqual(sum(spread(997, [5, 3, 0.5, 7])), 997)
+
+    def test_federal_holidays_follow_weekday_rules(self):
+        holidays = dict((name, day) for day, name in federal_holidays(2026))
+        self.assertEqual(holidays['Thanksgiving Day'], date(2026, 11, 26))
+        self.assertEqual(holidays['Memorial Day'], date(2026, 5, 25))
+        self.assertEqual(len(holidays), 11)
+
+
+class SyntheticDatasetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.counts = generate(cases=12, deadlines_per_case=10, seed=3, anchor=ANCHOR, batch_size=50)
+
+    def test_counts_match_the_requested_shape(self):
+        self.assertEqual(self.counts['cases'], 12)
+        self.assertEqual(self.counts['deadlines'], 120)
+        self.assertEqual(Deadline.objects.count(), 120)
+        empty = [table for table, count in self.counts.items() if count == 0]
+        self.assertEqual(empty, [])
+
+    def test_rows_are_usable_by_the_services(self):
+        user = User.objects.get(email=LOGIN_EMAIL)
+        self.assertTrue(user.check_password(LOGIN_PASSWORD))
+        self.assertTrue(user.auth_token.key)
+        self.assertFalse(Contact.objects.filter(normalized_name='').exists())
+        self.assertFalse(Rule.objects.filter(valid_from__isnull=True).exists())
+        self.assertTrue(Holiday.objects.filter(date=date(2026, 7, 4), name='Independence Day').exists())
+        self.assertTrue(AuditLog.objects.filter(sequence=1, is_checkpoint=True).exists())
+
+    def test_audit_history_replays_to_the_rows(self):
+        for deadline in Deadline.objects.all():
+            state = reconstruct_entity_state('deadlines', deadline.id)
+            self.assertEqual((state['status'], state['priority']), (deadline.status, deadline.priority))
+
+    def test_same_seed_and_anchor_reproduce_the_rows(self):
+        first = sorted(map(str, Case.objects.values_list('id', flat=True)))
+        call_command('flush', interactive=False, verbosity=0)
+        counts = generate(cases=12, deadlines_per_case=10, seed=3, anchor=ANCHOR, batch_size=50)
+
+        self.assertEqual(counts, self.counts)
+        self.assertEqual(sorted(map(str, Case.objects.values_list('id', flat=True))), first)
+
+
+class SeedSyntheticCommandTests(TestCase):
+    def test_refuses_to_mix_with_existing_data(self):
+        call_command('seed_synthetic', cases=2, deadlines_per_case=3, anchor='2026-03-02', stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command('seed_synthetic', cases=2, stdout=StringIO())
+        output = StringIO()
+        call_command('seed_synthetic', cases=3, deadlines_per_case=3, flush=True, stdout=output)
+        self.assertEqual(Case.objects.count(), 3)
+        self.assertIn(LOGIN_EMAIL, output.getvalue())
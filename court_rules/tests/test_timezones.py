@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.test import SimpleTestCase, TestCase
+
+from court_rules.models import AuditLog, Case, Court, Deadline, Hearing, Judge, JudgeProcedure
+from court_rules.services.deadlines import due_instant, filing_cutoffs, recompute_due_instants
+from court_rules.services.timezones import get_zone, local_to_utc, transition_table
+
+
+UTC = dt_timezone.utc
+ZONES = [
+    'America/Chicago',
+    'America/New_York',
+    'America/Phoenix',
+    'America/Santiago',
+    'Europe/London',
+    'Australia/Sydney',
+    'Australia/Lord_Howe',
+    'Pacific/Honolulu',
+]
+
+
+def reference_instant(day: date, wall_time: time, zone_name: str) -> datetime:
+    """``zoneinfo``'s answer, with ambiguous times taken at the later instant."""
+
+    zone = get_zone(zone_name)
+    earlier = datetime.combine(day, wall_time, tzinfo=zone)
+    later = earlier.replace(fold=1)
+    if earlier.astimezone(UTC).astimezone(zone).replace(tzinfo=None) != earlier.replace(tzinfo=None):
+        # Non-existent wall time: fold=0 applies the offset from before the gap.
+        return earlier.astimezone(UTC)
+    return max(earlier.astimezone(UTC), later.astimezone(UTC))
+
+
+class LocalToUtcPropertyTests(SimpleTestCase):
+    def test_random_wall_times_match_zoneinfo(self):
+        rng = random.Random(20251019)
+        for _ in range(3000):
+            zone_name = rng.choice(ZONES)
+            day = date(2018, 1, 1) + timedelta(days=rng.randrange(365 * 12))
+            wall_time = time(rng.randrange(24), rng.randrange(60), rng.randrange(60))
+            with self.subTest(zone=zone_name, day=day, wall_time=wall_time):
+                self.assertEqual(local_to_utc(day, wall_time, zone_name), reference_instant(day, wall_time, zone_name))
+
+    def test_wall_times_around_every_transition_match_zoneinfo(self):
+        rng = random.Random(36)
+        for zone_name in ZONES:
+            zone = get_zone(zone_name)
+            for year in (2024, 2025, 2026):
+                instants, _ = transition_table(zone_name, year)
+                for instant in instants:
+                    local = instant.astimezone(zone).replace(tzinfo=None)
+                    for _ in range(40):
+                        wall = local + timedelta(minutes=rng.randrange(-150, 150))
+                        with self.subTest(zone=zone_name, wall=wall):
+                            self.assertEqual(
+                                local_to_utc(wall.date(), wall.time(), zone_name),
+                                reference_instant(wall.date(), wall.time(), zone_name),
+                            )
+
+    def test_gap_and_ambiguous_hours(self):
+        # 2025-03-09 02:30 does not exist in Chicago; it lands at 03:30 CDT.
+        self.assertEqual(
+            local_to_utc(date(2025, 3, 9), time(2, 30), 'America/Chicago'),
+            datetime(2025, 3, 9, 8, 30, tzinfo=UTC),
+        )
+        # 2025-11-02 01:30 happens twice; the later (CST) instant wins.
+        self.assertEqual(
+            local_to_utc(date(2025, 11, 2), time(1, 30), 'America/Chicago'),
+            datetime(2025, 11, 2, 7, 30, tzinfo=UTC),
+        )
+
+    def test_unknown_zone_falls_back_to_utc(self):
+        self.assertEqual(
+            local_to_utc(date(2025, 6, 1), time(17), 'Mars/Olympus_Mons'),
+            datetime(2025, 6, 1, 17, tzinfo=UTC),
+        )
+        self.assertEqual(
+            due_instant(date(2025, 6, 1), ''),
+            datetime(2025, 6, 1, 23, 59, 59, tzinfo=UTC),
+        )
+
+
+class DeadlineCutoffTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.court = Court.objects.create(name='N.D. Ill.', timezone='America/Chicago')
+        cls.judge = Judge.objects.create(full_name='Judge Cutoff', court=cls.court)
+        JudgeProcedure.objects.create(
+            judge=cls.judge,
+            title='Standing order',
+            version='1',
+            content_text='Filings after 5:00 pm are deemed filed the next day.',
+            effective_date=date(2024, 1, 1),
+            filing_cutoff_time=time(17),
+        )
+        cls.case = Case.objects.create(
+            internal_case_id='TZ-1',
+            caption='Zone v. Offset',
+            court=cls.court,
+            timezone='America/New_York',
+        )
+        Hearing.objects.create(
+            case=cls.case,
+            judge=cls.judge,
+            starts_at=datetime(2025, 2, 3, 15, tzinfo=UTC),
+            ends_at=datetime(2025, 2, 3, 16, tzinfo=UTC),
+        )
+
+    def test_filing_cutoffs_read_current_procedures(self):
+        self.assertEqual(filing_cutoffs([self.judge.id, None]), {self.judge.id: time(17)})
+
+    def test_recompute_applies_court_zone_and_judge_cutoff(self):
+        # Stored as end of day in the case's (wrong) zone, on the Friday before DST starts.
+        deadline = Deadline.objects.create(
+            case=self.case,
+            trigger_type='rule',
+            due_at=datetime(2025, 3, 8, 4, 59, 59, tzinfo=UTC),
+            timezone='America/New_York',
+        )
+        closed = Deadline.objects.create(
+            case=self.case,
+            trigger_type='rule',
+            due_at=datetime(2025, 3, 8, 4, 59, 59, tzinfo=UTC),
+            timezone='America/New_York',
+            status='done',
+        )
+
+        self.assertEqual(recompute_due_instants(), 1)
+        self.assertEqual(recompute_due_instants(), 0)
+
+        deadline.refresh_from_db()
+        closed.refresh_from_db()
+        self.assertEqual(deadline.due_at, datetime(2025, 3, 7, 23, tzinfo=UTC))
+        self.assertEqual(deadline.timezone, 'America/Chicago')
+        self.assertEqual(closed.timezone, 'America/New_York')
+        entry = AuditLog.objects.get(entity_id=deadline.id, action='update')
+        self.assertEqual(entry.after['timezone'], 'America/Chicago')
+
+    def test_recompute_leaves_manually_timed_deadlines_alone(self):
+        # Typed in by a user at end of day in New York, and moved by hand to 2:30 pm there.
+        end_of_day = datetime(2025, 3, 8, 4, 59, 59, tzinfo=UTC)
+        afternoon = datetime(2025, 3, 7, 19, 30, tzinfo=UTC)
+        typed = Deadline.objects.create(case=self.case, trigger_type='user', due_at=end_of_day, timezone='America/New_York')
+        moved = Deadline.objects.create(case=self.case, trigger_type='rule', due_at=afternoon, timezone='America/New_York')
+
+        self.assertEqual(recompute_due_instants(), 0)
+
+        typed.refresh_from_db()
+        moved.refresh_from_db()
+        self.assertEqual((typed.due_at, typed.timezone), (end_of_day, 'America/New_York'))
+        self.assertEqual((moved.due_at, moved.timezone), (afternoon, 'America/New_York'))
+        self.assertFalse(AuditLog.objects.filter(action='update').exists())
@@ -1,3 +1,19 @@
-from django.shortcuts import render
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
 
-# Create your views here.
+from court_rules.metrics import render_metrics
+
+
+@require_GET
+def metrics(request):
+    """Prometheus exposition; guarded by ``METRICS_BEARER_TOKEN``, and hidden without one unless ``METRICS_PUBLIC``."""
+
+    token = settings.METRICS_BEARER_TOKEN
+    if not token and not settings.METRICS_PUBLIC:
+        raise Http404
+    if token and not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=401, headers={'WWW-Authenticate': 'Bearer'})
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
@@ -3,7 +3,7 @@ import { Loader2 } from '../lucide-stub';
 
 import { useTheme } from '../contexts/ThemeContext';
 import { useApi } from '../hooks/useApi';
-import { Deadline, AuditLogEntry, PaginatedResponse } from '../types';
+import { Deadline, AuditLogEntry, AuditHistoryEntry, PaginatedResponse } from '../types';
 
 interface AuditLogModalProps {
   deadline: Deadline | null;
@@ -21,7 +21,7 @@ const actionLabel: Record<AuditLogEntry['action'], string> = {
 const AuditLogModal: React.FC<AuditLogModalProps> = ({ deadline, isOpen, onClose }) => {
   const { isDarkMode } = useTheme();
   const { apiFetch } = useApi();
-  const [entries, setEntries] = useState<AuditLogEntry[]>([]);
+  const [entries, setEntries] = useState<AuditHistoryEntry[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
@@ -35,8 +35,8 @@ const AuditLogModal: React.FC<AuditLogModalProps> = ({ deadline, isOpen, onClose
       setIsLoading(true);
       setError(null);
       try {
-        const response = await apiFetch<PaginatedResponse<AuditLogEntry>>(
-          `audit-log/?entity_table=deadlines&entity_id=${deadline.id}`,
+        const response = await apiFetch<PaginatedResponse<AuditHistoryEntry>>(
+          `deadlines/${deadline.id}/history/`,
         );
         if (!cancelled) {
           setEntries(response.results ?? []);
@@ -137,7 +137,7 @@ const AuditLogModal: React.FC<AuditLogModalProps> = ({ deadline, isOpen, onClose
                       </td>
                       <td className="px-4 py-3">
                         <pre className={`whitespace-pre-wrap text-xs ${isDarkMode ? 'text-gray-400' : 'text-gray-600'}`}>
-                          {JSON.stringify({ before: entry.before, after: entry.after }, null, 2)}
+                          {JSON.stringify(entry.changes, null, 2)}
                         </pre>
                       </td>
                     </tr>
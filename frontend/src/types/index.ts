@@ -23,6 +23,28 @@ export interface Judge {
   contact_phone: string;
   holiday_calendar: string | null;
   holiday_calendar_name: string | null;
+  procedures?: JudgeProcedure[];
+  associations?: JudgeAssociation[];
+}
+
+export interface JudgeProcedure {
+  id: string;
+  title: string;
+  version: string;
+  effective_date: string | null;
+  expiry_date: string | null;
+  filing_format: Record<string, unknown> | null;
+  exhibit_labeling: Record<string, unknown> | null;
+  motion_practice: Record<string, unknown> | null;
+  filing_cutoff_time: string | null;
+  hearing_windows: unknown;
+}
+
+export interface JudgeAssociation {
+  id: string;
+  associated_judge: string;
+  associated_judge_name: string;
+  association_type: string;
 }
 
 export interface Case {
@@ -56,6 +78,7 @@ export interface Deadline {
   holiday_calendar: string | null;
   holiday_calendar_name: string | null;
   due_at: string;
+  due_at_local: string;
   timezone: string;
   owner: string | null;
   owner_name: string | null;
@@ -129,6 +152,12 @@ export interface AuditLogEntry {
   created_at: string;
 }
 
+export interface AuditHistoryEntry extends AuditLogEntry {
+  sequence: number;
+  is_checkpoint: boolean;
+  changes: Record<string, { from: unknown; to: unknown }>;
+}
+
 export interface Rule {
   id: string;
   source_type: 'FRCP' | 'LocalRule' | 'JudgeProcedure' | 'ECFManual' | 'StandingOrder';
@@ -138,6 +167,8 @@ export interface Rule {
   effective_date: string | null;
   superseded_by: string | null;
   superseded_by_citation: string | null;
+  valid_from: string | null;
+  valid_to: string | null;
   text: string;
   url: string;
   created_at: string;